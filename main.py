@@ -11,7 +11,7 @@ app_start_time : float = time.time()  # Start time for the application
 # ---------------------------------------------------------------------------- +
 #region Imports
 # python standard library modules and packages
-import sys, logging, os
+import sys, logging, os, shutil
 from pathlib import Path
 # third-party modules and packages
 from rich.console import Console
@@ -20,6 +20,7 @@ from p3_utils import exc_err_msg, dscr, start_timer, stop_timer
 import argparse
 # local modules and packages
 import budman_namespace as bdm
+import p3_mvvm as p3m
 from budman_settings.budman_settings_constants import *
 from budman_settings.budman_settings import BudManSettings
 from src.budman_app.budman_app import BudManApp
@@ -28,7 +29,8 @@ from src.budman_app.budman_app import BudManApp
 #region Globals and Constants
 logger = logging.getLogger(__name__)
 sys.stdout.reconfigure(encoding='utf-8')  # Ensure stdout uses UTF-8 encoding
-terminal_size = os.get_terminal_size()
+# shutil falls back to 80 columns without a terminal, e.g. for --script.
+terminal_size = shutil.get_terminal_size()
 console = Console(force_terminal=True, 
                   color_system='truecolor',
                   width=terminal_size.columns, 
@@ -44,6 +46,11 @@ parser: argparse.ArgumentParser = argparse.ArgumentParser(
 )
 parser.add_argument("--show_log_config", action="store_true",
                     help="Show the logging configuration.")
+parser.add_argument("--script", metavar="SCRIPT_FILE", default=None,
+                    help="Run a command script headless, then exit.")
+parser.add_argument("--script_workers", type=int, 
+                    default=p3m.CP_DEFAULT_WORKER_COUNT,
+                    help="Maximum script commands run at once.")
 args = parser.parse_args()
 #endregion command line argparse setup
 # ---------------------------------------------------------------------------- +
@@ -89,11 +96,15 @@ def configure_logging(logger_name : str, log_config_url: str, logtest : bool = T
 """
 #endregion backlog - main todo list
 # ---------------------------------------------------------------------------- +
-def main(bdms_url : str = None, start_time:float = app_start_time) -> None:
+def main(bdms_url : str = None, start_time:float = app_start_time,
+         script : str = None, 
+         script_workers : int = p3m.CP_DEFAULT_WORKER_COUNT) -> None:
     """Main entry point for the Budget Manager application.
     Args:
         bdms_url (str): Optional, the URL to BDM_STORE to load at startup.
         start_time (float): Optional, the start time for the application.
+        script (str): Optional, a command script to run headless, then exit.
+        script_workers (int): Optional, maximum script commands run at once.
     """
     try:
         msg = f"Started: {stop_timer(start_time)}"
@@ -113,6 +124,12 @@ def main(bdms_url : str = None, start_time:float = app_start_time) -> None:
         logger.info(f"BizEVENT: Started {app_name} User BDM_STORE {fs}bdms_url = '{bdms_url}'...")
         app = BudManApp(BudManMain_settings,start_time)
         logger.debug(f"{dscr(app)} created. ...{stop_timer(start_time)}")
+        if script is not None:
+            # Headless, no cli view.
+            exit_code = app.run_script(script, bdms_url, script_workers)
+            logger.info(f"BizEVENT: {Path(__file__).name} script '{script}' "
+                        f"exit code {exit_code} in {stop_timer(app_start_time)} seconds.")
+            sys.exit(exit_code)
         app.run(bdms_url)  # Start the application
         logger.debug(f"Complete: {stop_timer(start_time)}")
         logger.info(f"BizEVENT: {Path(__file__).name} completed successfully "
@@ -124,4 +141,5 @@ def main(bdms_url : str = None, start_time:float = app_start_time) -> None:
 
 if __name__ == "__main__":
     bdms_url = None #"file:///C:/Users/ppain/OneDrive/budman/p3_budget_manager_ca063e8b.jsonc"
-    main(bdms_url,start_time=app_start_time)
+    main(bdms_url,start_time=app_start_time, 
+         script=args.script, script_workers=args.script_workers)
@@ -16,8 +16,14 @@ __license__ = "MIT"
 
 from .budget_domain_model import BudgetDomainModel
 from .budget_domain_model_config import BDMConfig
-from .bdm_workbook_tree import BDMWorkbookTree
+from .bdm_workbook_tree import (BDMWorkbookTree, WBT_CHANGE_ADD,
+                                WBT_CHANGE_REMOVE, WBT_CHANGE_MOVE,
+                                WBT_CHANGE_UPDATE)
 from .bdm_workbook_tree_node import BDMWorkbookTreeNode
+from .bdm_workbook_data_collection import (LazyWorkbookDataCollection, 
+    wdc_attribute, wdc_reconcile, WDCReconcileSummary)
+from .bdm_workbook_index import WorkbookIndex
+from .bdm_wf_folder_table import WFFolderTable, WFFolderEntry
 
 # symbols for "from budman_model import *"
 __all__ = [
@@ -26,5 +32,16 @@ __all__ = [
     "Model_Binding",
     "BDMConfig",
     "BDMWorkbookTreeNode",
-    "BDMWorkbookTree"
+    "BDMWorkbookTree",
+    "LazyWorkbookDataCollection",
+    "wdc_attribute",
+    "wdc_reconcile",
+    "WDCReconcileSummary",
+    "WorkbookIndex",
+    "WFFolderTable",
+    "WFFolderEntry",
+    "WBT_CHANGE_ADD",
+    "WBT_CHANGE_REMOVE",
+    "WBT_CHANGE_MOVE",
+    "WBT_CHANGE_UPDATE"
 ]
\ No newline at end of file
@@ -0,0 +1,123 @@
+# ---------------------------------------------------------------------------- +
+#region bdm_wf_folder_table.py module
+""" bdm_wf_folder_table.py implements the WFFolderTable class.
+
+    WFFolderTable is a lookup table of the WF_FOLDER_CONFIGs of the FI's in
+    the BDM, keyed by (fi_key, wf_key, wf_purpose). Each WFFolderEntry holds
+    the WF_FOLDER_CONFIG with its WF_FOLDER, WF_PREFIX and WF_FOLDER_URL
+    values, and the WF_FOLDER path and abs path, so lookups do not walk the
+    FI_WF_FOLDER_CONFIG_COLLECTION or build Path objects.
+
+    The entries of an FI are built on first lookup. They are rebuilt when
+    the FI's FI_WF_FOLDER_CONFIG_COLLECTION object, FI_FOLDER or the
+    BDM_FOLDER change, see is_current(). Changes made in place to a
+    collection must be followed by invalidate(), the BudgetDomainModel does
+    this where it changes them.
+"""
+#endregion bdm_wf_folder_table.py module
+# ---------------------------------------------------------------------------- +
+#region Imports
+# python standard library modules and packages
+import logging, threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+# third-party modules and packages
+import p3_utils as p3u
+
+# local modules and packages
+from budman_namespace.design_language_namespace import (
+    WF_FOLDER, WF_PREFIX, WF_PURPOSE, WF_FOLDER_URL,
+    FI_WF_FOLDER_CONFIG_COLLECTION_TYPE, WF_FOLDER_CONFIG_TYPE)
+#endregion Imports
+# ---------------------------------------------------------------------------- +
+#region Globals and Constants
+logger = logging.getLogger(__name__)
+# (fi_key, wf_key, wf_purpose)
+WF_FOLDER_KEY_TYPE = Tuple[str, str, str]
+#endregion Globals and Constants
+# ---------------------------------------------------------------------------- +
+@dataclass(slots=True, frozen=True)
+class WFFolderEntry:
+    """The resolved values of one WF_FOLDER_CONFIG of an FI."""
+    wf_folder_config: WF_FOLDER_CONFIG_TYPE
+    wf_folder: Optional[str]
+    wf_prefix: Optional[str]
+    wf_folder_url: Optional[str]
+    path: Optional[Path]
+    abs_path: Optional[Path]
+# ---------------------------------------------------------------------------- +
+class WFFolderTable:
+    """Lookup table of WF_FOLDER_CONFIGs by (fi_key, wf_key, wf_purpose)."""
+    def __init__(self) -> None:
+        self._lock: threading.RLock = threading.RLock()
+        self._entries: Dict[WF_FOLDER_KEY_TYPE, WFFolderEntry] = {}
+        # fi_key: (collection object, FI_FOLDER, BDM_FOLDER) when built
+        self._sources: Dict[str, Tuple[Any, str, str]] = {}
+        self.build_count: int = 0
+
+    def is_current(self, fi_key: str,
+                   fi_wf_fldr_cfg: Optional[FI_WF_FOLDER_CONFIG_COLLECTION_TYPE],
+                   fi_folder: str, bdm_folder: str) -> bool:
+        """True if the entries of fi_key were built from these values."""
+        source = self._sources.get(fi_key)
+        return (source is not None and source[0] is fi_wf_fldr_cfg and
+                source[1] == fi_folder and source[2] == bdm_folder)
+
+    def build_fi(self, fi_key: str,
+                 fi_wf_fldr_cfg: Optional[FI_WF_FOLDER_CONFIG_COLLECTION_TYPE],
+                 fi_folder: str, bdm_folder: str,
+                 fi_path_str: Optional[str]) -> None:
+        """Build the entries of fi_key, replacing its previous entries.
+
+        Args:
+            fi_key (str): The FI_KEY.
+            fi_wf_fldr_cfg (Dict): The FI_WF_FOLDER_CONFIG_COLLECTION of fi_key.
+            fi_folder (str): The FI_FOLDER value of fi_key.
+            bdm_folder (str): The BDM_FOLDER value.
+            fi_path_str (str): The FI_FOLDER path, as bsm_FI_FOLDER_path_str(),
+                None to build the entries without paths.
+        """
+        try:
+            with self._lock:
+                self.invalidate(fi_key)
+                for wf_key, wfc_list in (fi_wf_fldr_cfg or {}).items():
+                    for wfc in wfc_list or []:
+                        key = (fi_key, wf_key, wfc[WF_PURPOSE])
+                        if key in self._entries:
+                            continue  # The first config for a purpose is used.
+                        wf_folder = wfc.get(WF_FOLDER)
+                        path: Optional[Path] = None
+                        if wf_folder and fi_path_str:
+                            path = (Path(fi_path_str) / wf_folder).expanduser()
+                        self._entries[key] = WFFolderEntry(
+                            wf_folder_config=wfc,
+                            wf_folder=wf_folder,
+                            wf_prefix=wfc.get(WF_PREFIX),
+                            wf_folder_url=wfc.get(WF_FOLDER_URL),
+                            path=path,
+                            abs_path=path.resolve() if path else None)
+                self._sources[fi_key] = (fi_wf_fldr_cfg, fi_folder, bdm_folder)
+                self.build_count += 1
+        except Exception as e:
+            logger.error(p3u.exc_err_msg(e))
+            raise
+
+    def invalidate(self, fi_key: Optional[str] = None) -> None:
+        """Remove the entries of fi_key, or all FI's, to rebuild on lookup."""
+        with self._lock:
+            if fi_key is None:
+                self._entries.clear()
+                self._sources.clear()
+                return
+            if self._sources.pop(fi_key, None) is None:
+                return
+            for key in [k for k in self._entries if k[0] == fi_key]:
+                del self._entries[key]
+
+    def get(self, fi_key: str, wf_key: str,
+            wf_purpose: str) -> Optional[WFFolderEntry]:
+        """Return the entry for (fi_key, wf_key, wf_purpose), None if not
+        configured."""
+        return self._entries.get((fi_key, wf_key, wf_purpose))
@@ -0,0 +1,291 @@
+# ---------------------------------------------------------------------------- +
+#region bdm_workbook_data_collection.py module
+""" bdm_workbook_data_collection.py implements LazyWorkbookDataCollection.
+
+    A FI_WORKBOOK_DATA_COLLECTION is a dict of wb_id: BDMWorkbook. When the
+    BDM is rehydrated lazily, the collection holds the workbook dicts loaded
+    from the BDM_STORE, and each one is converted to a BDMWorkbook on first
+    access through the usual dict methods. Metadata can be read without
+    materializing a BDMWorkbook with wdc_attribute().
+
+    wdc_reconcile() compares a collection with the workbooks discovered in
+    storage, keyed by wb_id, and returns the changes as a WDCReconcileSummary.
+"""
+#endregion bdm_workbook_data_collection.py module
+# ---------------------------------------------------------------------------- +
+#region Imports
+# python standard library modules and packages
+import logging, copy, threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+# third-party modules and packages
+import p3_utils as p3u
+# local modules and packages
+from budman_namespace.design_language_namespace import (
+    WB_URL, WB_NAME, WF_FOLDER, WB_TYPE, WORKBOOK_DATA_COLLECTION_TYPE)
+from budman_namespace.bdm_workbook_class import BDMWorkbook
+#endregion Imports
+# ---------------------------------------------------------------------------- +
+#region Globals and Constants
+logger = logging.getLogger(__name__)
+_MISSING = object()
+#endregion Globals and Constants
+# ---------------------------------------------------------------------------- +
+class LazyWorkbookDataCollection(dict):
+    """A WORKBOOK_DATA_COLLECTION that materializes BDMWorkbooks on access.
+
+    Pending entries hold the BDM_STORE workbook dict, with the wb_type and
+    wf_folder_url values resolved during rehydration. Reading an entry with
+    [], get(), items(), values(), pop() or setdefault() replaces the dict
+    with a BDMWorkbook. Keys, len() and membership never materialize.
+    """
+    def __init__(self, pending: Optional[Dict[str, Tuple[dict, str, Optional[str]]]] = None) -> None:
+        """Create the collection from pending entries.
+
+        Args:
+            pending: wb_id: (wb_data dict, wb_type, wf_folder_url), in the
+                key order for the collection.
+        """
+        super().__init__()
+        self._pending: Dict[str, Tuple[str, Optional[str]]] = {}
+        self._lock: threading.Lock = threading.Lock()
+        for wb_id, (wb_data, wb_type, wf_folder_url) in (pending or {}).items():
+            self.add_pending(wb_id, wb_data, wb_type, wf_folder_url)
+
+    def add_pending(self, wb_id: str, wb_data: dict, wb_type: str,
+                    wf_folder_url: Optional[str]) -> None:
+        """Add wb_data for wb_id, to be materialized on first access."""
+        dict.__setitem__(self, wb_id, wb_data)
+        self._pending[wb_id] = (wb_type, wf_folder_url)
+
+    @property
+    def pending_count(self) -> int:
+        """Count of entries not materialized yet."""
+        return len(self._pending)
+
+    def is_materialized(self, wb_id: str) -> bool:
+        """True if wb_id is present as a BDMWorkbook."""
+        return wb_id in self and wb_id not in self._pending
+
+    def _materialize(self, wb_id: str) -> Any:
+        """Convert the pending entry for wb_id to a BDMWorkbook."""
+        with self._lock:
+            if wb_id not in self._pending:
+                return dict.__getitem__(self, wb_id)
+            wb_type, wf_folder_url = self._pending[wb_id]
+            wb_data: dict = dict.__getitem__(self, wb_id)
+            wb_object = BDMWorkbook(**BDMWorkbook.check_schema(wb_data))
+            wb_object.wb_type = wb_type
+            if wf_folder_url is not None:
+                wb_object.wf_folder_url = wf_folder_url
+            # Materializing is not a change to journal.
+            wb_object.wb_change_clear()
+            dict.__setitem__(self, wb_id, wb_object)
+            del self._pending[wb_id]
+            return wb_object
+
+    def _materialize_all(self) -> None:
+        for wb_id in list(self._pending):
+            self._materialize(wb_id)
+
+    def is_pending(self, wb_id: str) -> bool:
+        """True if wb_id is still a pending wb_data dict."""
+        return wb_id in self._pending
+
+    def raw_items(self) -> Iterator[Tuple[str, Any]]:
+        """Iterate (wb_id, BDMWorkbook or pending wb_data dict), no materializing."""
+        return iter(list(dict.items(self)))
+
+    def __getitem__(self, wb_id: str) -> BDMWorkbook:
+        if wb_id in self._pending:
+            return self._materialize(wb_id)
+        return dict.__getitem__(self, wb_id)
+
+    def get(self, wb_id: str, default: Any = None) -> Any:
+        if wb_id not in self:
+            return default
+        return self[wb_id]
+
+    def items(self):
+        self._materialize_all()
+        return dict.items(self)
+
+    def values(self):
+        self._materialize_all()
+        return dict.values(self)
+
+    def __setitem__(self, wb_id: str, value: Any) -> None:
+        self._pending.pop(wb_id, None)
+        dict.__setitem__(self, wb_id, value)
+
+    def __delitem__(self, wb_id: str) -> None:
+        self._pending.pop(wb_id, None)
+        dict.__delitem__(self, wb_id)
+
+    def pop(self, wb_id: str, default: Any = _MISSING) -> Any:
+        if wb_id in self._pending:
+            self._materialize(wb_id)
+        if default is _MISSING:
+            return dict.pop(self, wb_id)
+        return dict.pop(self, wb_id, default)
+
+    def popitem(self) -> Tuple[str, Any]:
+        self._materialize_all()
+        return dict.popitem(self)
+
+    def setdefault(self, wb_id: str, default: Any = None) -> Any:
+        if wb_id in self:
+            return self[wb_id]
+        self[wb_id] = default
+        return default
+
+    def update(self, *args, **kwargs) -> None:
+        for wb_id, value in dict(*args, **kwargs).items():
+            self[wb_id] = value
+
+    def clear(self) -> None:
+        self._pending.clear()
+        dict.clear(self)
+
+    def copy(self) -> "LazyWorkbookDataCollection":
+        new = LazyWorkbookDataCollection()
+        for wb_id, value in dict.items(self):
+            dict.__setitem__(new, wb_id, value)
+        new._pending = dict(self._pending)
+        return new
+
+    def __deepcopy__(self, memo: dict) -> "LazyWorkbookDataCollection":
+        new = LazyWorkbookDataCollection()
+        memo[id(self)] = new
+        for wb_id, value in dict.items(self):
+            dict.__setitem__(new, wb_id, copy.deepcopy(value, memo))
+        new._pending = dict(self._pending)
+        return new
+
+    def __reduce__(self):
+        # Pickle pending entries as they are, without materializing.
+        return (_lazy_wdc_unpickle, (list(dict.items(self)), dict(self._pending)))
+
+    def __repr__(self) -> str:
+        return (f"{type(self).__name__}(len={len(self)}, "
+                f"pending={len(self._pending)})")
+def _lazy_wdc_unpickle(items: list, pending: dict) -> LazyWorkbookDataCollection:
+    """Recreate a pickled LazyWorkbookDataCollection."""
+    new = LazyWorkbookDataCollection()
+    for wb_id, value in items:
+        dict.__setitem__(new, wb_id, value)
+    new._pending = pending
+    return new
+# ---------------------------------------------------------------------------- +
+#region wdc_attribute() function
+def wdc_attribute(wdc: WORKBOOK_DATA_COLLECTION_TYPE, wb_id: str,
+                  attribute: str) -> Any:
+    """Return a BDMWorkbook attribute for wb_id in wdc, without materializing.
+
+    Works for plain and lazy collections. For a pending workbook dict, the
+    value is normalized as BDMWorkbook would, wb_url and wf_folder lower case.
+    """
+    try:
+        if (isinstance(wdc, LazyWorkbookDataCollection) and
+            wb_id in wdc._pending):
+            if attribute == WB_TYPE:
+                return wdc._pending[wb_id][0]
+            value = dict.__getitem__(wdc, wb_id).get(attribute, None)
+            if attribute in (WB_URL, WF_FOLDER) and isinstance(value, str):
+                return value.lower()
+            return value
+        return getattr(wdc[wb_id], attribute, None)
+    except Exception as e:
+        logger.error(p3u.exc_err_msg(e))
+        raise
+#endregion wdc_attribute() function
+# ---------------------------------------------------------------------------- +
+#region wdc_reconcile() function
+@dataclass
+class WDCReconcileSummary:
+    """Changes from an FI_WORKBOOK_DATA_COLLECTION to the discovered workbooks."""
+    fi_key: str
+    added: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    # (old wb_id, new wb_id), the same wb_name found in another WF_FOLDER.
+    moved: List[Tuple[str, str]] = field(default_factory=list)
+    # (wb_id, old wb_type, new wb_type)
+    type_changed: List[Tuple[str, str, str]] = field(default_factory=list)
+    unchanged: int = 0
+    applied: bool = False
+
+    @property
+    def changed(self) -> bool:
+        """True if there is any change to apply."""
+        return bool(self.added or self.removed or self.moved or self.type_changed)
+
+    def summary_str(self) -> str:
+        """Return the change counts as a one line display string."""
+        return (f"FI_KEY('{self.fi_key}') added: {len(self.added)}  "
+                f"removed: {len(self.removed)}  moved: {len(self.moved)}  "
+                f"type changed: {len(self.type_changed)}  "
+                f"unchanged: {self.unchanged}"
+                f"{'' if self.applied or not self.changed else '  (not applied)'}")
+
+    def display_str(self, pad: str = "") -> str:
+        """Return the summary line and one line per change."""
+        lines = [f"{pad}{self.summary_str()}"]
+        lines += [f"{pad}  + {wb_id}" for wb_id in self.added]
+        lines += [f"{pad}  - {wb_id}" for wb_id in self.removed]
+        lines += [f"{pad}  > {old} -> {new}" for old, new in self.moved]
+        lines += [f"{pad}  ~ {wb_id}: {old} -> {new}" 
+                  for wb_id, old, new in self.type_changed]
+        return "\n".join(lines)
+
+def wdc_reconcile(fi_key: str, wdc: Optional[WORKBOOK_DATA_COLLECTION_TYPE],
+                  disc_wdc: Dict[str, BDMWorkbook],
+                  scanned_wf_folders: Set[str]) -> WDCReconcileSummary:
+    """Return the changes from wdc to the discovered workbooks in disc_wdc.
+
+    One pass over each collection, keyed by wb_id, reading wdc with 
+    wdc_attribute() so a lazy collection is not materialized. A workbook of
+    wdc not discovered is only removed, or moved, if its WF_FOLDER is in 
+    scanned_wf_folders, lower case, where it would have been discovered.
+
+    Args:
+        fi_key (str): The FI_KEY of the collections.
+        wdc (WORKBOOK_DATA_COLLECTION_TYPE): The FI_WORKBOOK_DATA_COLLECTION.
+        disc_wdc (Dict[str, BDMWorkbook]): The workbooks found in storage.
+        scanned_wf_folders (Set[str]): The WF_FOLDERs scanned for disc_wdc.
+    """
+    try:
+        summary = WDCReconcileSummary(fi_key)
+        wdc = wdc if wdc is not None else {}
+        # wb_name: wb_id of the discovered workbooks not in wdc.
+        added: Dict[str, str] = {}
+        # wb_ids added, in discovery order, a dict for O(1) removal on a move.
+        added_ids: Dict[str, None] = {}
+        for wb_id, disc_wb in disc_wdc.items():
+            if wb_id not in wdc:
+                added.setdefault(disc_wb.wb_name.lower(), wb_id)
+                added_ids[wb_id] = None
+                continue
+            wb_type = wdc_attribute(wdc, wb_id, WB_TYPE)
+            if wb_type != disc_wb.wb_type:
+                summary.type_changed.append((wb_id, wb_type, disc_wb.wb_type))
+            else:
+                summary.unchanged += 1
+        for wb_id in wdc.keys():
+            if wb_id in disc_wdc:
+                continue
+            wf_folder = wdc_attribute(wdc, wb_id, WF_FOLDER)
+            if (wf_folder or "").lower() not in scanned_wf_folders:
+                continue  # Not scanned, leave it.
+            new_wb_id = added.pop((wdc_attribute(wdc, wb_id, WB_NAME) or "").lower(), None)
+            if new_wb_id is not None:
+                summary.moved.append((wb_id, new_wb_id))
+                del added_ids[new_wb_id]
+            else:
+                summary.removed.append(wb_id)
+        summary.added = list(added_ids)
+        return summary
+    except Exception as e:
+        logger.error(p3u.exc_err_msg(e))
+        raise
+#endregion wdc_reconcile() function
+# ---------------------------------------------------------------------------- +
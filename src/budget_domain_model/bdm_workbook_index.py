@@ -0,0 +1,275 @@
+# ---------------------------------------------------------------------------- +
+#region bdm_workbook_index.py module
+""" bdm_workbook_index.py implements the WorkbookIndex class.
+
+    WorkbookIndex is a multi-key index of the workbooks in the
+    FI_WORKBOOK_DATA_COLLECTIONs of the BDM. Workbooks are indexed by wb_id,
+    wb_index, wb_name, wb_url, wb_type, fi_key, wf_key, wf_purpose and the
+    (wf_key, wf_purpose) pair, so lookups do not scan the collections.
+
+    The wb_index of a workbook is its position in the key order of its
+    FI_WORKBOOK_DATA_COLLECTION. The index holds wb_id values, not workbook
+    objects, and reads attributes with wdc_attribute(), so indexing a
+    LazyWorkbookDataCollection does not materialize workbooks. String values
+    are indexed in lower case, lookups are case-insensitive.
+
+    The BudgetDomainModel maintains the index as workbooks are added and
+    removed. An FI is re-indexed if its collection object or length no
+    longer match the index, see is_current(). Workbooks changed in place,
+    renamed or replaced by another BDMWorkbook, carry a wb_change_stamp
+    after the FI was indexed and are re-indexed, see reindex_changed().
+"""
+#endregion bdm_workbook_index.py module
+# ---------------------------------------------------------------------------- +
+#region Imports
+# python standard library modules and packages
+import logging, threading
+from typing import Any, Dict, List, Optional, Tuple
+
+# third-party modules and packages
+import p3_utils as p3u
+
+# local modules and packages
+from budman_namespace.bdm_workbook_class import (
+    BDMWorkbook, bdm_workbook_change_mark, bdm_workbook_last_change)
+from budman_namespace.design_language_namespace import (
+    WB_ID, WB_INDEX, WB_NAME, WB_URL, WB_TYPE, FI_KEY, WF_KEY, WF_PURPOSE,
+    WORKBOOK_DATA_COLLECTION_TYPE)
+from .bdm_workbook_data_collection import (LazyWorkbookDataCollection,
+                                           wdc_attribute)
+#endregion Imports
+# ---------------------------------------------------------------------------- +
+#region Globals and Constants
+logger = logging.getLogger(__name__)
+# Workbook reference in the index: (fi_key, wb_id)
+WB_REF_TYPE = Tuple[str, str]
+#endregion Globals and Constants
+# ---------------------------------------------------------------------------- +
+class WorkbookIndex:
+    """Multi-key index of workbooks in the FI_WORKBOOK_DATA_COLLECTIONs."""
+    INDEX_KEYS = (WB_ID, WB_NAME, WB_URL, WB_TYPE, FI_KEY, WF_KEY, WF_PURPOSE)
+
+    def __init__(self) -> None:
+        self._lock: threading.RLock = threading.RLock()
+        # fi_key: the indexed wdc object, wb_ids in wb_index order, positions
+        self._wdcs: Dict[str, WORKBOOK_DATA_COLLECTION_TYPE] = {}
+        self._wb_ids: Dict[str, List[str]] = {}
+        self._positions: Dict[str, Optional[Dict[str, int]]] = {}
+        # fi_key: change mark, workbooks stamped after it are re-indexed
+        self._marks: Dict[str, int] = {}
+        # (fi_key, wb_id): indexed attribute values
+        self._values: Dict[WB_REF_TYPE, Dict[str, Any]] = {}
+        # key: value: {(fi_key, wb_id): None}, dicts keep insertion order
+        self._by_key: Dict[str, Dict[Any, Dict[WB_REF_TYPE, None]]] = {
+            k: {} for k in self.INDEX_KEYS}
+        self._by_purpose: Dict[Tuple[Any, Any], Dict[WB_REF_TYPE, None]] = {}
+
+    # ------------------------------------------------------------------------ +
+    #region    Index maintenance methods
+    def rebuild(self, fi_collection: Dict[str, dict],
+                wdc_key: str) -> None:
+        """Re-index all FI's, the FI_OBJECT collection is wdc at wdc_key."""
+        with self._lock:
+            for fi_key in list(self._wdcs.keys()):
+                if fi_key not in fi_collection:
+                    self.remove_fi(fi_key)
+            for fi_key, fi_obj in fi_collection.items():
+                self.index_fi(fi_key, fi_obj.get(wdc_key))
+
+    def is_current(self, fi_key: str,
+                   wdc: Optional[WORKBOOK_DATA_COLLECTION_TYPE]) -> bool:
+        """True if fi_key is indexed for this wdc object at its length."""
+        return (fi_key in self._wdcs and self._wdcs[fi_key] is wdc and
+                len(self._wb_ids[fi_key]) == (len(wdc) if wdc else 0))
+
+    def index_fi(self, fi_key: str,
+                 wdc: Optional[WORKBOOK_DATA_COLLECTION_TYPE]) -> None:
+        """Index all workbooks of fi_key, replacing its previous entries."""
+        try:
+            with self._lock:
+                self.remove_fi(fi_key)
+                self._wdcs[fi_key] = wdc
+                self._marks[fi_key] = bdm_workbook_change_mark()
+                self._wb_ids[fi_key] = []
+                self._positions[fi_key] = {}
+                for wb_id in (wdc.keys() if wdc else ()):
+                    self._append(fi_key, wb_id)
+        except Exception as e:
+            logger.error(p3u.exc_err_msg(e))
+            raise
+
+    def remove_fi(self, fi_key: str) -> None:
+        """Remove all entries of fi_key from the index."""
+        with self._lock:
+            for wb_id in self._wb_ids.get(fi_key, []):
+                self._unindex_values((fi_key, wb_id))
+            self._wdcs.pop(fi_key, None)
+            self._wb_ids.pop(fi_key, None)
+            self._positions.pop(fi_key, None)
+            self._marks.pop(fi_key, None)
+
+    def reindex_changed(self, fi_key: str) -> int:
+        """Re-index the workbooks of fi_key changed since it was indexed.
+
+        Only BDMWorkbooks are checked, pending workbooks of a lazy
+        collection are not materialized. Returns the count re-indexed.
+        """
+        try:
+            with self._lock:
+                mark = self._marks.get(fi_key)
+                if mark is None or bdm_workbook_last_change() <= mark:
+                    return 0
+                self._marks[fi_key] = bdm_workbook_change_mark()
+                wdc = self._wdcs[fi_key]
+                items = (wdc.raw_items() if isinstance(wdc, LazyWorkbookDataCollection)
+                         else wdc.items() if wdc else ())
+                changed = [wb_id for wb_id, wb in items
+                           if isinstance(wb, BDMWorkbook) and 
+                           wb.wb_change_stamp > mark]
+                for wb_id in changed:
+                    self.add(fi_key, wb_id)
+                return len(changed)
+        except Exception as e:
+            logger.error(p3u.exc_err_msg(e))
+            raise
+
+    def add(self, fi_key: str, wb_id: str) -> None:
+        """Index wb_id after it was added to, or changed in, the fi_key wdc.
+
+        A wb_id already indexed keeps its wb_index, its values are updated.
+        """
+        try:
+            with self._lock:
+                if fi_key not in self._wdcs:
+                    raise KeyError(f"FI_KEY('{fi_key}') is not indexed.")
+                wb_ref = (fi_key, wb_id)
+                if wb_ref in self._values:
+                    self._unindex_values(wb_ref)
+                    self._index_values(wb_ref)
+                else:
+                    self._append(fi_key, wb_id)
+        except Exception as e:
+            logger.error(p3u.exc_err_msg(e))
+            raise
+
+    def remove(self, fi_key: str, wb_id: str) -> None:
+        """Remove wb_id after it was removed from the fi_key wdc."""
+        with self._lock:
+            wb_ref = (fi_key, wb_id)
+            if wb_ref not in self._values:
+                return
+            self._unindex_values(wb_ref)
+            self._wb_ids[fi_key].remove(wb_id)
+            # Later positions shift, recompute on the next lookup.
+            self._positions[fi_key] = None
+
+    def _append(self, fi_key: str, wb_id: str) -> None:
+        positions = self._fi_positions(fi_key)
+        positions[wb_id] = len(self._wb_ids[fi_key])
+        self._wb_ids[fi_key].append(wb_id)
+        self._index_values((fi_key, wb_id))
+
+    def _index_values(self, wb_ref: WB_REF_TYPE) -> None:
+        fi_key, wb_id = wb_ref
+        wdc = self._wdcs[fi_key]
+        values: Dict[str, Any] = {}
+        for key in self.INDEX_KEYS:
+            if key == WB_ID:
+                value = wb_id
+            elif key == FI_KEY:
+                value = fi_key
+            else:
+                value = wdc_attribute(wdc, wb_id, key)
+            value = self._normalize(value)
+            values[key] = value
+            self._by_key[key].setdefault(value, {})[wb_ref] = None
+        self._by_purpose.setdefault(
+            (values[WF_KEY], values[WF_PURPOSE]), {})[wb_ref] = None
+        self._values[wb_ref] = values
+
+    def _unindex_values(self, wb_ref: WB_REF_TYPE) -> None:
+        values = self._values.pop(wb_ref, None)
+        if values is None:
+            return
+        for key, value in values.items():
+            self._discard(self._by_key[key], value, wb_ref)
+        self._discard(self._by_purpose, (values[WF_KEY], values[WF_PURPOSE]),
+                      wb_ref)
+
+    @staticmethod
+    def _discard(mapping: Dict[Any, Dict[WB_REF_TYPE, None]], value: Any,
+                 wb_ref: WB_REF_TYPE) -> None:
+        refs = mapping.get(value)
+        if refs is not None:
+            refs.pop(wb_ref, None)
+            if not refs:
+                del mapping[value]
+
+    @staticmethod
+    def _normalize(value: Any) -> Any:
+        return value.lower() if isinstance(value, str) else value
+
+    def _fi_positions(self, fi_key: str) -> Dict[str, int]:
+        positions = self._positions.get(fi_key)
+        if positions is None:
+            positions = {wb_id: i for i, wb_id in enumerate(self._wb_ids[fi_key])}
+            self._positions[fi_key] = positions
+        return positions
+    #endregion Index maintenance methods
+    # ------------------------------------------------------------------------ +
+    #region    Lookup methods
+    def count(self, fi_key: Optional[str] = None) -> int:
+        """Count of indexed workbooks, for fi_key or all FI's."""
+        if fi_key is not None:
+            return len(self._wb_ids.get(fi_key, []))
+        return len(self._values)
+
+    def wb_ids(self, fi_key: str) -> List[str]:
+        """The wb_ids of fi_key in wb_index order."""
+        return list(self._wb_ids.get(fi_key, []))
+
+    def wb_index(self, fi_key: str, wb_id: str) -> int:
+        """Return the wb_index of wb_id in the fi_key wdc, -1 if not found."""
+        with self._lock:
+            if fi_key not in self._wb_ids:
+                return -1
+            return self._fi_positions(fi_key).get(wb_id, -1)
+
+    def wb_id_at(self, fi_key: str, wb_index: int) -> Optional[str]:
+        """Return the wb_id at wb_index in the fi_key wdc, None if invalid."""
+        wb_ids = self._wb_ids.get(fi_key, [])
+        if isinstance(wb_index, int) and 0 <= wb_index < len(wb_ids):
+            return wb_ids[wb_index]
+        return None
+
+    def find(self, key: str, value: Any,
+             fi_key: Optional[str] = None) -> List[WB_REF_TYPE]:
+        """Return the (fi_key, wb_id) of workbooks with key equal to value.
+
+        Args:
+            key (str): WB_INDEX or one of INDEX_KEYS.
+            value (Any): The value to match, strings ignore case.
+            fi_key (str): Optional, only match workbooks of this FI.
+                Required for WB_INDEX.
+        """
+        with self._lock:
+            if key == WB_INDEX:
+                wb_id = self.wb_id_at(fi_key, value)
+                return [(fi_key, wb_id)] if wb_id is not None else []
+            if key not in self._by_key:
+                raise KeyError(f"Workbook attribute '{key}' is not indexed.")
+            refs = self._by_key[key].get(self._normalize(value), {})
+            return [r for r in refs if fi_key is None or r[0] == fi_key]
+
+    def find_purpose(self, wf_key: str, wf_purpose: str,
+                     fi_key: Optional[str] = None) -> List[WB_REF_TYPE]:
+        """Return the (fi_key, wb_id) of workbooks for wf_key and wf_purpose,
+        in wb_index order within each FI."""
+        with self._lock:
+            refs = self._by_purpose.get(
+                (self._normalize(wf_key), self._normalize(wf_purpose)), {})
+            refs = [r for r in refs if fi_key is None or r[0] == fi_key]
+            fi_order = {k: i for i, k in enumerate(self._wdcs)}
+            return sorted(refs, key=lambda r: (fi_order[r[0]], self.wb_index(*r)))
+    #endregion Lookup methods
+    # ------------------------------------------------------------------------ +
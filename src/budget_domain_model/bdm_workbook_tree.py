@@ -1,23 +1,37 @@
 # ---------------------------------------------------------------------------- +
 #region bdm_workbook_tree.py module
 """ bdm_workbook_tree.py implements the class BDMWorkbookTree.
+
+    The BDMWorkbookTree is maintained incrementally. Workbook nodes are
+    placed under the WF_FOLDER_CONFIG node registered for their workbook
+    group, (fi_key, wf_key, wf_purpose, wf_folder), and are added, moved
+    and removed one at a time as workbooks change. Each change to the tree
+    nodes is recorded with a version number, so views can apply only the
+    changes since the version they last showed, see changes_since().
 """
 #endregion bdm_workbook_tree.py module
 #------------------------------------------------------------------------------+
 #region Imports
 # python standard library modules and packages
 import logging
-from typing import Optional, Union, List
+from typing import Optional, Union, List, Dict, Tuple, Callable, Any
 # third-party modules and packages
 from treelib import Tree, Node
 import p3_utils as p3u, p3logging as p3l, p3_mvvm as p3m
 # local modules and packages
-from budman_namespace import (VALID_WBT_NODE_TYPES, BDM)
+from budman_namespace import (VALID_WBT_NODE_TYPES, BDM, BDM_WORKBOOK)
 from .bdm_workbook_tree_node import BDMWorkbookTreeNode
 #endregion Imports
 # ---------------------------------------------------------------------------- +
 #region Globals and Constants
 logger = logging.getLogger(__name__)  # create logger for the module
+# Workbook group: (fi_key, wf_key, wf_purpose, wf_folder)
+WB_GROUP_TYPE = Tuple[str, str, str, str]
+# Tree change ops recorded for views, with the node identifier.
+WBT_CHANGE_ADD = "add"
+WBT_CHANGE_REMOVE = "remove"
+WBT_CHANGE_MOVE = "move"
+WBT_CHANGE_UPDATE = "update"
 #endregion Globals and Constants
 # ---------------------------------------------------------------------------- +
 class BDMWorkbookTree(Tree):
@@ -38,6 +52,15 @@ class BDMWorkbookTree(Tree):
         """
         super().__init__()
         self._root_node_id: str = None
+        # Workbook group: WF_FOLDER_CONFIG node identifier
+        self._wf_folder_node_ids: Dict[WB_GROUP_TYPE, str] = {}
+        # fi_key: {wb_id: workbook group} of the workbooks in the tree
+        self._wb_groups: Dict[str, Dict[str, WB_GROUP_TYPE]] = {}
+        # fi_key: (wdc object, length) the FI workbook nodes were synced from
+        self._wdc_synced: Dict[str, Tuple[Any, int]] = {}
+        # Change log, _changes[i] is version _changes_base + i + 1
+        self._changes: List[Tuple[str, Any]] = []
+        self._changes_base: int = 0
     #endregion    __init__() method
     # ------------------------------------------------------------------------ +
     #region    Class Properties
@@ -45,6 +68,11 @@ class BDMWorkbookTree(Tree):
     def root_node_id(self) -> Optional[str]:
         """Get the root node identifier."""
         return self._root_node_id
+
+    @property
+    def version(self) -> int:
+        """The version of the tree, incremented by each node change."""
+        return self._changes_base + len(self._changes)
     #endregion   Class Properties
     # ------------------------------------------------------------------------ +
     #endregion BDMWorkbookTree class intrinsics
@@ -57,7 +85,8 @@ class BDMWorkbookTree(Tree):
                  tag: str,
                  identifier: Optional[Union[str, int]] = None,
                  data: Optional[dict] = None,
-                 parent_id: Optional[str] = None) -> BDMWorkbookTreeNode:
+                 parent_id: Optional[str] = None,
+                 data_loader: Optional[Callable[[], Any]] = None) -> BDMWorkbookTreeNode:
         """Add a BDMWorkbookTreeNode to the tree.
 
         Args:
@@ -65,6 +94,8 @@ class BDMWorkbookTree(Tree):
             tag (str): The display name of the node.
             identifier (Optional[Union[str, int]]): Unique identifier for the node.
             data (Optional[dict]): Additional data associated with the node.
+            parent_id (Optional[str]): The parent node identifier.
+            data_loader (Optional[Callable]): Provides data on first access.
 
         Returns:
             BDMWorkbookTreeNode: The added node.
@@ -85,7 +116,8 @@ class BDMWorkbookTree(Tree):
             node_type=node_type,
             tag=tag,
             identifier=identifier,
-            data=data
+            data=data,
+            data_loader=data_loader
         )
         if self.size() == 0:
             if node_type != BDM:
@@ -96,6 +128,115 @@ class BDMWorkbookTree(Tree):
             self.add_node(this_node)  # Add as root node
         else:
             self.add_node(this_node, parent=parent_id)
+        self._changes.append((WBT_CHANGE_ADD, identifier))
         return this_node
     #endregion    BDMWorkbookTree class methods
+    # ------------------------------------------------------------------------ +
+    #region    Workbook node maintenance methods
+    def register_wf_folder_node(self, wb_group: WB_GROUP_TYPE,
+                                wf_folder_node_id: str) -> None:
+        """Register the WF_FOLDER_CONFIG node for workbooks in wb_group."""
+        self._wf_folder_node_ids[wb_group] = wf_folder_node_id
+
+    def wf_folder_node_id(self, wb_group: WB_GROUP_TYPE) -> Optional[str]:
+        """Return the WF_FOLDER_CONFIG node identifier for wb_group."""
+        return self._wf_folder_node_ids.get(wb_group)
+
+    def put_workbook_node(self, fi_key: str, wb_id: str,
+                          wb_group: WB_GROUP_TYPE, tag: str,
+                          data_loader: Optional[Callable[[], Any]] = None,
+                          wb_index_loader: Optional[Callable[[], int]] = None
+                          ) -> Optional[BDMWorkbookTreeNode]:
+        """Add the workbook node for wb_id of fi_key, or move it to wb_group.
+
+        Workbooks in a group with no registered WF_FOLDER_CONFIG node are
+        left out of the tree, the node is removed if present. An existing
+        node takes the new tag and loaders, the workbook data collection
+        may have been replaced since it was added.
+
+        Returns:
+            BDMWorkbookTreeNode: The workbook node, None if not in the tree.
+        """
+        fi_groups = self._wb_groups.setdefault(fi_key, {})
+        parent_id = self._wf_folder_node_ids.get(wb_group)
+        old_group = fi_groups.get(wb_id)
+        if parent_id is None:
+            if old_group is not None:
+                self.remove_workbook_node(fi_key, wb_id)
+            return None
+        wb_node: Optional[BDMWorkbookTreeNode] = self.get_node(wb_id)
+        if old_group is None:
+            if wb_node is not None:
+                # wb_id is already in the tree for another FI.
+                logger.debug(f"Node with identifier '{wb_id}' already exists. Skipping add.")
+                return None
+            wb_node = self.add_tree_node(node_type=BDM_WORKBOOK, tag=tag,
+                                         identifier=wb_id, parent_id=parent_id,
+                                         data_loader=data_loader)
+            wb_node.wb_index_loader = wb_index_loader
+        else:
+            if old_group != wb_group:
+                self.move_node(wb_id, parent_id)
+                self._changes.append((WBT_CHANGE_MOVE, wb_id))
+            if wb_node.tag != tag:
+                wb_node.tag = wb_node.name = tag
+                self._changes.append((WBT_CHANGE_UPDATE, wb_id))
+            if data_loader is not None:
+                wb_node.data_loader = data_loader
+            if wb_index_loader is not None:
+                wb_node.wb_index_loader = wb_index_loader
+        fi_groups[wb_id] = wb_group
+        return wb_node
+
+    def remove_workbook_node(self, fi_key: str, wb_id: str) -> None:
+        """Remove the workbook node for wb_id of fi_key, if in the tree."""
+        if self._wb_groups.get(fi_key, {}).pop(wb_id, None) is None:
+            return
+        self.remove_tree_node(wb_id)
+
+    def remove_fi_node(self, fi_key: str) -> None:
+        """Remove the FI_OBJECT node of fi_key and all nodes below it."""
+        self._wb_groups.pop(fi_key, None)
+        self._wdc_synced.pop(fi_key, None)
+        self._wf_folder_node_ids = {g: nid for g, nid in
+                                    self._wf_folder_node_ids.items()
+                                    if g[0] != fi_key}
+        self.remove_tree_node(fi_key)
+
+    def remove_tree_node(self, identifier: str) -> None:
+        """Remove the node with identifier and its subtree, if present."""
+        if self.contains(identifier):
+            self.remove_node(identifier)
+            self._changes.append((WBT_CHANGE_REMOVE, identifier))
+
+    def workbook_ids(self, fi_key: str) -> List[str]:
+        """The wb_ids of fi_key with a node in the tree."""
+        return list(self._wb_groups.get(fi_key, {}))
+
+    def is_synced(self, fi_key: str, wdc: Any) -> bool:
+        """True if fi_key workbook nodes were synced from wdc, at its length."""
+        synced = self._wdc_synced.get(fi_key)
+        return (synced is not None and synced[0] is wdc and
+                synced[1] == (len(wdc) if wdc else 0))
+
+    def set_synced(self, fi_key: str, wdc: Any) -> None:
+        """Record fi_key workbook nodes as synced from wdc."""
+        self._wdc_synced[fi_key] = (wdc, len(wdc) if wdc else 0)
+
+    def changes_since(self, version: int) -> Optional[List[Tuple[str, Any]]]:
+        """Return the (op, node identifier) changes after version.
+
+        Returns:
+            List: The changes in order, None if they are no longer available
+            and the view must be rebuilt.
+        """
+        if version < self._changes_base or version > self.version:
+            return None
+        return self._changes[version - self._changes_base:]
+
+    def compact_changes(self) -> None:
+        """Discard the change log, views older than version must rebuild."""
+        self._changes_base = self.version
+        self._changes = []
+    #endregion    Workbook node maintenance methods
     # ------------------------------------------------------------------------ +
\ No newline at end of file
@@ -7,7 +7,7 @@
 #region Imports
 # python standard library modules and packages
 import logging
-from typing import Optional, Union, List
+from typing import Optional, Union, List, Callable, Any
 # third-party modules and packages
 from treelib import Tree, Node
 import p3_utils as p3u, p3logging as p3l, p3_mvvm as p3m
@@ -36,7 +36,8 @@ class BDMWorkbookTreeNode(Node):
                  node_type: str,
                  tag: str,
                  identifier: Optional[Union[str, int]] = None,
-                 data: Optional[dict] = None) -> None:
+                 data: Optional[dict] = None,
+                 data_loader: Optional[Callable[[], Any]] = None) -> None:
         """Initialize a BDMWorkbookTreeNode instance.
 
         Args:
@@ -44,12 +45,16 @@ class BDMWorkbookTreeNode(Node):
             tag (str): The display name of the node.
             identifier (Optional[Union[str, int]]): Unique identifier for the node.
             data (Optional[dict]): Additional data associated with the node.
+            data_loader (Optional[Callable]): Called for data on first access,
+                when data is None.
         """
+        self._data_loader: Optional[Callable[[], Any]] = data_loader
         super().__init__(tag=tag, identifier=identifier, data=data)
         # Additional initialization can be added here if needed
         self._node_type: str = node_type
         self._name:str = tag
         self._wb_index: int = -1
+        self._wb_index_loader: Optional[Callable[[], int]] = None
     #endregion    __init__() method
     # ------------------------------------------------------------------------ +
     #region    Class Properties
@@ -71,14 +76,48 @@ class BDMWorkbookTreeNode(Node):
         """Set the name of the node."""
         self._name = value
 
+    @property
+    def data(self) -> Any:
+        """Get the node data, from the data_loader on first access."""
+        if self._data is None and self._data_loader is not None:
+            self._data = self._data_loader()
+            self._data_loader = None
+        return self._data
+    @data.setter
+    def data(self, value: Any) -> None:
+        """Set the node data."""
+        self._data = value
+
+    @property
+    def data_loader(self) -> Optional[Callable[[], Any]]:
+        """Called for data on first access, None once the data is loaded."""
+        return self._data_loader
+    @data_loader.setter
+    def data_loader(self, value: Optional[Callable[[], Any]]) -> None:
+        """Set the data_loader, data loaded before is dropped."""
+        self._data = None
+        self._data_loader = value
+
     @property
     def wb_index(self) -> int:
-        """Get the index of the node."""
+        """Get the index of the node, from the wb_index_loader if set."""
+        if self._wb_index_loader is not None:
+            return self._wb_index_loader()
         return self._wb_index
     @wb_index.setter
     def wb_index(self, value: int) -> None:
         """Set the index of the node."""
+        self._wb_index_loader = None
         self._wb_index = value
+
+    @property
+    def wb_index_loader(self) -> Optional[Callable[[], int]]:
+        """Called for the current wb_index, which shifts as workbooks change."""
+        return self._wb_index_loader
+    @wb_index_loader.setter
+    def wb_index_loader(self, value: Optional[Callable[[], int]]) -> None:
+        """Set the wb_index_loader."""
+        self._wb_index_loader = value
     #endregion Class Properties
     # ------------------------------------------------------------------------ +
     #endregion BDMWorkbookTreeNode class intrinsics
@@ -96,9 +96,9 @@
 #region Imports
 # python standard library modules and packages
 from abc import ABCMeta
-import logging, os, getpass, time, copy
+import logging, os, getpass, time, copy, threading, functools
 from pathlib import Path
-from typing import List, Optional, Type, Generator, Dict, Tuple, Any, TYPE_CHECKING
+from typing import List, Optional, Set, Type, Generator, Dict, Tuple, Any, Callable, TYPE_CHECKING
 # third-party modules and packages
 import p3_utils as p3u, pyjson5, p3logging as p3l, p3_mvvm as p3m
 # from openpyxl import Workbook, load_workbook
@@ -108,18 +108,48 @@ from budman_namespace import *
 from .budget_domain_model_config import BDMConfig
 from .bdm_workbook_tree_node import BDMWorkbookTreeNode
 from .bdm_workbook_tree import BDMWorkbookTree
+from .bdm_workbook_data_collection import (LazyWorkbookDataCollection, 
+    wdc_attribute, wdc_reconcile, WDCReconcileSummary)
+from .bdm_workbook_index import WorkbookIndex
+from .bdm_wf_folder_table import WFFolderTable, WFFolderEntry
 from budget_storage_model import (
     BSMFileTree,
+    BSMChangeMonitor,
+    BSMChangeEvent,
+    BSM_CHANGE_ADDED,
+    BSM_CHANGE_REMOVED,
     bsm_BDMWorkbook_delete,
     bsm_verify_folder, 
     bsm_BDM_STORE_url_put,
+    bsm_journal_path,
+    bsm_journal_size,
+    bsm_journal_append,
+    bsm_journal_clear,
+    BSM_JOURNAL_COMPACT_SIZE,
+    BSM_JOURNAL_OP,
+    BSM_JOURNAL_OP_WB_PUT,
+    BSM_JOURNAL_OP_WB_DEL,
+    BSM_JOURNAL_OP_FI_PUT,
+    BSM_JOURNAL_OP_FI_DEL,
+    BSM_JOURNAL_OP_SET,
     bsm_get_workbook_names,
+    bsm_map_folders_concurrent,
     bsm_BDM_STORE_to_json
     )                              
 #endregion Imports
 # ---------------------------------------------------------------------------- +
 #region Globals and Constants
 logger = logging.getLogger(__name__)
+# Model attributes saved in a warm-start snapshot.
+BDM_WARM_START_ATTRIBUTES = (
+    BDM_ID, BDM_STORE_OBJECT, BDM_FILENAME, BDM_FILETYPE, BDM_FOLDER, BDM_URL,
+    BDM_FI_COLLECTION, BDM_WF_COLLECTION, BDM_OPTIONS, BDM_CREATED_DATE,
+    BDM_LAST_MODIFIED_DATE, BDM_LAST_MODIFIED_BY, BDM_DATA_CONTEXT,
+    BSM_FILE_TREE, BDM_VALID_PREFIXES, BDM_VALID_WB_TYPES)
+# The base of a workbook not in the journal base state.
+_JOURNAL_NO_WB = object()
+# Appended to the BSM_FILE_TREE node tags of the workbooks in the BDM.
+BDM_WORKBOOK_TAG_SUFFIX = " (BDMWorkbook)"
 # ---------------------------------------------------------------------------- +
 #endregion Globals and Constants
 # ---------------------------------------------------------------------------- +
@@ -173,6 +203,15 @@ class BudgetDomainModel(p3m.Model,metaclass=BDMSingletonMeta):
         setattr(self, BDM_WORKBOOK_TREE, None)
         setattr(self, BDM_VALID_PREFIXES, None)
         setattr(self, BDM_VALID_WB_TYPES, None)
+        # Storage change monitor, and a lock for the model's own multi-step updates.
+        self._bsm_change_monitor: Optional[BSMChangeMonitor] = None
+        self._bdm_lock: threading.RLock = threading.RLock()
+        # Bumped each time storage changes are applied, see bdm_STORAGE_CHANGES_apply().
+        self.bdm_storage_version: int = 0
+        self._bdm_workbook_index: WorkbookIndex = WorkbookIndex()
+        self._bdm_wf_folder_table: WFFolderTable = WFFolderTable()
+        # Persisted state as of the last save, for journaled saves.
+        self._bdm_journal_base: Optional[Dict[str, Any]] = None
         logger.debug("Complete:")
     #endregion BudgetDomainModel class constructor __init__()
     # ------------------------------------------------------------------------ +
@@ -606,7 +645,12 @@ class BudgetDomainModel(p3m.Model,metaclass=BDMSingletonMeta):
             # is that data was marshalled from a storage format such as json.
             # bdm_rehydrate() reinstates any native class objects based from 
             # the persisted storage format.
-            self.bdm_rehydrate()
+            self.bdm_rehydrate(
+                lazy=bool((self.bdm_options or {}).get(BDMO_LAZY_REHYDRATE, False)))
+            # In journaled mode, saves append the changes since this state,
+            # the rehydrated workbooks are not changes.
+            if self.bdm_journal_enabled:
+                self._bdm_journal_base = self._bdm_journal_state()
             # Set some values gathered from BDM configuration.
             self.bdm_valid_prefixes = self.bdm_configured_prefixes()
             self.bdm_valid_wb_types = VALID_WB_TYPE_VALUES
@@ -626,8 +670,9 @@ class BudgetDomainModel(p3m.Model,metaclass=BDMSingletonMeta):
     def bdm_refresh_trees(self) -> None:
         """Refresh both the BSM file tree and the BDM workbook tree."""
         try:
-            self.bdm_FILE_TREE_refresh()
-            self.bdm_WORKBOOK_TREE_refresh()
+            with self._bdm_lock:
+                self.bdm_FILE_TREE_refresh()
+                self.bdm_WORKBOOK_TREE_refresh()
             return
         except Exception as e:
             m = p3u.exc_err_msg(e)
@@ -635,12 +680,65 @@ class BudgetDomainModel(p3m.Model,metaclass=BDMSingletonMeta):
             raise
     #endregion bdm_refresh_trees() method 
     # ------------------------------------------------------------------------ +
+    #region    bdm_WARM_START methods
+    def bdm_WARM_START_state(self) -> Dict[str, Any]:
+        """Return the initialized model state to save in a warm-start snapshot.
+
+        The BDM_WORKBOOK_TREE and the WorkbookIndex are not included, their
+        nodes and loaders reference this live model object. They are rebuilt
+        in memory by bdm_WARM_START_restore(), without storage access.
+        """
+        try:
+            if not self.bdm_initialized:
+                raise ValueError("BudgetModel is not initialized.")
+            with self._bdm_lock:
+                state = {name: getattr(self, name) 
+                         for name in BDM_WARM_START_ATTRIBUTES}
+                state["_bdm_journal_base"] = self._bdm_journal_base
+                return state
+        except Exception as e:
+            logger.error(p3u.exc_err_msg(e))
+            raise
+
+    def bdm_WARM_START_restore(self, state: Dict[str, Any]) -> "BudgetDomainModel":
+        """Initialize the model from bdm_WARM_START_state() content.
+
+        Used instead of bdm_initialize() when a warm-start snapshot is
+        current, skipping the BDM_STORE load, bsm_initialize(), 
+        bdm_rehydrate() and the BSM_FILE_TREE scan.
+        """
+        try:
+            st = p3u.start_timer()
+            logger.info(f"BizEVENT: Model warm start for BudgetDomainModel (BDM)")
+            with self._bdm_lock:
+                for name in BDM_WARM_START_ATTRIBUTES:
+                    setattr(self, name, state[name])
+                self._bdm_journal_base = state["_bdm_journal_base"]
+                self._bdm_workbook_index = WorkbookIndex()
+                self._bdm_wf_folder_table.invalidate()
+                self.bdm_workbook_tree = None
+                self.bdm_WORKBOOK_TREE_refresh()
+                self.bdm_initialized = True
+            logger.debug(f"Complete: {p3u.stop_timer(st)}")
+            return self
+        except Exception as e:
+            logger.error(p3u.exc_err_msg(e))
+            raise
+
+    def bdm_WARM_START_sources(self) -> Tuple[List[Path], List[Path]]:
+        """Return the source files of the model state, and the folders
+        scanned for it, for the warm-start manifest."""
+        bdms_path = Path.from_uri(self.bdm_url)
+        file_paths = [bdms_path, bsm_journal_path(bdms_path)]
+        folder_paths = ([Path(p) for p in self.bsm_file_tree.folder_paths()]
+                        if self.bsm_file_tree is not None else [])
+        return file_paths, folder_paths
+    #endregion bdm_WARM_START methods
+    # ------------------------------------------------------------------------ +
     #region    bdm_FILE_TREE_refresh()
     def bdm_FILE_TREE_refresh(self) -> None:
         """Refresh the BSM file tree."""
         try:
-            if self.bsm_file_tree is not None:
-                self.bsm_file_tree = None
             # Build a list of all FI_FOLDER urls
             fi_folder_urls: List[str] = []
             for fi_key in self.bdm_fi_collection.keys():
@@ -664,24 +762,45 @@ class BudgetDomainModel(p3m.Model,metaclass=BDMSingletonMeta):
                         md = {WF_KEY: wf_key, WF_PURPOSE: wf_purpose}
                         wf_folder_config_metadata[wf_folder_url] = md
 
-            # Rebuild the BSM_FILE_TREE
-            self.bsm_file_tree = BSMFileTree(
-                folder_url=bdm_folder_url,
-                valid_prefixes=self.bdm_valid_prefixes,
-                valid_wb_types=self.bdm_valid_wb_types)
-            
+            # Reuse the BSM_FILE_TREE with an incremental scan when possible,
+            # otherwise rebuild it.
+            ft: BSMFileTree = self.bsm_file_tree
+            if (ft is not None and ft.folder_url == bdm_folder_url and
+                ft.valid_prefixes == self.bdm_valid_prefixes and
+                ft.valid_wb_types == self.bdm_valid_wb_types):
+                ft.update_file_tree()
+            else:
+                self.bsm_file_tree = BSMFileTree(
+                    folder_url=bdm_folder_url,
+                    valid_prefixes=self.bdm_valid_prefixes,
+                    valid_wb_types=self.bdm_valid_wb_types)
+            # Clear the marks of a previous refresh, on a reused tree or one
+            # from the snapshot, workbooks may have left the BDM since.
+            self.bsm_file_tree.reset_metadata(BDM_WORKBOOK_TAG_SUFFIX)
+
+            # Index the workbooks by wb_url once, without materializing
+            # workbooks from a lazy FI_WORKBOOK_DATA_COLLECTION.
+            wb_url_index: Dict[str, Tuple[WORKBOOK_DATA_COLLECTION_TYPE, str]] = {}
+            for fi_key, fi_obj in self.bdm_fi_collection.items():
+                wdc = fi_obj.get(FI_WORKBOOK_DATA_COLLECTION) or {}
+                for wb_id in wdc.keys():
+                    wb_url = wdc_attribute(wdc, wb_id, WB_URL)
+                    if isinstance(wb_url, str):
+                        wb_url_index.setdefault(wb_url, (wdc, wb_id))
             # Update the BSMFile metadata with more analysis
             for bsm_file in self.bsm_file_tree.all_files():
-                wb = self.bdm_WORKBOOK_DATA_COLLECTION_find(WB_URL, bsm_file.file_url)
-                if wb is not None:
-                    ft_node: Node = self.bsm_file_tree.file_tree.get_node(wb.wb_url)
-                    if ft_node is not None:
-                        ft_node.tag += " (BDMWorkbook)"
-                    bsm_file.in_bdm = wb is not None
-                    bsm_file.wb_type = wb.wb_type
-                    bsm_file.type = BDMWorkbook.__name__
-                    bsm_file.wf_key = wb.wf_key
-                    bsm_file.wf_purpose = wb.wf_purpose
+                wb_url = bsm_file.file_url
+                if wb_url not in wb_url_index:
+                    continue
+                wdc, wb_id = wb_url_index[wb_url]
+                ft_node: Node = self.bsm_file_tree.file_tree.get_node(wb_url)
+                if ft_node is not None:
+                    ft_node.tag += BDM_WORKBOOK_TAG_SUFFIX
+                bsm_file.in_bdm = True
+                bsm_file.wb_type = wdc_attribute(wdc, wb_id, WB_TYPE)
+                bsm_file.type = BDMWorkbook.__name__
+                bsm_file.wf_key = wdc_attribute(wdc, wb_id, WF_KEY)
+                bsm_file.wf_purpose = wdc_attribute(wdc, wb_id, WF_PURPOSE)
 
             for bsm_folder in self.bsm_file_tree.all_folders():
                 # Update the workflow metadata for the folders in the BSM_FILE_TREE.
@@ -699,8 +818,139 @@ class BudgetDomainModel(p3m.Model,metaclass=BDMSingletonMeta):
             m = p3u.exc_err_msg(e)
             logger.error(m)
             raise
+
+    def bdm_FILE_TREE_current(self) -> BSMFileTree:
+        """Return the BSM file tree, up to date with storage.
+
+        While the change monitor runs, it keeps the BSM_FILE_TREE current
+        and bumps bdm_storage_version on each change, so the tree is returned
+        as is. Otherwise storage is rescanned, holding the model lock, by 
+        bdm_FILE_TREE_refresh().
+        """
+        with self._bdm_lock:
+            if self.bsm_file_tree is None or not self.bdm_CHANGE_MONITOR_running:
+                self.bdm_FILE_TREE_refresh()
+            return self.bsm_file_tree
     #endregion bdm_FILE_TREE_refresh()
     # ------------------------------------------------------------------------ +
+    #region    bdm_CHANGE_MONITOR methods
+    def bdm_CHANGE_MONITOR_start(self, poll_interval: Optional[float] = None,
+                                 on_changes: Optional[Callable[[List[BSMChangeEvent]], Any]] = None) -> None:
+        """Start watching the FI and WF folders for storage changes.
+
+        Changes found by the monitor are passed to on_changes on the monitor
+        thread. An app with a command processor passes a callback queueing
+        them as a cmd, so bdm_STORAGE_CHANGES_apply() runs with the model
+        lock held to write, like any other change to the model. Without
+        on_changes, bdm_STORAGE_CHANGES_apply() runs on the monitor thread.
+        Either way the BSM_FILE_TREE, BDM_WORKBOOK_TREE and 
+        FI_WORKBOOK_DATA_COLLECTIONs stay current without a full refresh.
+
+        Args:
+            poll_interval (float): Optional, seconds between polls.
+            on_changes (Callable): Optional, called with each change set.
+        """
+        try:
+            self.bdm_CHANGE_MONITOR_stop()
+            monitor = BSMChangeMonitor(
+                on_changes=on_changes or self.bdm_STORAGE_CHANGES_apply)
+            if poll_interval is not None:
+                monitor.poll_interval = poll_interval
+            for fi_key in self.bdm_fi_collection.keys():
+                monitor.watch(self.bsm_FI_FOLDER_abs_path(fi_key).as_uri())
+                for wfc_list in self.bdm_FI_WF_FOLDER_CONFIG_COLLECTION(fi_key).values():
+                    for wfc in wfc_list:
+                        if wfc[WF_FOLDER_URL] is not None:
+                            monitor.watch(wfc[WF_FOLDER_URL])
+            monitor.start()
+            self._bsm_change_monitor = monitor
+            logger.info(f"BizEVENT: Storage change monitor watching "
+                        f"{len(monitor.watched_folders)} folders.")
+        except Exception as e:
+            m = p3u.exc_err_msg(e)
+            logger.error(m)
+            raise
+
+    @property
+    def bdm_CHANGE_MONITOR_running(self) -> bool:
+        """True while the storage change monitor is watching for changes."""
+        return self._bsm_change_monitor is not None
+
+    def bdm_CHANGE_MONITOR_stop(self) -> None:
+        """Stop the storage change monitor, if it is running."""
+        if self._bsm_change_monitor is not None:
+            self._bsm_change_monitor.stop()
+            self._bsm_change_monitor = None
+
+    def bdm_STORAGE_CHANGES_apply(self, events: List[BSMChangeEvent]) -> int:
+        """Apply storage change events to the BDM incrementally.
+
+        Workbook files added to a WF_FOLDER are added to the 
+        FI_WORKBOOK_DATA_COLLECTION, and removed files are removed from it.
+        Then the BSM_FILE_TREE is updated by an incremental scan, listing only
+        changed folders, and the BDM_WORKBOOK_TREE is rebuilt from the model.
+
+        Args:
+            events (List[BSMChangeEvent]): The changes found in storage.
+
+        Returns:
+            int: The count of FI_WORKBOOK_DATA_COLLECTION changes applied.
+        """
+        try:
+            if not events:
+                return 0
+            applied: int = 0
+            with self._bdm_lock:
+                wf_folders = self.bdm_WF_FOLDER_URL_map()
+                for event in events:
+                    wf_folder = wf_folders.get(event.folder_url)
+                    if wf_folder is None:
+                        continue  # Not a WF_FOLDER, only the file tree changes.
+                    fi_key, wf_key, wf_folder_config = wf_folder
+                    wb_path: Path = event.file_path
+                    if event.change_type == BSM_CHANGE_ADDED:
+                        if (wb_path.suffix.lower() not in VALID_WB_FILETYPES or
+                            wb_path.name.startswith("~$")):
+                            continue
+                        bdm_wb = self.bsm_WORKBOOK_from_path(
+                            fi_key, wf_key, wf_folder_config, wb_path)
+                        wdc = self.bdm_FI_WORKBOOK_DATA_COLLECTION(fi_key)
+                        if bdm_wb is None or bdm_wb.wb_id in wdc:
+                            continue
+                        self.bdm_WORKBOOK_add(bdm_wb)
+                        applied += 1
+                        logger.debug(f"FI_KEY('{fi_key}') added BDMWorkbook "
+                                     f"'{bdm_wb.wb_id}' from storage.")
+                    elif event.change_type == BSM_CHANGE_REMOVED:
+                        bdm_wb = self.bdm_FI_WORKBOOK_DATA_COLLECTION_find(
+                            fi_key, WB_URL, event.file_url)
+                        if bdm_wb is None:
+                            continue
+                        self.bdm_WORKBOOK_remove(fi_key, bdm_wb.wb_id)
+                        applied += 1
+                        logger.debug(f"FI_KEY('{fi_key}') removed BDMWorkbook "
+                                     f"'{bdm_wb.wb_id}', deleted from storage.")
+                self.bdm_refresh_trees()
+                self.bdm_storage_version += 1
+            logger.info(f"Applied {len(events)} storage change(s), "
+                        f"{applied} workbook(s) added or removed.")
+            return applied
+        except Exception as e:
+            m = p3u.exc_err_msg(e)
+            logger.error(m)
+            raise
+
+    def bdm_WF_FOLDER_URL_map(self) -> Dict[str, Tuple[str, str, WF_FOLDER_CONFIG_TYPE]]:
+        """Map each configured WF_FOLDER_URL to (fi_key, wf_key, wf_folder_config)."""
+        wf_folders: Dict[str, Tuple[str, str, WF_FOLDER_CONFIG_TYPE]] = {}
+        for fi_key in self.bdm_fi_collection.keys():
+            for wf_key, wfc_list in self.bdm_FI_WF_FOLDER_CONFIG_COLLECTION(fi_key).items():
+                for wfc in wfc_list:
+                    if wfc[WF_FOLDER_URL] is not None:
+                        wf_folders[wfc[WF_FOLDER_URL]] = (fi_key, wf_key, wfc)
+        return wf_folders
+    #endregion bdm_CHANGE_MONITOR methods
+    # ------------------------------------------------------------------------ +
     #region    bdm_configured_prefixes() method
     def bdm_configured_prefixes(self) -> List[str]:
         """Get the valid workbook prefixes for all configured FI's in the budget model."""
@@ -711,10 +961,22 @@ class BudgetDomainModel(p3m.Model,metaclass=BDMSingletonMeta):
     #endregion bdm_configured_prefixes() method
     # ------------------------------------------------------------------------ +
     #region    bdm_rehydrate() method
-    def bdm_rehydrate(self) -> None:
-        """Rehydrate dicts loaded from the BDM_STORE into class instances."""
+    def bdm_rehydrate(self, lazy: bool = False) -> None:
+        """Rehydrate dicts loaded from the BDM_STORE into class instances.
+
+        Workbook existence is checked with one directory listing per folder,
+        the wb_type is determined from the wb_url and the wf_folder_url is
+        looked up in a map of the FI_WF_FOLDER_CONFIG_COLLECTION. With lazy,
+        the FI_WORKBOOK_DATA_COLLECTION is a LazyWorkbookDataCollection,
+        which creates each BDMWorkbook object on first access, so startup 
+        time scales with the number of folders, not workbooks.
+
+        Args:
+            lazy (bool): Defer creating BDMWorkbook objects until accessed.
+        """
         try:
-            logger.debug("Start:  ...")
+            st = p3u.start_timer()
+            logger.debug(f"Start: lazy={lazy} ...")
             to_remove: List[str] = []
             removed_count: int = 0
             # Focus on the BDM_FI_COLLECTION.
@@ -722,6 +984,8 @@ class BudgetDomainModel(p3m.Model,metaclass=BDMSingletonMeta):
                 len(self.bdm_fi_collection) == 0):
                 logger.debug("FI_COLLECTION is empty.")
                 return None
+            wf_folder_urls = self._bdm_WF_FOLDER_URL_by_purpose()
+            folder_listings: Dict[Path, set] = {}
             for fi_key, fi_object in self.bdm_fi_collection.items():
                 if (fi_object[FI_WORKBOOK_DATA_COLLECTION] is None):
                     logger.debug(f"FI_KEY('{fi_key}') WORKBOOK_DATA_COLLECTION is None.")
@@ -731,7 +995,8 @@ class BudgetDomainModel(p3m.Model,metaclass=BDMSingletonMeta):
                     len(fi_object[FI_WORKBOOK_DATA_COLLECTION]) == 0):
                     logger.debug(f"FI_KEY('{fi_key}') has empty WORKBOOK_DATA_COLLECTION.")
                     continue
-                fi_folder_abs_path: Path = self.bsm_FI_FOLDER_abs_path(fi_key)
+                # wb_id: (wb_data, wb_type, wf_folder_url) to rehydrate.
+                pending: Dict[str, Tuple[dict, str, Optional[str]]] = {}
                 for wb_id, wb_data in fi_object[FI_WORKBOOK_DATA_COLLECTION].items():
                     if not isinstance(wb_data, dict):
                         # During this initialization, expecting the wb_data as
@@ -740,28 +1005,23 @@ class BudgetDomainModel(p3m.Model,metaclass=BDMSingletonMeta):
                                         f"wb_data is not a dict, skipping "
                                         f"type: {type(wb_data)}")
                         continue
-                    # Check if the wb_data.wb_url still exists. If not,
-                    # remove it from the collection.
-                    if (WB_URL in wb_data and
-                        wb_data[WB_URL] is not None and
-                        isinstance(wb_data[WB_URL], str)):
-                        wb_url = wb_data[WB_URL]
+                    # Check if the wb_data.wb_url still exists. If not, log it.
+                    wb_url = wb_data.get(WB_URL, None)
+                    wb_path: Optional[Path] = None
+                    if wb_url is not None and isinstance(wb_url, str):
                         try:
-                            # Raises exception if wb_url not found or invalid.
-                            _ = p3u.verify_url_file_path(wb_url)
+                            wb_path = Path.from_uri(wb_url)
+                            if not self._bsm_folder_listing_contains(
+                                folder_listings, wb_path):
+                                raise FileNotFoundError(f"File does not exist: {wb_path}")
                         except Exception as e: 
                             m = p3u.exc_err_msg(e)
                             logger.error(m)
                             logger.error(f"Error verifying WORKBOOK URL: '{wb_url}'")
                             logger.error(f"Skipping: FI_KEY('{fi_key}') WB_ID('{wb_id}')")
                             continue
-                    # Check the wb_data content for schema compliance with
-                    # the BDMWorkbook class. If not compliant, skip it.
-                    wb_data_2: dict = BDMWorkbook.check_schema(wb_data)
-                    # Convert the WORKBOOK_ITEM to a WORKBOOK_OBJECT.
-                    wb_object = BDMWorkbook(**wb_data_2)
-                    # Check the workbook type
-                    detected_wb_type = wb_object.determine_wb_type()
+                    # Check the workbook type, as BDMWorkbook.determine_wb_type()
+                    detected_wb_type = bdm_workbook_type_detect(wb_path)
                     if detected_wb_type == WB_TYPE_UNKNOWN:
                         logger.warning(f"FI_KEY('{fi_key}') WB_ID('{wb_id}'): "
                                        f"Workbook type is unknown,"
@@ -770,24 +1030,18 @@ class BudgetDomainModel(p3m.Model,metaclass=BDMSingletonMeta):
                         to_remove.append(wb_id)
                         continue
                     # Get the wf_folder_url expected for this workbook.
-                    wb_folder_url = self.bdm_WF_FOLDER_CONFIG_ATTRIBUTE(
-                        fi_key=wb_object.fi_key, wf_key=wb_object.wf_key,
-                        wf_purpose=wb_object.wf_purpose, attribute=WF_FOLDER_URL,
-                        raise_errors=True)
+                    wb_folder_url = wf_folder_urls.get(
+                        (fi_key, wb_data.get(WF_KEY), wb_data.get(WF_PURPOSE)))
                     if wb_folder_url is None:
                         # wb_folder_url not found in the fi_wf_folder_config_collection
                         # which means the fi_workbook_data_collection is out of
                         # sync with the fi_wf_folder_config_collection.
-                        wf_folder_abs_path: Path = fi_folder_abs_path / wb_object.wf_folder
-                        logger.warning(f"FI_KEY('{fi_key}') WF_KEY('{wb_object.wf_key}') "
-                                     f"WF_PURPOSE('{wb_object.wf_purpose}'): "
+                        logger.warning(f"FI_KEY('{fi_key}') WF_KEY('{wb_data.get(WF_KEY)}') "
+                                     f"WF_PURPOSE('{wb_data.get(WF_PURPOSE)}'): "
                                      f"FI_WF_FOLDER_CONFIG_COLLECTION is missing "
-                                     f"BDMWorkbook(wb_id='{wb_object.wb_id}').wf_folder: "
-                                     f"'{wb_object.wf_folder}'.")
-                    # Set the wb_folder_url in the WORKBOOK_OBJECT.
-                    wb_object.wb_folder_url = wb_folder_url
-                    # Replace the DATA_OBJECT with the WORKBOOK_OBJECT.
-                    fi_object[FI_WORKBOOK_DATA_COLLECTION][wb_id] = wb_object
+                                     f"BDMWorkbook(wb_id='{wb_id}').wf_folder: "
+                                     f"'{wb_data.get(WF_FOLDER)}'.")
+                    pending[wb_id] = (wb_data, detected_wb_type, wb_folder_url)
                 # Remove detected invalid wb_id from the wdc
                 for wb_id in to_remove:
                     logger.warning(f"Removing invalid WB_ID('{wb_id}') from "
@@ -796,21 +1050,74 @@ class BudgetDomainModel(p3m.Model,metaclass=BDMSingletonMeta):
                     removed_count += 1
                 to_remove.clear()
                 # Sort the FI_WORKBOOK_DATA_COLLECTION by wb_id, for
-                # WB_INDEX order from here on.
-                sorted_wdc = dict(
-                    sorted(fi_object[FI_WORKBOOK_DATA_COLLECTION].items()))
+                # WB_INDEX order from here on. Workbooks that could not be
+                # verified are kept as they were, as dicts.
+                wdc = fi_object[FI_WORKBOOK_DATA_COLLECTION]
+                if lazy:
+                    sorted_wdc = LazyWorkbookDataCollection()
+                    for wb_id in sorted(wdc):
+                        if wb_id in pending:
+                            sorted_wdc.add_pending(wb_id, *pending[wb_id])
+                        else:
+                            sorted_wdc[wb_id] = wdc[wb_id]
+                else:
+                    sorted_wdc = {}
+                    for wb_id in sorted(wdc):
+                        if wb_id not in pending:
+                            sorted_wdc[wb_id] = wdc[wb_id]
+                            continue
+                        wb_data, wb_type, wb_folder_url = pending[wb_id]
+                        # Convert the WORKBOOK_ITEM to a WORKBOOK_OBJECT.
+                        wb_object = BDMWorkbook(**BDMWorkbook.check_schema(wb_data))
+                        wb_object.wb_type = wb_type
+                        # Set the wf_folder_url in the WORKBOOK_OBJECT.
+                        if wb_folder_url is not None:
+                            wb_object.wf_folder_url = wb_folder_url
+                        sorted_wdc[wb_id] = wb_object
                 fi_object[FI_WORKBOOK_DATA_COLLECTION] = sorted_wdc
+            self._bdm_workbook_index.rebuild(self.bdm_fi_collection,
+                                             FI_WORKBOOK_DATA_COLLECTION)
             # If model was modified during rehydration, then save it.
             if removed_count > 0:
                 logger.info(f"Model modified during rehydration, saving model. "
                             f"Removed {removed_count} invalid workbooks.")
                 self.bdm_save_model()
-            logger.debug(f"Complete:")
+            logger.debug(f"Complete: {p3u.stop_timer(st)}")
             return None
         except Exception as e:
             m = p3u.exc_err_msg(e)
             logger.error(m)
             raise
+
+    def _bdm_WF_FOLDER_URL_by_purpose(self) -> Dict[Tuple[str, str, str], Optional[str]]:
+        """Map (fi_key, wf_key, wf_purpose) to the first configured WF_FOLDER_URL."""
+        wf_folder_urls: Dict[Tuple[str, str, str], Optional[str]] = {}
+        for fi_key, fi_object in self.bdm_fi_collection.items():
+            wfcc = fi_object.get(FI_WF_FOLDER_CONFIG_COLLECTION) or {}
+            for wf_key, wfc_list in wfcc.items():
+                for wfc in wfc_list or []:
+                    entry = self.bdm_WF_FOLDER_entry(fi_key, wf_key, wfc[WF_PURPOSE])
+                    wf_folder_urls[(fi_key, wf_key, wfc[WF_PURPOSE])] = entry.wf_folder_url
+        return wf_folder_urls
+
+    @staticmethod
+    def _bsm_folder_listing_contains(folder_listings: Dict[Path, set], 
+                                     file_path: Path) -> bool:
+        """True if file_path exists, listing its folder once per folder.
+
+        Names are compared with os.path.normcase(), case-insensitive only
+        where the platform is, e.g. Windows.
+        """
+        folder = file_path.parent
+        names = folder_listings.get(folder)
+        if names is None:
+            try:
+                with os.scandir(folder) as it:
+                    names = {os.path.normcase(e.name) for e in it}
+            except OSError:
+                names = set()
+            folder_listings[folder] = names
+        return os.path.normcase(file_path.name) in names
     #endregion bdm_rehydrate() method
     # ------------------------------------------------------------------------ +
     #region    bdm_dehydrate() method
@@ -840,26 +1147,14 @@ class BudgetDomainModel(p3m.Model,metaclass=BDMSingletonMeta):
                 if (len(wdc) == 0):
                     logger.debug(f"FI_KEY('{fi_key}') WORKBOOK_DATA_COLLECTION is empty, skipping.")
                     continue
+                if isinstance(wdc, LazyWorkbookDataCollection):
+                    # Pending workbook dicts are serialized as they are.
+                    wdc = dict(wdc.raw_items())
+                    fi_object[FI_WORKBOOK_DATA_COLLECTION] = wdc
                 for wb_id, bdm_wb in wdc.items():
-                    if isinstance(bdm_wb, BDMWorkbook):
-                        # Convert the BDMWorkbook object to a dict.
-                        # Don't modify the BDMWorkbook objects
-                        bdm_wb_dict = bdm_wb.to_dict()
-                    elif isinstance(bdm_wb, dict):
-                        bdm_wb_dict = bdm_wb
-                    else:
-                        logger.warning(f"FI_KEY('{fi_key}') WB_ID('{wb_id}') "
-                                       f"type:({type(bdm_wb).__name__}).")
+                    bdm_wb_dict = self._bdm_WORKBOOK_persisted_dict(fi_key, wb_id, bdm_wb)
+                    if bdm_wb_dict is None:
                         continue
-                    # A bdm_wb dict may have an object for wb_content
-                    if bdm_wb_dict[WB_CONTENT] is not None:
-                        # Never serialize the wb_content, so set it to None.
-                        wbc_type = type(bdm_wb_dict[WB_CONTENT]).__name__
-                        logger.debug(f" Dehydrating BDMWorkbook({wb_id}): "
-                                        f"wb_content type: '{wbc_type}'")
-                        bdm_wb_dict[WB_CONTENT] = None
-                    # Always set the wb_loaded to False, never serialize True.
-                    bdm_wb_dict[WB_LOADED] = False 
                     # Replace the bdm_wb in fi_object[FI_WORKBOOK_DATA_COLLECTION]
                     fi_object[FI_WORKBOOK_DATA_COLLECTION][wb_id] = bdm_wb_dict
             logger.debug(f"Complete:")   
@@ -868,24 +1163,165 @@ class BudgetDomainModel(p3m.Model,metaclass=BDMSingletonMeta):
             m = p3u.exc_err_msg(e)
             logger.error(m)
             raise
+
+    @staticmethod
+    def _bdm_WORKBOOK_persisted_dict(fi_key: str, wb_id: str, 
+                                     bdm_wb: Any) -> Optional[dict]:
+        """Return the dict to persist for bdm_wb, None if not a workbook.
+
+        BDMWorkbook objects are not modified. A dict already in persisted 
+        form is returned as is.
+        """
+        if isinstance(bdm_wb, BDMWorkbook):
+            # Convert the BDMWorkbook object to a dict.
+            # Don't modify the BDMWorkbook objects
+            bdm_wb_dict = bdm_wb.to_dict()
+        elif isinstance(bdm_wb, dict):
+            if (bdm_wb.get(WB_CONTENT) is None and 
+                bdm_wb.get(WB_LOADED, False) is False):
+                return bdm_wb
+            bdm_wb_dict = dict(bdm_wb)
+        else:
+            logger.warning(f"FI_KEY('{fi_key}') WB_ID('{wb_id}') "
+                            f"type:({type(bdm_wb).__name__}).")
+            return None
+        # A bdm_wb dict may have an object for wb_content
+        if bdm_wb_dict.get(WB_CONTENT) is not None:
+            # Never serialize the wb_content, so set it to None.
+            wbc_type = type(bdm_wb_dict[WB_CONTENT]).__name__
+            logger.debug(f" Dehydrating BDMWorkbook({wb_id}): "
+                            f"wb_content type: '{wbc_type}'")
+            bdm_wb_dict[WB_CONTENT] = None
+        # Always set the wb_loaded to False, never serialize True.
+        bdm_wb_dict[WB_LOADED] = False 
+        return bdm_wb_dict
     #endregion bdm_dehydrate() method
     # ------------------------------------------------------------------------ +
     #region    bdm_save_model() method                       +
     def bdm_save_model(self) -> None:
-        """Save the model for this view_model to the BDM_STORE."""
+        """Save the model for this view_model to the BDM_STORE.
+
+        With the BDMO_JOURNAL option, only the changes since the last save
+        are appended to the BDM_STORE journal. A full save of the BDM_STORE
+        compacts the journal once it exceeds BSM_JOURNAL_COMPACT_SIZE.
+        """
         try:
             st = p3u.start_timer()
             logger.info(f"Start: ...")
-            # Get a Dict of the BudgetModel to store.
-            bdm_dict = self.bdm_dehydrate()
-            # Save the BDM_STORE file to storage.
-            bsm_BDM_STORE_url_put(bdm_dict, self.bdm_url)
+            with self._bdm_lock:
+                if self._bdm_journal_save():
+                    logger.info(f"Complete: {p3u.stop_timer(st)}")
+                    return None
+                # Get a Dict of the BudgetModel to store.
+                bdm_dict = self.bdm_dehydrate()
+                # Save the BDM_STORE file to storage.
+                bsm_BDM_STORE_url_put(bdm_dict, self.bdm_url)
+                # The BDM_STORE now includes any journaled changes.
+                bsm_journal_clear(Path.from_uri(self.bdm_url))
+                if self.bdm_journal_enabled:
+                    self._bdm_journal_base = self._bdm_journal_state()
             logger.info(f"Saved BDM_STORE url: {self.bdm_url}")
             logger.info(f"Complete: {p3u.stop_timer(st)}")
             return None
         except Exception as e:
             logger.error(p3u.exc_err_msg(e))
             raise
+
+    @property
+    def bdm_concurrent_initialize(self) -> bool:
+        """True unless the BDMO_CONCURRENT_INITIALIZE option is set False."""
+        return bool((self.bdm_options or {}).get(BDMO_CONCURRENT_INITIALIZE, True))
+
+    @property
+    def bdm_journal_enabled(self) -> bool:
+        """True if the BDMO_JOURNAL option is set in bdm_options."""
+        return bool((self.bdm_options or {}).get(BDMO_JOURNAL, False))
+
+    def _bdm_journal_save(self) -> bool:
+        """Append the changes since the last save to the journal.
+
+        Returns:
+            bool: False if a full save is needed instead.
+        """
+        if not self.bdm_journal_enabled or self._bdm_journal_base is None:
+            return False
+        bdms_path = Path.from_uri(self.bdm_url)
+        if (not bdms_path.exists() or
+            bsm_journal_size(bdms_path) >= BSM_JOURNAL_COMPACT_SIZE):
+            logger.info(f"BizEVENT: Compacting BDM_STORE journal: '{bdms_path}'")
+            return False
+        state = self._bdm_journal_state()
+        records = self._bdm_journal_records(self._bdm_journal_base, state)
+        bsm_journal_append(bdms_path, records)
+        self._bdm_journal_base = state
+        logger.info(f"BizEVENT: Journaled {len(records)} change(s) to "
+                    f"BDM_STORE url: {self.bdm_url}")
+        return True
+
+    def _bdm_journal_state(self) -> Dict[str, Any]:
+        """Return the BDM state to journal the changes since, see
+        _bdm_journal_records().
+
+        The props and FI objects, without their workbooks, are copied. The
+        workbooks are not, BDMWorkbooks record a wb_change_stamp when
+        changed, so the state keeps a change mark and a reference to each
+        workbook, to find those added, replaced or removed. Only plain dict
+        workbooks, not pending in a LazyWorkbookDataCollection, are copied.
+        """
+        mark = bdm_workbook_change_mark()
+        props = {k: copy.deepcopy(getattr(self, k)) 
+                 for k in BSM_PERSISTED_PROPERTIES if k != BDM_FI_COLLECTION}
+        fis: Dict[str, dict] = {}
+        wbs: Dict[Tuple[str, str], Any] = {}
+        for fi_key, fi_obj in (self.bdm_fi_collection or {}).items():
+            fis[fi_key] = copy.deepcopy({k: v for k, v in fi_obj.items()
+                                         if k != FI_WORKBOOK_DATA_COLLECTION})
+            wdc = fi_obj.get(FI_WORKBOOK_DATA_COLLECTION) or {}
+            lazy = isinstance(wdc, LazyWorkbookDataCollection)
+            for wb_id, bdm_wb in (wdc.raw_items() if lazy else wdc.items()):
+                if isinstance(bdm_wb, dict) and not (lazy and wdc.is_pending(wb_id)):
+                    bdm_wb = dict(bdm_wb)
+                wbs[(fi_key, wb_id)] = bdm_wb
+        return {"props": props, "fi": fis, "wb": wbs, "mark": mark}
+
+    @classmethod
+    def _bdm_journal_records(cls, base: Dict[str, Any], 
+                             state: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Return the journal records to change base into state.
+
+        A workbook is changed if it is new, replaced by another object, a
+        BDMWorkbook stamped after the base mark, or a plain dict not equal
+        to its base copy. A pending dict materialized to a BDMWorkbook with
+        no change stamp is not changed.
+        """
+        records: List[Dict[str, Any]] = []
+        for key, value in state["props"].items():
+            if key not in base["props"] or base["props"][key] != value:
+                records.append({BSM_JOURNAL_OP: BSM_JOURNAL_OP_SET, 
+                                "key": key, "value": value})
+        for fi_key, fi_obj in state["fi"].items():
+            if base["fi"].get(fi_key) != fi_obj:
+                records.append({BSM_JOURNAL_OP: BSM_JOURNAL_OP_FI_PUT, 
+                                FI_KEY: fi_key, "fi": fi_obj})
+        for (fi_key, wb_id), bdm_wb in state["wb"].items():
+            old = base["wb"].get((fi_key, wb_id), _JOURNAL_NO_WB)
+            if isinstance(bdm_wb, BDMWorkbook):
+                changed = (bdm_wb.wb_change_stamp > base["mark"] or
+                           (old is not bdm_wb and not isinstance(old, dict)))
+            else:
+                changed = old is not bdm_wb and old != bdm_wb
+            if not changed:
+                continue
+            wb_dict = cls._bdm_WORKBOOK_persisted_dict(fi_key, wb_id, bdm_wb)
+            if wb_dict is not None:
+                records.append({BSM_JOURNAL_OP: BSM_JOURNAL_OP_WB_PUT, 
+                                FI_KEY: fi_key, WB_ID: wb_id, "wb": wb_dict})
+        for fi_key, wb_id in sorted(base["wb"].keys() - state["wb"].keys()):
+            records.append({BSM_JOURNAL_OP: BSM_JOURNAL_OP_WB_DEL, 
+                            FI_KEY: fi_key, WB_ID: wb_id})
+        for fi_key in sorted(base["fi"].keys() - state["fi"].keys()):
+            records.append({BSM_JOURNAL_OP: BSM_JOURNAL_OP_FI_DEL, FI_KEY: fi_key})
+        return records
     #endregion bdm_save_model() method                       +
     # ------------------------------------------------------------------------ +
     #region    bdm_BDM_STORE_json() method
@@ -909,6 +1345,14 @@ class BudgetDomainModel(p3m.Model,metaclass=BDMSingletonMeta):
         Return the first matching BDMWorkbook or None if not found.
         """
         try:
+            if search_key in WorkbookIndex.INDEX_KEYS:
+                for fi_key, wb_id in self.bdm_WORKBOOK_INDEX.find(search_key, 
+                                                                  search_value):
+                    found = self._bdm_WORKBOOK_index_match(
+                        fi_key, wb_id, search_key, search_value, True)
+                    if found is not None:
+                        return found
+                return None
             for fi_key in self.bdm_fi_collection.keys():
                 found: BDMWorkbook = self.bdm_FI_WORKBOOK_DATA_COLLECTION_find(
                     fi_key, search_key, search_value)
@@ -930,7 +1374,7 @@ class BudgetDomainModel(p3m.Model,metaclass=BDMSingletonMeta):
             wb_id = bdm_wb.wb_id
             fi_wdc: WORKBOOK_DATA_COLLECTION_TYPE = self.bdm_FI_WORKBOOK_DATA_COLLECTION(fi_key)
             if wb_id in fi_wdc:
-                del fi_wdc[wb_id]
+                self.bdm_WORKBOOK_remove(fi_key, wb_id)
                 logger.info(f"Deleted BDMWorkbook(wb_id='{wb_id}') from FI_KEY('{fi_key}')")
             else:
                 logger.warning(f"BDMWorkbook(wb_id='{wb_id}') not found in FI_KEY('{fi_key}')")
@@ -944,6 +1388,87 @@ class BudgetDomainModel(p3m.Model,metaclass=BDMSingletonMeta):
             raise ValueError(m)
     #endregion bdm_WORKBOOK_delete() method
     # ------------------------------------------------------------------------ +
+    #region    bdm_WORKBOOK_INDEX methods
+    @property
+    def bdm_WORKBOOK_INDEX(self) -> WorkbookIndex:
+        """The WorkbookIndex of all FI_WORKBOOK_DATA_COLLECTIONs.
+
+        An FI whose collection was replaced, or changed in length without
+        bdm_WORKBOOK_add() or bdm_WORKBOOK_remove(), is re-indexed first,
+        and workbooks changed in place are re-indexed.
+        """
+        index = self._bdm_workbook_index
+        fi_collection = self.bdm_fi_collection or {}
+        for fi_key, fi_obj in fi_collection.items():
+            wdc = fi_obj.get(FI_WORKBOOK_DATA_COLLECTION)
+            if not index.is_current(fi_key, wdc):
+                index.index_fi(fi_key, wdc)
+            else:
+                index.reindex_changed(fi_key)
+        if index.count() != sum(index.count(k) for k in fi_collection):
+            index.rebuild(fi_collection, FI_WORKBOOK_DATA_COLLECTION)
+        return index
+
+    def bdm_WORKBOOK_add(self, bdm_wb: BDMWorkbook) -> None:
+        """Add or replace bdm_wb in its FI_WORKBOOK_DATA_COLLECTION and index."""
+        try:
+            p3u.is_not_obj_of_type("bdm_wb", bdm_wb, BDMWorkbook, raise_error=True)
+            fi_obj: FI_OBJECT_TYPE = self.bdm_FI_OBJECT(bdm_wb.fi_key)
+            if fi_obj[FI_WORKBOOK_DATA_COLLECTION] is None:
+                fi_obj[FI_WORKBOOK_DATA_COLLECTION] = {}
+            wdc = fi_obj[FI_WORKBOOK_DATA_COLLECTION]
+            index = self.bdm_WORKBOOK_INDEX
+            wb_tree = self.bdm_workbook_tree
+            synced = wb_tree is not None and wb_tree.is_synced(bdm_wb.fi_key, wdc)
+            wdc[bdm_wb.wb_id] = bdm_wb
+            index.add(bdm_wb.fi_key, bdm_wb.wb_id)
+            if synced:
+                self._bdm_WORKBOOK_TREE_put(wb_tree, bdm_wb.fi_key, bdm_wb.wb_id)
+                wb_tree.set_synced(bdm_wb.fi_key, wdc)
+        except Exception as e:
+            m = p3u.exc_err_msg(e)
+            logger.error(m)
+            raise
+
+    def bdm_WORKBOOK_remove(self, fi_key: str, wb_id: str) -> Optional[BDMWorkbook]:
+        """Remove wb_id from the FI_WORKBOOK_DATA_COLLECTION and index."""
+        try:
+            wdc = self.bdm_FI_OBJECT(fi_key)[FI_WORKBOOK_DATA_COLLECTION]
+            if wdc is None or wb_id not in wdc:
+                return None
+            index = self.bdm_WORKBOOK_INDEX
+            wb_tree = self.bdm_workbook_tree
+            synced = wb_tree is not None and wb_tree.is_synced(fi_key, wdc)
+            bdm_wb = wdc.pop(wb_id)
+            index.remove(fi_key, wb_id)
+            if synced:
+                wb_tree.remove_workbook_node(fi_key, wb_id)
+                wb_tree.set_synced(fi_key, wdc)
+            return bdm_wb
+        except Exception as e:
+            m = p3u.exc_err_msg(e)
+            logger.error(m)
+            raise
+
+    def bdm_WORKBOOK_reindex(self, bdm_wb: BDMWorkbook) -> None:
+        """Update the index and tree after indexed attributes of bdm_wb changed."""
+        self.bdm_WORKBOOK_INDEX.add(bdm_wb.fi_key, bdm_wb.wb_id)
+        wb_tree = self.bdm_workbook_tree
+        if wb_tree is not None:
+            self._bdm_WORKBOOK_TREE_put(wb_tree, bdm_wb.fi_key, bdm_wb.wb_id)
+
+    def _bdm_WORKBOOK_index_match(self, fi_key: str, wb_id: str, search_key: str,
+                                  search_value: Any, ignore_case: bool) -> Optional[BDMWorkbook]:
+        """Return the workbook for an index match, if its value still matches."""
+        wdc = self.bdm_fi_collection[fi_key][FI_WORKBOOK_DATA_COLLECTION]
+        value = wb_id if search_key == WB_ID else wdc_attribute(wdc, wb_id, search_key)
+        if ignore_case and isinstance(value, str) and isinstance(search_value, str):
+            matched = value.lower() == search_value.lower()
+        else:
+            matched = value == search_value
+        return wdc[wb_id] if matched else None
+    #endregion bdm_WORKBOOK_INDEX methods
+    # ------------------------------------------------------------------------ +
     #endregion BDM - Budget Domain Model methods
     # ======================================================================== +
 
@@ -997,6 +1522,7 @@ class BudgetDomainModel(p3m.Model,metaclass=BDMSingletonMeta):
             if wf_key not in fi_wf_fldr_cfg_coll:
                 fi_wf_fldr_cfg_coll[wf_key] = []
             fi_wf_fldr_cfg_coll[wf_key].append(wf_folder_config)
+            self._bdm_wf_folder_table.invalidate(fi_key)
             return None
         except Exception as e:
             m = p3u.exc_err_msg(e)
@@ -1042,6 +1568,14 @@ class BudgetDomainModel(p3m.Model,metaclass=BDMSingletonMeta):
                 m = f"search_key('{search_key}') not BDMWorkbook attribute: "
                 logger.debug(m)
                 return None
+            if search_key in WorkbookIndex.INDEX_KEYS:
+                for _, wb_id in self.bdm_WORKBOOK_INDEX.find(search_key, 
+                                                             search_value, fi_key):
+                    found = self._bdm_WORKBOOK_index_match(
+                        fi_key, wb_id, search_key, search_value, ignore_case)
+                    if found is not None:
+                        return found
+                return None
             for wb_id, wb in wdc.items():
                 search_attr = getattr(wb,search_key)
                 if ignore_case:
@@ -1065,15 +1599,9 @@ class BudgetDomainModel(p3m.Model,metaclass=BDMSingletonMeta):
         try:
             if p3u.str_empty(wb_id):
                 return -1
-            wdc: WORKBOOK_DATA_COLLECTION_TYPE = self.bdm_FI_OBJECT(fi_key)[FI_WORKBOOK_DATA_COLLECTION]
-            if wdc is None or len(wdc) == 0:
-                return -1
-            # The wb_index is determined as the index from list(wdc.keys())
-            wdc_key_list : List[str]= list(wdc.keys())
-            if wb_id in wdc_key_list:
-                # If the wb_id is in the keys, return its index.
-                return wdc_key_list.index(wb_id)
-            return -1
+            self.bdm_FI_KEY_validate(fi_key)
+            # The wb_index is the position of wb_id in the wdc key order.
+            return self.bdm_WORKBOOK_INDEX.wb_index(fi_key, wb_id)
         except Exception as e:
             m = p3u.exc_err_msg(e)
             logger.error(m)
@@ -1141,6 +1669,11 @@ class BudgetDomainModel(p3m.Model,metaclass=BDMSingletonMeta):
                              wf_key:str, wf_purpose:str) -> Optional[WF_FOLDER_CONFIG_TYPE]:
         """Return the WF_FOLDER_CONFIG for a given fi_key, wf_key and wf_purpose."""
         try:
+            entry = self.bdm_WF_FOLDER_entry(fi_key, wf_key, wf_purpose)
+            if entry is not None:
+                self.bdm_WF_KEY_validate(wf_key)
+                return entry.wf_folder_config
+            # Not configured, report why.
             fi_wf_fldr_cfg_coll: FI_WF_FOLDER_CONFIG_COLLECTION_TYPE = None
             fi_wf_fldr_cfg_coll = self.bdm_FI_WF_FOLDER_CONFIG_COLLECTION(fi_key)
             if (fi_wf_fldr_cfg_coll is None or
@@ -1164,14 +1697,32 @@ class BudgetDomainModel(p3m.Model,metaclass=BDMSingletonMeta):
                 m += f"WF_KEY('{wf_key}') is empty or None."
                 logger.debug(m)
                 return None
-            for wf_folder_config in wf_fldr_cfg_list:
-                if (wf_folder_config[WF_PURPOSE] == wf_purpose):
-                    return wf_folder_config
             return None
         except Exception as e:
             m = p3u.exc_err_msg(e)
             logger.error(m)
             raise ValueError(m)
+
+    def bdm_WF_FOLDER_entry(self, fi_key:str, 
+                            wf_key:str, wf_purpose:str) -> Optional[WFFolderEntry]:
+        """Return the WFFolderEntry for fi_key, wf_key and wf_purpose, None if
+        not configured.
+        
+        The entries of fi_key in the WFFolderTable are rebuilt when its 
+        FI_WF_FOLDER_CONFIG_COLLECTION, FI_FOLDER or the BDM_FOLDER changed.
+        """
+        fi_obj: FI_OBJECT_TYPE = self.bdm_FI_OBJECT(fi_key)
+        table = self._bdm_wf_folder_table
+        fi_wf_fldr_cfg = fi_obj.get(FI_WF_FOLDER_CONFIG_COLLECTION)
+        fi_folder = fi_obj.get(FI_FOLDER)
+        bdm_folder = self.bdm_folder
+        if not table.is_current(fi_key, fi_wf_fldr_cfg, fi_folder, bdm_folder):
+            try:
+                fi_p_s = self.bsm_FI_FOLDER_path_str(fi_key)
+            except ValueError:
+                fi_p_s = None # No paths, see bsm_FI_WORKFLOW_DATA_FOLDER_path().
+            table.build_fi(fi_key, fi_wf_fldr_cfg, fi_folder, bdm_folder, fi_p_s)
+        return table.get(fi_key, wf_key, wf_purpose)
         
     def bdm_WF_FOLDER_CONFIG_ATTRIBUTE(self, 
                                           fi_key:str, 
@@ -1181,8 +1732,10 @@ class BudgetDomainModel(p3m.Model,metaclass=BDMSingletonMeta):
                              raise_errors: bool =  True) -> Optional[str]:
         """Return an attribute value from the workflow folder config."""
         try:
+            entry = self.bdm_WF_FOLDER_entry(fi_key, wf_key, wf_purpose)
             wf_folder_config: Optional[WF_FOLDER_CONFIG_TYPE] = None
-            wf_folder_config = self.bdm_WF_FOLDER_CONFIG(fi_key, wf_key, wf_purpose)
+            wf_folder_config = (entry.wf_folder_config if entry is not None else
+                self.bdm_WF_FOLDER_CONFIG(fi_key, wf_key, wf_purpose))
             if wf_folder_config is None:
                 m = f"Workflow folder config for FI_KEY('{fi_key}'), "
                 m += f"WF_KEY('{wf_key}'), WF_PURPOSE('{wf_purpose}') is None."
@@ -1218,10 +1771,15 @@ class BudgetDomainModel(p3m.Model,metaclass=BDMSingletonMeta):
     # ------------------------------------------------------------------------ +
     #region    bdm_WORKBOOK_TREE_refresh()
     def bdm_WORKBOOK_TREE_refresh(self) -> None:
-        """Refresh the BDM workbook tree."""
+        """Refresh the BDM workbook tree, constructing it if needed.
+
+        An existing tree is updated in place. Workbook nodes are maintained
+        by bdm_WORKBOOK_add(), bdm_WORKBOOK_remove() and
+        bdm_WORKBOOK_reindex(), so only FIs whose FI_WORKBOOK_DATA_COLLECTION
+        was changed some other way, or that have new WF_FOLDER_CONFIG nodes,
+        are re-synced here.
+        """
         try:
-            if self.bdm_workbook_tree is not None:
-                self.bdm_workbook_tree = None
             self.bdm_workbook_tree = self.bdm_WORKBOOK_TREE_construct()
             return
         except Exception as e:
@@ -1235,6 +1793,7 @@ class BudgetDomainModel(p3m.Model,metaclass=BDMSingletonMeta):
         """Update a workbook_tree structure from the model's current content."""
         # Does the tree have nodes yet?
         try:
+            st = p3u.start_timer()
             root_node_id:str = self.bdm_id
             root_node_tag: str = f"BDM_FOLDER('{self.bdm_folder}')"
             wb_tree: Tree = self.bdm_workbook_tree if self.bdm_workbook_tree is not None else BDMWorkbookTree()
@@ -1243,8 +1802,15 @@ class BudgetDomainModel(p3m.Model,metaclass=BDMSingletonMeta):
                                     tag=root_node_tag,
                                     identifier=root_node_id,
                                     data=self)
-            # Iterate all FIs and the wf_folder configs for each, collect workbooks
+            # Remove FIs no longer in the model.
+            for fi_node in wb_tree.children(root_node_id):
+                if fi_node.identifier not in self.bdm_fi_collection:
+                    wb_tree.remove_fi_node(fi_node.identifier)
+            # Make the WorkbookIndex current, for the workbook wb_index.
+            _ = self.bdm_WORKBOOK_INDEX
+            # Iterate all FIs and the wf_folder configs for each.
             fi_obj: Optional[FI_OBJECT_TYPE] = None
+            synced_count: int = 0
             for fi_key, fi_obj in self.bdm_fi_collection.items():
                 # Each fi_obj needs a node.
                 fi_node: Node = wb_tree.get_node(fi_key)
@@ -1257,9 +1823,8 @@ class BudgetDomainModel(p3m.Model,metaclass=BDMSingletonMeta):
                                                   identifier=fi_key,
                                                   data=fi_obj,
                                                   parent_id=root_node_id)
-                if fi_obj[FI_WF_FOLDER_CONFIG_COLLECTION] is None:
-                    continue
-                for wf_key, wfc_list in fi_obj[FI_WF_FOLDER_CONFIG_COLLECTION].items():
+                new_folders: bool = False
+                for wf_key, wfc_list in (fi_obj[FI_WF_FOLDER_CONFIG_COLLECTION] or {}).items():
                     # Each wf_key needs a node.
                     wf_obj: WF_OBJECT_TYPE = self.bdm_WF_OBJECT(wf_key)
                     if wf_obj is None:
@@ -1273,8 +1838,6 @@ class BudgetDomainModel(p3m.Model,metaclass=BDMSingletonMeta):
                                                         identifier=wf_key_id,
                                                         data=wf_obj,
                                                         parent_id=fi_key)
-                    if len(wfc_list) == 0:
-                        continue
                     for wfc in wfc_list:
                         # Each wf_purpose:wf_folder needs a node.
                         wf_purpose = wfc.get(WF_PURPOSE, "")
@@ -1289,35 +1852,53 @@ class BudgetDomainModel(p3m.Model,metaclass=BDMSingletonMeta):
                                 identifier=wf_folder_key,
                                 data=wfc,
                                 parent_id=wf_key_id)
-                        # Process workbooks if any are listed in the FI_WORKBOOK_DATA_COLLECTION for this fi_key.
-                        if (fi_obj[FI_WORKBOOK_DATA_COLLECTION] is None or 
-                            len(fi_obj[FI_WORKBOOK_DATA_COLLECTION]) == 0):
-                            continue
-                        wb: BDMWorkbook = None
-                        for wb_id, wb in fi_obj[FI_WORKBOOK_DATA_COLLECTION].items():
-                            if (wb.wf_purpose == wf_purpose and
-                                wb.wf_key == wf_key and
-                                wb.wf_folder == wf_folder and
-                                wb.fi_key == fi_key ):
-                                # This workbook belongs in this wf_folder_node
-                                wb_node_id = wb.wb_id
-                                wb_node: Node = wb_tree.get_node(wb_node_id)
-                                if wb_node is None:
-                                    wb_node = wb_tree.add_tree_node(
-                                        node_type=BDM_WORKBOOK,
-                                        tag=wb.wb_name,
-                                        identifier=wb_node_id,
-                                        data=wb,
-                                        parent_id=wf_folder_key)
-                                    # Look up wb_index, save in wb_node
-                                    wb_node.wb_index = self.bdm_FI_WORKBOOK_index(fi_key, wb.wb_id) 
-                        # lookup workbooks for fi_key, wf_key, wf_purpose and wf_folder
-                        # Add workbook nodes to wf_folder_node
+                        wb_group = (fi_key, wf_key, wf_purpose, wf_folder)
+                        if wb_tree.wf_folder_node_id(wb_group) is None:
+                            # Workbooks in this group go in this wf_folder_node.
+                            wb_tree.register_wf_folder_node(wb_group, wf_folder_key)
+                            new_folders = True
+                # Sync the workbook nodes, if not maintained incrementally.
+                wdc = fi_obj[FI_WORKBOOK_DATA_COLLECTION]
+                if new_folders or not wb_tree.is_synced(fi_key, wdc):
+                    self._bdm_WORKBOOK_TREE_sync(wb_tree, fi_key)
+                    synced_count += 1
+            logger.debug(f"Synced workbook nodes of {synced_count} FI(s) "
+                         f"{p3u.stop_timer(st)}")
             return wb_tree
         except Exception as e:
             logger.error(p3u.exc_err_msg(e))
             raise
 
+    def _bdm_WORKBOOK_TREE_sync(self, wb_tree: BDMWorkbookTree, fi_key: str) -> None:
+        """Sync the workbook nodes of fi_key with its FI_WORKBOOK_DATA_COLLECTION.
+
+        One pass over the workbooks, each placed by its workbook group.
+        """
+        wdc = self.bdm_fi_collection[fi_key][FI_WORKBOOK_DATA_COLLECTION]
+        for wb_id in wb_tree.workbook_ids(fi_key):
+            if wdc is None or wb_id not in wdc:
+                wb_tree.remove_workbook_node(fi_key, wb_id)
+        for wb_id in (wdc.keys() if wdc else ()):
+            self._bdm_WORKBOOK_TREE_put(wb_tree, fi_key, wb_id)
+        wb_tree.set_synced(fi_key, wdc)
+
+    def _bdm_WORKBOOK_TREE_put(self, wb_tree: BDMWorkbookTree,
+                               fi_key: str, wb_id: str) -> None:
+        """Add or move the workbook node of wb_id in fi_key."""
+        # Match on attributes without materializing workbooks,
+        # the node loads its BDMWorkbook on first data access.
+        wdc = self.bdm_fi_collection[fi_key][FI_WORKBOOK_DATA_COLLECTION]
+        wb_group = (wdc_attribute(wdc, wb_id, FI_KEY),
+                    wdc_attribute(wdc, wb_id, WF_KEY),
+                    wdc_attribute(wdc, wb_id, WF_PURPOSE),
+                    wdc_attribute(wdc, wb_id, WF_FOLDER))
+        wb_tree.put_workbook_node(
+            fi_key, wb_id, wb_group,
+            tag=wdc_attribute(wdc, wb_id, WB_NAME),
+            data_loader=functools.partial(wdc.__getitem__, wb_id),
+            wb_index_loader=functools.partial(
+                self._bdm_workbook_index.wb_index, fi_key, wb_id))
+
     #endregion bdm_WORKBOOK_TREE_construct()
     # ------------------------------------------------------------------------ +
     #endregion BDM - WORKBOOK_TREE methods
@@ -1516,8 +2097,19 @@ class BudgetDomainModel(p3m.Model,metaclass=BDMSingletonMeta):
             logger.info("BizEVENT: Model setup for BudgetStorageModel (BSM)")
             self.bsm_BDM_FOLDER_resolve(create_missing_folders, raise_errors)
             # Initialize the bdm_fi_collection of financial institutions.
-            _ = [self.bsm_FI_initialize(fi_key, create_missing_folders, raise_errors) 
-                   for fi_key, fi_object in self.bdm_fi_collection.items()]                
+            fi_keys = list(self.bdm_fi_collection.keys())
+            if self.bdm_concurrent_initialize:
+                # FI's are independent, resolve them concurrently, then
+                # merge the results into the model in FI order.
+                resolved = bsm_map_folders_concurrent(
+                    lambda fi_key: self.bsm_FI_resolve(
+                        fi_key, create_missing_folders, raise_errors), fi_keys)
+                for fi_key, fi_wf_fldr_cfg in zip(fi_keys, resolved):
+                    self.bsm_FI_merge(fi_key, fi_wf_fldr_cfg)
+            else:
+                for fi_key in fi_keys:
+                    self.bsm_FI_initialize(fi_key, create_missing_folders, 
+                                           raise_errors)
             logger.debug(f"Complete: {p3u.stop_timer(st)}")   
             return self
         except Exception as e:
@@ -1655,190 +2247,303 @@ class BudgetDomainModel(p3m.Model,metaclass=BDMSingletonMeta):
         #       update and refresh any storage system URL references. 
         try:
             logger.debug("Start: ...")
+            fi_wf_fldr_cfg = self.bsm_FI_resolve(fi_key, 
+                                        create_missing_folders, raise_errors)
+            self.bsm_FI_merge(fi_key, fi_wf_fldr_cfg)
+            logger.debug(f"Complete: {p3u.stop_timer(st)}")   
+            return True
+        except Exception as e:
+            m = p3u.exc_err_msg(e)
+            logger.error(m)
+            raise
+
+    def bsm_FI_resolve(self, fi_key : str, 
+                       create_missing_folders:bool=True,
+                       raise_errors:bool=True) -> FI_WF_FOLDER_CONFIG_COLLECTION_TYPE:
+        """Resolve the storage of an FI, without changing the model.
+
+        The storage I/O of bsm_FI_initialize(). Resolve the FI_FOLDER and 
+        the WF_FOLDERs of fi_key, and return the resolved copy of its 
+        FI_WF_FOLDER_CONFIG_COLLECTION, to apply with bsm_FI_merge(). Only 
+        reads the model, so FI's can be resolved concurrently.
+        """
+        try:
             p3u.str_empty(fi_key, raise_error=True) # Raises TypeError, ValueError
             # Resolve FI_FOLDER path.
             self.bsm_FI_FOLDER_resolve(fi_key, 
                                         create_missing_folders, raise_errors)
-            # Resolve/initialize the FI_WF_FOLDER_CONFIG_COLLECTION.
+            # Resolve/initialize a copy of the FI_WF_FOLDER_CONFIG_COLLECTION.
+            fi_wf_fldr_cfg: FI_WF_FOLDER_CONFIG_COLLECTION_TYPE = copy.deepcopy(
+                self.bdm_FI_WF_FOLDER_CONFIG_COLLECTION(fi_key))
             self.bsm_FI_WF_FOLDER_CONFIG_resolve(fi_key, 
-                                        create_missing_folders, raise_errors)
-            logger.debug(f"Complete: {p3u.stop_timer(st)}")   
-            return True
+                                        create_missing_folders, raise_errors,
+                                        fi_wf_fldr_cfg)
+            return fi_wf_fldr_cfg
         except Exception as e:
             m = p3u.exc_err_msg(e)
             logger.error(m)
             raise
+
+    def bsm_FI_merge(self, fi_key : str, 
+                     fi_wf_fldr_cfg: FI_WF_FOLDER_CONFIG_COLLECTION_TYPE) -> None:
+        """Apply the bsm_FI_resolve() result for fi_key to the model."""
+        with self._bdm_lock:
+            self.bdm_FI_OBJECT(fi_key)[FI_WF_FOLDER_CONFIG_COLLECTION] = fi_wf_fldr_cfg
+            self._bdm_wf_folder_table.invalidate(fi_key)
     #endregion bsm_FI_initialize() method
     # ------------------------------------------------------------------------ +    
     #region bsm_FI_WORKBOOK_DATA_COLLECTION_resolve() method
     def bsm_FI_WORKBOOK_DATA_COLLECTION_resolve(self, 
                                                 fi_key:str,
                                                 reconcile:bool = False) -> Tuple[WORKBOOK_DATA_COLLECTION_TYPE, str]:
-        """Discover all actual WORKBOOKS in storage for the BDM. 
-        Return a file_tree with just workbook files found in the BSM storage.
+        """Discover all actual WORKBOOKS in storage for the FI. 
+
+        See bsm_WORKBOOK_DATA_COLLECTION_resolve(), for a single fi_key.
         """
-        bsm_file_tree : BSMFileTree = self.bsm_file_tree
-        if bsm_file_tree is None:
+        disc_wdcs, r_msg = self.bsm_WORKBOOK_DATA_COLLECTION_resolve(
+            [fi_key], reconcile)
+        return disc_wdcs.get(fi_key, {}), r_msg
+
+    def bsm_WORKBOOK_DATA_COLLECTION_resolve(self, 
+                                             fi_keys:Optional[List[str]] = None,
+                                             reconcile:bool = False
+                                             ) -> Tuple[Dict[str, WORKBOOK_DATA_COLLECTION_TYPE], str]:
+        """Discover all actual WORKBOOKS in storage for FI's.
+
+        Traverse the FI_WF_FOLDER_CONFIG_COLLECTION of each FI to compile a 
+        WORKBOOK_DATA_COLLECTION of BDMWorkbook objects found in storage. The
+        WF_FOLDERs of all the FI's are scanned concurrently, one os.scandir()
+        pass per folder, since the work is I/O bound on network or 
+        cloud-synced drives. Results are merged in configuration order, so 
+        the discovered collections are the same as a sequential scan.
+
+        Args:
+            fi_keys (List[str]): Optional, the FI's to resolve, default all.
+            reconcile (bool): Reconcile the discovered workbooks with each 
+                FI_WORKBOOK_DATA_COLLECTION.
+
+        Returns:
+            Tuple[Dict[str, WORKBOOK_DATA_COLLECTION_TYPE], str]: The
+            discovered workbooks by fi_key, and a result message.
+        """
+        if self.bsm_file_tree is None:
             m = "BSMFileTree is not initialized, cannot resolve workbooks in storage."
             logger.error(m)
             raise ValueError(m)
-        # Re-write:
-        #    1. Traverse the file tree.
-        #    2. Duplicate the tree but add only workbook files from the bsm_file_tree.
-        #    3. If reconcile, then verify that each located workbook file has an
-        #       entry in the BDM_STORE, adding it if necessary.
-        #    4. If reconcile, then verify that each workbook in the BDM_STORE is
-        #       present in the file tree, removing it from the BDM_STORE if not.
-
-        discovered_wdc: WORKBOOK_DATA_COLLECTION_TYPE = {}
-        wf_folder_config: WF_OBJECT_TYPE = None
+        st = p3u.start_timer()
+        disc_wdcs: Dict[str, WORKBOOK_DATA_COLLECTION_TYPE] = {}
         r_msg: str = ""
-        fi_folder_abs_path: Path = None
-        wf_name: str = ""
-        wfdf_name: str = ""
-        wf_folder_abs_path: Path = None
         try:
-            _ = self.bdm_FI_KEY_validate(fi_key)
-            fi_object: FI_OBJECT_TYPE = self.bdm_FI_OBJECT(fi_key)
-            fi_folder_abs_path = self.bsm_FI_FOLDER_abs_path(fi_key)
-            fi_name = self.bdm_FI_NAME(fi_key)
-            m = (f"Start: FI_KEY('{fi_key}') "
-                            f"WORKBOOK_DATA_COLLECTION storage discovery "
-                            f"FI_FOLDER('{str(fi_folder_abs_path)}')")
-            r_msg += f"{P2}{m}\n"
-            logger.debug(m)
-            # Traverse the FI_OBJECT's FI_WF_FOLDER_CONFIG_COLLECTION structure, 
-            # to compile a list of WORKBOOKS as BDMWorkbook objects with 
-            # populated metadata. 
-            # Then reconcile list with the FI_WORKBOOK_DATA_COLLECTION.
-            for wf_key, wf_folder_config_list in self.bdm_FI_WF_FOLDER_CONFIG_COLLECTION(fi_key).items():
-                # wf_folder_config_collection is a dict 'wf_key' : List[WF_FOLDER_CONFIG]
-                wf_name = self.bdm_WF_NAME(wf_key)
-
-                for wf_folder_config in wf_folder_config_list:
-                    wf_purpose: str = wf_folder_config[WF_PURPOSE]
-                    wf_folder: str = wf_folder_config[WF_FOLDER]
-                    wf_folder_url: str = wf_folder_config[WF_FOLDER_URL]
-                    wf_prefix: str = wf_folder_config[WF_PREFIX]
-
-                    wf_folder_abs_path = Path.from_uri(wf_folder_url).resolve() if wf_folder_url is not None else None
-                    if wf_folder_abs_path is None: 
-                        m = f"{fi_key}:{wf_key}:{wf_purpose}: wf_folder_abs_path path is None."
-                        logger.debug(m)
-                        r_msg += f"{P4}{m}\n"
-                        continue
-                    if not wf_folder_abs_path.exists():
-                        m = f"{fi_key}:{wf_key}:{wf_purpose}: wf_folder_abs_path does not exist: {wf_folder_abs_path}"
-                        logger.debug(m)
-                        r_msg += f"{P4}{m}\n"
-                        continue
-                    # Scan the storage model (bsm) folder for actual files that
-                    # are potentially associated with workbooks based on filetype.
-                    bdm_wb_paths = bsm_get_workbook_names(wf_folder_abs_path)
-                    if len(bdm_wb_paths) == 0:
-                        m = f"{fi_key}:{wf_key}:{wf_purpose}: wf_folder_abs_path has no workbooks: {wf_folder_abs_path}"
-                        logger.debug(m)
-                        r_msg += f"{P4}{m}\n"
-                        continue
-                    m = f"{fi_key}:{wf_key}:{wf_purpose}: WORKFLOW_DATA_FOLDER('{wf_folder_abs_path}') "
-                    m += f"found {len(bdm_wb_paths)} files."
-                    logger.debug(m)
-                    r_msg += f"{P4}{m}\n"
-                    for wb_path in bdm_wb_paths:
-                        # Create a BDMWorkbook object for each workbook found in storage.
-                        wb_filename = wb_path.stem
-                        wb_filetype = wb_path.suffix.lower()
-                        wb_name = wb_path.name
-                        wb_url = wb_path.as_uri()
-                        bdm_wb = BDMWorkbook(
-                            wb_name = wb_name, 
-                            wb_filename =  wb_filename,
-                            wb_filetype = wb_filetype,
-                            wb_url = wb_url,
-                            fi_key= fi_key,
-                            wf_key = wf_key,
-                            wf_purpose = wf_purpose,
-                            wf_folder_url = wf_folder_url,
-                            wf_folder = wf_folder,
-                            wb_loaded = False,
-                            wb_content = None
-                            )
-                        wb_id = bdm_wb.wb_id
-                        bdm_wb.determine_wb_type() 
-                        # Exclude unknown workbook types from the discovered workbook collection,
-                        if bdm_wb.wb_type == WB_TYPE_UNKNOWN:
-                            m = f"{fi_key}:{wf_key}:{wf_purpose}: Workbook '{wb_name}' has unknown type, skipping."
+            fi_keys = list(self.bdm_fi_collection.keys()) if fi_keys is None else fi_keys
+            # First, compile the WF_FOLDERs to scan, in configuration order.
+            # Each scan task is (fi_key, wf_key, wf_folder_config, abs_path).
+            scan_tasks: List[Tuple[str, str, WF_FOLDER_CONFIG_TYPE, Path]] = []
+            for fi_key in fi_keys:
+                _ = self.bdm_FI_KEY_validate(fi_key)
+                disc_wdcs[fi_key] = {}
+                fi_folder_abs_path = self.bsm_FI_FOLDER_abs_path(fi_key)
+                m = (f"Start: FI_KEY('{fi_key}') "
+                                f"WORKBOOK_DATA_COLLECTION storage discovery "
+                                f"FI_FOLDER('{str(fi_folder_abs_path)}')")
+                r_msg += f"{P2}{m}\n"
+                logger.debug(m)
+                for wf_key, wf_folder_config_list in self.bdm_FI_WF_FOLDER_CONFIG_COLLECTION(fi_key).items():
+                    for wf_folder_config in wf_folder_config_list:
+                        wf_purpose: str = wf_folder_config[WF_PURPOSE]
+                        wf_folder_url: str = wf_folder_config[WF_FOLDER_URL]
+                        wf_folder_abs_path = Path.from_uri(wf_folder_url).resolve() if wf_folder_url is not None else None
+                        if wf_folder_abs_path is None: 
+                            m = f"{fi_key}:{wf_key}:{wf_purpose}: wf_folder_abs_path path is None."
                             logger.debug(m)
-                            r_msg += f"{P6}{m}\n"
-                            del bdm_wb
+                            r_msg += f"{P4}{m}\n"
                             continue
-                        discovered_wdc[wb_id] = bdm_wb
-                        m = bdm_wb.wb_info_display_str()
-                        logger.debug(f"Collected workbook: {m}")
-                        r_msg += f"{P6}workbook: {m}\n"
+                        scan_tasks.append((fi_key, wf_key, wf_folder_config, 
+                                           wf_folder_abs_path))
+            # Scan the storage model (bsm) folders concurrently for actual 
+            # files that are potentially associated with workbooks, creating 
+            # BDMWorkbook objects with populated metadata.
+            results = bsm_map_folders_concurrent(self._bsm_WF_FOLDER_scan, 
+                                                 scan_tasks)
+            # Merge the results in scan_tasks order.
+            for (fi_key, wf_key, wf_folder_config, wf_folder_abs_path), (found, wb_list) in zip(scan_tasks, results):
+                wf_purpose = wf_folder_config[WF_PURPOSE]
+                if found is None:
+                    m = f"{fi_key}:{wf_key}:{wf_purpose}: wf_folder_abs_path does not exist: {wf_folder_abs_path}"
+                    logger.debug(m)
+                    r_msg += f"{P4}{m}\n"
+                    continue
+                if found == 0:
+                    m = f"{fi_key}:{wf_key}:{wf_purpose}: wf_folder_abs_path has no workbooks: {wf_folder_abs_path}"
+                    logger.debug(m)
+                    r_msg += f"{P4}{m}\n"
+                    continue
+                m = f"{fi_key}:{wf_key}:{wf_purpose}: WORKFLOW_DATA_FOLDER('{wf_folder_abs_path}') "
+                m += f"found {found} files."
+                logger.debug(m)
+                r_msg += f"{P4}{m}\n"
+                for wb_path, bdm_wb in wb_list:
+                    # Exclude unknown workbook types from the discovered workbook collection,
+                    if bdm_wb is None:
+                        m = f"{fi_key}:{wf_key}:{wf_purpose}: Workbook '{wb_path.name}' has unknown type, skipping."
+                        logger.debug(m)
+                        r_msg += f"{P6}{m}\n"
+                        continue
+                    disc_wdcs[fi_key][bdm_wb.wb_id] = bdm_wb
+                    m = bdm_wb.wb_info_display_str()
+                    logger.debug(f"Collected workbook: {m}")
+                    r_msg += f"{P6}workbook: {m}\n"
             # Now have scanned all of the BSM storage to capture all BDMWorkbooks
             # from the FI_WORKFLOW structure mapped to storage.
             # Now reconcile the list of BDMWorkbook objects with the 
             # FI_WORKBOOK_DATA_COLLECTION.
-            m = f"FI_KEY('{fi_key}') discovered {len(discovered_wdc)} workbooks."
-            logger.debug(m)
-            r_msg += f"{P4}{m}\n"
-            if reconcile:
-                self.bsm_FI_WORKBOOK_DATA_COLLECTION_reconcile(fi_key, discovered_wdc)
-            m = f"Complete: FI_KEY('{fi_key}') WORKBOOK storage discovery"
-            logger.debug(m)
-            r_msg += f"{P2}{m}\n"
-            return discovered_wdc, r_msg
+            for fi_key, discovered_wdc in disc_wdcs.items():
+                m = f"FI_KEY('{fi_key}') discovered {len(discovered_wdc)} workbooks."
+                logger.debug(m)
+                r_msg += f"{P4}{m}\n"
+                if reconcile:
+                    summary = self.bsm_FI_WORKBOOK_DATA_COLLECTION_reconcile(
+                        fi_key, discovered_wdc)
+                    r_msg += summary.display_str(P4) + "\n"
+                m = f"Complete: FI_KEY('{fi_key}') WORKBOOK storage discovery"
+                logger.debug(m)
+                r_msg += f"{P2}{m}\n"
+            logger.debug(f"Scanned {len(scan_tasks)} WF_FOLDERs {p3u.stop_timer(st)}")
+            return disc_wdcs, r_msg
         except Exception as e:
                 m = p3u.exc_err_msg(e)
                 logger.error(m)
                 r_msg += f"{P2}{m}\n"
-                return discovered_wdc, r_msg
+                return disc_wdcs, r_msg
+
+    def _bsm_WF_FOLDER_scan(self, scan_task: Tuple[str, str, WF_FOLDER_CONFIG_TYPE, Path]
+                            ) -> Tuple[Optional[int], List[Tuple[Path, Optional[BDMWorkbook]]]]:
+        """Scan one WF_FOLDER, in a worker thread.
+
+        Returns:
+            Tuple: (count of workbook files found or None if the folder does 
+            not exist, list of (wb_path, BDMWorkbook or None if unknown type)).
+        """
+        fi_key, wf_key, wf_folder_config, wf_folder_abs_path = scan_task
+        if not wf_folder_abs_path.exists():
+            return None, []
+        bdm_wb_paths = bsm_get_workbook_names(wf_folder_abs_path)
+        return len(bdm_wb_paths), [
+            (wb_path, self.bsm_WORKBOOK_from_path(fi_key, wf_key, 
+                                                  wf_folder_config, wb_path))
+            for wb_path in bdm_wb_paths]
     #endregion bsm_FI_WORKBOOK_DATA_COLLECTION_resolve() method
     # ------------------------------------------------------------------------ +   
+    #region bsm_WORKBOOK_from_path() method
+    def bsm_WORKBOOK_from_path(self, fi_key: str, wf_key: str,
+                               wf_folder_config: WF_FOLDER_CONFIG_TYPE,
+                               wb_path: Path) -> Optional[BDMWorkbook]:
+        """Create a BDMWorkbook for a workbook file found in a WF_FOLDER.
+
+        Returns:
+            Optional[BDMWorkbook]: None if the workbook type is unknown.
+        """
+        bdm_wb = BDMWorkbook(
+            wb_name = wb_path.name, 
+            wb_filename =  wb_path.stem,
+            wb_filetype = wb_path.suffix.lower(),
+            wb_url = wb_path.as_uri(),
+            fi_key= fi_key,
+            wf_key = wf_key,
+            wf_purpose = wf_folder_config[WF_PURPOSE],
+            wf_folder_url = wf_folder_config[WF_FOLDER_URL],
+            wf_folder = wf_folder_config[WF_FOLDER],
+            wb_loaded = False,
+            wb_content = None
+            )
+        bdm_wb.determine_wb_type() 
+        if bdm_wb.wb_type == WB_TYPE_UNKNOWN:
+            return None
+        return bdm_wb
+    #endregion bsm_WORKBOOK_from_path() method
+    # ------------------------------------------------------------------------ +   
     #region bsm_FI_WORKBOOK_DATA_COLLECTION_reconcile() method
     def bsm_FI_WORKBOOK_DATA_COLLECTION_reconcile(
             self, 
             fi_key:str,
-            disc_wdc:WORKBOOK_DATA_COLLECTION_TYPE) -> None:
+            disc_wdc:WORKBOOK_DATA_COLLECTION_TYPE,
+            apply:bool = True) -> WDCReconcileSummary:
         """Reconcile the FI_WORKBOOK_DATA_COLLECTION with the discovered workbooks.
         
-        This method reconciles the discovered workbooks with the existing 
-        FI_WORKBOOK_DATA_COLLECTION. It updates the BDM to reflect the current
-        state of the workbooks in the storage system.
+        The changes are computed as keyed differences in one pass over both
+        collections, see wdc_reconcile(): workbooks added, removed, moved to
+        another WF_FOLDER and with a changed wb_type. Workbooks not in a
+        scanned WF_FOLDER are left as they are. With apply, the changes are
+        made to the collection in bulk, then the WorkbookIndex and the 
+        BDM_WORKBOOK_TREE are updated for the changed workbooks only.
         
         Args:
             fi_key (str): The financial institution key.
             disc_wdc (Dict[str, BDMWorkbook]): The discovered workbooks.
+            apply (bool): Apply the changes, or only return them.
+
+        Returns:
+            WDCReconcileSummary: The changes, applied or not.
         """
         try:
+            st = p3u.start_timer()
             logger.debug(f"Start: FI_KEY('{fi_key}') reconcile WORKBOOK_DATA_COLLECTION")
-            wdc = self.bdm_FI_WORKBOOK_DATA_COLLECTION(fi_key)
-            if (p3u.is_not_obj_of_type(f"FI_WORKBOOK_DATA_COLLECTION({fi_key})", 
-                                       wdc, 
-                                       WORKBOOK_DATA_COLLECTION_TYPE, 
-                                       raise_error=False) or 
-                len(wdc) == 0):
-                m = f"FI_KEY('{fi_key}') has no workflow workbook data."
-                logger.debug(m)
-                raise ValueError(m)
-            # Enumerate the discoverd WORKBOOK_DATA_COLLECTION (disc_wdc),
-            # and test the FI WORKBOOK_DATA_COLLECTION for the presence of each
-            # discovered BDMWorkbook. If the BDMWorkbook is not present, add it.
-            added : List[str] = []
-            for wb_id, wb in disc_wdc.items():
-                if wb_id not in wdc:
-                    # Add a new discovered workbook.
-                    logger.debug(f"FI_KEY('{fi_key}') adding discovered "
-                                 f"BDMWorkbook '{wb_id}' to FI_WORKBOOK_DATA_COLLECTION.")
-                    wdc[wb_id] = wb
-                    added.append(wb_id)
-            logger.debug(f"Complete: FI_KEY('{fi_key}') reconciled, added "
-                         f"{len(added)} new BDMWorkbook(s) {str(added)}")
+            with self._bdm_lock:
+                fi_obj: FI_OBJECT_TYPE = self.bdm_FI_OBJECT(fi_key)
+                summary = wdc_reconcile(fi_key, fi_obj[FI_WORKBOOK_DATA_COLLECTION],
+                                        disc_wdc, self._bsm_FI_WF_FOLDERS_scanned(fi_key))
+                if apply and summary.changed:
+                    self._bsm_FI_WORKBOOK_DATA_COLLECTION_apply(fi_key, disc_wdc, summary)
+                summary.applied = apply
+            logger.debug(f"Complete: {summary.summary_str()} {p3u.stop_timer(st)}")
+            return summary
         except Exception as e:
                 m = p3u.exc_err_msg(e)
                 logger.error(m)
                 raise
+
+    def _bsm_FI_WORKBOOK_DATA_COLLECTION_apply(self, fi_key: str,
+            disc_wdc: WORKBOOK_DATA_COLLECTION_TYPE,
+            summary: WDCReconcileSummary) -> None:
+        """Apply the summary changes to the FI_WORKBOOK_DATA_COLLECTION."""
+        fi_obj: FI_OBJECT_TYPE = self.bdm_FI_OBJECT(fi_key)
+        if fi_obj[FI_WORKBOOK_DATA_COLLECTION] is None:
+            fi_obj[FI_WORKBOOK_DATA_COLLECTION] = {}
+        wdc = fi_obj[FI_WORKBOOK_DATA_COLLECTION]
+        index = self.bdm_WORKBOOK_INDEX
+        wb_tree = self.bdm_workbook_tree
+        synced = wb_tree is not None and wb_tree.is_synced(fi_key, wdc)
+        # Collection changes, in bulk.
+        removed: List[str] = summary.removed + [old for old, _ in summary.moved]
+        put: List[str] = summary.added + [new for _, new in summary.moved]
+        for wb_id in removed:
+            wdc.pop(wb_id, None)
+        for wb_id in put:
+            wdc[wb_id] = disc_wdc[wb_id]
+        for wb_id, _, wb_type in summary.type_changed:
+            wdc[wb_id].wb_type = wb_type
+        # Then the index and tree, for the changed workbooks only.
+        changed: List[str] = put + [wb_id for wb_id, _, _ in summary.type_changed]
+        for wb_id in removed:
+            index.remove(fi_key, wb_id)
+        for wb_id in changed:
+            index.add(fi_key, wb_id)
+        if synced:
+            for wb_id in removed:
+                wb_tree.remove_workbook_node(fi_key, wb_id)
+            for wb_id in changed:
+                self._bdm_WORKBOOK_TREE_put(wb_tree, fi_key, wb_id)
+            wb_tree.set_synced(fi_key, wdc)
+
+    def _bsm_FI_WF_FOLDERS_scanned(self, fi_key: str) -> Set[str]:
+        """Return the WF_FOLDERs of fi_key, lower case, that exist in storage
+        and are scanned for workbooks."""
+        wf_folders: Set[str] = set()
+        for wfc_list in self.bdm_FI_WF_FOLDER_CONFIG_COLLECTION(fi_key).values():
+            for wfc in wfc_list:
+                wf_folder_url = wfc.get(WF_FOLDER_URL)
+                if wf_folder_url and Path.from_uri(wf_folder_url).exists():
+                    wf_folders.add(wfc[WF_FOLDER].lower())
+        return wf_folders
     #endregion bsm_FI_WORKBOOK_DATA_COLLECTION_reconcile() method
     # ------------------------------------------------------------------------ + 
     #region bsm_FI_FOLDER Path methods
@@ -1877,7 +2582,8 @@ class BudgetDomainModel(p3m.Model,metaclass=BDMSingletonMeta):
     #region bsm_FI_WF_FOLDER_CONFIG_resolve() method
     def bsm_FI_WF_FOLDER_CONFIG_resolve(self, 
                 fi_key:str, create_missing_folders:bool=True, 
-                raise_errors:bool=True) -> None:
+                raise_errors:bool=True,
+                fi_wf_fldr_cfg: Optional[FI_WF_FOLDER_CONFIG_COLLECTION_TYPE] = None) -> None:
         """Resolve all WF_FOLDER_CONFIG settings an FI_KEY.
         
         A BDM_STORE provides configurations for workflow processes in the
@@ -1894,10 +2600,18 @@ class BudgetDomainModel(p3m.Model,metaclass=BDMSingletonMeta):
         
         The second part is to resolve each FI_KEY FI_WF_FOLDER_CONFIG_COLLECTION
         to create missing folders and update the WF_FOLDER_URL attributes.
+
+        If fi_wf_fldr_cfg is given, it is resolved instead of the 
+        FI_WF_FOLDER_CONFIG_COLLECTION in the model for fi_key.
         """
         try:
             logger.debug(f"FI_KEY('{fi_key}') FI_WF_FOLDER_CONFIG_COLLECTION.")
             fi_folder_abs_path: Path = self.bsm_FI_FOLDER_abs_path(fi_key)
+            if fi_wf_fldr_cfg is None:
+                fi_obj: FI_OBJECT_TYPE = self.bdm_FI_OBJECT(fi_key)
+                if not fi_obj[FI_WF_FOLDER_CONFIG_COLLECTION]:
+                    fi_obj[FI_WF_FOLDER_CONFIG_COLLECTION] = {}
+                fi_wf_fldr_cfg = fi_obj[FI_WF_FOLDER_CONFIG_COLLECTION]
 
             # Step 1. Validate the FI_WF_FOLDER_CONFIG_COLLECTION has all the
             # WF_FOLDER_CONFIG_LISTs prescribed in the BDM_WF_COLLECTION.
@@ -1912,18 +2626,16 @@ class BudgetDomainModel(p3m.Model,metaclass=BDMSingletonMeta):
                 wf_folder_config_list = wf_object[WF_FOLDER_CONFIG_LIST]
                 for wf_folder_config in wf_folder_config_list:
                     # Lookup wf_folder_config in the fi_wf_folder_config_list.
-                    fi_wf_folder_config: WF_FOLDER_CONFIG_TYPE = None
-                    fi_wf_folder_config = self.bdm_WF_FOLDER_CONFIG(
-                        fi_key, wf_key, wf_folder_config[WF_PURPOSE])
-                    if fi_wf_folder_config is None:
-                        # Not found, so add it to the fi_wf_folder_config_list.
-                        self.bdm_FI_WF_FOLDER_CONFIG_COLLECTION_append(
-                            fi_key, wf_key, wf_folder_config)
+                    fi_wf_folder_config_list = fi_wf_fldr_cfg.get(wf_key) or []
+                    if not any(c[WF_PURPOSE] == wf_folder_config[WF_PURPOSE]
+                               for c in fi_wf_folder_config_list):
+                        # Not found, so add a copy to the fi_wf_folder_config_list,
+                        # the WF_FOLDER_URL resolved below is specific to the FI.
+                        fi_wf_fldr_cfg.setdefault(wf_key, []).append(
+                            dict(wf_folder_config))
                         logger.debug(f"FI_KEY('{fi_key}') WF_KEY('{wf_key}') "
                                       f"added wf_folder_config: ({wf_folder_config})")
             # Step 2. Resolve the FI_WF_FOLDER_CONFIG_COLLECTION.
-            fi_wf_fldr_cfg: FI_WF_FOLDER_CONFIG_COLLECTION_TYPE = None
-            fi_wf_fldr_cfg = self.bdm_FI_WF_FOLDER_CONFIG_COLLECTION(fi_key)
             for wf_key, wf_config_list in fi_wf_fldr_cfg.items():
                 for wf_folder in wf_config_list:
                     wf_folder_abs_path: Path = fi_folder_abs_path / wf_folder[WF_FOLDER]
@@ -1940,33 +2652,40 @@ class BudgetDomainModel(p3m.Model,metaclass=BDMSingletonMeta):
             m = p3u.exc_err_msg(e)
             logger.error(m)
             raise
+        finally:
+            # The model's collection may be changed in place.
+            self._bdm_wf_folder_table.invalidate(fi_key)
     #endregion bsm_FI_WF_FOLDER_CONFIG_resolve() method
     # ------------------------------------------------------------------------ + 
-    #region bsm_FI_WF_FOLDER Path methods TODO: Are these still needed?
+    #region bsm_FI_WF_FOLDER Path methods
     def bsm_FI_WORKFLOW_DATA_FOLDER_path_str(self, fi_key : str, wf_key : str,
                                folder_id : str) -> str:
         """str version of the WF_FOLDER value for fi_key/wf_key/folder_id."""
+        p = self.bsm_FI_WORKFLOW_DATA_FOLDER_path(fi_key, wf_key, folder_id)
+        return str(p) if p is not None else None
+    def bsm_FI_WORKFLOW_DATA_FOLDER_path(self, fi_key : str, wf_key : str, 
+                           folder_id:str) -> Path:
+        """Path of the WF_FOLDER for fi_key/wf_key/folder_id, expanduser()."""
         if folder_id not in VALID_WF_PURPOSE_VALUES:
             m = f"Invalid folder_id '{folder_id}' for FI_KEY('{fi_key}') "
             m += f"and WF_KEY('{wf_key}')"
             logger.error(m)
             raise ValueError(m)
-        fi_p_s = self.bsm_FI_FOLDER_path_str(fi_key) # FI_FOLDER Path component
-        wf_p_s = self.bdm_WF_FOLDER(wf_key, folder_id)
-        return str(Path(fi_p_s) / wf_p_s) if wf_p_s is not None else None
-    def bsm_FI_WORKFLOW_DATA_FOLDER_path(self, fi_key : str, wf_key : str, 
-                           folder_id:str) -> Path:
-        """Path of self.bsm_wf_folder_path_str().expanduser()."""
-        p_s = self.bsm_FI_WORKFLOW_DATA_FOLDER_path_str(fi_key, wf_key, folder_id)
-        return Path(p_s).expanduser() if p_s is not None else None
+        entry = self.bdm_WF_FOLDER_entry(fi_key, wf_key, folder_id)
+        if entry is None or entry.wf_folder is None:
+            return None
+        if entry.path is None:
+            self.bsm_FI_FOLDER_path_str(fi_key) # Raises the ValueError.
+        return entry.path
     def bsm_FI_WORKFLOW_DATA_FOLDER_abs_path(self, fi_key : str, wf_key : str,
                                folder_id : str) -> Path:
-        """Path of self.bsm_wf_folder_path().resolve()."""
-        p = self.bsm_FI_WORKFLOW_DATA_FOLDER_path(fi_key, wf_key, folder_id)
-        return p.resolve() if p is not None else None
+        """Path of self.bsm_FI_WORKFLOW_DATA_FOLDER_path().resolve()."""
+        if self.bsm_FI_WORKFLOW_DATA_FOLDER_path(fi_key, wf_key, folder_id) is None:
+            return None
+        return self.bdm_WF_FOLDER_entry(fi_key, wf_key, folder_id).abs_path
     def bsm_FI_WORKFLOW_DATA_FOLDER_abs_path_str(self, fi_key : str, wf_key : str,
                                    folder_id : str) -> str:
-        """str of self.bsm_wf_folder_abs_path()."""
+        """str of self.bsm_FI_WORKFLOW_DATA_FOLDER_abs_path()."""
         p = self.bsm_FI_WORKFLOW_DATA_FOLDER_abs_path(fi_key, wf_key, folder_id)
         return str(p) if p is not None else None
     #endregion bsm_FI_WF_FOLDER_CONFIG_resolve Path methods
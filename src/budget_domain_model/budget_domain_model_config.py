@@ -27,7 +27,6 @@ import logging, uuid, os, getpass, copy
 from pathlib import Path
 from typing import List, Dict, Any
 # third-party modules and packages
-from openpyxl import Workbook, load_workbook
 import p3_utils as p3u, pyjson5, p3logging as p3l
 # local modules and packages
 from budman_namespace.bdm_singleton_meta import BDMSingletonMeta
@@ -13,9 +13,13 @@ from .budget_storage_model import (
     bsm_BDMWorkbook_copy,
     bsm_BDMWorkbook_close,
     bsm_BDMWorkbook_delete,
+    bsm_BDMWorkbook_load_aio,
+    bsm_BDMWorkbook_save_aio,
     # Level 2 Methods
     bsm_WORKBOOK_CONTENT_url_get,
     bsm_WORKBOOK_CONTENT_url_put,
+    bsm_WORKBOOK_CONTENT_url_get_aio,
+    bsm_WORKBOOK_CONTENT_url_put_aio,
     bsm_WORKBOOK_CONTENT_url_copy,
     bsm_WORKBOOK_CONTENT_url_close,
     bsm_WORKBOOK_CONTENT_url_delete,
@@ -37,13 +41,53 @@ from .budget_storage_model import (
     bsm_URL_verify_file_scheme,
     bsm_verify_folder,
     bsm_get_workbook_names,
+    bsm_map_folders_concurrent,
     bsm_get_folder_structure,
     bsm_file_url_abs_path,
     bsm_file_url_full_filename,
     bsm_BDM_STORE_to_json
 )
 from .bsm_file import BSMFile
+from .bsm_journal import (
+    bsm_journal_path,
+    bsm_journal_size,
+    bsm_journal_append,
+    bsm_journal_read,
+    bsm_journal_clear,
+    bsm_journal_replay,
+    BSM_JOURNAL_COMPACT_SIZE,
+    BSM_JOURNAL_OP,
+    BSM_JOURNAL_OP_WB_PUT,
+    BSM_JOURNAL_OP_WB_DEL,
+    BSM_JOURNAL_OP_FI_PUT,
+    BSM_JOURNAL_OP_FI_DEL,
+    BSM_JOURNAL_OP_SET,
+    BSM_JOURNAL_OP_COMMIT
+)
+from .bsm_json_codec import (
+    bsm_json_decode,
+    bsm_json_file_load,
+    bsm_json_snapshot_path,
+    bsm_json_snapshot_load,
+    bsm_json_snapshot_save
+)
+from .bsm_warm_start import (
+    bsm_warm_start_cache_dir,
+    bsm_warm_start_path,
+    bsm_warm_start_manifest,
+    bsm_warm_start_manifest_current,
+    bsm_warm_start_save,
+    bsm_warm_start_load,
+    bsm_warm_start_clear,
+    BSM_WARM_START_VERSION
+)
 from .bsm_file_tree import BSMFileTree
+from .bsm_change_monitor import (
+    BSMChangeMonitor,
+    BSMChangeEvent,
+    BSM_CHANGE_ADDED,
+    BSM_CHANGE_REMOVED
+)
 from .csv_data_collection import (
     csv_DATA_LIST_url_get,
     csv_DATA_LIST_url_put,
@@ -56,7 +100,8 @@ from .csv_data_collection import (
     csv_DATA_LIST_remove_extra_columns,
     csv_DATA_LIST_merge_columns,
     csv_DATA_LIST_rename_columns,
-    csv_DATA_LIST_file_validate_header
+    csv_DATA_LIST_file_validate_header,
+    csv_header_row_matches
 )
 
 __all__ = [
@@ -67,9 +112,13 @@ __all__ = [
     "bsm_BDMWorkbook_copy",
     "bsm_BDMWorkbook_close",
     "bsm_BDMWorkbook_delete",
+    "bsm_BDMWorkbook_load_aio",
+    "bsm_BDMWorkbook_save_aio",
     # Level 2 Methods
     "bsm_WORKBOOK_CONTENT_url_get",
     "bsm_WORKBOOK_CONTENT_url_put",
+    "bsm_WORKBOOK_CONTENT_url_get_aio",
+    "bsm_WORKBOOK_CONTENT_url_put_aio",
     "bsm_WORKBOOK_CONTENT_url_copy",
     "bsm_WORKBOOK_CONTENT_url_close",
     "bsm_WORKBOOK_CONTENT_url_delete",
@@ -91,14 +140,50 @@ __all__ = [
     "bsm_URL_verify_file_scheme",
     "bsm_verify_folder",
     "bsm_get_workbook_names",
+    "bsm_map_folders_concurrent",
     "bsm_get_folder_structure",
     "bsm_file_url_abs_path",
     "bsm_file_url_full_filename",
     "bsm_BDM_STORE_to_json",
     # bsm_file moddule
     "BSMFile",
+    # bsm_journal module
+    "bsm_journal_path",
+    "bsm_journal_size",
+    "bsm_journal_append",
+    "bsm_journal_read",
+    "bsm_journal_clear",
+    "bsm_journal_replay",
+    "BSM_JOURNAL_COMPACT_SIZE",
+    "BSM_JOURNAL_OP",
+    "BSM_JOURNAL_OP_WB_PUT",
+    "BSM_JOURNAL_OP_WB_DEL",
+    "BSM_JOURNAL_OP_FI_PUT",
+    "BSM_JOURNAL_OP_FI_DEL",
+    "BSM_JOURNAL_OP_SET",
+    "BSM_JOURNAL_OP_COMMIT",
+    # bsm_json_codec module
+    "bsm_json_decode",
+    "bsm_json_file_load",
+    "bsm_json_snapshot_path",
+    "bsm_json_snapshot_load",
+    "bsm_json_snapshot_save",
+    # bsm_warm_start module
+    "bsm_warm_start_cache_dir",
+    "bsm_warm_start_path",
+    "bsm_warm_start_manifest",
+    "bsm_warm_start_manifest_current",
+    "bsm_warm_start_save",
+    "bsm_warm_start_load",
+    "bsm_warm_start_clear",
+    "BSM_WARM_START_VERSION",
     #bsm_file_tree module
     "BSMFileTree",
+    # bsm_change_monitor module
+    "BSMChangeMonitor",
+    "BSMChangeEvent",
+    "BSM_CHANGE_ADDED",
+    "BSM_CHANGE_REMOVED",
     # csv_data_collection Functions
     "csv_DATA_LIST_url_get",
     "csv_DATA_LIST_url_put",
@@ -111,5 +196,6 @@ __all__ = [
     "csv_DATA_LIST_remove_extra_columns",
     "csv_DATA_LIST_merge_columns",
     "csv_DATA_LIST_rename_columns",
-    "csv_DATA_LIST_file_validate_header"
+    "csv_DATA_LIST_file_validate_header",
+    "csv_header_row_matches"
     ]
@@ -0,0 +1,175 @@
+# ---------------------------------------------------------------------------- +
+#region    bsm_change_monitor.py module
+""" Implements BSMChangeMonitor Class.
+
+    A lightweight storage change monitor for BudMan folders, using only the
+    python standard library. Watched folders are polled by directory mtime on
+    a background thread. Only folders whose mtime changed are listed again,
+    and the new listing is compared to the previous one to produce
+    BSMChangeEvent objects for files added or removed. The cost of a poll is
+    one stat() per watched folder, plus a listing of each changed folder.
+
+    The monitor only collects events, it does not know about the BDM. A
+    consumer, such as the BudgetDomainModel, provides an on_changes callback
+    to apply the events, which is invoked from the monitor thread. Events
+    can also be collected synchronously with poll().
+
+    Watched folders are not recursive, subfolders are watched explicitly.
+    Changes to the content of an existing file do not change the folder
+    mtime and are not reported.
+"""
+#endregion bsm_change_monitor.py module
+# ---------------------------------------------------------------------------- +
+#region    Imports
+# python standard library modules and packages
+import logging, os, threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Set
+
+# third-party modules and packages
+import p3_utils as p3u
+
+# local modules and packages
+from budget_storage_model.budget_storage_model import bsm_URL_verify_file_scheme
+#endregion Imports
+# ---------------------------------------------------------------------------- +
+#region    Globals and Constants
+logger = logging.getLogger(__name__)
+BSM_CHANGE_ADDED = "added"
+BSM_CHANGE_REMOVED = "removed"
+BSM_CHANGE_MONITOR_POLL_INTERVAL = 2.0  # seconds
+#endregion Globals and Constants
+# ---------------------------------------------------------------------------- +
+@dataclass(frozen=True)
+class BSMChangeEvent:
+    """A file added to or removed from a watched folder."""
+    change_type: str
+    folder_url: str
+    file_url: str
+
+    @property
+    def file_path(self) -> Path:
+        """The file path for the event."""
+        return Path.from_uri(self.file_url)
+# ---------------------------------------------------------------------------- +
+class BSMChangeMonitor:
+    """Poll watched folders by mtime and report files added or removed.
+
+    Args:
+        on_changes (Callable): Optional, called with a List[BSMChangeEvent]
+            from the monitor thread when a poll finds changes.
+        poll_interval (float): Seconds between polls on the monitor thread.
+    """
+    def __init__(self, on_changes: Optional[Callable[[List[BSMChangeEvent]], None]] = None,
+                 poll_interval: float = BSM_CHANGE_MONITOR_POLL_INTERVAL) -> None:
+        self.on_changes = on_changes
+        self.poll_interval: float = poll_interval
+        # folder_url -> (abs path, mtime_ns, set of file names)
+        self._folders: Dict[str, tuple] = {}
+        self._lock: threading.Lock = threading.Lock()
+        self._stop_event: threading.Event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def watched_folders(self) -> List[str]:
+        """The urls of the watched folders."""
+        with self._lock:
+            return list(self._folders.keys())
+
+    @property
+    def is_running(self) -> bool:
+        """True if the monitor thread is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def watch(self, folder_url: str) -> None:
+        """Start watching the folder at folder_url, recording its content now.
+
+        Folders that do not exist yet are watched and reported once created.
+        """
+        try:
+            p3u.is_not_non_empty_str("folder_url", folder_url, raise_error=True)
+            folder_path: Path = bsm_URL_verify_file_scheme(folder_url, test_exists=False)
+            mtime_ns, names = self._list_folder(folder_path)
+            with self._lock:
+                self._folders[folder_url] = (folder_path, mtime_ns, names)
+        except Exception as e:
+            logger.error(p3u.exc_err_msg(e))
+            raise
+
+    def unwatch(self, folder_url: str) -> None:
+        """Stop watching the folder at folder_url."""
+        with self._lock:
+            self._folders.pop(folder_url, None)
+
+    def poll(self) -> List[BSMChangeEvent]:
+        """Check the watched folders once, return the change events found."""
+        events: List[BSMChangeEvent] = []
+        with self._lock:
+            folders = list(self._folders.items())
+        for folder_url, (folder_path, old_mtime, old_names) in folders:
+            try:
+                mtime_ns: int = os.stat(folder_path).st_mtime_ns
+            except FileNotFoundError:
+                mtime_ns = -1
+            if mtime_ns == old_mtime:
+                continue
+            mtime_ns, names = self._list_folder(folder_path)
+            for name in sorted(names - old_names):
+                events.append(BSMChangeEvent(BSM_CHANGE_ADDED, folder_url,
+                                             (folder_path / name).as_uri()))
+            for name in sorted(old_names - names):
+                events.append(BSMChangeEvent(BSM_CHANGE_REMOVED, folder_url,
+                                             (folder_path / name).as_uri()))
+            with self._lock:
+                if folder_url in self._folders:
+                    self._folders[folder_url] = (folder_path, mtime_ns, names)
+        if events:
+            logger.debug(f"BSMChangeMonitor found {len(events)} change(s).")
+        return events
+
+    def start(self) -> None:
+        """Start the monitor thread."""
+        try:
+            if self.is_running:
+                return
+            self._stop_event.clear()
+            self._thread = threading.Thread(target=self._monitor_thread_func,
+                                            name="BSMChangeMonitorThread",
+                                            daemon=True)
+            self._thread.start()
+            logger.debug(f"BSMChangeMonitor started, watching "
+                         f"{len(self._folders)} folder(s).")
+        except Exception as e:
+            logger.error(p3u.exc_err_msg(e))
+            raise
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop the monitor thread and wait for it to exit."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        logger.debug("BSMChangeMonitor stopped.")
+
+    def _monitor_thread_func(self) -> None:
+        """Poll until stopped, handing events to the on_changes callback."""
+        while not self._stop_event.wait(self.poll_interval):
+            try:
+                events = self.poll()
+                if events and self.on_changes is not None:
+                    self.on_changes(events)
+            except Exception as e:
+                # Keep monitoring, a failed poll or callback is only logged.
+                logger.error(p3u.exc_err_msg(e))
+
+    @staticmethod
+    def _list_folder(folder_path: Path) -> tuple:
+        """Return (mtime_ns, set of file names) for folder_path."""
+        try:
+            mtime_ns: int = os.stat(folder_path).st_mtime_ns
+            with os.scandir(folder_path) as it:
+                names: Set[str] = {e.name for e in it if e.is_file()}
+            return mtime_ns, names
+        except FileNotFoundError:
+            return -1, set()
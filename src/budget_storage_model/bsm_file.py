@@ -162,6 +162,17 @@ class BSMFile():
             raise ValueError("in_bdm must be a boolean value.")
         self._in_bdm = value
 
+    def reset_metadata(self, type: str) -> None:
+        """Reset the type and the metadata set by the BDM, recompute the
+        prefix and wb_type from the filename."""
+        self.type = type
+        self._prefix = None
+        self._wb_type = WB_TYPE_UNKNOWN
+        self._wf_key = "n/a"
+        self._wf_purpose = "User-Defined"
+        self._in_bdm = False
+        self.update()
+
     def verify_url(self) -> Optional[Path]:
         """Verify the file URL."""
         try:
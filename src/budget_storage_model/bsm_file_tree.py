@@ -12,16 +12,18 @@
     based on the Treelib module. This module provides a simple API to create 
     and update a file tree for a specified budget domain model based on a url.
 
-    Once initialized, the file_tree is saved in a .json file in the root 
-    BDM_FOLDER of BudMan. Other functions are used to look up information from the
+    Once initialized, the file_tree is saved as a snapshot in a .json file in 
+    the root BDM_FOLDER of BudMan, with the directory mtimes seen at scan time.
+    Later scans start from the snapshot and only list folders whose mtime 
+    changed. Other functions are used to look up information from the
     file_tree about folders and files using an int file_index or dir_index. The 
-    index values are unique to the entire tree. 
+    index values are unique to the entire tree and stable across scans.
 """
 #endregion bsm_file_tree.py module
 # ---------------------------------------------------------------------------- +
 #region    Imports
 # python standard library modules and packages
-import logging, os, time, toml
+import logging, os, time, toml, json
 from pathlib import Path
 from typing import Dict, List, Any, Union, Optional, Generator
 
@@ -31,12 +33,22 @@ from treelib import Tree, Node
 
 # local modules and packages
 from budget_storage_model.bsm_file import BSMFile
+from budget_storage_model.bsm_journal import BSM_JOURNAL_SUFFIX
+from budget_storage_model.bsm_json_codec import BSM_JSON_SNAPSHOT_SUFFIX
 import budman_namespace.design_language_namespace as bdm
 from budget_storage_model import (bsm_verify_folder, bsm_URL_verify_file_scheme,)
 #endregion Imports
 # ---------------------------------------------------------------------------- +
 #region    Globals and Constants
 logger = logging.getLogger(__name__)
+BSM_FILE_TREE_SNAPSHOT_FILENAME = ".bdm_file_tree.json"
+BSM_FILE_TREE_SNAPSHOT_VERSION = 2
+BSM_FILE_TREE_EXCLUDED_FOLDERS = ["backup", "test", "draft", 
+                                  "copies","__pycache__", "personal"]
+# BSM files kept beside json files and the BDM_STORE, never in the file_tree.
+BSM_FILE_TREE_EXCLUDED_SUFFIXES = (BSM_JSON_SNAPSHOT_SUFFIX, 
+                                   BSM_JSON_SNAPSHOT_SUFFIX + ".tmp",
+                                   BSM_JOURNAL_SUFFIX)
 # ---------------------------------------------------------------------------- +
 #endregion Globals and Constants
 # ---------------------------------------------------------------------------- +
@@ -65,32 +77,45 @@ class BSMFileTree:
         self.file_tree: Tree = None
         self.max_file_index: int = -1
         self.max_dir_index: int = -1
+        # Scan state: folder node_id -> (abs path str, dir st_mtime_ns).
+        self._folder_paths: Dict[str, str] = {}
+        self._folder_mtimes: Dict[str, int] = {}
+        self.scan_stats: Dict[str, Any] = {}
         if save_tree:
-            self.file_tree_json_file: Path = self.folder_path / ".bdm_file_tree.json"
+            self.file_tree_json_file: Path = self.folder_path / BSM_FILE_TREE_SNAPSHOT_FILENAME
+            self.load_snapshot()
         else:
             self.file_tree_json_file = None
         self.update_file_tree()
 
-    def update_file_tree(self) -> None:
-        """Update the file_tree from the folder_url."""
+    def update_file_tree(self, full_scan:bool=False) -> None:
+        """Update the file_tree from the folder_url.
+
+        The scan is incremental. Folders whose directory mtime is unchanged 
+        since the last scan (or the persisted snapshot) are not listed again, 
+        only their known subfolders are checked. In changed folders, only the 
+        added or removed nodes are updated, existing file_index and 
+        folder_index values are kept stable. The snapshot is only saved when
+        something was added or removed, a folder whose mtime changed without 
+        any change in its entries is just listed again next time.
+
+        Args:
+            full_scan (bool): Discard the current tree and rescan everything.
+        """
         try:
             p3u.is_not_non_empty_str("folder_url", self.folder_url, raise_error=True)
-            self.file_tree = self.construct_file_tree()
+            st = p3u.start_timer()
+            if full_scan or self.file_tree is None:
+                self.file_tree = self.construct_file_tree()
+            else:
+                self.scan_file_tree()
             if self.file_tree is None or not isinstance(self.file_tree, Tree):
                 raise ValueError("file_tree is not a valid Tree object.")
-            # Update max file_index and dir_index
-            self.max_file_index = -1
-            self.max_dir_index = -1
-            for node in self.file_tree.all_nodes():
-                if isinstance(node.data, BSMFile):
-                    if node.data.file_index > self.max_file_index:
-                        self.max_file_index = node.data.file_index
-                    if node.data.folder_index > self.max_dir_index:
-                        self.max_dir_index = node.data.folder_index
-            # Save the file_tree to a .json file
-            if self.save_tree and self.file_tree_json_file:
-                logger.debug(f"Saving file_tree to {self.file_tree_json_file}")
-                self.file_tree.save2file(str(self.file_tree_json_file))
+            logger.debug(f"file_tree scan: {self.scan_stats} {p3u.stop_timer(st)}")
+            # Save the file_tree snapshot to a .json file
+            if (self.save_tree and self.file_tree_json_file and 
+                self.scan_stats.get("dirty", False)):
+                self.save_snapshot()
         except Exception as e:
             logger.error(p3u.exc_err_msg(e))
             raise
@@ -100,73 +125,224 @@ class BSMFileTree:
         p3u.is_not_non_empty_str("folder_url", self.folder_url, raise_error=True)
         folder_abs_path: Path = Path.from_uri(self.folder_url)
         bsm_verify_folder(folder_abs_path, create=False, raise_errors=True)
-        file_index:int = 0
-        folder_index:int = 0
-        file_tree = Tree()
-        tag = f"{folder_index:03}:{folder_abs_path.name}"
+        self.max_file_index = -1
+        self.max_dir_index = 0
+        self._folder_paths.clear()
+        self._folder_mtimes.clear()
+        self.file_tree = Tree()
+        tag = f"{0:03}:{folder_abs_path.name}"
         # Root node
-        bsm_file: BSMFile = BSMFile(BSMFile.BSM_FOLDER, folder_index, -1, 
+        bsm_file: BSMFile = BSMFile(BSMFile.BSM_FOLDER, 0, -1, 
                                     self.folder_url,
                                     valid_prefixes=self.valid_prefixes,
                                     valid_wb_types=self.valid_wb_types)
-        file_tree.create_node(tag=tag, identifier=self.folder_url,data=bsm_file)
+        self.file_tree.create_node(tag=tag, identifier=self.folder_url,data=bsm_file)
+        self._folder_paths[self.folder_url] = str(folder_abs_path)
+        self.scan_file_tree()
+        return self.file_tree
 
-        def add_nodes(current_path: Path, parent_id: str) -> None:
-            """Recursive scan folder current_path, depth-first"""
-            nonlocal folder_index, file_index
-            try:
-                if not current_path.is_dir(): # Windows file system specific is_dir()
-                    raise ValueError(f"Path is not a folder: {current_path}")
-                folder_index += 1
-                # iterdir() returns "arbitrary order, may need to sort."
-                for item in current_path.iterdir(): # Windows file system sprecific.
-                    node_id = item.as_uri().lower() 
-                    if item.is_dir():
-                        # Folder
-                        # Apply folder exclude list
-                        if item.stem in ["backup", "test", "draft", 
-                                        "copies","__pycache__", "personal"]:
-                            continue
-                        tag = f"{folder_index:03}:{item.name}"
-                        folder_bsm_file: BSMFile = BSMFile(
-                            BSMFile.BSM_FOLDER, 
-                            folder_index, 
-                            -1, 
-                            node_id,
-                            valid_prefixes=self.valid_prefixes,
-                            valid_wb_types=self.valid_wb_types)
-                        file_tree.create_node(
-                            tag=tag, 
-                            identifier=node_id,
-                            parent=parent_id,
-                            data=folder_bsm_file)
-                        add_nodes(item, node_id)
-                    else:
-                        # File
-                        tag = f"{file_index:03}:{item.name}"
-                        file_bsm_file: BSMFile = BSMFile(
-                            BSMFile.BSM_FILE, folder_index, 
-                            file_index, item.as_uri(),
-                            valid_prefixes=self.valid_prefixes,
-                            valid_wb_types=self.valid_wb_types)
-                        file_tree.create_node(
-                            tag=tag, 
-                            identifier=node_id,
-                            parent=parent_id,
-                            data=file_bsm_file)
-                        file_index += 1
-                return
-            except Exception as e:
-                logger.error(p3u.exc_err_msg(e))
-                raise
+    def scan_file_tree(self) -> None:
+        """Apply storage changes to the file_tree, depth-first from the root."""
+        self.scan_stats = {"listed": 0, "skipped": 0, "added": 0, 
+                           "removed": 0, "dirty": False}
+        root_path: str = self._folder_paths.get(self.folder_url, 
+                                                str(self.folder_path))
+        try:
+            root_mtime: int = os.stat(root_path).st_mtime_ns
+        except FileNotFoundError:
+            m = f"Path is not a folder: {root_path}"
+            logger.error(m)
+            raise ValueError(m)
+        self._scan_folder(self.folder_url, root_path, root_mtime)
 
+    def _scan_folder(self, node_id: str, folder_path: str, mtime_ns: int) -> None:
+        """Scan one folder, listing its entries only if its mtime changed."""
         try:
-            add_nodes(folder_abs_path, self.folder_url)
-            return file_tree
+            tree: Tree = self.file_tree
+            if self._folder_mtimes.get(node_id) == mtime_ns:
+                # Unchanged: no entries added or removed in this folder, but 
+                # its subfolders may have changed, so check those by stat.
+                self.scan_stats["skipped"] += 1
+                for child_id in list(tree.is_branch(node_id)):
+                    if child_id not in self._folder_paths:
+                        continue
+                    child_path = self._folder_paths[child_id]
+                    try:
+                        child_mtime = os.stat(child_path).st_mtime_ns
+                    except FileNotFoundError:
+                        # Parent mtime should have changed, be defensive.
+                        self._remove_node(child_id)
+                        continue
+                    self._scan_folder(child_id, child_path, child_mtime)
+                return
+            self.scan_stats["listed"] += 1
+            folder_index: int = tree.get_node(node_id).data.folder_index
+            existing: set = set(tree.is_branch(node_id))
+            subfolders: List[tuple] = []
+            with os.scandir(folder_path) as it:
+                entries = sorted(it, key=lambda e: e.name)
+            for entry in entries:
+                child_id = Path(entry.path).as_uri().lower()
+                is_dir = entry.is_dir()
+                if is_dir and Path(entry.name).stem in BSM_FILE_TREE_EXCLUDED_FOLDERS:
+                    continue
+                if entry.name.startswith(BSM_FILE_TREE_SNAPSHOT_FILENAME):
+                    continue # the snapshot itself, or its temp file
+                if not is_dir and entry.name.endswith(BSM_FILE_TREE_EXCLUDED_SUFFIXES):
+                    continue # json snapshots and the BDM_STORE journal
+                if child_id in existing:
+                    existing.discard(child_id)
+                    if is_dir == (child_id in self._folder_paths):
+                        if is_dir:
+                            subfolders.append((child_id, entry))
+                        continue
+                    # Changed between file and folder, replace the node.
+                    self._remove_node(child_id)
+                if is_dir:
+                    self.max_dir_index += 1
+                    self._add_folder_node(child_id, node_id, entry.path, 
+                                          entry.name, self.max_dir_index)
+                    subfolders.append((child_id, entry))
+                else:
+                    self.max_file_index += 1
+                    self._add_file_node(child_id, node_id, entry.path, 
+                                        entry.name, folder_index, 
+                                        self.max_file_index)
+            # Whatever is left in existing is no longer in storage.
+            for child_id in existing:
+                self._remove_node(child_id)
+            self._folder_mtimes[node_id] = mtime_ns
+            for child_id, entry in subfolders:
+                self._scan_folder(child_id, entry.path, entry.stat().st_mtime_ns)
         except Exception as e:
             logger.error(p3u.exc_err_msg(e))
             raise
 
+    def _add_folder_node(self, node_id: str, parent_id: str, path: str, 
+                         name: str, folder_index: int) -> None:
+        """Add a folder node to the file_tree."""
+        folder_bsm_file: BSMFile = BSMFile(
+            BSMFile.BSM_FOLDER, folder_index, -1, node_id,
+            valid_prefixes=self.valid_prefixes,
+            valid_wb_types=self.valid_wb_types)
+        self.file_tree.create_node(tag=f"{folder_index:03}:{name}", 
+                                   identifier=node_id, parent=parent_id,
+                                   data=folder_bsm_file)
+        self._folder_paths[node_id] = path
+        self._folder_mtimes.pop(node_id, None)
+        self.scan_stats["added"] = self.scan_stats.get("added", 0) + 1
+        self.scan_stats["dirty"] = True
+
+    def _add_file_node(self, node_id: str, parent_id: str, path: str, 
+                       name: str, folder_index: int, file_index: int) -> None:
+        """Add a file node to the file_tree."""
+        file_bsm_file: BSMFile = BSMFile(
+            BSMFile.BSM_FILE, folder_index, file_index, Path(path).as_uri(),
+            valid_prefixes=self.valid_prefixes,
+            valid_wb_types=self.valid_wb_types)
+        self.file_tree.create_node(tag=f"{file_index:03}:{name}", 
+                                   identifier=node_id, parent=parent_id,
+                                   data=file_bsm_file)
+        self.scan_stats["added"] = self.scan_stats.get("added", 0) + 1
+        self.scan_stats["dirty"] = True
+
+    def _remove_node(self, node_id: str) -> None:
+        """Remove a node and its subtree from the file_tree and scan state."""
+        if not self.file_tree.contains(node_id):
+            return
+        for sub_id in list(self.file_tree.expand_tree(node_id)):
+            self._folder_paths.pop(sub_id, None)
+            self._folder_mtimes.pop(sub_id, None)
+        count = self.file_tree.remove_node(node_id)
+        self.scan_stats["removed"] = self.scan_stats.get("removed", 0) + count
+        self.scan_stats["dirty"] = True
+
+    def load_snapshot(self) -> bool:
+        """Load the file_tree from the persisted snapshot, if it is usable.
+
+        Returns:
+            bool: True if the snapshot was loaded, False otherwise.
+        """
+        try:
+            if not self.file_tree_json_file or not self.file_tree_json_file.exists():
+                return False
+            with open(self.file_tree_json_file, "r", encoding="utf-8") as f:
+                snapshot: Dict[str, Any] = json.load(f)
+            if (not isinstance(snapshot, dict) or
+                snapshot.get("version") != BSM_FILE_TREE_SNAPSHOT_VERSION or
+                snapshot.get("folder_url") != self.folder_url):
+                logger.debug(f"Ignoring stale file_tree snapshot: "
+                             f"'{self.file_tree_json_file}'")
+                return False
+            tree = Tree()
+            folder_paths: Dict[str, str] = {}
+            folder_mtimes: Dict[str, int] = {}
+            # Nodes are saved depth-first, so parents precede children.
+            for n in snapshot["nodes"]:
+                bsm_file: BSMFile = BSMFile(
+                    n["type"], n["folder_index"], n["file_index"], n["url"],
+                    valid_prefixes=self.valid_prefixes,
+                    valid_wb_types=self.valid_wb_types)
+                tree.create_node(tag=n["tag"], identifier=n["id"],
+                                 parent=n["parent"], data=bsm_file)
+                if n["type"] == BSMFile.BSM_FOLDER:
+                    folder_paths[n["id"]] = n["path"]
+                    folder_mtimes[n["id"]] = n["mtime_ns"]
+            self.file_tree = tree
+            self._folder_paths = folder_paths
+            self._folder_mtimes = folder_mtimes
+            self.max_file_index = snapshot["max_file_index"]
+            self.max_dir_index = snapshot["max_dir_index"]
+            logger.debug(f"Loaded file_tree snapshot with {tree.size()} nodes "
+                         f"from '{self.file_tree_json_file}'")
+            return True
+        except Exception as e:
+            # A bad snapshot is not fatal, just rescan from storage.
+            logger.warning(f"Ignoring unusable file_tree snapshot: "
+                           f"'{self.file_tree_json_file}': {p3u.exc_err_msg(e)}")
+            self.file_tree = None
+            self._folder_paths.clear()
+            self._folder_mtimes.clear()
+            return False
+
+    def save_snapshot(self) -> None:
+        """Save the file_tree and scan state to the snapshot .json file."""
+        try:
+            logger.debug(f"Saving file_tree to {self.file_tree_json_file}")
+            nodes: List[Dict[str, Any]] = []
+            for node_id in self.file_tree.expand_tree(sorting=False):
+                node: Node = self.file_tree.get_node(node_id)
+                bsm_file: BSMFile = node.data
+                is_folder: bool = node_id in self._folder_paths
+                parent: Optional[Node] = self.file_tree.parent(node_id)
+                nodes.append({
+                    "id": node_id,
+                    "parent": parent.identifier if parent else None,
+                    "tag": node.tag,
+                    "type": BSMFile.BSM_FOLDER if is_folder else BSMFile.BSM_FILE,
+                    "url": bsm_file.file_url,
+                    "folder_index": bsm_file.folder_index,
+                    "file_index": bsm_file.file_index,
+                    "path": self._folder_paths.get(node_id),
+                    "mtime_ns": self._folder_mtimes.get(node_id),
+                })
+            snapshot: Dict[str, Any] = {
+                "version": BSM_FILE_TREE_SNAPSHOT_VERSION,
+                "folder_url": self.folder_url,
+                "max_file_index": self.max_file_index,
+                "max_dir_index": self.max_dir_index,
+                "nodes": nodes,
+            }
+            tmp_file: Path = self.file_tree_json_file.with_name(
+                BSM_FILE_TREE_SNAPSHOT_FILENAME + ".tmp")
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump(snapshot, f)
+            os.replace(tmp_file, self.file_tree_json_file)
+        except Exception as e:
+            # The snapshot is an optimization, never fail the refresh.
+            logger.warning(f"Unable to save file_tree snapshot: "
+                           f"'{self.file_tree_json_file}': {p3u.exc_err_msg(e)}")
+
     def delete_file(self, bsm_file: BSMFile) -> None:
         """Delete the file_tree .json file if it exists."""
         try:
@@ -288,6 +464,10 @@ class BSMFileTree:
             logger.error(p3u.exc_err_msg(e))
             raise
 
+    def folder_paths(self) -> List[str]:
+        """Return the abs path of each folder in the file_tree."""
+        return list(self._folder_paths.values())
+
     def all_workbooks(self) -> Generator[BSMFile, None, None]:
         """Generate all the workbooks in the file tree."""
         try:
@@ -303,6 +483,22 @@ class BSMFileTree:
             logger.error(p3u.exc_err_msg(e))
             raise
 
+    def reset_metadata(self, tag_suffix: Optional[str] = None) -> None:
+        """Reset the metadata of every node to the values from a scan, and
+        remove tag_suffix from the node tags, e.g. before marking the nodes
+        again on a reused file_tree."""
+        try:
+            for node in self.file_tree.all_nodes_itr():
+                if tag_suffix and node.tag.endswith(tag_suffix):
+                    node.tag = node.tag[:-len(tag_suffix)]
+                if isinstance(node.data, BSMFile):
+                    is_folder: bool = node.identifier in self._folder_paths
+                    node.data.reset_metadata(
+                        BSMFile.BSM_FOLDER if is_folder else BSMFile.BSM_FILE)
+        except Exception as e:
+            logger.error(p3u.exc_err_msg(e))
+            raise
+
     def all_files(self) -> Generator[BSMFile, None, None]:
         """Generate all the files in the file tree."""
         try:
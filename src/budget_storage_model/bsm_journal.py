@@ -0,0 +1,157 @@
+# ---------------------------------------------------------------------------- +
+#region    bsm_journal.py module
+""" Append-only change journal for a BDM_STORE file.
+
+    In journaled mode, saving the BDM appends compact change records to a
+    journal file beside the BDM_STORE file, instead of rewriting the whole
+    store. The journal is a json lines file, one record per line. A save
+    appends its records followed by a commit record, so a save interrupted
+    by a crash leaves no partial changes: only records up to the last commit
+    record are replayed.
+
+    Loading the BDM_STORE replays the committed journal records onto the
+    store content. Compaction is a full save of the BDM_STORE followed by
+    bsm_journal_clear(). All record operations are idempotent, replaying a
+    journal onto a store that already contains the changes is harmless.
+
+    Record operations:
+        wb_put: set FI_WORKBOOK_DATA_COLLECTION[wb_id] of fi_key to wb.
+        wb_del: remove wb_id from FI_WORKBOOK_DATA_COLLECTION of fi_key.
+        fi_put: set the FI_OBJECT of fi_key, except its workbook collection.
+        fi_del: remove the FI_OBJECT of fi_key.
+        set:    set a top level BDM_STORE property key to value.
+"""
+#endregion bsm_journal.py module
+# ---------------------------------------------------------------------------- +
+#region    Imports
+# python standard library modules and packages
+import logging, os, json
+from pathlib import Path
+from typing import Any, Dict, List
+
+# third-party modules and packages
+import p3_utils as p3u
+
+# local modules and packages
+import budman_namespace.design_language_namespace as bdm
+#endregion Imports
+# ---------------------------------------------------------------------------- +
+#region    Globals and Constants
+logger = logging.getLogger(__name__)
+BSM_JOURNAL_SUFFIX = ".journal"
+BSM_JOURNAL_COMPACT_SIZE = 1_000_000  # bytes, compact beyond this size
+BSM_JOURNAL_OP = "op"
+BSM_JOURNAL_OP_WB_PUT = "wb_put"
+BSM_JOURNAL_OP_WB_DEL = "wb_del"
+BSM_JOURNAL_OP_FI_PUT = "fi_put"
+BSM_JOURNAL_OP_FI_DEL = "fi_del"
+BSM_JOURNAL_OP_SET = "set"
+BSM_JOURNAL_OP_COMMIT = "commit"
+#endregion Globals and Constants
+# ---------------------------------------------------------------------------- +
+#region    bsm_journal functions
+def bsm_journal_path(bdms_path: Path) -> Path:
+    """Return the journal path for the BDM_STORE at bdms_path."""
+    return bdms_path.with_name(f".{bdms_path.name}{BSM_JOURNAL_SUFFIX}")
+
+def bsm_journal_size(bdms_path: Path) -> int:
+    """Return the size in bytes of the journal for bdms_path, 0 if none."""
+    try:
+        return os.stat(bsm_journal_path(bdms_path)).st_size
+    except FileNotFoundError:
+        return 0
+
+def bsm_journal_append(bdms_path: Path, records: List[Dict[str, Any]]) -> None:
+    """Append records and a commit record to the journal for bdms_path."""
+    try:
+        if not records:
+            return
+        lines = [json.dumps(r, separators=(",", ":")) for r in records]
+        lines.append(json.dumps({BSM_JOURNAL_OP: BSM_JOURNAL_OP_COMMIT}))
+        with open(bsm_journal_path(bdms_path), "a", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        logger.debug(f"Appended {len(records)} journal record(s) for '{bdms_path}'")
+    except Exception as e:
+        logger.error(p3u.exc_err_msg(e))
+        raise
+
+def bsm_journal_read(bdms_path: Path) -> List[Dict[str, Any]]:
+    """Return the committed journal records for bdms_path, in order."""
+    try:
+        committed: List[Dict[str, Any]] = []
+        pending: List[Dict[str, Any]] = []
+        try:
+            f = open(bsm_journal_path(bdms_path), "r", encoding="utf-8")
+        except FileNotFoundError:
+            return committed
+        with f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # A torn write at the end, from a crash during append.
+                    logger.warning(f"Ignoring invalid journal line for '{bdms_path}'")
+                    break
+                if record.get(BSM_JOURNAL_OP) == BSM_JOURNAL_OP_COMMIT:
+                    committed.extend(pending)
+                    pending.clear()
+                else:
+                    pending.append(record)
+        if pending:
+            logger.warning(f"Ignoring {len(pending)} uncommitted journal "
+                           f"record(s) for '{bdms_path}'")
+        return committed
+    except Exception as e:
+        logger.error(p3u.exc_err_msg(e))
+        raise
+
+def bsm_journal_clear(bdms_path: Path) -> None:
+    """Remove the journal for bdms_path, after a full save."""
+    try:
+        bsm_journal_path(bdms_path).unlink(missing_ok=True)
+    except Exception as e:
+        logger.error(p3u.exc_err_msg(e))
+        raise
+
+def bsm_journal_replay(bdm_store: bdm.BDM_STORE_TYPE,
+                       records: List[Dict[str, Any]]) -> bdm.BDM_STORE_TYPE:
+    """Apply journal records to bdm_store content, in place, and return it."""
+    try:
+        fi_collection = bdm_store.get(bdm.BDM_FI_COLLECTION)
+        if fi_collection is None:
+            fi_collection = bdm_store[bdm.BDM_FI_COLLECTION] = {}
+        for record in records:
+            op = record.get(BSM_JOURNAL_OP)
+            if op == BSM_JOURNAL_OP_SET:
+                bdm_store[record["key"]] = record["value"]
+            elif op == BSM_JOURNAL_OP_FI_PUT:
+                fi_obj = dict(record["fi"])
+                old = fi_collection.get(record[bdm.FI_KEY]) or {}
+                fi_obj[bdm.FI_WORKBOOK_DATA_COLLECTION] = old.get(
+                    bdm.FI_WORKBOOK_DATA_COLLECTION)
+                fi_collection[record[bdm.FI_KEY]] = fi_obj
+            elif op == BSM_JOURNAL_OP_FI_DEL:
+                fi_collection.pop(record[bdm.FI_KEY], None)
+            elif op in (BSM_JOURNAL_OP_WB_PUT, BSM_JOURNAL_OP_WB_DEL):
+                fi_obj = fi_collection.get(record[bdm.FI_KEY])
+                if fi_obj is None:
+                    logger.warning(f"Journal record for unknown "
+                                   f"FI_KEY('{record[bdm.FI_KEY]}'), skipped.")
+                    continue
+                if fi_obj.get(bdm.FI_WORKBOOK_DATA_COLLECTION) is None:
+                    fi_obj[bdm.FI_WORKBOOK_DATA_COLLECTION] = {}
+                wdc = fi_obj[bdm.FI_WORKBOOK_DATA_COLLECTION]
+                if op == BSM_JOURNAL_OP_WB_PUT:
+                    wdc[record[bdm.WB_ID]] = record["wb"]
+                else:
+                    wdc.pop(record[bdm.WB_ID], None)
+            else:
+                logger.warning(f"Unknown journal record op: '{op}', skipped.")
+        return bdm_store
+    except Exception as e:
+        logger.error(p3u.exc_err_msg(e))
+        raise
+#endregion bsm_journal functions
+# ---------------------------------------------------------------------------- +
@@ -0,0 +1,133 @@
+# ---------------------------------------------------------------------------- +
+#region    bsm_json_codec.py module
+""" Json codec for BSM json files: BDM_STORE, BDM_CONFIG and TXN_CATEGORIES.
+
+    BSM json files are decoded with the python std lib json module first,
+    which is implemented in C. Only files actually using JSON5 syntax, such
+    as comments or trailing commas, fall back to the slower pyjson5
+    decoder.
+
+    On load, a binary snapshot of the decoded content is written beside the
+    json file, with marshal. The snapshot records the size and mtime of the
+    json file it was made from, plus a schema version. A later load uses the
+    snapshot only while the json file still matches it, otherwise the json
+    file is decoded again and a new snapshot is written. Snapshots are a
+    cache, any problem reading or writing one is logged and ignored.
+"""
+#endregion bsm_json_codec.py module
+# ---------------------------------------------------------------------------- +
+#region    Imports
+# python standard library modules and packages
+import logging, os, json, marshal, sys
+from pathlib import Path
+from typing import Any, Optional, Tuple
+
+# third-party modules and packages
+import p3_utils as p3u
+import pyjson5 as json5
+#endregion Imports
+# ---------------------------------------------------------------------------- +
+#region    Globals and Constants
+logger = logging.getLogger(__name__)
+BSM_JSON_SNAPSHOT_VERSION = 1
+BSM_JSON_SNAPSHOT_SUFFIX = ".snapshot"
+BSM_JSON_MAX_DEPTH = 10
+#endregion Globals and Constants
+# ---------------------------------------------------------------------------- +
+#region    bsm_json_decode() function
+def bsm_json_decode(json_text: str) -> Any:
+    """Decode json_text, strict json first, JSON5 only if that fails."""
+    try:
+        return json.loads(json_text)
+    except json.JSONDecodeError:
+        logger.debug("Not strict json, decoding as JSON5.")
+        return json5.decode(json_text, BSM_JSON_MAX_DEPTH)
+#endregion bsm_json_decode() function
+# ---------------------------------------------------------------------------- +
+#region    bsm_json_file_load() function
+def bsm_json_file_load(json_path: Path, snapshot: bool = True) -> Any:
+    """Load the content of a json file, using its snapshot when current.
+
+    Args:
+        json_path (Path): The json file to load.
+        snapshot (bool): Use and refresh the binary snapshot of the file.
+
+    Returns:
+        Any: The decoded json content.
+    """
+    try:
+        st = p3u.start_timer()
+        source_stat = _bsm_json_source_stat(json_path) if snapshot else None
+        if source_stat is not None:
+            content = bsm_json_snapshot_load(json_path, source_stat)
+            if content is not None:
+                logger.debug(f"Loaded snapshot for '{json_path}' "
+                             f"{p3u.stop_timer(st)}")
+                return content
+        with open(json_path, "r") as f:
+            content = bsm_json_decode(f.read())
+        if source_stat is not None:
+            bsm_json_snapshot_save(json_path, content, source_stat)
+        logger.debug(f"Decoded json file '{json_path}' {p3u.stop_timer(st)}")
+        return content
+    except Exception as e:
+        logger.error(p3u.exc_err_msg(e))
+        raise
+#endregion bsm_json_file_load() function
+# ---------------------------------------------------------------------------- +
+#region    bsm_json snapshot functions
+def bsm_json_snapshot_path(json_path: Path) -> Path:
+    """Return the snapshot path for json_path, a hidden file beside it."""
+    return json_path.with_name(f".{json_path.name}{BSM_JSON_SNAPSHOT_SUFFIX}")
+
+def bsm_json_snapshot_load(json_path: Path,
+                           source_stat: Optional[Tuple[int, int]] = None) -> Any:
+    """Return the snapshot content for json_path, None if not current."""
+    snapshot_path = bsm_json_snapshot_path(json_path)
+    try:
+        if source_stat is None:
+            source_stat = _bsm_json_source_stat(json_path)
+        with open(snapshot_path, "rb") as f:
+            header, content = marshal.loads(f.read())
+        if header != _bsm_json_snapshot_header(source_stat):
+            logger.debug(f"Snapshot is stale: '{snapshot_path}'")
+            return None
+        return content
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"Ignoring snapshot '{snapshot_path}': {p3u.exc_err_msg(e)}")
+        return None
+
+def bsm_json_snapshot_save(json_path: Path, content: Any,
+                           source_stat: Optional[Tuple[int, int]] = None) -> None:
+    """Write the snapshot of content for json_path, as currently stored."""
+    snapshot_path = bsm_json_snapshot_path(json_path)
+    tmp_path = snapshot_path.with_name(snapshot_path.name + ".tmp")
+    try:
+        if source_stat is None:
+            source_stat = _bsm_json_source_stat(json_path)
+        data = marshal.dumps((_bsm_json_snapshot_header(source_stat), content))
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, snapshot_path)
+        logger.debug(f"Saved snapshot: '{snapshot_path}'")
+    except Exception as e:
+        logger.warning(f"Not saving snapshot '{snapshot_path}': {p3u.exc_err_msg(e)}")
+        try:
+            tmp_path.unlink(missing_ok=True)
+        except OSError:
+            pass
+
+def _bsm_json_source_stat(json_path: Path) -> Tuple[int, int]:
+    """Return (size, mtime_ns) for json_path."""
+    st = os.stat(json_path)
+    return (st.st_size, st.st_mtime_ns)
+
+def _bsm_json_snapshot_header(source_stat: Tuple[int, int]) -> tuple:
+    """Return the header identifying a snapshot of a json file version."""
+    # The marshal format is specific to the python version.
+    return (BSM_JSON_SNAPSHOT_VERSION, marshal.version,
+            sys.version_info[:2], *source_stat)
+#endregion bsm_json snapshot functions
+# ---------------------------------------------------------------------------- +
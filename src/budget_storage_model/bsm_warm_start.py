@@ -0,0 +1,249 @@
+# ---------------------------------------------------------------------------- +
+#region    bsm_warm_start.py module
+""" Warm-start snapshot of the initialized application state.
+
+    Startup decodes the BDM_STORE, rehydrates and resolves the workbooks
+    against the filesystem, scans the BSM_FILE_TREE and loads the category
+    catalogs. A warm-start snapshot saves the result of all that in one
+    versioned file, so a later startup can restore it instead.
+
+    The content holds model objects and is pickled, and unpickling runs
+    code. Snapshots are therefore kept in a per-user cache folder, not
+    beside a BDM_STORE in a folder others may write to, see
+    bsm_warm_start_cache_dir(). The folder is created private to the user
+    and the content is signed with an HMAC key kept there. Content is only
+    unpickled when its signature matches.
+
+    The snapshot is guarded by a manifest of its sources. Source files, such
+    as the BDM_STORE, its journal, the settings and the category files, are
+    recorded with size, mtime and sha256. A file with a new mtime but the
+    same size and hash is still current. Folders are recorded with their
+    mtime, which changes when files are added, removed or renamed in them,
+    the same test the BSM_FILE_TREE incremental scan uses, and a sha256 of
+    their entry names. A folder with a new mtime but the same entries is
+    still current. A snapshot is only used while all of its manifest entries
+    are current.
+
+    The file holds a JSON header line with the version and the manifest,
+    then the signature line, then the pickled content, so a stale snapshot
+    is rejected without reading its content. Snapshots are a cache, any
+    problem reading or writing one is logged and ignored, and the caller
+    falls back to a cold start.
+"""
+#endregion bsm_warm_start.py module
+# ---------------------------------------------------------------------------- +
+#region    Imports
+# python standard library modules and packages
+import logging, os, pickle, hashlib, hmac, json, secrets, sys
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+# third-party modules and packages
+import p3_utils as p3u
+#endregion Imports
+# ---------------------------------------------------------------------------- +
+#region    Globals and Constants
+logger = logging.getLogger(__name__)
+BSM_WARM_START_VERSION = 1
+BSM_WARM_START_SUFFIX = ".warm_start"
+BSM_WARM_START_FILES = "files"
+BSM_WARM_START_FOLDERS = "folders"
+# Overrides the per-user cache folder of the warm-start snapshots.
+BSM_WARM_START_CACHE_DIR_ENV_VAR = "BUDMAN_CACHE_DIR"
+BSM_WARM_START_KEY_FILENAME = "warm_start.key"
+#endregion Globals and Constants
+# ---------------------------------------------------------------------------- +
+#region    bsm_warm_start functions
+def bsm_warm_start_cache_dir() -> Path:
+    """Return the per-user cache folder of the warm-start snapshots, from
+    BUDMAN_CACHE_DIR, else %LOCALAPPDATA%/budman/cache on Windows, else
+    $XDG_CACHE_HOME/budman or ~/.cache/budman."""
+    cache_dir = os.getenv(BSM_WARM_START_CACHE_DIR_ENV_VAR)
+    if cache_dir:
+        return Path(cache_dir).expanduser()
+    if sys.platform == "win32" and os.getenv("LOCALAPPDATA"):
+        return Path(os.getenv("LOCALAPPDATA")) / "budman" / "cache"
+    xdg_cache = os.getenv("XDG_CACHE_HOME")
+    return (Path(xdg_cache) if xdg_cache else Path.home() / ".cache") / "budman"
+
+def bsm_warm_start_path(bdms_path: Path) -> Path:
+    """Return the warm-start snapshot path for the BDM_STORE at bdms_path,
+    in the cache folder, named for the BDM_STORE and a hash of its path."""
+    path_hash = hashlib.sha256(
+        str(Path(bdms_path).resolve()).encode("utf-8")).hexdigest()[:16]
+    return bsm_warm_start_cache_dir() / (
+        f"{bdms_path.name}.{path_hash}{BSM_WARM_START_SUFFIX}")
+
+def bsm_warm_start_manifest(file_paths: Iterable[Path],
+                            folder_paths: Iterable[Path]) -> Dict[str, Dict[str, Any]]:
+    """Return the manifest for the current state of the source files and
+    folders. A missing file or folder is recorded as None."""
+    files: Dict[str, Optional[Tuple[int, int, str]]] = {}
+    for path in file_paths:
+        try:
+            st = os.stat(path)
+            files[str(path)] = (st.st_size, st.st_mtime_ns, _bsm_file_sha256(path))
+        except FileNotFoundError:
+            files[str(path)] = None
+    folders: Dict[str, Optional[Tuple[int, str]]] = {}
+    for path in folder_paths:
+        try:
+            st = os.stat(path)
+            folders[str(path)] = (st.st_mtime_ns, _bsm_folder_sha256(path))
+        except FileNotFoundError:
+            folders[str(path)] = None
+    return {BSM_WARM_START_FILES: files, BSM_WARM_START_FOLDERS: folders}
+
+def bsm_warm_start_manifest_current(manifest: Dict[str, Dict[str, Any]]) -> bool:
+    """True if every source file and folder in manifest is unchanged."""
+    for path, recorded in manifest[BSM_WARM_START_FILES].items():
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            if recorded is not None:
+                logger.debug(f"Warm-start source removed: '{path}'")
+                return False
+            continue
+        if recorded is None or st.st_size != recorded[0]:
+            logger.debug(f"Warm-start source changed: '{path}'")
+            return False
+        # Only hash when the mtime moved, a touched file is still current.
+        if (st.st_mtime_ns != recorded[1] and
+            _bsm_file_sha256(Path(path)) != recorded[2]):
+            logger.debug(f"Warm-start source changed: '{path}'")
+            return False
+    for path, recorded in manifest[BSM_WARM_START_FOLDERS].items():
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            if recorded is not None:
+                logger.debug(f"Warm-start folder removed: '{path}'")
+                return False
+            continue
+        # Only list when the mtime moved, e.g. by saving a snapshot there.
+        if (recorded is None or (st.st_mtime_ns != recorded[0] and
+            _bsm_folder_sha256(Path(path)) != recorded[1])):
+            logger.debug(f"Warm-start folder changed: '{path}'")
+            return False
+    return True
+
+def bsm_warm_start_save(bdms_path: Path, content: Dict[str, Any],
+                        file_paths: Iterable[Path],
+                        folder_paths: Iterable[Path]) -> None:
+    """Write the warm-start snapshot of content for bdms_path.
+
+    Args:
+        bdms_path (Path): The BDM_STORE file the content was loaded from.
+        content (Dict): The picklable state to restore.
+        file_paths (Iterable[Path]): Source files of the content.
+        folder_paths (Iterable[Path]): Folders scanned to create the content.
+    """
+    snapshot_path = bsm_warm_start_path(bdms_path)
+    tmp_path = snapshot_path.with_name(snapshot_path.name + ".tmp")
+    try:
+        st = p3u.start_timer()
+        key = _bsm_warm_start_key(create=True)
+        manifest = bsm_warm_start_manifest(file_paths, folder_paths)
+        header = {"header": _bsm_warm_start_header(), "manifest": manifest}
+        data = pickle.dumps(content, protocol=pickle.HIGHEST_PROTOCOL)
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(json.dumps(header).encode("utf-8") + b"\n")
+            f.write(_bsm_warm_start_signature(key, data).encode("ascii") + b"\n")
+            f.write(data)
+        os.replace(tmp_path, snapshot_path)
+        logger.debug(f"Saved warm-start snapshot: '{snapshot_path}' "
+                     f"{p3u.stop_timer(st)}")
+    except Exception as e:
+        logger.warning(f"Not saving warm-start snapshot '{snapshot_path}': "
+                       f"{p3u.exc_err_msg(e)}")
+        try:
+            tmp_path.unlink(missing_ok=True)
+        except OSError:
+            pass
+
+def bsm_warm_start_load(bdms_path: Path) -> Optional[Dict[str, Any]]:
+    """Return the warm-start content for bdms_path, None if missing, not
+    current or not signed with the user's key."""
+    snapshot_path = bsm_warm_start_path(bdms_path)
+    try:
+        st = p3u.start_timer()
+        key = _bsm_warm_start_key(create=False)
+        if key is None:
+            return None
+        with open(snapshot_path, "rb") as f:
+            header = json.loads(f.readline())
+            if header.get("header") != list(_bsm_warm_start_header()):
+                logger.debug(f"Warm-start snapshot version mismatch: '{snapshot_path}'")
+                return None
+            if not bsm_warm_start_manifest_current(header["manifest"]):
+                return None
+            signature = f.readline().strip().decode("ascii")
+            data = f.read()
+        if not hmac.compare_digest(signature,
+                                   _bsm_warm_start_signature(key, data)):
+            logger.warning(f"Ignoring unsigned warm-start snapshot: '{snapshot_path}'")
+            return None
+        content = pickle.loads(data)
+        logger.debug(f"Loaded warm-start snapshot: '{snapshot_path}' "
+                     f"{p3u.stop_timer(st)}")
+        return content
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"Ignoring warm-start snapshot '{snapshot_path}': "
+                       f"{p3u.exc_err_msg(e)}")
+        return None
+
+def bsm_warm_start_clear(bdms_path: Path) -> None:
+    """Remove the warm-start snapshot for bdms_path."""
+    try:
+        bsm_warm_start_path(bdms_path).unlink(missing_ok=True)
+    except Exception as e:
+        logger.error(p3u.exc_err_msg(e))
+        raise
+
+def _bsm_file_sha256(path: Path) -> str:
+    """Return the sha256 hex digest of the file content at path."""
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+def _bsm_folder_sha256(path: Path) -> str:
+    """Return the sha256 hex digest of the entry names in the folder at path."""
+    names = sorted(os.listdir(path))
+    return hashlib.sha256("\n".join(names).encode("utf-8")).hexdigest()
+
+def _bsm_warm_start_header() -> tuple:
+    """Return the header identifying a warm-start snapshot format."""
+    # Pickled classes must match the code loading them.
+    return (BSM_WARM_START_VERSION, *sys.version_info[:2])
+
+def _bsm_warm_start_key(create: bool) -> Optional[bytes]:
+    """Return the user's HMAC key from the cache folder, None if there is
+    none and not create. The cache folder and key are created private to
+    the user, on POSIX a folder others may write to is refused."""
+    cache_dir = bsm_warm_start_cache_dir()
+    if create:
+        cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+    if os.name == "posix" and cache_dir.exists():
+        st = os.stat(cache_dir)
+        if st.st_uid != os.getuid() or st.st_mode & 0o022:
+            raise PermissionError(f"Warm-start cache folder is not private "
+                                  f"to the user: '{cache_dir}'")
+    key_path = cache_dir / BSM_WARM_START_KEY_FILENAME
+    try:
+        return bytes.fromhex(key_path.read_text(encoding="ascii").strip())
+    except FileNotFoundError:
+        if not create:
+            return None
+    key = secrets.token_bytes(32)
+    fd = os.open(key_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    with os.fdopen(fd, "w", encoding="ascii") as f:
+        f.write(key.hex())
+    return key
+
+def _bsm_warm_start_signature(key: bytes, data: bytes) -> str:
+    """Return the HMAC-SHA256 hex digest of data with key."""
+    return hmac.new(key, data, hashlib.sha256).hexdigest()
+#endregion bsm_warm_start functions
+# ---------------------------------------------------------------------------- +
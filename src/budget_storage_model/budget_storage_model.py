@@ -47,25 +47,29 @@
 # ---------------------------------------------------------------------------- +
 #region    Imports
 # python standard library modules and packages
-import logging, os, time, toml
+import logging, os, time, toml, functools
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from urllib.parse import urlparse, urlunparse, urlsplit, ParseResult
-from typing import Dict, List, Any, Union, Optional
+from typing import Dict, List, Any, Union, Optional, Callable, Awaitable
 
 # third-party modules and packages
-import p3_utils as p3u, pyjson5, p3logging as p3l
+import p3_utils as p3u, pyjson5, p3logging as p3l, p3_telemetry as p3t
 import pyjson5 as json5, json
-import openpyxl
-from openpyxl import Workbook, load_workbook
 # local modules and packages
 import budman_settings as bdms
 import budman_namespace.design_language_namespace as bdm
 from budman_namespace.bdm_workbook_class import BDMWorkbook
+from budman_namespace.bdm_lazy_import import bdm_lazy_import, bdm_module_loaded
 from .csv_data_collection import *
+from .bsm_json_codec import bsm_json_file_load, bsm_json_snapshot_save
+from .bsm_journal import bsm_journal_read, bsm_journal_replay
 #endregion Imports
 # ---------------------------------------------------------------------------- +
 #region    Globals and Constants
 logger = logging.getLogger(__name__)
+openpyxl = bdm_lazy_import("openpyxl")
+BSM_SCAN_MAX_WORKERS: int = 8  # folder scans are I/O bound, e.g., cloud drives
 # ---------------------------------------------------------------------------- +
 #endregion Globals and Constants
 # ---------------------------------------------------------------------------- +
@@ -135,6 +139,48 @@ def bsm_BDMWorkbook_save(bdm_wb:BDMWorkbook) -> None:
         raise
 #endregion bsm_BDMWorkbook_save()
 # ---------------------------------------------------------------------------- +
+#region    bsm_BDMWorkbook_load_aio() and bsm_BDMWorkbook_save_aio()
+async def bsm_BDMWorkbook_load_aio(bdm_wb:BDMWorkbook,
+                                   run_blocking: Callable[..., Awaitable[Any]]
+                                   ) -> bdm.WORKBOOK_CONTENT_TYPE:
+    """Await the load of the BDMWorkbook content, bsm_BDMWorkbook_load() for
+    a coroutine, e.g. a cmd of an AsyncCommandProcessor.
+
+    Args:
+        bdm_wb (BDMWorkbook): The workbook object to load content for.
+        run_blocking (Callable): Awaits a blocking call, e.g. 
+            AsyncCommandProcessor.cp_run_blocking, the file load runs in it.
+
+    Returns:
+        Any: The loaded workbook content object.
+    """
+    try:
+        p3u.is_not_obj_of_type("bdm_wb", bdm_wb, BDMWorkbook, raise_error=True)
+        logger.debug(f"Loading BDMWorkbook content for WB_ID('{bdm_wb.wb_id}') ")
+        bdm_wb.wb_content = await bsm_WORKBOOK_CONTENT_url_get_aio(
+            bdm_wb.wb_url, bdm_wb.wb_type, run_blocking)
+        bdm_wb.wb_loaded = True
+        return bdm_wb.wb_content
+    except Exception as e:
+        logger.error(p3u.exc_err_msg(e))
+        raise
+
+async def bsm_BDMWorkbook_save_aio(bdm_wb:BDMWorkbook,
+                                   run_blocking: Callable[..., Awaitable[Any]]
+                                   ) -> None:
+    """Await the save of the BDMWorkbook content, bsm_BDMWorkbook_save() for
+    a coroutine, the file save runs in run_blocking."""
+    try:
+        p3u.is_not_obj_of_type("bdm_wb", bdm_wb, BDMWorkbook, raise_error=True)
+        logger.debug(f"Saving BDMWorkbook content for WB_ID('{bdm_wb.wb_id}') ")
+        await bsm_WORKBOOK_CONTENT_url_put_aio(
+            bdm_wb.wb_content, bdm_wb.wb_url, bdm_wb.wb_type, run_blocking)
+        bdm_wb.wb_loaded = True
+    except Exception as e:
+        logger.error(p3u.exc_err_msg(e))
+        raise
+#endregion bsm_BDMWorkbook_load_aio() and bsm_BDMWorkbook_save_aio()
+# ---------------------------------------------------------------------------- +
 #region    bsm_BDMWorkbook_copy()
 def bsm_BDMWorkbook_copy(src_wb:BDMWorkbook, dst_wb:BDMWorkbook, symlink: bool = False) -> None:
     """
@@ -288,6 +334,43 @@ def bsm_WORKBOOK_CONTENT_url_put(wb_content: bdm.WORKBOOK_CONTENT_TYPE,
         logger.error(p3u.exc_err_msg(e))
         raise
 #endregion bsm_WORKBOOK_CONTENT_url_put() function
+# ---------------------------------------------------------------------------- +
+#region    bsm_WORKBOOK_CONTENT_url_get_aio() and _put_aio() functions
+async def bsm_WORKBOOK_CONTENT_url_get_aio(wb_content_url: str, wb_type: str,
+                                           run_blocking: Callable[..., Awaitable[Any]]
+                                           ) -> bdm.WORKBOOK_CONTENT_TYPE:
+    """BSM: Await the load of a WORKBOOK_OBJECT by URL, 
+    bsm_WORKBOOK_CONTENT_url_get() for a coroutine. The URL is validated on
+    the caller, the bsm_WORKBOOK_CONTENT_file_load() runs in run_blocking,
+    so the event loop goes on with other cmds meanwhile."""
+    try:
+        bsm_WB_URL_TYPE_validate(wb_content_url, wb_type)
+        wb_content_abs_path: Path = bsm_URL_verify_file_scheme(wb_content_url, 
+                                                                  test_exists=True)
+        return await run_blocking(bsm_WORKBOOK_CONTENT_file_load,
+                                  wb_content_abs_path, wb_type,
+                                  pre_validated=True)
+    except Exception as e:
+        logger.error(p3u.exc_err_msg(e))
+        raise
+
+async def bsm_WORKBOOK_CONTENT_url_put_aio(wb_content: bdm.WORKBOOK_CONTENT_TYPE,
+                                           wb_content_url: str, wb_type: str,
+                                           run_blocking: Callable[..., Awaitable[Any]]
+                                           ) -> None:
+    """BSM: Await the save of a WORKBOOK_OBJECT by URL,
+    bsm_WORKBOOK_CONTENT_url_put() for a coroutine, the
+    bsm_WORKBOOK_CONTENT_file_save() runs in run_blocking."""
+    try:
+        bsm_WB_URL_TYPE_validate(wb_content_url, wb_type)
+        wb_content_abs_path: Path = bsm_URL_verify_file_scheme(wb_content_url,
+                                                                  test_exists=False)
+        await run_blocking(bsm_WORKBOOK_CONTENT_file_save, wb_content,
+                           wb_content_abs_path, wb_type, pre_validated=True)
+    except Exception as e:
+        logger.error(p3u.exc_err_msg(e))
+        raise
+#endregion bsm_WORKBOOK_CONTENT_url_get_aio() and _put_aio() functions
 # ---------------------------------------------------------------------------- +
  #region    bsm_WORKBOOK_CONTENT_url_copy() function
 def bsm_WORKBOOK_CONTENT_url_copy(src_url: str, dst_url: str, wb_type: str, symlink: bool = False) -> None:
@@ -421,9 +504,12 @@ def bsm_WORKBOOK_CONTENT_url_delete(wb_content: bdm.WORKBOOK_CONTENT_TYPE,
 #region    bsm_WORKBOOK_CONTENT_file functions
 # ---------------------------------------------------------------------------- +
 #region    bsm_WORKBOOK_CONTENT_file_load(wb_abs_path : str = None) -> Any
+@p3t.cp_traced(p3t.CP_TRACE_CAT_STORAGE)
+@p3t.cp_timed(bdm.BDM_METRIC_WB_LOAD_SECONDS)
 def bsm_WORKBOOK_CONTENT_file_load(wb_content_abs_path:Path, 
                                    wb_type: str,
-                                   pre_validated:bool=False) -> bdm.WORKBOOK_CONTENT_TYPE:
+                                   pre_validated:bool=False,
+                                   csv_fieldnames:Optional[List[str]]=None) -> bdm.WORKBOOK_CONTENT_TYPE:
     """Load a wb_content file of a given wb_type.
 
     BSM Layer 3: This is a local file system service function, loading a 
@@ -433,6 +519,8 @@ def bsm_WORKBOOK_CONTENT_file_load(wb_content_abs_path:Path,
         wb_content_abs_path (Path): The path of the workbook file to load.
         wb_type (str): The type of the workbook to load.
         pre_validated (bool): If True, the input parameters are already validated.
+        csv_fieldnames (List[str]): Optional virtual header for csv wb_types,
+            injected at load time without rewriting the file.
 
     Returns:
         WORKBOOK_CONTENT: The loaded wb_content.
@@ -454,21 +542,21 @@ def bsm_WORKBOOK_CONTENT_file_load(wb_content_abs_path:Path,
         wb_content: bdm.WORKBOOK_CONTENT_TYPE = None
         if wb_type in [bdm.WB_TYPE_BDM_STORE, bdm.WB_TYPE_BDM_CONFIG]:
             # WB_TYPE_BDM_STORE, WB_TYPE_BDM_CONFIG: Load it as a json file.
-            with open(wb_content_abs_path, "r") as f:
-                wb_content = json5.decode(f.read(),10)
+            wb_content = bsm_json_file_load(wb_content_abs_path)
         elif wb_type == bdm.WB_TYPE_TXN_REGISTER:
             # WB_TYPE_TXN_REGISTER: Load it as a CSV file.
-            wb_content = csv_DATA_LIST_file_load(wb_content_abs_path)
+            wb_content = csv_DATA_LIST_file_load(wb_content_abs_path,
+                                                 fieldnames=csv_fieldnames)
         elif wb_type == bdm.WB_TYPE_EXCEL_TXNS:
             # WB_TYPE_EXCEL_TXNS: Load it as an Excel file.
             wb_content = openpyxl.load_workbook(filename=wb_content_abs_path)
         elif wb_type == bdm.WB_TYPE_CSV_TXNS:
             # WB_TYPE_CSV_TXNS: Load it as a CSV file.
-            wb_content = csv_DATA_LIST_file_load(wb_content_abs_path)
+            wb_content = csv_DATA_LIST_file_load(wb_content_abs_path,
+                                                 fieldnames=csv_fieldnames)
         elif wb_type == bdm.WB_TYPE_TXN_CATEGORIES:
             # WB_TYPE_TXN_CATEGORIES: Load it as a JSON file.
-            with open(wb_content_abs_path, "r") as f:
-                wb_content = json5.decode(f.read(),10)
+            wb_content = bsm_json_file_load(wb_content_abs_path)
         elif wb_type == bdm.WB_TYPE_CATEGORY_MAP:
             # WB_TYPE_CATEGORY_MAP, load it as a TOML file.
             with open(wb_content_abs_path, "r") as f:
@@ -478,6 +566,13 @@ def bsm_WORKBOOK_CONTENT_file_load(wb_content_abs_path:Path,
             m = f"Unsupported wb_type: '{wb_type}' for file: '{wb_content_abs_path}'"
             logger.error(m)
             raise ValueError(m)
+        rows = bsm_WORKBOOK_CONTENT_rows(wb_content)
+        if rows is not None:
+            p3t.cp_metrics.counter(bdm.BDM_METRIC_WB_LOAD_ROWS).inc(rows)
+        if p3t.cp_tracer.enabled:
+            p3t.cp_trace_current().set(
+                wb_type=wb_type, file=Path(wb_content_abs_path).name,
+                **{p3t.CK_TRACE_ROWS: rows})
         logger.debug(f"Complete: {p3u.stop_timer(st)}")
         return wb_content
     except Exception as e:
@@ -486,6 +581,8 @@ def bsm_WORKBOOK_CONTENT_file_load(wb_content_abs_path:Path,
 #endregion bsm_WORKBOOK_CONTENT_file_load(wb_abs_path : str = None) -> Any
 # ---------------------------------------------------------------------------- +
 #region    bsm_WORKBOOK_CONTENT_file_save(wb:Workbook,wb_abs_path : str = None) -> Any
+@p3t.cp_traced(p3t.CP_TRACE_CAT_STORAGE)
+@p3t.cp_timed(bdm.BDM_METRIC_WB_SAVE_SECONDS)
 def bsm_WORKBOOK_CONTENT_file_save(wb_content:bdm.WORKBOOK_CONTENT_TYPE,
                                    wb_content_abs_path:Path, 
                                    wb_type: str,
@@ -548,6 +645,13 @@ def bsm_WORKBOOK_CONTENT_file_save(wb_content:bdm.WORKBOOK_CONTENT_TYPE,
             m = f"Unsupported wb_type: '{wb_type}' for file: '{wb_content_abs_path}'"
             logger.error(m)
             raise ValueError(m)
+        rows = bsm_WORKBOOK_CONTENT_rows(wb_content)
+        if rows is not None:
+            p3t.cp_metrics.counter(bdm.BDM_METRIC_WB_SAVE_ROWS).inc(rows)
+        if p3t.cp_tracer.enabled:
+            p3t.cp_trace_current().set(
+                wb_type=wb_type, file=Path(wb_content_abs_path).name,
+                **{p3t.CK_TRACE_ROWS: rows})
         logger.info(f"BizEVENT: Saved {wbtl} to file: {wb_content_abs_path}")
         logger.debug(f"Complete: {p3u.stop_timer(st)}")
     except Exception as e:
@@ -555,6 +659,20 @@ def bsm_WORKBOOK_CONTENT_file_save(wb_content:bdm.WORKBOOK_CONTENT_TYPE,
         raise    
 #endregion bsm_WORKBOOK_CONTENT_file_save(wb_abs_path : str = None) -> Any
 # ---------------------------------------------------------------------------- +
+#region    bsm_WORKBOOK_CONTENT_rows(wb_content) -> Optional[int]
+def bsm_WORKBOOK_CONTENT_rows(wb_content: bdm.WORKBOOK_CONTENT_TYPE) -> Optional[int]:
+    """Return the count of data rows in a wb_content, for tracing and metrics.
+
+    The rows of all worksheets of an excel Workbook, less a header row each,
+    the items of a csv DATA_LIST or a json or toml dict, else None.
+    """
+    if bdm_module_loaded(openpyxl) and isinstance(wb_content, openpyxl.Workbook):
+        return sum(max(ws.max_row - 1, 0) for ws in wb_content.worksheets)
+    if isinstance(wb_content, (list, dict)):
+        return len(wb_content)
+    return None
+#endregion bsm_WORKBOOK_CONTENT_rows(wb_content) -> Optional[int]
+# ---------------------------------------------------------------------------- +
 #region    bsm_WORKBOOK_CONTENT_file_copy(wb:Workbook,wb_abs_path : str = None) -> Any
 def bsm_WORKBOOK_CONTENT_file_copy(src_abs_path:Path, 
                                    dst_abs_path:Path,
@@ -860,11 +978,14 @@ def bsm_BDM_STORE_file_load(bdms_path : Path = None) -> bdm.BDM_STORE_TYPE:
             m = f"file is empty: {bdms_path}"
             logger.error(m)
             raise ValueError(m)
-        with open(bdms_path, "r") as f:
-            bdms_json : str = f.read()
-            bdms_json_size = len(bdms_json)
-            bdm_store_content = json5.decode(bdms_json,10)
-        logger.info(f"BizEVENT: Loaded '{bdms_json_size}' chars of json content from file: '{bdms_path}'")
+        bdm_store_content = bsm_json_file_load(bdms_path)
+        logger.info(f"BizEVENT: Loaded '{bdms_path.stat().st_size}' bytes of json content from file: '{bdms_path}'")
+        # Replay changes saved to the journal since the last full save.
+        journal_records = bsm_journal_read(bdms_path)
+        if journal_records:
+            bsm_journal_replay(bdm_store_content, journal_records)
+            logger.info(f"BizEVENT: Replayed '{len(journal_records)}' journal "
+                        f"records for file: '{bdms_path}'")
         return bdm_store_content
     except json5.Json5DecoderException as e:
         logger.error(p3u.exc_err_msg(e))
@@ -889,6 +1010,11 @@ def bsm_BDM_STORE_file_save(bdm_store:bdm.BDM_STORE_TYPE, bdms_path:Path) -> Non
         with open(bdms_path, "w") as f:
             f.write(jsonc_content)
         logger.info(f"BizEVENT: Saved BDM_STORE to file: {bdms_path}")
+        # Refresh the snapshot with the content as it will be loaded next.
+        try:
+            bsm_json_snapshot_save(bdms_path, json.loads(jsonc_content))
+        except ValueError:
+            pass
         return None
     except json5.Json5UnstringifiableType as e:
         logger.error(p3u.exc_err_msg(e))
@@ -1159,18 +1285,20 @@ def bsm_verify_folder(ap: Path, create:bool=True, raise_errors:bool=True) -> boo
 # ---------------------------------------------------------------------------- +
 #region    bsm_get_workbook_names()
 def bsm_get_workbook_names(abs_folder : Path) -> List[Path]:
-    """Return list of workbook Paths from absolute folder path."""
+    """Return list of workbook Paths from absolute folder path.
+    
+    One os.scandir() pass over the folder, keeping files with a filetype in
+    VALID_WB_FILETYPES, sorted by name.
+    """
     try:
         p3u.is_obj_of_type("wb_folder", abs_folder, Path, raise_error=True)
-        # Get a list of Path objects for all .xlsx files in the folder.
         wb_paths = []
-        for filetype in bdm.VALID_WB_FILETYPES:
-            my_glob = f"*{filetype}"
-            filetype_paths = list(abs_folder.glob(my_glob))
-            if not filetype_paths:
-                logger.debug(f"No '{filetype}' files found in folder: {abs_folder}")
-                continue
-            wb_paths.extend(filetype_paths)
+        with os.scandir(abs_folder) as it:
+            for entry in it:
+                if (os.path.splitext(entry.name)[1].lower() in bdm.VALID_WB_FILETYPES
+                    and entry.is_file()):
+                    wb_paths.append(abs_folder / entry.name)
+        wb_paths.sort(key=lambda p: p.name)
         filtered_wb_paths = bsm_filter_workbook_names(wb_paths)
         return filtered_wb_paths
     except Exception as e:
@@ -1178,6 +1306,37 @@ def bsm_get_workbook_names(abs_folder : Path) -> List[Path]:
         raise
 #endregion bsm_get_workbook_names()
 # ---------------------------------------------------------------------------- +
+#region    bsm_map_folders_concurrent()
+def bsm_map_folders_concurrent(func, folders : List[Any],
+                               max_workers : int = BSM_SCAN_MAX_WORKERS,
+                               return_exceptions : bool = False) -> List[Any]:
+    """Apply func to each item of folders on a thread pool.
+    
+    Results are returned in the order of folders, so callers merge them
+    deterministically. Exceptions from func are raised to the caller, or 
+    with return_exceptions, returned in place of the result.
+    """
+    try:
+        if return_exceptions:
+            func = functools.partial(_bsm_call_capture, func)
+        if len(folders) <= 1 or max_workers <= 1:
+            return [func(f) for f in folders]
+        workers = min(max_workers, len(folders))
+        with ThreadPoolExecutor(max_workers=workers, 
+                                thread_name_prefix="bsm_scan") as executor:
+            return list(executor.map(func, folders))
+    except Exception as e:
+        logger.error(p3u.exc_err_msg(e))
+        raise
+
+def _bsm_call_capture(func, item : Any) -> Any:
+    """Return func(item), or the exception it raised."""
+    try:
+        return func(item)
+    except Exception as e:
+        return e
+#endregion bsm_map_folders_concurrent()
+# ---------------------------------------------------------------------------- +
 #region    bsm_filter_workbook_names()
 def bsm_filter_workbook_names(wb_paths : List[Path]) -> List[Path]:
     """Filter out paths for invalid workbooks."""
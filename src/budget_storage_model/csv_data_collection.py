@@ -20,10 +20,10 @@
 # ---------------------------------------------------------------------------- +
 #region    Imports
 # python standard library modules and packages
-import csv, logging, shutil, os, time
+import csv, logging, shutil, os, time, tempfile
 from pathlib import Path
 from urllib.parse import urlparse, unquote
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 # third-party modules and packages
 import p3_utils as p3u, pyjson5, p3logging as p3l
@@ -33,12 +33,16 @@ import budman_namespace.design_language_namespace as bdm
 # ---------------------------------------------------------------------------- +
 #region    Globals and Constants
 logger = logging.getLogger(__name__)
+# Buffer size used when stream-copying csv file content, e.g., to prepend a
+# missing header row without materializing all rows in memory.
+CSV_COPY_BUFFER_SIZE: int = 1024 * 1024
 # ---------------------------------------------------------------------------- +
 #endregion Globals and Constants
 # ---------------------------------------------------------------------------- +
 #region    csv_DATA_LIST_get_url() function
 def csv_DATA_LIST_url_get(csv_url : str = None, 
-                          return_type: type = bdm.DATA_ROW_DICT_TYPE) -> bdm.DATA_ROW_DICT_TYPE | bdm.DATA_ROW_LIST_TYPE:
+                          return_type: type = bdm.DATA_ROW_DICT_TYPE,
+                          fieldnames: Optional[List[str]] = None) -> bdm.DATA_ROW_DICT_TYPE | bdm.DATA_ROW_LIST_TYPE:
     """Get a DATA_LIST object from a URL to a csv file in storage.
 
     A csv DATA_LIST is read in from the csv_url. Parse the URL and decide
@@ -46,13 +50,15 @@ def csv_DATA_LIST_url_get(csv_url : str = None,
 
     Args:
         csv_url (str): The URL to the DATA_LIST object to load.
+        fieldnames (List[str]): Optional virtual header, see 
+            csv_DATA_LIST_file_load().
     """
     try:
         st = p3u.start_timer()
         logger.debug(f"Get DATA_LIST from  url: '{csv_url}'")
         # only support file:// scheme for now.
         csv_path = p3u.verify_url_file_path(csv_url, test=True)
-        result = csv_DATA_LIST_file_load(csv_path, return_type=return_type)
+        result = csv_DATA_LIST_file_load(csv_path, fieldnames=fieldnames)
         logger.debug(f"Complete csv_path: {csv_path} {p3u.stop_timer(st)}")
         return result
     except Exception as e:
@@ -116,14 +122,19 @@ def csv_DATA_LIST_url_copy(src_url: str, dst_url: str ) -> None:
 #endregion csv_DATA_LIST_url_put() function
 # ---------------------------------------------------------------------------- +
 #region    csv_DATA_LIST_file_load() function
-def csv_DATA_LIST_file_load(csv_path: Path) -> bdm.DATA_OBJECT_LIST_TYPE:
+def csv_DATA_LIST_file_load(csv_path: Path,
+                            fieldnames: Optional[List[str]] = None) -> bdm.DATA_OBJECT_LIST_TYPE:
     """Load a DATA_LIST from a csv file at the given Path.
     
     A csv file is read in from the csv_path using csv.DictReader().
-    The csv file is expected to have a header row with the fieldnames.
+    The csv file is expected to have a header row with the fieldnames, 
+    unless fieldnames is provided as a "virtual header". In that case, the 
+    fieldnames are injected into the DictReader and the file is not touched.
+    If the file does have a header row matching the fieldnames, it is skipped.
 
     Args:
         csv_path (Path): The path to the csv file to load.
+        fieldnames (List[str]): Optional virtual header fieldnames.
 
     Returns:
         bdm.DATA_OBJECT_LIST_TYPE: The loaded DATA_LIST object as List[Dict[str,Any]].
@@ -144,7 +155,15 @@ def csv_DATA_LIST_file_load(csv_path: Path) -> bdm.DATA_OBJECT_LIST_TYPE:
             raise ValueError(m)
         
         with open(csv_path, "r", newline="", encoding='utf-8-sig') as f:
-            reader = csv.DictReader(f, skipinitialspace=True)
+            if fieldnames:
+                # Virtual header: skip a real header row if it is present.
+                first_line = f.readline()
+                if not csv_header_row_matches(first_line, fieldnames):
+                    f.seek(0)
+                reader = csv.DictReader(f, fieldnames=list(fieldnames),
+                                        skipinitialspace=True)
+            else:
+                reader = csv.DictReader(f, skipinitialspace=True)
             data_list: bdm.DATA_OBJECT_LIST_TYPE = list(reader)
         
         logger.info(f"BizEVENT: BSM: Loaded DATA_OBJECT_LIST_TYPE from csv file: '{csv_path}'")
@@ -420,11 +439,39 @@ def csv_DATA_LIST_rename_columns(csv_content: bdm.DATA_OBJECT_LIST_TYPE,
         raise
 #endregion csv_DATA_LIST_rename_columns() function
 # ---------------------------------------------------------------------------- +
+#region csv_header_row_matches() function
+def csv_header_row_matches(first_line: str, 
+                           expected_fieldnames: List[str]) -> bool:
+    """Check if the first line of a csv file is the expected header row.
+
+    Only the single line is parsed, the comparison is case insensitive and 
+    ignores column order, same as csv_DATA_LIST_has_header_row().
+
+    Args:
+        first_line (str): The first line of text read from the csv file.
+        expected_fieldnames (List[str]): List of expected fieldnames.
+
+    Returns:
+        True if the line holds the expected fieldnames, False otherwise.
+    """
+    if not first_line or not first_line.strip():
+        return False
+    row = next(csv.reader([first_line], skipinitialspace=True), [])
+    actual_set = set(name.strip().lower() for name in row)
+    expected_set = set(name.lower() for name in expected_fieldnames)
+    return actual_set == expected_set
+#endregion csv_header_row_matches() function
+# ---------------------------------------------------------------------------- +
 #region csv_DATA_LIST_file_validate_header() function
 def csv_DATA_LIST_file_validate_header(csv_path: Path, 
                                        expected_fieldnames: List[str],
                                        inplace: bool=False) -> Path:
     """Check if a CSV file has the expected header row. If missing, add it and save to a new file.
+
+    Single pass: only the first line is read to sniff the header. When the
+    header is missing, the header row and the remaining content are 
+    stream-copied into a temp file next to the original, which then 
+    atomically replaces the output file. Rows are never materialized.
     
     Args:
         csv_path (Path): Path to the CSV file to check
@@ -437,6 +484,7 @@ def csv_DATA_LIST_file_validate_header(csv_path: Path,
     Raises:
         ValueError: If the CSV file cannot be processed
     """
+    tmp_path: Optional[Path] = None
     try:
         logger.debug(f"Checking header in CSV file: '{csv_path}'")
         
@@ -445,53 +493,36 @@ def csv_DATA_LIST_file_validate_header(csv_path: Path,
             raise ValueError(f"CSV file does not exist: {csv_path}")
         if csv_path.suffix.lower() != '.csv':
             raise ValueError(f"File is not a CSV file: {csv_path}")
-            
-        # Load the CSV file using DictReader to check current structure
-        with open(csv_path, "r", newline="", encoding='utf-8-sig') as f:
-            # Peek at the first line to check if it looks like a header
-            first_line = f.readline().strip()
-            f.seek(0)  # Reset file pointer
-            
-            reader = csv.DictReader(f, skipinitialspace=True)
-            
-            # Get the actual fieldnames from DictReader (will be None, integers, or strings)
-            actual_fieldnames = reader.fieldnames
-            
-        # Check if the current fieldnames match expected fieldnames (case insensitive)
-        if actual_fieldnames:
-            actual_set = set(name.lower() if isinstance(name, str) else str(name) 
-                           for name in actual_fieldnames)
-            expected_set = set(name.lower() for name in expected_fieldnames)
-            
-            if actual_set == expected_set:
-                logger.debug(f"Header row already exists and matches expected fieldnames")
-                return csv_path
-        
-        # Header is missing or doesn't match - need to add it
-        logger.info(f"Adding missing header row to CSV file: {expected_fieldnames}")
-        
-        # Create new filename with "_hdr" appended
-        stem = csv_path.stem
-        suffix = csv_path.suffix
+
         if inplace:
             output_path = csv_path
         else:
-            new_filename = f"{stem}_hdr{suffix}"
-            output_path = csv_path.parent / new_filename
-        
-        # Read the original file as raw rows
-        with open(csv_path, "r", newline="", encoding='utf-8-sig') as f:
-            reader = csv.reader(f, skipinitialspace=True)
-            raw_rows = list(reader)
-        
-        # Write new file with header row
-        with open(output_path, "w", newline="", encoding='utf-8-sig') as f:
-            writer = csv.writer(f)
-            # Write the header row first
-            writer.writerow(expected_fieldnames)
-            # Write all the original rows
-            for row in raw_rows:
-                writer.writerow(row)
+            output_path = csv_path.parent / f"{csv_path.stem}_hdr{csv_path.suffix}"
+
+        with open(csv_path, "r", newline="", encoding='utf-8-sig') as src:
+            # Sniff the first line to check if it is the expected header.
+            first_line = src.readline()
+            if csv_header_row_matches(first_line, expected_fieldnames):
+                logger.debug(f"Header row already exists and matches expected fieldnames")
+                return csv_path
+
+            # Header is missing or doesn't match - need to add it
+            logger.info(f"Adding missing header row to CSV file: {expected_fieldnames}")
+            fd, tmp_name = tempfile.mkstemp(prefix=f".{csv_path.stem}_", 
+                                            suffix=".tmp", 
+                                            dir=csv_path.parent)
+            tmp_path = Path(tmp_name)
+            with open(fd, "w", newline="", encoding='utf-8-sig',
+                      buffering=CSV_COPY_BUFFER_SIZE) as dst:
+                # Keep the line terminator used by the original content.
+                eol = "\r\n" if first_line.endswith("\r\n") else "\n"
+                csv.writer(dst, lineterminator=eol).writerow(expected_fieldnames)
+                dst.write(first_line)
+                shutil.copyfileobj(src, dst, CSV_COPY_BUFFER_SIZE)
+        # mkstemp() creates the temp file 0600, keep the original's mode.
+        shutil.copymode(csv_path, tmp_path)
+        os.replace(tmp_path, output_path)
+        tmp_path = None
         
         logger.info(f"Created CSV file with header: '{output_path}'")
         return output_path
@@ -499,5 +530,9 @@ def csv_DATA_LIST_file_validate_header(csv_path: Path,
     except Exception as e:
         logger.error(p3u.exc_err_msg(e))
         raise
+    finally:
+        # Don't leave a partial temp file behind on failure.
+        if tmp_path is not None and tmp_path.exists():
+            tmp_path.unlink()
 #endregion csv_DATA_LIST_file_validate_header() function
 # ---------------------------------------------------------------------------- +
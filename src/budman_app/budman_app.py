@@ -10,7 +10,9 @@
 #region Imports
 # python standard libraries packages and modules 
 import atexit, pathlib, time, logging, inspect, logging.config  #, logging.handlers
-from typing import Optional
+from pathlib import Path
+from typing import Any, Dict, Optional
+from urllib.parse import urlparse
 
 # third-party  packages and module libraries
 from rich.console import Console
@@ -22,9 +24,13 @@ from budman_settings import *
 import budman_namespace as bdm
 from budman_namespace import BDMSingletonMeta
 import budman_command_services.budman_cp_namespace as cp
+from budman_command_services import BUDMAN_CMD_resources
 from budman_view_model import BudManViewModel
-from budman_cli_view import BudManCLIView
+from budman_cli_view import (BudManCLIView, BudManScriptLineParser,
+                             budman_script_user_output,
+                             budman_script_cmd_result_output)
 from budget_domain_model import (BudgetDomainModel)
+from budget_storage_model import bsm_warm_start_load, bsm_warm_start_save
 from budman_data_context import BDMDataContext
 from budman_workflow_services import BDMTXNCategoryManager
 #endregion Imports
@@ -32,6 +38,9 @@ from budman_workflow_services import BDMTXNCategoryManager
 #region Globals and Constants
 # ---------------------------------------------------------------------------- +
 logger = logging.getLogger(__name__)
+# Warm-start snapshot content keys.
+WARM_START_MODEL = "model"
+WARM_START_CATALOGS = "catalogs"
 console = Console(force_terminal=True,width=bdm.BUDMAN_WIDTH, highlight=True,
                   soft_wrap=False)
 console.print(f"Starting [green]{__name__}[/green] ...")
@@ -183,6 +192,7 @@ class BudManApp(p3m.Model_Binding, metaclass=BDMSingletonMeta):
     def budman_app_exit_handler(self):
         """start the cli repl loop."""
         try:
+            self.model.bdm_CHANGE_MONITOR_stop()
             self.view_model.save_model()
             m = f"BizEVENT: Exiting application {self.settings[APP_NAME]}..."
             logger.info(m)
@@ -195,12 +205,17 @@ class BudManApp(p3m.Model_Binding, metaclass=BDMSingletonMeta):
     #region    budman_app_services_dependency_injection() function
     def budman_app_services_dependency_injection(self, 
                                                 bdms_url : str = None, 
-                                                testmode : bool = False):
+                                                testmode : bool = False,
+                                                warm_start : Optional[Dict[str, Any]] = None,
+                                                headless : bool = False):
         """Assemble the application for startup. Do Dependency Injection.
                 
         Args:
             bdms_url (str): Optional, the URL to BDM_STORE to load at startup.
             testmode (bool): If True, run in test mode.
+            warm_start (Dict): Optional, warm-start snapshot content to 
+                restore the model and category catalogs from.
+            headless (bool): If True, no VIEW, output goes to the console.
         """
         try:
             logger.debug(f"Started: bdms_url = '{bdms_url}'...")
@@ -211,13 +226,17 @@ class BudManApp(p3m.Model_Binding, metaclass=BDMSingletonMeta):
             # Start by creating the VIEW_MODEL.
             self.view_model = BudManViewModel(bdms_url, self.settings)
             # Initialize the VIEW_MODEL, which also initializes the CommandProcessor.            
-            self.view_model.initialize()  
+            self.view_model.initialize(
+                warm_start[WARM_START_MODEL] if warm_start else None)
             self.model = self.view_model.model
             # Next, instantiate the BDMDataContext to serve as the 
             # DATA_CONTEXT for the VIEW_MODEL
             self.DC : BDMDataContext = BDMDataContext()
             # Next, instantiate the BDMTXNCategoryManager service.
             self.WF_CATEGORY_MANAGER = BDMTXNCategoryManager(self.settings)
+            if warm_start:
+                self.WF_CATEGORY_MANAGER.WARM_START_restore(
+                    warm_start[WARM_START_CATALOGS])
             # Bind it to the DC, a sort of service registry.
             self.DC.WF_CATEGORY_MANAGER = self.WF_CATEGORY_MANAGER
             # Next, bind the MODEL to the DATA_CONTEXT.
@@ -227,6 +246,13 @@ class BudManApp(p3m.Model_Binding, metaclass=BDMSingletonMeta):
             self.DC.dc_INITIALIZED = True
             # Next, bind the DATA_CONTEXT to the VIEW_MODEL.
             self.view_model.DC = self.DC
+            if headless:
+                # No VIEW, subscribe console output for the CP messages.
+                p3m.cp_msg_svc.subscribe_user_message(budman_script_user_output)
+                p3m.cp_msg_svc.subscribe_cmd_result_message(
+                    budman_script_cmd_result_output)
+                logger.debug(f"Complete: headless")
+                return self
             # Next, instantiate the BudManCLIView class to server as the VIEW 
             # for the application. The VIEW_MODEL is bound as the CommandProcessor.
             self.view = BudManCLIView(command_processor=self.view_model,
@@ -243,19 +269,35 @@ class BudManApp(p3m.Model_Binding, metaclass=BDMSingletonMeta):
     #endregion budman_app_services_dependency_injection() function
     # ------------------------------------------------------------------------ +
     #region    budman_app_setup() function
-    def budman_app_setup(self, bdms_url : str = None, testmode : bool = False):
+    def budman_app_setup(self, bdms_url : str = None, testmode : bool = False,
+                         headless : bool = False):
         """Assemble the application for startup. Do Dependency Injection by 
         instantiating the appropriate classes for components and services.
                 
         Args:
             bdms_url (str): Optional, the URL to BDM_STORE to load at startup.
             testmode (bool): If True, run in test mode.
+            headless (bool): If True, no VIEW or change monitor.
         """
         try:
+            st = start_timer()
             logger.debug(f"Started: bdms_url = '{bdms_url}'...")
+            # Restore from a current warm-start snapshot, if there is one.
+            bdms_path = self.budman_app_warm_start_path(bdms_url)
+            warm_start = bsm_warm_start_load(bdms_path) if bdms_path else None
             # In our MVVM pattern design, there are app_services for the VIEW, 
             # VIEW_MODEL, MODEL, DATA_CONTEXT and COMMAND_PROCESSOR.
-            _ = self.budman_app_services_dependency_injection(bdms_url, testmode)
+            _ = self.budman_app_services_dependency_injection(bdms_url, testmode,
+                                                              warm_start, headless)
+            if bdms_path and warm_start is None:
+                self.budman_app_warm_start_save(bdms_path)
+            logger.info(f"BizEVENT: {'Warm' if warm_start else 'Cold'} start "
+                        f"setup {stop_timer(st)}")
+            # Keep the model current with storage changes, except in testmode
+            # or headless. The changes are applied as cmds in the CP writer lane.
+            if not testmode and not headless:
+                self.model.bdm_CHANGE_MONITOR_start(
+                    on_changes=self.view_model.STORAGE_CHANGES_queue)
             # Register exit handler
             atexit.register(self.budman_app_exit_handler)
             logger.debug(f"Complete:")
@@ -266,6 +308,32 @@ class BudManApp(p3m.Model_Binding, metaclass=BDMSingletonMeta):
             raise
     #endregion budman_app_setup() function
     # ------------------------------------------------------------------------ +
+    #region    budman_app_warm_start methods
+    def budman_app_warm_start_path(self, bdms_url : str = None) -> Optional[Path]:
+        """Return the BDM_STORE path for bdms_url if warm start applies."""
+        if not bdms_url or not self.settings.get(BUDMAN_WARM_START, True):
+            return None
+        if urlparse(bdms_url).scheme != "file":
+            return None
+        return Path.from_uri(bdms_url)
+
+    def budman_app_warm_start_save(self, bdms_path : Path) -> None:
+        """Save the initialized model and category catalogs as the
+        warm-start snapshot for bdms_path, after a cold start."""
+        try:
+            file_paths, folder_paths = self.model.bdm_WARM_START_sources()
+            file_paths += self.WF_CATEGORY_MANAGER.WARM_START_sources()
+            file_paths += self.settings.SETTINGS_FILES_abs_paths()
+            content = {
+                WARM_START_MODEL: self.model.bdm_WARM_START_state(),
+                WARM_START_CATALOGS: self.WF_CATEGORY_MANAGER.WARM_START_state()
+            }
+            bsm_warm_start_save(bdms_path, content, file_paths, folder_paths)
+        except Exception as e:
+            # The snapshot is only a cache, startup continues without it.
+            logger.warning(f"Warm-start snapshot not saved: {exc_err_msg(e)}")
+    #endregion budman_app_warm_start methods
+    # ------------------------------------------------------------------------ +
     #region    budman_app_start() function
     def budman_app_start(self,testmode:bool=False):
         """start the cli repl loop."""
@@ -309,5 +377,46 @@ class BudManApp(p3m.Model_Binding, metaclass=BDMSingletonMeta):
         logger.info(f"{d} exiting ...")
     #endregion run() function
     # ------------------------------------------------------------------------ +
+    #region    run_script() function
+    def run_script(self, 
+                   script_path : str,
+                   bdms_url : str = None, 
+                   max_workers : int = p3m.CP_DEFAULT_WORKER_COUNT) -> int:
+        """Run a BudMan command script headless, without the cli view.
+
+        Independent commands in the script run in parallel, see
+        p3m.CPScriptRunner and BUDMAN_CMD_resources().
+
+        Args:
+            script_path (str): The command script file, e.g. load_all.bdm.
+            bdms_url (str): Optional, the URL to BDM_STORE to load at startup.
+            max_workers (int): The maximum number of commands run at once.
+
+        Returns:
+            int: The exit code, 0 if all script commands succeeded.
+        """
+        try:
+            if self.settings is None:
+                raise ValueError("Settings not configured.")
+            self.app_name = self.settings.get(APP_NAME, "BudManApp")
+            logger.debug(f"Started: {self.app_name} script = '{script_path}'...")
+            self.budman_app_setup(bdms_url, headless=True)
+            runner = p3m.CPScriptRunner(
+                self.view_model,
+                BudManScriptLineParser(self.view_model, self.settings),
+                BUDMAN_CMD_resources,
+                max_workers)
+            cmd_result = runner.cp_script_run_file(script_path)
+            self._exit_code = 0 if cmd_result[p3m.CK_CMD_RESULT_STATUS] else 1
+            logger.debug(f"Complete: {stop_timer(self.start_time)}")
+        except Exception as e:
+            m = exc_err_msg(e)
+            logger.error(m)
+            self._exit_code = 1
+        # Output the queued messages before exit.
+        p3m.cp_msg_svc.drain()
+        return self._exit_code
+    #endregion run_script() function
+    # ------------------------------------------------------------------------ +
     #endregion class methods
     # ------------------------------------------------------------------------ +
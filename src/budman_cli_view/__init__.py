@@ -11,7 +11,15 @@ __license__ = "MIT"
 # Budget Model Domain Working Data
 from .budman_cli_parser import ( BudManCLIParser )
 from .budman_cli_view import ( BudManCLIView)
+from .budman_cli_script import (
+    BudManScriptLineParser,
+    budman_script_user_output,
+    budman_script_cmd_result_output
+)
 __all__ = [
     "BudManCLIParser",
-    "BudManCLIView"
+    "BudManCLIView",
+    "BudManScriptLineParser",
+    "budman_script_user_output",
+    "budman_script_cmd_result_output"
 ]
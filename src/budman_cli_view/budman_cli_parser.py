@@ -9,7 +9,7 @@
 # python standard library modules and packages
 from email import parser
 import logging, shutil
-from typing import List
+from typing import Dict, List
 # third-party modules and packages
 import p3_utils as p3u, p3logging as p3l, p3_mvvm as p3m
 import cmd2, argparse
@@ -58,6 +58,11 @@ class BudManCLIParser():
     BudManCLIParser uses cmd2 to parse command line arguments for the 
     BudgetModelCLIView class, creating a command line interface for the
     Budget Manager application.
+
+    The parser of each top-level command, e.g. app_cmd or workflow_cmd, is
+    built by its <cmd>_cmd_parser_setup() method on first use, when cmd2
+    parses, completes or shows help for the command, and then cached. So
+    startup does not pay for building the parsers of unused commands.
     """
     #endregion    BudManCLIParser class docstring
     # ------------------------------------------------------------------------ +
@@ -84,29 +89,72 @@ class BudManCLIParser():
         self.valid_fi_key_values = settings[BUDMAN_VALID_FI_KEY_VALUES]
         self.valid_wf_key_values = settings[BUDMAN_VALID_WF_KEY_VALUES]
         self.valid_wf_purpose_key_values = settings[BUDMAN_VALID_WF_PURPOSE_KEY_VALUES]
-        # The cmd parsers
-        self.app_cmd = cmd2.Cmd2ArgumentParser()
-        self.change_cmd = cmd2.Cmd2ArgumentParser()
-        self.list_cmd = cmd2.Cmd2ArgumentParser()
-        self.load_cmd = cmd2.Cmd2ArgumentParser()
-        self.save_cmd = cmd2.Cmd2ArgumentParser()
-        self.close_cmd = cmd2.Cmd2ArgumentParser()
-        self.show_cmd = cmd2.Cmd2ArgumentParser()
-        self.workflow_cmd = cmd2.Cmd2ArgumentParser(
-            description="Workflow management commands.",
-            formatter_class=UnwrappedPositionalHelpFormatter
-        )
-        # Initialize all the cmd parsers
-        self.app_cmd_parser_setup(self.app_name)
-        self.change_cmd_parser_setup(self.app_name)
-        self.list_cmd_parser_setup(self.app_name)
-        self.load_cmd_parser_setup(self.app_name)
-        self.save_cmd_parser_setup(self.app_name)
-        self.close_cmd_parser_setup(self.app_name)
-        self.show_cmd_parser_setup(self.app_name)
-        self.workflow_cmd_parser_setup(self.app_name)
+        # The cmd parsers, by cmd_name, built on first use by cmd_parser().
+        self._cmd_parsers: Dict[str, Cmd2ArgumentParser] = {}
     #endregion __init__()
     # ------------------------------------------------------------------------ +
+    #region    Lazy cmd parser properties
+    # The top-level cmd_names, each with a <cmd_name>_cmd_parser_setup() method.
+    CMD_NAMES = (cp.CV_APP_CMD_NAME, cp.CV_CHANGE_CMD_NAME, cp.CV_LIST_CMD_NAME,
+                 cp.CV_LOAD_CMD_NAME, cp.CV_SAVE_CMD_NAME, cp.CV_CLOSE_CMD_NAME,
+                 cp.CV_SHOW_CMD_NAME, cp.CV_WORKFLOW_CMD_NAME)
+
+    def cmd_parser(self, cmd_name: str) -> Cmd2ArgumentParser:
+        """Return the parser for cmd_name, built and cached on first use."""
+        parser = self._cmd_parsers.get(cmd_name)
+        if parser is not None:
+            return parser
+        if cmd_name not in self.CMD_NAMES:
+            raise ValueError(f"No parser for cmd_name: '{cmd_name}'")
+        try:
+            st = p3u.start_timer()
+            if cmd_name == cp.CV_WORKFLOW_CMD_NAME:
+                parser = cmd2.Cmd2ArgumentParser(
+                    description="Workflow management commands.",
+                    formatter_class=UnwrappedPositionalHelpFormatter)
+            else:
+                parser = cmd2.Cmd2ArgumentParser()
+            # Cache it first, the setup method gets it as self.<cmd_name>_cmd.
+            self._cmd_parsers[cmd_name] = parser
+            getattr(self, f"{cmd_name}_cmd_parser_setup")(self.app_name)
+            logger.debug(f"Built '{cmd_name}' cmd parser: {p3u.stop_timer(st)}")
+            return parser
+        except Exception as e:
+            self._cmd_parsers.pop(cmd_name, None)
+            logger.error(p3u.exc_err_msg(e))
+            raise
+
+    def cmd_parser_build_all(self) -> None:
+        """Build the parsers of all cmds not yet built."""
+        for cmd_name in self.CMD_NAMES:
+            self.cmd_parser(cmd_name)
+
+    @property
+    def app_cmd(self) -> Cmd2ArgumentParser:
+        return self.cmd_parser(cp.CV_APP_CMD_NAME)
+    @property
+    def change_cmd(self) -> Cmd2ArgumentParser:
+        return self.cmd_parser(cp.CV_CHANGE_CMD_NAME)
+    @property
+    def list_cmd(self) -> Cmd2ArgumentParser:
+        return self.cmd_parser(cp.CV_LIST_CMD_NAME)
+    @property
+    def load_cmd(self) -> Cmd2ArgumentParser:
+        return self.cmd_parser(cp.CV_LOAD_CMD_NAME)
+    @property
+    def save_cmd(self) -> Cmd2ArgumentParser:
+        return self.cmd_parser(cp.CV_SAVE_CMD_NAME)
+    @property
+    def close_cmd(self) -> Cmd2ArgumentParser:
+        return self.cmd_parser(cp.CV_CLOSE_CMD_NAME)
+    @property
+    def show_cmd(self) -> Cmd2ArgumentParser:
+        return self.cmd_parser(cp.CV_SHOW_CMD_NAME)
+    @property
+    def workflow_cmd(self) -> Cmd2ArgumentParser:
+        return self.cmd_parser(cp.CV_WORKFLOW_CMD_NAME)
+    #endregion Lazy cmd parser properties
+    # ------------------------------------------------------------------------ +
     #endregion class BudManCLIParser Intrinsics
     # ------------------------------------------------------------------------ +
 
@@ -243,6 +291,51 @@ class BudManCLIParser():
                 help="Cause file loggers to rollover now.")
             self.add_common_optional_args(log_subcmd_parser)
             #endregion app log subcommand
+            #region app trace subcommand
+            trace_parser = subparsers.add_parser(
+                cp.CV_TRACE_SUBCMD_NAME,
+                help="Trace commands, tasks and storage calls in spans.")
+            trace_parser_defaults = {
+                p3m.CK_SUBCMD_NAME: cp.CV_TRACE_SUBCMD_NAME,
+                p3m.CK_SUBCMD_KEY: cp.CV_TRACE_SUBCMD_KEY}
+            trace_parser.set_defaults(**trace_parser_defaults)
+            trace_parser.add_argument(
+                cp.CK_TRACE_ACTION, nargs="?",
+                choices=cp.CV_TRACE_ACTIONS,
+                default=None,
+                help="Turn tracing on or off, or dump the spans as Chrome "
+                     "trace JSON. Show the tracing status if omitted.")
+            trace_parser.add_argument(
+                cp.CK_TRACE_PATH, nargs="?",
+                default=cp.CV_TRACE_DEFAULT_FILENAME,
+                help="Path of the trace JSON file to dump.")
+            self.add_common_optional_args(trace_parser)
+            #endregion app trace subcommand
+            #region app profile subcommand
+            profile_parser = subparsers.add_parser(
+                cp.CV_PROFILE_SUBCMD_NAME,
+                help="Run a command line under cProfile and tracemalloc.")
+            profile_parser_defaults = {
+                p3m.CK_SUBCMD_NAME: cp.CV_PROFILE_SUBCMD_NAME,
+                p3m.CK_SUBCMD_KEY: cp.CV_PROFILE_SUBCMD_KEY}
+            profile_parser.set_defaults(**profile_parser_defaults)
+            profile_parser.add_argument(
+                "--memory", "-m", dest=cp.CK_PROFILE_MEMORY,
+                action="store_true",
+                help="Also trace memory allocations with tracemalloc.")
+            profile_parser.add_argument(
+                "--top", "-t", dest=cp.CK_PROFILE_TOP,
+                type=int, default=p3m.CP_PROFILE_TOP,
+                help="Count of hotspots and allocation sites to report.")
+            profile_parser.add_argument(
+                "--sort", "-s", dest=cp.CK_PROFILE_SORT,
+                choices=p3m.CV_PROFILE_SORT_KEYS,
+                default=p3m.CV_PROFILE_SORT_CUMULATIVE,
+                help="Sort the hotspots by this key.")
+            profile_parser.add_argument(
+                cp.CK_PROFILE_CMDLINE, nargs=argparse.REMAINDER,
+                help="The command line to profile, e.g. 'wf categorize 2'.")
+            #endregion app profile subcommand
         except Exception as e:
             logger.exception(p3u.exc_err_msg(e))
             raise
@@ -523,7 +616,7 @@ class BudManCLIParser():
             parser.set_defaults(**show_cmd_defaults)
 
             # show subcommands: 
-            #     categories, datacontext, workbooks, fin_inst, workflows
+            #     categories, datacontext, workbooks, fin_inst, workflows, metrics
 
             #region Show Budget Categories subcommand
             categories_subcmd_parser = subparsers.add_parser(
@@ -615,6 +708,44 @@ class BudManCLIParser():
             self.add_common_optional_args(wf_subcmd_parser)
             #endregion show workflows subcommand
 
+            #region show metrics subcommand [prefix] [--json] [--reset] [--dump [path]] [--interval secs] [--stop]
+            metrics_subcmd_parser = subparsers.add_parser(
+                cp.CV_METRICS_SUBCMD_NAME,
+                aliases=["m"],
+                help="Show the command, storage and workflow metrics.")
+            metrics_subcmd_defaults = {
+                p3m.CK_SUBCMD_NAME: cp.CV_METRICS_SUBCMD_NAME,
+                p3m.CK_SUBCMD_KEY: cp.CV_SHOW_METRICS_SUBCMD_KEY
+            }
+            metrics_subcmd_parser.set_defaults(**metrics_subcmd_defaults)
+            metrics_subcmd_parser.add_argument(
+                cp.CK_METRICS_PREFIX, nargs="?",
+                default="",
+                help="Show only metrics with names starting with this prefix, "
+                     "e.g. 'cp.cmd' or 'bsm'.")
+            metrics_subcmd_parser.add_argument(
+                "--json", "-j", dest=cp.CK_METRICS_JSON,
+                action="store_true",
+                help="Show the metrics snapshot as JSON.")
+            metrics_subcmd_parser.add_argument(
+                "--reset", dest=cp.CK_METRICS_RESET,
+                action="store_true",
+                help="Reset all metrics after showing them.")
+            metrics_subcmd_parser.add_argument(
+                "--dump", "-d", dest=cp.CK_METRICS_DUMP, nargs="?",
+                const=cp.CV_METRICS_DEFAULT_FILENAME, default=None,
+                help="Append a metrics snapshot to a JSON Lines file.")
+            metrics_subcmd_parser.add_argument(
+                "--interval", "-i", dest=cp.CK_METRICS_INTERVAL,
+                type=float, default=None,
+                help="With --dump, append a snapshot each interval seconds.")
+            metrics_subcmd_parser.add_argument(
+                "--stop", dest=cp.CK_METRICS_STOP,
+                action="store_true",
+                help="Stop a periodic metrics dump.")
+            self.add_common_optional_args(metrics_subcmd_parser)
+            #endregion show metrics subcommand [prefix] [--json] [--reset] [--dump [path]] [--interval secs] [--stop]
+
         except Exception as e:
             logger.exception(p3u.exc_err_msg(e))
             raise
@@ -0,0 +1,120 @@
+# ---------------------------------------------------------------------------- +
+#region budman_cli_script.py module
+""" budman_cli_script.py headless BudMan command scripts.
+
+Parses the lines of a BudMan command script, such as load_all.bdm, with the
+BudManCLIParser argparse parsers into p3m.Command objects for a
+p3m.CPScriptRunner, without a BudManCLIView, cmd2.Cmd or a terminal. The
+output callbacks print the user messages and command results to the console
+in place of the BudManCLIView.
+"""
+#endregion budman_cli_script.py module
+# ---------------------------------------------------------------------------- +
+#region Imports
+# python standard library modules and packages
+import logging, shlex, argparse
+from typing import Dict, Any
+# third-party modules and packages
+from rich.console import Console
+from rich.markup import escape
+import p3_utils as p3u, p3_mvvm as p3m
+# local modules and packages
+import budman_settings as bdms
+import budman_namespace as bdm
+import budman_command_services as cp
+from .budman_cli_parser import BudManCLIParser
+from .budman_cli_view import BudManCLIView
+#endregion Imports
+# ---------------------------------------------------------------------------- +
+#region Globals and Constants
+logger = logging.getLogger(__name__)
+console = Console(force_terminal=True,width=bdm.BUDMAN_WIDTH, highlight=True,
+                  soft_wrap=False)
+#endregion Globals and Constants
+# ---------------------------------------------------------------------------- +
+#region    BudManScriptLineParser class
+class BudManScriptLineParser():
+    """Parse a BudMan command script line into a p3m.Command."""
+    # Same as the BudManCLIView cmd2 shortcuts.
+    CMD_SHORTCUTS: Dict[str, str] = {"wf": cp.CV_WORKFLOW_CMD_NAME}
+
+    def __init__(self, command_processor: p3m.CommandProcessor,
+                 settings: bdms.BudManSettings) -> None:
+        self.CP: p3m.CommandProcessor = command_processor
+        self.cli_parser: BudManCLIParser = BudManCLIParser(settings)
+
+    def __call__(self, line: str) -> p3m.Command | p3m.CMD_OBJECT_TYPE:
+        """Return the p3m.Command for line, or the CMD_OBJECT of a cmd in the
+        cp_cmd_map, or raise an error. An argparse error raises SystemExit."""
+        tokens = shlex.split(line)
+        if len(tokens) == 0:
+            raise ValueError("Invalid: No command name provided.")
+        cmd_name = self.CMD_SHORTCUTS.get(tokens[0], tokens[0])
+        parser = getattr(self.cli_parser, f"{cmd_name}_cmd", None)
+        if not isinstance(parser, argparse.ArgumentParser):
+            raise ValueError(f"Invalid: Unknown command '{tokens[0]}'.")
+        opts_dict: Dict[str, Any] = vars(parser.parse_args(tokens[1:])).copy()
+        # As BudManCLIView.extract_command_from_argparse_namespace().
+        cmd_name = opts_dict.pop(p3m.CK_CMD_NAME, cmd_name)
+        cmd_key = opts_dict.pop(p3m.CK_CMD_KEY, f"{cmd_name}{p3m.CK_CMD_KEY_SUFFIX}")
+        subcmd_name = opts_dict.pop(p3m.CK_SUBCMD_NAME, None)
+        subcmd_key = opts_dict.pop(p3m.CK_SUBCMD_KEY,
+                f"{cmd_key}_{subcmd_name}" if subcmd_name else None)
+        _ = opts_dict.pop(p3m.CK_CMD_EXEC_FUNC, None)
+        if cp.CK_CMDLINE_WF_PURPOSE in opts_dict:
+            opts_dict[cp.CK_CMDLINE_WF_PURPOSE] = BudManCLIView.translate_wf_purpose(
+                opts_dict[cp.CK_CMDLINE_WF_PURPOSE])
+        # Script cmds run in parallel, 'load wb' does not select the DC
+        # current workbook, see BUDMAN_CMD_resources().
+        opts_dict[cp.CK_SELECT_WORKBOOK] = False
+        cmd: p3m.Command = self.CP.cp_copy_command(cmd_key, subcmd_key)
+        if cmd is not None:
+            cmd.cmd_parms_update(opts_dict)
+            return cmd
+        if (subcmd_key or cmd_key) not in (self.CP.cp_cmd_map or {}):
+            raise ValueError(f"Invalid: No command for cmd_key '{cmd_key}' "
+                             f"subcmd_key '{subcmd_key}'.")
+        # A cp_cmd_map cmd, e.g. 'load wb', is a CMD_OBJECT as in
+        # BudManCLIView.cp_construct_cmd_from_argparse().
+        return p3m.cp_CMD_OBJECT_create(cmd_name=cmd_name, cmd_key=cmd_key,
+                                        subcmd_name=subcmd_name,
+                                        subcmd_key=subcmd_key,
+                                        other_attrs=opts_dict)
+#endregion BudManScriptLineParser class
+# ---------------------------------------------------------------------------- +
+#region    budman_script_user_output() function
+@p3m.cp_user_message_callback
+def budman_script_user_output(m: p3m.CPUserOutputMessage) -> None:
+    """Output user messages of a headless script run to the console."""
+    try:
+        if not isinstance(m.message, str):
+            return
+        if m.tag == p3m.CP_NONE:
+            console.print(escape(m.message))
+            return
+        for line in m.message.splitlines():
+            console.print(f"{m.tag:>7}: {escape(line)}")
+    except Exception as e:
+        logger.error(p3u.exc_err_msg(e))
+#endregion budman_script_user_output() function
+# ---------------------------------------------------------------------------- +
+#region    budman_script_cmd_result_output() function
+@p3m.cp_cmd_result_message_callback
+def budman_script_cmd_result_output(cmd_result: p3m.CMD_RESULT_TYPE) -> None:
+    """Output the successful command results of a headless script run to the
+    console, the CPScriptRunner outputs the failures."""
+    try:
+        if (not p3m.cp_is_CMD_RESULT(cmd_result) or
+            not cmd_result[p3m.CK_CMD_RESULT_STATUS]):
+            return
+        content = cmd_result.get(p3m.CK_CMD_RESULT_CONTENT, "")
+        if cmd_result[p3m.CK_CMD_RESULT_CONTENT_TYPE] == cp.CV_CMD_JSON_OUTPUT:
+            console.print_json(content)
+        elif isinstance(content, str):
+            console.print(escape(content))
+        else:
+            console.print(content)
+    except Exception as e:
+        logger.error(p3u.exc_err_msg(e))
+#endregion budman_script_cmd_result_output() function
+# ---------------------------------------------------------------------------- +
@@ -27,7 +27,7 @@ declarations are contained in that one class, separate from the View code.
 #region Imports
 # python standard library modules and packages
 import cmd
-import logging, os, sys, getpass, time, copy, threading
+import logging, os, sys, getpass, time, copy, threading, shlex
 from pathlib import Path
 from typing import List, Type, Generator, Dict, Tuple, Any, Optional, Union, Callable
 # third-party modules and packages
@@ -395,10 +395,31 @@ class BudManCLIView(cmd2.Cmd,
                 self.save_on_exit = not cmd[cp.CK_NO_SAVE]
                 console.print("Exiting Budget Manager CLI.")
                 return True
+            # If app profile cmd, profile the wrapped command line here.
+            if cmd[p3m.CK_SUBCMD_KEY] == cp.CV_PROFILE_SUBCMD_KEY:
+                return self.profile_cmdline(cmd)
             # Submit the command to the command processor.
             _ = self.cp_execute_cmd(cmd)
         except Exception as e:
             self.pexcept(e)
+
+    def profile_cmdline(self, cmd: p3m.CMD_OBJECT_TYPE) -> Optional[bool]:
+        """Run the command line of an app profile cmd under a p3m.CPProfiler,
+        saving the results in the profiles folder of the BUDMAN_FOLDER."""
+        tokens: List[str] = cmd.get(cp.CK_PROFILE_CMDLINE) or []
+        if len(tokens) == 0:
+            cp_user_error_message("app profile: No command line to profile.")
+            return None
+        cmdline = shlex.join(tokens)
+        profiler = p3m.CPProfiler(
+            self.settings.BUDMAN_FOLDER_abs_path() / cp.CV_PROFILES_FOLDER,
+            memory=cmd.get(cp.CK_PROFILE_MEMORY, False),
+            top=cmd.get(cp.CK_PROFILE_TOP, p3m.CP_PROFILE_TOP),
+            sort=cmd.get(cp.CK_PROFILE_SORT, p3m.CV_PROFILE_SORT_CUMULATIVE))
+        result = profiler.run(lambda: self.onecmd_plus_hooks(cmdline), cmdline)
+        p3m.cp_user_info_message(result.report())
+        # A stop from the wrapped command line, e.g. app exit, stops the CLI.
+        return result.value
     #endregion do_app command
     # ------------------------------------------------------------------------ +
     #region do_change command - change attributes of workbooks and other objects.
@@ -946,7 +967,8 @@ class BudManCLIView(cmd2.Cmd,
     #endregion extract_command_from_argparse_namespace
     # ------------------------------------------------------------------------ +
     #region    translate_wf_purpose
-    def translate_wf_purpose(self, wf_purpose: str) -> str:
+    @staticmethod
+    def translate_wf_purpose(wf_purpose: str) -> str:
         """Translate workflow purpose to user-friendly string."""
         if p3u.str_empty(wf_purpose):
             return "Unknown Purpose"
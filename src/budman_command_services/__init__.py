@@ -19,9 +19,12 @@ from .budman_command_services import (
     BUDMAN_CMD_list_files,
     BUDMAN_CMD_show_DATA_CONTEXT,
     BUDMAN_CMD_show_BUDGET_CATEGORIES,
+    BUDMAN_CMD_show_METRICS,
     BUDMAN_CMD_app_sync,
     BUDMAN_CMD_app_log,
+    BUDMAN_CMD_app_trace,
     BUDMAN_CMD_app_refresh,
+    BUDMAN_CMD_app_storage_changes,
     BUDMAN_CMD_app_reload,
     BUDMAN_CMD_app_delete,
     # BudMan Command File Services
@@ -33,6 +36,10 @@ from .budman_command_services import (
     verify_subcmd_key,
     validate_cmd_arguments
 )
+from .budman_cmd_resources import (
+    BUDMAN_CMD_resources,
+    BUDMAN_CMD_wb_resources
+)
 from .workflow_command_services import (
     WORKFLOW_CMD_transfer,
     WORKFLOW_CMD_transfer_files,
@@ -55,9 +62,12 @@ __all__ = [
     "BUDMAN_CMD_list_bdm_store_json",
     "BUDMAN_CMD_list_files",
     "BUDMAN_CMD_show_DATA_CONTEXT",
+    "BUDMAN_CMD_show_METRICS",
     "BUDMAN_CMD_app_sync",
     "BUDMAN_CMD_app_log",
+    "BUDMAN_CMD_app_trace",
     "BUDMAN_CMD_app_refresh",
+    "BUDMAN_CMD_app_storage_changes",
     "BUDMAN_CMD_app_reload",
     "BUDMAN_CMD_app_delete",
     # budman_command_services.py
@@ -79,6 +89,9 @@ __all__ = [
     "WORKFLOW_CMD_update_catalog_map",
     "WORKFLOW_CMD_set_value",
     "WORKFLOW_CMD_task",
-    "WORKFLOW_CMD_apply"
+    "WORKFLOW_CMD_apply",
+    # budman_cmd_resources.py
+    "BUDMAN_CMD_resources",
+    "BUDMAN_CMD_wb_resources"
     ]
 
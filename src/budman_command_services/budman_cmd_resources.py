@@ -0,0 +1,83 @@
+# ---------------------------------------------------------------------------- +
+#region budman_cmd_resources.py module
+""" budman_cmd_resources.py the resources read and written by BudMan commands.
+
+    BUDMAN_CMD_resources() is the resource_func of a p3m.CPScriptRunner for
+    BudMan command scripts. A wb_index is scoped to the current fi_key of
+    the DC, so every command reads CV_DC_RESOURCE and a command changing the
+    DC writes it, e.g. 'change'. In a script, 'load', 'save' and 'close' 
+    change only the loaded content of their workbooks, a script 'load' does
+    not select the DC current workbook (CK_SELECT_WORKBOOK). Then, 
+    'load wb 0' ... 'load wb 4' run in parallel, as do 'list wb 0' ... 
+    'show wb 4', while a 'list wb 0' waits for a 'load wb 0'.
+
+    Commands not known here, such as 'workflow' and 'app', write
+    p3m.CP_RESOURCE_ALL and run alone.
+"""
+#endregion budman_cmd_resources.py module
+# ---------------------------------------------------------------------------- +
+#region Imports
+# python standard library modules and packages
+import logging
+from typing import List, Set, Tuple, Dict, Any
+# third-party modules and packages
+import p3_mvvm as p3m
+# local modules and packages
+from .budman_cp_namespace import *
+#endregion Imports
+# ---------------------------------------------------------------------------- +
+#region Globals and Constants
+logger = logging.getLogger(__name__)
+#endregion Globals and Constants
+# ---------------------------------------------------------------------------- +
+#region    BUDMAN_CMD_parms() function
+def BUDMAN_CMD_parms(cmd: p3m.Command | p3m.CMD_OBJECT_TYPE) -> Dict[str, Any]:
+    """Return the parameters of a p3m.Command, or a CMD_OBJECT, e.g. a
+    'load wb' cmd of the cp_cmd_map."""
+    return cmd.cmd_parms if isinstance(cmd, p3m.Command) else cmd
+#endregion BUDMAN_CMD_parms() function
+# ---------------------------------------------------------------------------- +
+#region    BUDMAN_CMD_wb_resources() function
+def BUDMAN_CMD_wb_resources(cmd: p3m.Command | p3m.CMD_OBJECT_TYPE) -> Set[str]:
+    """Return the workbook resources selected by the wb_list or all_wbs
+    parameters of cmd. Without either, the selection depends on the DC, so
+    all workbooks."""
+    cmd_parms: Dict[str, Any] = BUDMAN_CMD_parms(cmd)
+    wb_list: List[int] = cmd_parms.get(CK_WB_LIST, None) or []
+    if cmd_parms.get(CK_ALL_WBS, False) or len(wb_list) == 0:
+        return {f"{CV_WB_RESOURCE}{p3m.CP_RESOURCE_SEP}{p3m.CP_RESOURCE_ALL}"}
+    return {f"{CV_WB_RESOURCE}{p3m.CP_RESOURCE_SEP}{wb_index}"
+            for wb_index in wb_list}
+#endregion BUDMAN_CMD_wb_resources() function
+# ---------------------------------------------------------------------------- +
+#region    BUDMAN_CMD_resources() function
+def BUDMAN_CMD_resources(cmd: p3m.Command | p3m.CMD_OBJECT_TYPE
+                         ) -> Tuple[Set[str], Set[str]]:
+    """Return the (reads, writes) resource sets of a BudMan command."""
+    cmd_parms: Dict[str, Any] = BUDMAN_CMD_parms(cmd)
+    if isinstance(cmd, p3m.Command):
+        cmd_key: str = cmd.cmd_key
+        subcmd_key: str = getattr(cmd, p3m.CK_SUBCMD_KEY, None)
+    else:
+        cmd_key, subcmd_key = cmd.get(p3m.CK_CMD_KEY), cmd.get(p3m.CK_SUBCMD_KEY)
+    if cmd_parms.get(CK_PARSE_ONLY, False):
+        return set(), set()
+    dc: Set[str] = {CV_DC_RESOURCE}
+    if subcmd_key in (CV_LOAD_WORKBOOKS_SUBCMD_KEY, CV_SAVE_WORKBOOKS_SUBCMD_KEY,
+                      CV_CLOSE_WORKBOOKS_SUBCMD_KEY):
+        # These change the loaded workbooks, a selecting load the DC too.
+        writes: Set[str] = BUDMAN_CMD_wb_resources(cmd)
+        if (subcmd_key == CV_LOAD_WORKBOOKS_SUBCMD_KEY and 
+            cmd_parms.get(CK_SELECT_WORKBOOK, True)):
+            writes |= dc
+        return dc | {CV_BDM_STORE_RESOURCE}, writes
+    if subcmd_key == CV_CHANGE_WORKBOOKS_SUBCMD_KEY:
+        return {CV_BDM_STORE_RESOURCE}, dc | BUDMAN_CMD_wb_resources(cmd)
+    if subcmd_key == CV_SAVE_BDM_STORE_SUBCMD_KEY:
+        return dc | BUDMAN_CMD_wb_resources(cmd), {CV_BDM_STORE_RESOURCE}
+    if cmd_key in (CV_LIST_CMD_KEY, CV_SHOW_CMD_KEY):
+        return (dc | {CV_BDM_STORE_RESOURCE} | BUDMAN_CMD_wb_resources(cmd),
+                set())
+    return set(), {p3m.CP_RESOURCE_ALL}
+#endregion BUDMAN_CMD_resources() function
+# ---------------------------------------------------------------------------- +
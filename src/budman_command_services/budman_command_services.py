@@ -34,8 +34,6 @@ from datetime import datetime as dt
 # third-party modules and packages
 from arrow import now
 import p3_utils as p3u, pyjson5, p3logging as p3l, p3_mvvm as p3m
-from setuptools import command
-from openpyxl import Workbook, load_workbook
 from treelib import Tree, Node
 from rich import print
 from rich.markup import escape
@@ -48,10 +46,10 @@ from .budman_cp_namespace import *
 import budman_namespace as bdm
 from budman_namespace import (BDMWorkbook, P2, P4)
 import budman_settings as bdms
-from budget_domain_model import BudgetDomainModel
+from budget_domain_model import BudgetDomainModel, wdc_attribute, WDCReconcileSummary
 from budman_data_context import BudManAppDataContext_Base
 from budget_storage_model import (
-    BSMFile, BSMFileTree,
+    BSMFile, BSMFileTree, BSMChangeEvent,
     bsm_verify_folder, bsm_URL_verify_file_scheme,)
 from budman_workflow_services import (
     BDMTXNCategoryManager, TXNCategoryMap,
@@ -92,6 +90,9 @@ def BUDMAN_CMD_router(cmd: p3m.CMD_OBJECT_TYPE,
             elif cmd[p3m.CK_SUBCMD_KEY] == CV_LOG_SUBCMD_KEY:
                 # Show the current log level.
                 return BUDMAN_CMD_app_log(cmd, bdm_DC)
+            elif cmd[p3m.CK_SUBCMD_KEY] == CV_TRACE_SUBCMD_KEY:
+                # Turn tracing on or off, or dump the trace.
+                return BUDMAN_CMD_app_trace(cmd, bdm_DC)
             elif cmd[p3m.CK_SUBCMD_KEY] == CV_APP_REFRESH_SUBCMD_KEY:
                 # App Refresh subcommand.
                 return BUDMAN_CMD_app_refresh(cmd, bdm_DC)
@@ -229,6 +230,9 @@ def BUDMAN_CMD_change_workbooks(
                             f" {m} for wb_index: "
                         f"'{str(bdm_DC.dc_WB_INDEX):>4}' wb_id: '{bdm_wb.wb_id}'")
                 bdm_DC.dc_BDM_STORE_changed = True
+            if any(v is not None for v in (new_wb_type, new_wf_key, new_wf_purpose)):
+                # Indexed attributes changed, update the model WorkbookIndex.
+                bdm_DC.model.bdm_WORKBOOK_reindex(bdm_wb)
             bdm_DC.dc_WORKBOOK = bdm_wb
         cmd_result[p3m.CK_CMD_RESULT_CONTENT] = result_all
         cmd_result[p3m.CK_CMD_RESULT_STATUS] = True
@@ -302,8 +306,6 @@ def BUDMAN_CMD_list_workbooks(cmd: p3m.Command,
             for wb in selected_bdm_wb_list:
                 wb_index = bdm_DC.dc_WORKBOOK_index(wb.wb_id)
                 cmd_result[p3m.CK_CMD_RESULT_CONTENT].append(wb.wb_info_dict(wb_index))
-            if len(selected_bdm_wb_list) == 1:
-                    bdm_DC.dc_WORKBOOK = wb
             # Convert the output dictionary result to a JSON string.
             cmd_result[p3m.CK_CMD_RESULT_CONTENT] = pyjson5.dumps(cmd_result[p3m.CK_CMD_RESULT_CONTENT])
             # Success for workbook_tree
@@ -392,12 +394,6 @@ def BUDMAN_CMD_list_files(
         level += 1
         # Start: ------------------------------------------------------------- +
         # Validate the cmd arguments.
-        cmd_args: p3m.CMD_ARGS_TYPE = cp.validate_command_for_exec(
-            expected_cmd_key=CV_LIST_CMD_KEY,
-            expected_subcmd_key=(CV_LIST_FILES_SUBCMD_KEY, CV_LIST_FOLDER_SUBCMD_KEY),
-            cmd=cmd
-        )
-
         cmd_args: p3m.CMD_ARGS_TYPE = cp.validate_command_for_exec(
             expected_cmd_key=CV_LIST_CMD_KEY,
             expected_subcmd_key=(CV_LIST_FILES_SUBCMD_KEY, CV_LIST_FOLDER_SUBCMD_KEY),
@@ -411,9 +407,7 @@ def BUDMAN_CMD_list_files(
         wf_folder_triplet: bool = cmd_args.get(CK_WF_FOLDER_TRIPLET, False)
         raw_format: bool = cmd_args.get(CK_RAW_FORMAT, False)
         all_files: bool = cmd_args.get(CK_ALL_FILES, False)
-        fi_key: str = cmd_args.get(CK_CMDLINE_FI_KEY, None)
-        prev_fi_key: str = bdm_DC.dc_FI_KEY
-        bdm_DC.dc_FI_KEY = fi_key if fi_key else prev_fi_key
+        fi_key: str = cmd_args.get(CK_CMDLINE_FI_KEY, None) or bdm_DC.dc_FI_KEY
         wf_key: str = cmd_args.get(CK_CMDLINE_WF_KEY, bdm_DC.dc_WF_KEY)
         if not wf_key:
             # No wf_key to work with
@@ -432,9 +426,8 @@ def BUDMAN_CMD_list_files(
         cmd_result: p3m.CMD_RESULT_TYPE = p3m.cp_CMD_RESULT_create(cmd=cmd)
         #endregion Initialization and validation
 
-        # Refresh the BSM file tree in the model to ensure it is up to date.
-        model.bdm_FILE_TREE_refresh()
-        bsm_file_tree : BSMFileTree = model.bsm_file_tree
+        # The BSM file tree, kept current by the change monitor if running.
+        bsm_file_tree : BSMFileTree = model.bdm_FILE_TREE_current()
 
         fi_wf_folder_url: str = model.bdm_WF_FOLDER_CONFIG_ATTRIBUTE(
             fi_key=fi_key, wf_key=wf_key, wf_purpose=wf_purpose, 
@@ -472,9 +465,6 @@ def BUDMAN_CMD_list_files(
         return cmd_result
     except Exception as e:
         return p3m.cp_CMD_RESULT_EXCEPTION_create(cmd, e)
-    finally:
-        # Restore previous DC Values if they were modified.
-        bdm_DC.dc_FI_KEY = prev_fi_key
 #endregion BUDMAN_CMD_list_files()
 # ---------------------------------------------------------------------------- +    
 #region BUDMAN_CMD_show_DATA_CONTEXT()
@@ -522,6 +512,10 @@ def BUDMAN_CMD_show_DATA_CONTEXT(
         p3m.cp_user_info_message("Budget Manager Data Context:")
         p3m.cp_user_info_message(f"{P2}{bdm.DC_INITIALIZED}: {bdm_DC.dc_INITIALIZED}")
         p3m.cp_user_info_message(f"{P2}{bdm.DC_BDM_STORE}: {bs_str}")
+        loaded_wbs = bdm_DC.dc_LOADED_WORKBOOKS
+        if hasattr(loaded_wbs, "residency_str"):
+            p3m.cp_user_info_message(f"{P2}{bdm.DC_LOADED_WORKBOOKS}: "
+                                     f"{loaded_wbs.residency_str()}")
         p3m.cp_user_info_message("Current Workflow Location:")
         p3m.cp_user_info_message(f"{P2}{bdm.FI_KEY}: {fi_key}"
                                  f"{P2}{bdm.WF_KEY}: {wf_key}"
@@ -601,15 +595,77 @@ def BUDMAN_CMD_show_BUDGET_CATEGORIES(
         return p3m.cp_CMD_RESULT_EXCEPTION_create(cmd, e)
 #endregion BUDMAN_CMD_show_BUDGET_CATEGORIES()
 # ---------------------------------------------------------------------------- +
+#region BUDMAN_CMD_show_METRICS()
+def BUDMAN_CMD_show_METRICS(
+        cmd: p3m.Command, 
+        bdm_DC: BudManAppDataContext_Base,
+        cp: p3m.CommandProcessor,
+        level: int = 0
+        ) -> p3m.CMD_RESULT_TYPE:
+    """Show the cp_metrics registry, and dump it to a JSON Lines file.
+
+    CMD parameters:
+        CK_METRICS_PREFIX (str): Show only metrics with names starting with it.
+        CK_METRICS_JSON (bool): Show the snapshot as JSON instead of text.
+        CK_METRICS_RESET (bool): Reset all metrics after showing them.
+        CK_METRICS_DUMP (str): Path of a JSON Lines file to append a snapshot.
+        CK_METRICS_INTERVAL (float): With a dump path, dump each interval
+            seconds until stopped.
+        CK_METRICS_STOP (bool): Stop a periodic dump.
+    """
+    try:
+        cmd_args: p3m.CMD_ARGS_TYPE = cp.validate_command_for_exec(
+            cmd,
+            expected_cmd_key=CV_SHOW_CMD_KEY,
+            expected_subcmd_key=CV_SHOW_METRICS_SUBCMD_KEY
+        )
+        metrics: p3m.CPMetricsRegistry = p3m.cp_metrics
+        prefix: str = cmd_args.get(CK_METRICS_PREFIX, None) or ""
+        dump_path: str = cmd_args.get(CK_METRICS_DUMP, None)
+        interval: float = cmd_args.get(CK_METRICS_INTERVAL, None)
+        msgs: List[str] = []
+        if cmd_args.get(CK_METRICS_STOP, False):
+            if metrics.dumping:
+                metrics.dump_stop()
+                msgs.append(f"Stopped metrics dump to: '{metrics.dump_path}'")
+            else:
+                msgs.append("No metrics dump running.")
+        if dump_path:
+            dump_path = Path(dump_path).resolve()
+            if interval:
+                metrics.dump_start(dump_path, interval)
+                msgs.append(f"Dumping metrics each {interval}s to: '{dump_path}'")
+            else:
+                metrics.dump(dump_path)
+                msgs.append(f"Dumped metrics to: '{dump_path}'")
+        if cmd_args.get(CK_METRICS_JSON, False):
+            snapshot = metrics.snapshot()
+            for kind in ("counters", "gauges", "histograms"):
+                snapshot[kind] = {k: v for k, v in snapshot[kind].items()
+                                  if k.startswith(prefix)}
+            content = p3m.cp_metrics_json(snapshot)
+            content_type = CV_CMD_JSON_OUTPUT
+        else:
+            content = "\n".join([metrics.report(prefix)] + msgs)
+            content_type = p3m.CV_CMD_STRING_OUTPUT
+        for m in msgs:
+            logger.info(m)
+        if cmd_args.get(CK_METRICS_RESET, False):
+            metrics.reset()
+        return p3m.cp_CMD_RESULT_create(True, content_type, content, cmd)
+    except Exception as e:
+        return p3m.cp_CMD_RESULT_EXCEPTION_create(cmd, e)
+#endregion BUDMAN_CMD_show_METRICS()
+# ---------------------------------------------------------------------------- +
 #region BUDMAN_CMD_app_sync()
 def BUDMAN_CMD_app_sync(cmd: p3m.CMD_OBJECT_TYPE,
                          bdm_DC: BudManAppDataContext_Base) -> p3m.CMD_RESULT_TYPE:
     """Sync the BDM store to the BSM.
     
-        Compare the files in model.bsm_file_tree to the workbooks in 
-        model overall (all FI's). Prepare collections of BDMWorkbooks found in
-        BSM but are missing from BDM, and BDMWorkbooks found in BDM but
-        missing from BSM. Depending on the cmd args, apply changes or not.
+        Discover the workbooks in the WF_FOLDERs of all FI's and reconcile
+        them with each FI_WORKBOOK_DATA_COLLECTION: workbooks added, removed,
+        moved and with a changed wb_type. Display the changes, and apply 
+        them with the --fix_switch.
     Args:
         cmd (CMD_OBJECT_TYPE): The command object to process.
         bdm_DC (BudManAppDataContext_Base): The data context for the BudMan application.
@@ -634,21 +690,21 @@ def BUDMAN_CMD_app_sync(cmd: p3m.CMD_OBJECT_TYPE,
         if not cmd_result[p3m.CK_CMD_RESULT_STATUS]:
             return cmd_result
         model: BudgetDomainModel = bdm_DC.model
-        bsm_file_tree : BSMFileTree = model.bsm_file_tree
+        fix: bool = cmd_args.get(CK_FIX_SWITCH, False)
         # Sync the BDM_STORE to the BSM.
-        wb: BDMWorkbook = None
-        for bsm_file in bsm_file_tree.all_workbooks():
-            logger.debug(f"BSM file_url: '{bsm_file._file_url}'")
-            wb = model.bdm_WORKBOOK_DATA_COLLECTION_find(bdm.WB_URL,
-                                                          bsm_file._file_url)
-            if wb:
-                logger.debug(f"Found matching BDMWorkbook: '{wb.wb_id}'")
+        disc_wdcs, _ = model.bsm_WORKBOOK_DATA_COLLECTION_resolve()
+        summaries: List[WDCReconcileSummary] = [
+            model.bsm_FI_WORKBOOK_DATA_COLLECTION_reconcile(fi_key, disc_wdc, apply=fix)
+            for fi_key, disc_wdc in disc_wdcs.items()]
+        if (fix and cmd_args.get(CK_SAVE, False) and 
+            any(summary.changed for summary in summaries)):
+            model.bdm_save_model()
         # Success
         return p3m.cp_CMD_RESULT_create(
-            cmd=None,
+            cmd=cmd,
             status=True,
             type=p3m.CV_CMD_STRING_OUTPUT,
-            content="foo"
+            content="\n".join(summary.display_str() for summary in summaries)
         )
     except Exception as e:
         return p3m.cp_CMD_RESULT_EXCEPTION_create(cmd, e)
@@ -672,6 +728,40 @@ def BUDMAN_CMD_app_log(cmd: p3m.CMD_OBJECT_TYPE,
         return p3m.cp_CMD_RESULT_EXCEPTION_create(cmd, e)
 #endregion BUDMAN_CMD_app_log()
 # ---------------------------------------------------------------------------- +    
+#region BUDMAN_CMD_app_trace()
+def BUDMAN_CMD_app_trace(cmd: p3m.CMD_OBJECT_TYPE,
+                      bdm_DC: BudManAppDataContext_Base) -> p3m.CMD_RESULT_TYPE:
+    """Turn tracing on or off, or dump the trace as Chrome trace JSON.
+
+    CMD parameters:
+        CK_TRACE_ACTION (str): 'on', 'off' or 'dump', if None, show status.
+        CK_TRACE_PATH (str): The path of the trace JSON file for 'dump'.
+    """
+    try:
+        tracer: p3m.CPTracer = p3m.cp_tracer
+        action: str = cmd.get(CK_TRACE_ACTION, None)
+        if action == CV_TRACE_ON:
+            tracer.start()
+            m = "Tracing on."
+        elif action == CV_TRACE_OFF:
+            tracer.stop()
+            m = f"Tracing off, {len(tracer)} spans recorded."
+        elif action == CV_TRACE_DUMP:
+            trace_path = Path(cmd.get(CK_TRACE_PATH, None) or 
+                              CV_TRACE_DEFAULT_FILENAME).resolve()
+            count = tracer.dump(trace_path)
+            m = f"Dumped {count} spans to: '{trace_path}'"
+            if tracer.dropped:
+                m += f", {tracer.dropped} oldest spans dropped."
+        else:
+            m = (f"Tracing {'on' if tracer.enabled else 'off'}, "
+                 f"{len(tracer)} spans recorded.")
+        logger.info(m)
+        return p3m.cp_CMD_RESULT_create(True, p3m.CV_CMD_STRING_OUTPUT, m, cmd)
+    except Exception as e:
+        return p3m.cp_CMD_RESULT_EXCEPTION_create(cmd, e)
+#endregion BUDMAN_CMD_app_trace()
+# ---------------------------------------------------------------------------- +    
 #region BUDMAN_CMD_app_refresh()
 def BUDMAN_CMD_app_refresh(cmd: p3m.CMD_OBJECT_TYPE,
                       bdm_DC: BudManAppDataContext_Base) -> p3m.CMD_RESULT_TYPE:
@@ -703,6 +793,30 @@ def BUDMAN_CMD_app_refresh(cmd: p3m.CMD_OBJECT_TYPE,
         return p3m.cp_CMD_RESULT_EXCEPTION_create(cmd, e)
 #endregion BUDMAN_CMD_app_refresh()
 # ---------------------------------------------------------------------------- +    
+#region BUDMAN_CMD_app_storage_changes()
+def BUDMAN_CMD_app_storage_changes(cmd: p3m.Command,
+                                   bdm_DC: BudManAppDataContext_Base,
+                                   cp: p3m.CommandProcessor) -> p3m.CMD_RESULT_TYPE:
+    """Apply the storage changes found by the model's change monitor.
+
+    The change monitor thread queues its change sets as this cmd, so they
+    are applied in the command processor writer lane, holding the model
+    lock to write like any other cmd changing the model.
+
+    CMD parameters:
+        CK_STORAGE_CHANGES (List[BSMChangeEvent]): The changes to apply.
+    """
+    try:
+        events: List[BSMChangeEvent] = cmd.cmd_parms.get(CK_STORAGE_CHANGES) or []
+        model: BudgetDomainModel = bdm_DC.model
+        applied: int = model.bdm_STORAGE_CHANGES_apply(events)
+        r = (f"Applied {len(events)} storage change(s), "
+             f"{applied} workbook(s) added or removed.")
+        return p3m.cp_CMD_RESULT_create(True, p3m.CV_CMD_STRING_OUTPUT, r, cmd)
+    except Exception as e:
+        return p3m.cp_CMD_RESULT_EXCEPTION_create(cmd, e)
+#endregion BUDMAN_CMD_app_storage_changes()
+# ---------------------------------------------------------------------------- +    
 #region BUDMAN_CMD_app_reload()
 def BUDMAN_CMD_app_reload(cmd: p3m.CMD_OBJECT_TYPE,
                       bdm_DC: BudManAppDataContext_Base) -> p3m.CMD_RESULT_TYPE:
@@ -882,8 +996,6 @@ def BUDMAN_CMD_TASK_get_workbook_tree(bdm_DC: BudManAppDataContext_Base) -> Rich
             )
             if count == 0: 
                 continue
-            # Put the wdc in wb_index order, which is sorted by wb_id key.
-            wdc = dict(sorted(wdc.items(), key=lambda item: item[0]))
             for wf_key, wf_folder_config_list in model.bdm_FI_WF_FOLDER_CONFIG_COLLECTION(fi_key).items():
                 x_key = f"{fi_key}_{wf_key}"
                 wf_key_branch = fi_key_branch.add(
@@ -901,7 +1013,7 @@ def BUDMAN_CMD_TASK_get_workbook_tree(bdm_DC: BudManAppDataContext_Base) -> Rich
                         guide_style="bold white"
                     )
                     # wf_purpose workbook names.
-                    wb_names = workbook_names(wdc, wf_key, wf_purpose)
+                    wb_names = workbook_names(model, fi_key, wf_key, wf_purpose)
                     logger.debug(f"FI: '{fi_key}', WF: '{wf_key}', WF_PURPOSE: '{wf_purpose}', workbooks({len(wb_names)}): {wb_names}")
                     if len(wb_names) > 0:
                         for wb_name in wb_names:
@@ -983,8 +1095,6 @@ def extract_bdm_tree(bdm_DC: BudManAppDataContext_Base) -> Tree:
                 continue
             tag = f"'{fi_folder}' (fi_folder) workbook count: '{len(wdc)}'"
             tree.create_node(tag, f"{fi_key}", parent="root") # fi_key node
-            # Put the wdc in wb_index order, which is sorted by wb_id key.
-            wdc = dict(sorted(wdc.items(), key=lambda item: item[0]))
             for wf_key, wf_folder_config_list in model.bdm_FI_WF_FOLDER_CONFIG_COLLECTION(fi_key).items():
                 x_key = f"{fi_key}_{wf_key}"
                 tree.create_node(f"{wf_key} workflow (wf_key)", x_key, parent=f"{fi_key}") # wf_key node
@@ -996,7 +1106,7 @@ def extract_bdm_tree(bdm_DC: BudManAppDataContext_Base) -> Tree:
                     tree.create_node(f"'{wf_folder}' {wf_purpose} (wf_folder)", 
                                      y_key, parent=x_key) # wf_purpose node
                     # wf_purpose workbook names.
-                    wb_names = workbook_names(wdc, wf_key, wf_purpose)
+                    wb_names = workbook_names(model, fi_key, wf_key, wf_purpose)
                     logger.debug(f"FI: '{fi_key}', WF: '{wf_key}', WF_PURPOSE: '{wf_purpose}', workbooks({len(wb_names)}): {wb_names}")
                     if len(wb_names) > 0:
                         for wb_name in wb_names:
@@ -1056,22 +1166,20 @@ def BUDMAN_CMD_FILE_SERVICE_get_full_filename(file_tree: Tree, file_index: int)
 #region BudMan Application Command Helper functions
 # ---------------------------------------------------------------------------- +
 #region workbook_names() function
-def workbook_names(wdc: bdm.WORKBOOK_DATA_COLLECTION_TYPE, wf_key: str, wf_purpose: str) -> List[str]:
-    """Return a list of workbook names for the given wf_key and wf_purpose."""
+def workbook_names(model: BudgetDomainModel, fi_key: str, wf_key: str, 
+                   wf_purpose: str) -> List[str]:
+    """Return a list of workbook names for the given wf_key and wf_purpose,
+    in wb_index order, from the model WorkbookIndex."""
     try:
         wb_name_list: List[str] = []
-        if wdc is None or len(wdc) == 0:
-            return wb_name_list
-        wb_id_list: List[str] = list(wdc.keys())
-        for wb_id,bdm_wb in wdc.items():
-            if not isinstance(bdm_wb, bdm.BDMWorkbook):
-                continue
-            if bdm_wb.wf_key != wf_key:
-                continue
-            if bdm_wb.wf_purpose != wf_purpose:
+        index = model.bdm_WORKBOOK_INDEX
+        wdc = model.bdm_FI_WORKBOOK_DATA_COLLECTION(fi_key)
+        for _, wb_id in index.find_purpose(wf_key, wf_purpose, fi_key):
+            wb_name = wdc_attribute(wdc, wb_id, bdm.WB_NAME)
+            if wb_name is None:
                 continue
-            wb_index = wb_id_list.index(wb_id)
-            name_str: str = f"{str(wb_index):>4} {bdm_wb.wb_name}"
+            wb_index = index.wb_index(fi_key, wb_id)
+            name_str: str = f"{str(wb_index):>4} {wb_name}"
             wb_name_list.append(name_str)
         return wb_name_list
     except Exception as e:
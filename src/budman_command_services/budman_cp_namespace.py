@@ -114,6 +114,8 @@ CV_EXIT_SUBCMD_NAME = "exit"
 CV_EXIT_SUBCMD_KEY = CV_APP_CMD_KEY + "_" + CV_EXIT_SUBCMD_NAME
 CV_APP_REFRESH_SUBCMD_NAME = "refresh"
 CV_APP_REFRESH_SUBCMD_KEY = CV_APP_CMD_KEY + "_" + CV_APP_REFRESH_SUBCMD_NAME
+CV_STORAGE_CHANGES_SUBCMD_NAME = "storage_changes"
+CV_STORAGE_CHANGES_SUBCMD_KEY = CV_APP_CMD_KEY + "_" + CV_STORAGE_CHANGES_SUBCMD_NAME
 CV_FILE_DELETE_SUBCMD_NAME = "delete"
 CV_FILE_DELETE_SUBCMD_KEY = CV_APP_CMD_KEY + "_" + CV_FILE_DELETE_SUBCMD_NAME
 CV_WORKFLOW_DELETE_SUBCMD_KEY = CV_WORKFLOW_CMD_KEY + "_" + CV_FILE_DELETE_SUBCMD_NAME
@@ -121,12 +123,38 @@ CV_RELOAD_SUBCMD_NAME = "reload"
 CV_RELOAD_SUBCMD_KEY = CV_APP_CMD_KEY + "_" + CV_RELOAD_SUBCMD_NAME
 CV_LOG_SUBCMD_NAME = "log"
 CV_LOG_SUBCMD_KEY = CV_APP_CMD_KEY + "_" + CV_LOG_SUBCMD_NAME
+CV_TRACE_SUBCMD_NAME = "trace"
+CV_TRACE_SUBCMD_KEY = CV_APP_CMD_KEY + "_" + CV_TRACE_SUBCMD_NAME
+CV_PROFILE_SUBCMD_NAME = "profile"
+CV_PROFILE_SUBCMD_KEY = CV_APP_CMD_KEY + "_" + CV_PROFILE_SUBCMD_NAME
 CV_SYNC_SUBCMD_NAME = "sync"
 CV_SYNC_SUBCMD_KEY = CV_APP_CMD_KEY  + "_" + CV_SYNC_SUBCMD_NAME 
 CV_TASK_SUBCMD_NAME = "task"
 CV_TASK_SUBCMD_KEY = CV_WORKFLOW_CMD_KEY + "_" + CV_TASK_SUBCMD_NAME
 CV_CHANGE_WORKBOOKS_SUBCMD_KEY = CV_CHANGE_CMD_KEY + "_" + CV_WORKBOOKS_SUBCMD_NAME
 CV_SHOW_WORKBOOKS_SUBCMD_KEY = CV_SHOW_CMD_KEY + "_" + CV_WORKBOOKS_SUBCMD_NAME
+CV_METRICS_SUBCMD_NAME = "metrics"
+CV_SHOW_METRICS_SUBCMD_KEY = CV_SHOW_CMD_KEY + "_" + CV_METRICS_SUBCMD_NAME
+# Pure read subcommands, their results are cached until the model changes.
+CV_CACHEABLE_SUBCMD_KEYS = (
+    CV_LIST_BDM_STORE_SUBCMD_KEY,
+    CV_LIST_WORKBOOKS_SUBCMD_KEY,
+    CV_SHOW_DATA_CONTEXT_SUBCMD_KEY,
+    CV_SHOW_BUDGET_CATEGORIES_SUBCMD_KEY
+)
+# Storage listings, cacheable while the model's change monitor runs, its
+# bdm_storage_version is in the cache key. Without it, storage is rescanned.
+CV_STORAGE_LISTING_SUBCMD_KEYS = (
+    CV_LIST_FILES_SUBCMD_KEY,
+    CV_LIST_FOLDER_SUBCMD_KEY
+)
+# Subcommands not changing the model or the DC, they run in parallel and
+# do not bump the model version. Any other subcommand may change the model.
+CV_READ_ONLY_SUBCMD_KEYS = CV_CACHEABLE_SUBCMD_KEYS + CV_STORAGE_LISTING_SUBCMD_KEYS + (
+    CV_SHOW_METRICS_SUBCMD_KEY,
+    CV_LOG_SUBCMD_KEY,
+    CV_TRACE_SUBCMD_KEY
+)
 CV_PARSE_ONLY_SUBCMD_NAME = "parse_only"
 CV_PARSE_ONLY_SUBCMD_KEY = CV_VAL_CMD_KEY + "_" + CV_PARSE_ONLY_SUBCMD_NAME
 
@@ -138,6 +166,7 @@ CK_VERBOSE = p3m.CK_VERBOSE                      # --verbose  -v
 CK_ALL_WBS = "all_wbs"                           # --all_wbs  -all
 CK_ALL_FILES = "all_files"                       # --all_files  -all
 CK_LOAD_WORKBOOK_SWITCH = "load_workbook"        # --load_workbook  -l, -load
+CK_SELECT_WORKBOOK = "select_workbook"          # load wb selects the DC current workbook, not in scripts
 CK_FIX_SWITCH = "fix_switch"                     # --fix_switch  -fix
 CK_VALIDATE_CATEGORIES = "validate_categories"   # --validate_categories  -vc
 CK_REMOVE_EXTRA_COLUMNS = "remove_extra_columns" # --remove_extra_columns  -rec
@@ -214,6 +243,30 @@ CK_HANDLER_NAME = "handler_name"
 CK_LIST_SWITCH = "list_switch" 
 CK_LEVEL_VALUE = "level_value"
 CK_ROLLOVER_SWITCH = "rollover_switch"
+# subcmd_name CV_TRACE_SUBCMD argument constants
+CK_TRACE_ACTION = "trace_action"
+CK_TRACE_PATH = "trace_path"
+CV_TRACE_ON = "on"
+CV_TRACE_OFF = "off"
+CV_TRACE_DUMP = "dump"
+CV_TRACE_ACTIONS = (CV_TRACE_ON, CV_TRACE_OFF, CV_TRACE_DUMP)
+CV_TRACE_DEFAULT_FILENAME = "budman_trace.json"
+# subcmd_name CV_PROFILE_SUBCMD argument constants
+CK_PROFILE_CMDLINE = "profile_cmdline"
+CK_PROFILE_MEMORY = "profile_memory"
+CK_PROFILE_TOP = "profile_top"
+CK_PROFILE_SORT = "profile_sort"
+CV_PROFILES_FOLDER = "profiles" # in the BUDMAN_FOLDER
+# subcmd_name CV_METRICS_SUBCMD argument constants
+CK_METRICS_PREFIX = "metrics_prefix"
+CK_METRICS_JSON = "metrics_json"
+CK_METRICS_RESET = "metrics_reset"
+CK_METRICS_DUMP = "metrics_dump"
+CK_METRICS_INTERVAL = "metrics_interval"
+CK_METRICS_STOP = "metrics_stop"
+CV_METRICS_DEFAULT_FILENAME = "budman_metrics.jsonl"
+# subcmd_name CV_STORAGE_CHANGES_SUBCMD argument constants
+CK_STORAGE_CHANGES = "storage_changes"
 # subcmd_name CV_RELOAD_SUBCMD argument constants
 CK_RELOAD_TARGET = "reload_target"
 CV_CATEGORY_MAP = "category_map"
@@ -222,6 +275,11 @@ CV_FI_WORKBOOK_DATA_COLLECTION = bdm.FI_WORKBOOK_DATA_COLLECTION
 CV_WORKFLOWS_MODULE = "budman_workflows"
 # deprecated
 CK_CHECK_REGISTER = "check_register"
+# CPScriptRunner resources read and written by BudMan commands. Workbook 
+# resources are CV_WB_RESOURCE:<wb_index>, or CV_WB_RESOURCE:* for all.
+CV_DC_RESOURCE = "DC"
+CV_BDM_STORE_RESOURCE = "BDM_STORE"
+CV_WB_RESOURCE = "WB"
 
 BUDMAN_VALID_CK_ATTRS = (p3m.CK_CMD_KEY, p3m.CK_CMD_NAME, p3m.CK_SUBCMD_KEY, p3m.CK_SUBCMD_NAME, 
                         p3m.CK_CMD_EXEC_FUNC,
@@ -19,8 +19,6 @@ from datetime import datetime as dt
 
 # third-party modules and packages
 import p3_utils as p3u, pyjson5, p3logging as p3l, p3_mvvm as p3m
-from openpyxl import Workbook, load_workbook
-from openpyxl.worksheet.worksheet import Worksheet
 
 # local modules and packages
 import budman_settings as bdms
@@ -40,6 +38,7 @@ from .budman_cp_namespace import *
 # ---------------------------------------------------------------------------- +
 #region Globals and Constants
 logger = logging.getLogger(__name__)
+openpyxl = bdm.bdm_lazy_import("openpyxl")
 #endregion Globals and Constants
 # ---------------------------------------------------------------------------- +
 
@@ -232,6 +231,7 @@ def WORKFLOW_CMD_transfer_workbooks(
 
         # Process the intended workbooks.
         for src_wb in selected_bdm_wb_list:
+            p3m.cp_cmd_cancel_check(cmd) # Stop here if an async cmd is cancelled.
             # Select the current workbook in the Data Context.
             bdm_DC.dc_WORKBOOK = src_wb
             wb_index: int = bdm_DC.dc_WB_INDEX    # src fi_key
@@ -285,9 +285,8 @@ def WORKFLOW_CMD_transfer_workbooks(
                 dst_wb = result
                 WORKFLOW_TASK_convert_csv_txns_to_excel_txns(src_wb, dst_wb)
                 # Add the new workbook to the wdc.
-                wdc = bdm_DC.dc_WORKBOOK_DATA_COLLECTION
                 wb_id = dst_wb.wb_id
-                wdc[wb_id] = dst_wb
+                bdm_DC.dc_WORKBOOK_DATA_COLLECTION_add(dst_wb)
                 wb_index = bdm_DC.dc_WORKBOOK_index(wb_id)
                 result_new_wb_index_list.append(wb_index)
                 msg = (f"{pad(level)}Added new workbook: '{wb_index:03}:{dst_wb.wb_name}' ")
@@ -329,9 +328,8 @@ def WORKFLOW_CMD_transfer_workbooks(
                 # Task: Copy the workbook content from the src workbook to the dst workbook.
                 bsm_BDMWorkbook_copy(src_wb, dst_wb, use_symlink)
                 # Add the new workbook to the wdc.
-                wdc = bdm_DC.dc_WORKBOOK_DATA_COLLECTION
                 wb_id = dst_wb.wb_id
-                wdc[wb_id] = dst_wb
+                bdm_DC.dc_WORKBOOK_DATA_COLLECTION_add(dst_wb)
                 wb_index = bdm_DC.dc_WORKBOOK_index(wb_id)
                 result_new_wb_index_list.append(wb_index)
                 msg = (f"{pad(level)}Added new workbook: '{wb_index:03}:{dst_wb.wb_name}' ")
@@ -915,6 +913,7 @@ def WORKFLOW_CMD_categorize_transactions(
 
         # Process the intended workbooks.
         for bdm_wb in selected_bdm_wb_list:
+            p3m.cp_cmd_cancel_check(cmd) # Stop here if an async cmd is cancelled.
             # Select the current workbook in the Data Context.
             bdm_DC.dc_WORKBOOK = bdm_wb
             bdm_wb_abs_path = bdm_wb.abs_path()
@@ -1022,6 +1021,7 @@ def WORKFLOW_CMD_delete_workbooks(
         # Process the intended workbooks.
         src_wb: BDMWorkbook = None
         for src_wb in selected_bdm_wb_list:
+            p3m.cp_cmd_cancel_check(cmd) # Stop here if an async cmd is cancelled.
             # Select the current workbook in the Data Context.
             bdm_DC.dc_WORKBOOK = src_wb
             wb_index: int = bdm_DC.dc_WB_INDEX
@@ -1101,6 +1101,7 @@ def WORKFLOW_CMD_check_workbooks(
             # budman_workflow_services package modules. When a file or workbook
             # are modified, the API function should save it by default.
         for src_wb in selected_bdm_wb_list:
+            p3m.cp_cmd_cancel_check(cmd) # Stop here if an async cmd is cancelled.
             # Select the current workbook in the Data Context.
             bdm_DC.dc_WORKBOOK = src_wb
             bdm_wb_abs_path = src_wb.abs_path()
@@ -1411,6 +1412,7 @@ def WORKFLOW_CMD_apply(
 #endregion WORKFLOW_CMD_apply() function
 # ---------------------------------------------------------------------------- +
 #region WORKFLOW_TASK_convert_csv_txns_to_excel_txns() function
+@p3m.cp_traced(p3m.CP_TRACE_CAT_TASK)
 def WORKFLOW_TASK_convert_csv_txns_to_excel_txns(csv_wb: BDMWorkbook, 
                                                  excel_wb: BDMWorkbook ) -> bdm.BUDMAN_RESULT_TYPE:
     """Convert CSV transactions to Excel transactions.
@@ -1426,8 +1428,8 @@ def WORKFLOW_TASK_convert_csv_txns_to_excel_txns(csv_wb: BDMWorkbook,
         csv_txns = csv_wb.wb_content
         headers = list(csv_txns[0].keys())  # Get headers from the first row
         
-        excel_wb.wb_content = Workbook() # Create a new Excel workbook.
-        ws: Worksheet = excel_wb.wb_content.active
+        excel_wb.wb_content = openpyxl.Workbook() # Create a new Excel workbook.
+        ws: bdm.EXCEL_TXNS_WORKSHEET_TYPE = excel_wb.wb_content.active
         #TODO: get the worksheet title from settings or config.
         ws.title = "TransactionData" # Set the name of the first worksheet.
 
@@ -1446,6 +1448,8 @@ def WORKFLOW_TASK_convert_csv_txns_to_excel_txns(csv_wb: BDMWorkbook,
             ws.append(list(row.values()))
         # Task 3: Save the excel_txns workbook
         excel_wb.wb_content.save(excel_wb.abs_path())
+        p3m.cp_trace_current().set(**{p3m.CK_TRACE_WB_ID: excel_wb.wb_id,
+                                      p3m.CK_TRACE_ROWS: len(csv_txns)})
         logger.debug(f"Saved excel_txns to {excel_wb.abs_path() }")
         return True, f"Converted CSV to Excel in {p3u.stop_timer(st)} "
     except Exception as e:
@@ -1456,6 +1460,7 @@ def WORKFLOW_TASK_convert_csv_txns_to_excel_txns(csv_wb: BDMWorkbook,
 #endregion WORKFLOW_TASK_convert_csv_txns_to_excel_txns() function
 # ---------------------------------------------------------------------------- +
 #region WORKFLOW_TASK_transfer_csv_file()
+@p3m.cp_traced(p3m.CP_TRACE_CAT_TASK)
 def WORKFLOW_TASK_transfer_csv_file_to_workbook(src_file_url: str,
                                     dst_wb: BDMWorkbook,
                                     wb_type: str) -> bdm.BUDMAN_RESULT_TYPE:
@@ -1487,6 +1492,7 @@ def WORKFLOW_TASK_transfer_csv_file_to_workbook(src_file_url: str,
 #endregion WORKFLOW_TASK_transfer_csv_file()
 # ---------------------------------------------------------------------------- +
 #region WORKFLOW_TASK_contstruct_wb_file_url() function
+@p3m.cp_traced(p3m.CP_TRACE_CAT_TASK)
 def WORKFLOW_TASK_construct_bdm_workbook(src_filename: str,
                                        wb_type: str,
                                        fi_key: str,
@@ -12,9 +12,12 @@ from .budman_app_data_context_base_ABC import BudManAppDataContext_Base
 from .budman_app_data_context import BudManAppDataContext
 from .budman_app_data_context_binding_class import BudManAppDataContext_Binding
 from .budget_domain_model_data_context import BDMDataContext
+from .loaded_workbook_collection import LoadedWorkbookCollection, wb_content_size
 __all__ = [
     "BudManAppDataContext_Base",
     "BudManAppDataContext",
     "BudManAppDataContext_Binding",
     "BDMDataContext",
+    "LoadedWorkbookCollection",
+    "wb_content_size",
 ]
@@ -15,7 +15,6 @@ Budget Domain Model.
 from pathlib import Path
 from typing import Any, Tuple, Dict, List, Optional
 # third-party modules and packages
-from openpyxl import Workbook
 from treelib import Tree, Node
 import logging, p3_utils as p3u, p3logging as p3l
 # local modules and packages for necessary classes and functions
@@ -24,7 +23,7 @@ from budman_data_context import BudManAppDataContext
 from p3_mvvm import Model_Base, Model_Binding
 import budget_storage_model as bsm
 from budman_workflow_services.category_manager import BDMTXNCategoryManager
-from budget_domain_model import BudgetDomainModel
+from budget_domain_model import BudgetDomainModel, WorkbookIndex
 #endregion imports
 # ---------------------------------------------------------------------------- +
 #region Globals and Constants
@@ -225,6 +224,14 @@ class BDMDataContext(BudManAppDataContext, Model_Binding):
                     m = "dc_FI_KEY is None. Cannot continue to initialize BDMDataContext."
                     logger.error(m)
                     raise ValueError(m)
+                # Apply the loaded workbooks budget, evicted workbook
+                # content is saved if dirty and reloaded from storage.
+                bdm_options = self.model.bdm_options or {}
+                self.dc_LOADED_WORKBOOKS.configure(
+                    max_count=bdm_options.get(BDMO_LOADED_WORKBOOKS_MAX_COUNT),
+                    max_bytes=bdm_options.get(BDMO_LOADED_WORKBOOKS_MAX_BYTES),
+                    loader=self._dc_LOADED_WORKBOOK_reload,
+                    flush=self._dc_LOADED_WORKBOOK_flush)
                 # Set the dc_FILE_TREE binding.
                 self._dc_FILE_TREE = self.model.bsm_file_tree.file_tree
                 # Set the dc_WORKBOOK_TREE binding.
@@ -237,8 +244,11 @@ class BDMDataContext(BudManAppDataContext, Model_Binding):
                 if self.WF_CATEGORY_MANAGER is not None:
                     # Load the WB_TYPE_TXN_CATEGORIES for all FI's.
                     wfm : BDMTXNCategoryManager = self.WF_CATEGORY_MANAGER
-                    for fi_key in self.model.bdm_fi_collection.keys():
-                        wfm.FI_TXN_CATEGORIES_WORKBOOK_load(fi_key)
+                    # Skip the FI's current, restored by a warm start.
+                    fi_keys = [fi_key for fi_key in self.model.bdm_fi_collection
+                               if not wfm.FI_CATALOG_restored_take(fi_key)]
+                    wfm.FI_TXN_CATEGORIES_WORKBOOK_load_all(
+                        fi_keys, self.model.bdm_concurrent_initialize)
             except Exception as e:
                 m = f"{p3u.exc_err_msg(e)}"
                 logger.error(m)
@@ -248,6 +258,20 @@ class BDMDataContext(BudManAppDataContext, Model_Binding):
             logger.error(p3u.exc_err_msg(e))
             raise
     
+    def _dc_LOADED_WORKBOOK_reload(self, wb_id: str, bdm_wb: BDMWorkbook) -> WORKBOOK_CONTENT_TYPE:
+        """Model-Aware: Reload evicted dc_LOADED_WORKBOOKS content from storage."""
+        if not isinstance(bdm_wb, BDMWorkbook):
+            raise ValueError(f"Cannot reload WB_ID('{wb_id}'), no BDMWorkbook.")
+        return bsm.bsm_BDMWorkbook_load(bdm_wb)
+
+    def _dc_LOADED_WORKBOOK_flush(self, wb_id: str, wb_content: WORKBOOK_CONTENT_TYPE,
+                                  bdm_wb: BDMWorkbook) -> None:
+        """Model-Aware: Save dirty dc_LOADED_WORKBOOKS content before eviction."""
+        if not isinstance(bdm_wb, BDMWorkbook):
+            raise ValueError(f"Cannot save WB_ID('{wb_id}'), no BDMWorkbook.")
+        bdm_wb.wb_content = wb_content
+        bsm.bsm_BDMWorkbook_save(bdm_wb)
+
     def not_dc_INITIALIZED(self) -> bool:
         """Model-Aware: Unforgiving check if the BDMDataContext is not initialized."""
         if not self.dc_INITIALIZED:
@@ -277,14 +301,56 @@ class BDMDataContext(BudManAppDataContext, Model_Binding):
             m = f"Invalid workbook object: {wb!r}"
             logger.error(m)
             return False
-        model_wdc: WORKBOOK_DATA_COLLECTION_TYPE = self.model.bdm_FI_WORKBOOK_DATA_COLLECTION(wb.fi_key)
-        if model_wdc is not None:
-            # Add to the model
-            model_wdc[wb.wb_id] = wb
-            # Add to the DC
-            super().dc_WORKBOOK_DATA_COLLECTION_add(wb)
-            return True
-        return False
+        # Add to the model, which maintains the WorkbookIndex.
+        self.model.bdm_WORKBOOK_add(wb)
+        # Add to the DC
+        super().dc_WORKBOOK_DATA_COLLECTION_add(wb)
+        return True
+
+    def dc_WORKBOOK_index(self, wb_id: str) -> int:
+        """Model-Aware: Return the wb_index of wb_id in the current FI, from 
+        the model WorkbookIndex, or -1 if not found."""
+        self.not_dc_INITIALIZED()
+        if not self.dc_VALID or self.dc_FI_KEY is None:
+            return -1
+        if wb_id is None or not isinstance(wb_id, str) or len(wb_id) == 0:
+            logger.error(f" TypeError(wb_id must be a string, got {type(wb_id)})")
+            return -1
+        return self.model.bdm_FI_WORKBOOK_index(self.dc_FI_KEY, wb_id)
+
+    def dc_WORKBOOK_by_index(self, wb_index: int) -> Optional[WORKBOOK_OBJECT_TYPE]:
+        """Model-Aware: Return the workbook at wb_index in the current FI, 
+        from the model WorkbookIndex, or None."""
+        try:
+            if not self.dc_WB_INDEX_validate(wb_index):
+                return None
+            wb_id = self.model.bdm_WORKBOOK_INDEX.wb_id_at(self.dc_FI_KEY, wb_index)
+            return self.dc_WORKBOOK_DATA_COLLECTION[wb_id] if wb_id is not None else None
+        except Exception as e:
+            m = p3u.exc_err_msg(e)
+            logger.error(m)
+            raise ValueError(f"Error retrieving workbook by index '{wb_index}': {e}")
+
+    def dc_WORKBOOK_find(self, find_key: str, value: str) -> WORKBOOK_OBJECT_TYPE:
+        """Model-Aware: Locate a workbook in the current FI by key and value,
+        using the model WorkbookIndex for indexed keys."""
+        try:
+            if not self.dc_VALID:
+                logger.error("Data context is not valid.")
+                return None
+            if find_key == WB_INDEX:
+                return self.dc_WORKBOOK_by_index(value)
+            if find_key not in WorkbookIndex.INDEX_KEYS:
+                return super().dc_WORKBOOK_find(find_key, value)
+            wb = self.model.bdm_FI_WORKBOOK_DATA_COLLECTION_find(
+                self.dc_FI_KEY, find_key, value, ignore_case=False)
+            if wb is None:
+                logger.warning(f"No workbook found with {find_key} = {value}.")
+            return wb
+        except Exception as e:
+            m = p3u.exc_err_msg(e)
+            logger.error(m)
+            raise ValueError(f"Error finding workbook by {find_key} = {value}: {e}")
 
     def dc_WORKBOOK_validate(self, bdm_wb : WORKBOOK_OBJECT_TYPE) -> bool:
         """Model-Aware: Validate the type of WORKBOOK_OBJECT.
@@ -337,8 +403,9 @@ class BDMDataContext(BudManAppDataContext, Model_Binding):
             wb_content = None
             wb.wb_loaded = wb.wb_id in self.dc_LOADED_WORKBOOKS
             if not load:
-                # Retrieve the workbook content from dc_LOADED_WORKBOOKS.
-                wb_content = self.dc_LOADED_WORKBOOKS[wb.wb_id]
+                # Retrieve the workbook content from dc_LOADED_WORKBOOKS,
+                # evicted content is reloaded.
+                wb_content = self.dc_LOADED_WORKBOOKS.get(wb.wb_id)
                 if wb_content is None:
                     m = f"Workbook content for '{wb.wb_id}' is not loaded."
                     logger.error(m)
@@ -397,8 +464,10 @@ class BDMDataContext(BudManAppDataContext, Model_Binding):
             logger.error(m)
             return False, m
 
-    def dc_WORKBOOK_load(self, bdm_wb : BDMWorkbook) -> BUDMAN_RESULT_TYPE:
-        """Model-aware: Load the workbook bdm_wb with BSM service."""
+    def dc_WORKBOOK_load(self, bdm_wb : BDMWorkbook,
+                         select: bool = True) -> BUDMAN_RESULT_TYPE:
+        """Model-aware: Load the workbook bdm_wb with BSM service, if select
+        make it the dc_WORKBOOK."""
         self.not_dc_INITIALIZED()
         try:
             # Model-Aware World
@@ -411,8 +480,9 @@ class BDMDataContext(BudManAppDataContext, Model_Binding):
             # Model-aware: Load the bdm_wb WORKBOOK_CONTENT object with the BSM.
             bsm.bsm_BDMWorkbook_load(bdm_wb)
             # Add/update to the loaded workbooks collection.
-            self.dc_LOADED_WORKBOOKS[bdm_wb.wb_id] = bdm_wb.wb_content
-            self.dc_WORKBOOK = bdm_wb  # Update workbook-related DC info.
+            self.dc_LOADED_WORKBOOKS.put(bdm_wb.wb_id, bdm_wb.wb_content, owner=bdm_wb)
+            if select:
+                self.dc_WORKBOOK = bdm_wb  # Update workbook-related DC info.
             logger.info(f"Loaded workbook '{bdm_wb.wb_id}' "
                         f"from url '{bdm_wb.wb_url}'.")
             return True, bdm_wb.wb_content
@@ -441,8 +511,8 @@ class BDMDataContext(BudManAppDataContext, Model_Binding):
                 return False, m
             # Save the workbook content using the BSM.
             bsm.bsm_BDMWorkbook_save(bdm_wb)
-            # Update the dc_LOADED_WORKBOOKS with the saved content.
-            self.dc_LOADED_WORKBOOKS[bdm_wb.wb_id] = bdm_wb.wb_content
+            # Update the dc_LOADED_WORKBOOKS with the saved, clean content.
+            self.dc_LOADED_WORKBOOKS.put(bdm_wb.wb_id, bdm_wb.wb_content, owner=bdm_wb)
             bdm_wb.wb_loaded = True
             return True, f"Workbook '{bdm_wb.wb_id}' saved successfully."
         except Exception as e:
@@ -59,12 +59,11 @@
 #region imports
 # python standard libraries
 from ast import Not
-import pytest, os
+import os
 from pathlib import Path
 from abc import ABC, abstractmethod
 from typing import Tuple, Any, Union, Dict, Optional
 # third-party modules and packages
-from openpyxl import Workbook
 from treelib import Tree, Node
 import logging, p3_utils as p3u, p3logging as p3l
 # local modules and packages
@@ -72,6 +71,7 @@ from budman_namespace.design_language_namespace import (
     FI_OBJECT_TYPE, DATA_CONTEXT_TYPE, LOADED_WORKBOOK_COLLECTION_TYPE, 
     WORKBOOK_DATA_COLLECTION_TYPE, WORKBOOK_OBJECT_TYPE,
     BDM_STORE_TYPE, DATA_COLLECTION_TYPE, BUDMAN_RESULT_TYPE, WORKBOOK_CONTENT_TYPE,
+    EXCEL_TXNS_WORKBOOK_TYPE,
     BDM_FI_COLLECTION, BDM_WF_COLLECTION, 
     FI_WORKBOOK_DATA_COLLECTION, FI_FOLDER,
     VALID_WF_PURPOSE_VALUES, VALID_WB_TYPE_VALUES,
@@ -84,6 +84,7 @@ from budman_namespace.design_language_namespace import (
 from budman_namespace.bdm_workbook_class import BDMWorkbook
 import budget_storage_model as bsm
 from budman_data_context.budman_app_data_context_base_ABC import BudManAppDataContext_Base
+from budman_data_context.loaded_workbook_collection import LoadedWorkbookCollection
 #endregion imports
 # ---------------------------------------------------------------------------- +
 #region Globals
@@ -112,7 +113,7 @@ class BudManAppDataContext(BudManAppDataContext_Base):
         self._dc_BDM_STORE_changed : bool = False
         self._dc_WORKBOOK : Optional[WORKBOOK_OBJECT_TYPE] = None
         self._dc_WORKBOOK_DATA_COLLECTION : WORKBOOK_DATA_COLLECTION_TYPE = dict()
-        self._dc_LOADED_WORKBOOKS : LOADED_WORKBOOK_COLLECTION_TYPE = dict()
+        self._dc_LOADED_WORKBOOKS : LOADED_WORKBOOK_COLLECTION_TYPE = LoadedWorkbookCollection()
         self._dc_DataContext : DATA_CONTEXT_TYPE = dict()
         self._dc_WORKBOOK_TREE : Optional[Tree] = None
     #endregion BudManAppDataContext__init__()
@@ -368,6 +369,12 @@ class BudManAppDataContext(BudManAppDataContext_Base):
     def dc_LOADED_WORKBOOKS(self, value: LOADED_WORKBOOK_COLLECTION_TYPE) -> None:
         """DC-Only: Set the list of workbooks currently loaded in the DC.
         Loaded means a file is loaded into memory and is available."""
+        if not isinstance(value, LoadedWorkbookCollection):
+            loaded = LoadedWorkbookCollection(
+                max_count=self._dc_LOADED_WORKBOOKS.max_count,
+                max_bytes=self._dc_LOADED_WORKBOOKS.max_bytes)
+            loaded.update(value or {})
+            value = loaded
         self._dc_LOADED_WORKBOOKS = value
 
     @property
@@ -663,21 +670,23 @@ class BudManAppDataContext(BudManAppDataContext_Base):
             if wb is None :
                 logger.error("dc_WORKBOOK_CONTENT_TYPE_get requires a valid WORKBOOK_OBJECT_TYPE.")
                 return None
-            self.dc_LOADED_WORKBOOKS[wb.wb_id] = wb_content
+            # Not saved to storage, so it is dirty.
+            self.dc_LOADED_WORKBOOKS.put(wb.wb_id, wb_content, owner=wb, dirty=True)
             return True, None 
         except Exception as e:
             m = p3u.exc_err_msg(e)
             logger.error(m)
             return False, m
         
-    def dc_WORKBOOK_load(self, bdm_wb: WORKBOOK_OBJECT_TYPE) -> BUDMAN_RESULT_TYPE:
+    def dc_WORKBOOK_load(self, bdm_wb: WORKBOOK_OBJECT_TYPE,
+                         select: bool = True) -> BUDMAN_RESULT_TYPE:
         """ DC-Only: Load bdm_wb WORKBOOK_CONTENT_TYPE. As DC-ONLY, there is no
             direct dependency on Model. The application must set the wb_content
             attribute outside, and set bdm_wb.wb_loaded.
 
             Abstract: Load bdm_wb WORKBOOK_CONTENT_TYPE from storage, set value 
-            or bdm_wb.wb_content, and set bdm_wb.wb_loaded. Make this bdm_wb
-            the dc_WORKBOOK, so that the application can use it.
+            or bdm_wb.wb_content, and set bdm_wb.wb_loaded. If select, make
+            this bdm_wb the dc_WORKBOOK, so that the application can use it.
 
             Returns:
                 BUDMAN_RESULT_TYPE: a Tuple[success: bool, result: Any].
@@ -702,15 +711,16 @@ class BudManAppDataContext(BudManAppDataContext_Base):
             if not wb_loaded:
                 return False, f"BDM_WORKBOOK with id '{wb_id}' is not loaded."
             # Add settings in DC for the workbook.
-            self.dc_WORKBOOK = bdm_wb
-            self.dc_LOADED_WORKBOOKS[wb_id] = wb_content
+            if select:
+                self.dc_WORKBOOK = bdm_wb
+            self.dc_LOADED_WORKBOOKS.put(wb_id, wb_content, owner=bdm_wb)
             return True, wb_content
         except Exception as e:
             m = p3u.exc_err_msg(e)
             logger.error(m)
             return False, m
 
-    def dc_WORKBOOK_save(self, bdm_wb: Workbook) -> BUDMAN_RESULT_TYPE:
+    def dc_WORKBOOK_save(self, bdm_wb: EXCEL_TXNS_WORKBOOK_TYPE) -> BUDMAN_RESULT_TYPE:
         """ DC-Only: Save bdm_wb WORKBOOK_CONTENT_TYPE to storage.
             Abstract: Save bdm_wb WORKBOOK_CONTENT_TYPE to storage.
         """
@@ -732,7 +742,7 @@ class BudManAppDataContext(BudManAppDataContext_Base):
             return False, m
         return None
 
-    def dc_WORKBOOK_close(self, bdm_wb: Workbook) -> BUDMAN_RESULT_TYPE:
+    def dc_WORKBOOK_close(self, bdm_wb: EXCEL_TXNS_WORKBOOK_TYPE) -> BUDMAN_RESULT_TYPE:
         """ DC-Only: Close bdm_wb by clearing the wb_content property.
             Abstract: Close bdm_wb WORKBOOK_CONTENT_TYPE.
         """
@@ -781,7 +791,7 @@ class BudManAppDataContext(BudManAppDataContext_Base):
             raise
         return None
 
-    def dc_WORKBOOK_add(self, wb_name: str, wb: Union[Workbook, Dict]) -> None:
+    def dc_WORKBOOK_add(self, wb_name: str, wb: Union[EXCEL_TXNS_WORKBOOK_TYPE, Dict]) -> None:
         """DC-Only: Add a new workbook to the data context."""
         # TODO: Not used yet, Handle duplicates by wb_name, need wb_id for uniqueness
         self.dc_WORKBOOK_DATA_COLLECTION[wb_name] = wb
@@ -37,7 +37,6 @@
 from abc import ABC, abstractmethod
 from typing import Tuple, Any, Union, Dict, Optional
 # third-party modules and packages
-from openpyxl import Workbook
 from treelib import Tree, Node
 # local modules and packages
 from p3_mvvm import DataContext_Base
@@ -45,7 +44,7 @@ from budman_namespace.design_language_namespace import (
     DATA_CONTEXT_TYPE, FI_OBJECT_TYPE, LOADED_WORKBOOK_COLLECTION_TYPE,
     WORKBOOK_DATA_COLLECTION_TYPE,
     BDM_STORE_TYPE, DATA_COLLECTION_TYPE, WORKBOOK_OBJECT_TYPE, BUDMAN_RESULT_TYPE,
-    WORKBOOK_CONTENT_TYPE)
+    WORKBOOK_CONTENT_TYPE, EXCEL_TXNS_WORKBOOK_TYPE)
 #endregion Imports
 # ---------------------------------------------------------------------------- +
 class BudManAppDataContext_Base(DataContext_Base):
@@ -388,10 +387,11 @@ class BudManAppDataContext_Base(DataContext_Base):
         pass
 
     @abstractmethod
-    def dc_WORKBOOK_load(self, bdm_wb: WORKBOOK_OBJECT_TYPE) -> BUDMAN_RESULT_TYPE:
+    def dc_WORKBOOK_load(self, bdm_wb: WORKBOOK_OBJECT_TYPE,
+                         select: bool = True) -> BUDMAN_RESULT_TYPE:
         """ Abstract: Load bdm_wb WORKBOOK_CONTENT_TYPE from storage, set value 
-            or bdm_wb.wb_content, and set bdm_wb.wb_loaded. Make this bdm_wb
-            the dc_WORKBOOK, so that the application can use it.
+            or bdm_wb.wb_content, and set bdm_wb.wb_loaded. If select, make
+            this bdm_wb the dc_WORKBOOK, so that the application can use it.
 
             Returns:
                 BUDMAN_RESULT_TYPE: a Tuple[success: bool, result: Any].
@@ -418,7 +418,7 @@ class BudManAppDataContext_Base(DataContext_Base):
         pass
 
     @abstractmethod
-    def dc_WORKBOOK_add(self, wb_name: str, wb: Union[Workbook, Dict]) -> None:
+    def dc_WORKBOOK_add(self, wb_name: str, wb: Union[EXCEL_TXNS_WORKBOOK_TYPE, Dict]) -> None:
         """Add a new workbook to the data context."""
         pass
 
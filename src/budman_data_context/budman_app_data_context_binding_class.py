@@ -44,7 +44,6 @@
 from abc import ABC, abstractmethod
 from typing import Tuple, Union, Dict, Optional
 # third-party modules and packages
-from openpyxl import Workbook
 from treelib import Tree, Node
 import p3_utils as p3u, p3_mvvm as p3m
 
@@ -52,7 +51,7 @@ import p3_utils as p3u, p3_mvvm as p3m
 from budman_namespace.design_language_namespace import (
     DATA_COLLECTION_TYPE, LOADED_WORKBOOK_COLLECTION_TYPE,
     WORKBOOK_DATA_COLLECTION_TYPE, WORKBOOK_OBJECT_TYPE, BUDMAN_RESULT_TYPE, 
-    WORKBOOK_CONTENT_TYPE, FI_OBJECT_TYPE
+    WORKBOOK_CONTENT_TYPE, FI_OBJECT_TYPE, EXCEL_TXNS_WORKBOOK_TYPE
     )
 from budman_data_context import BudManAppDataContext_Base
 #endregion Imports
@@ -337,7 +336,7 @@ class BudManAppDataContext_Binding(BudManAppDataContext_Base, p3m.DataContext_Bi
         """
         return self.DC.dc_WORKBOOK_validate(wb)
     
-    def dc_WORKBOOK_loaded(self, wb_id: str) -> Workbook:
+    def dc_WORKBOOK_loaded(self, wb_id: str) -> EXCEL_TXNS_WORKBOOK_TYPE:
         """Indicates whether the workbook with wb_id is loaded."""
         return self.DC.dc_WORKBOOK_loaded(wb_id)
     
@@ -397,7 +396,7 @@ class BudManAppDataContext_Binding(BudManAppDataContext_Base, p3m.DataContext_Bi
         """
         return self.DC.dc_WORKBOOK_content_put(wb_content, wb)
 
-    def dc_WORKBOOK_load(self, wb_index: str) -> BUDMAN_RESULT_TYPE:
+    def dc_WORKBOOK_load(self, wb_index: str, select: bool = True) -> BUDMAN_RESULT_TYPE:
         """DC_Binding: Load the specified workbook by wb_index into dc_LOADED_WORKBOOKS.
            Returns:
                 BUDMAN_RESULT_TYPE: a Tuple[success: bool, result: Any].
@@ -406,15 +405,15 @@ class BudManAppDataContext_Binding(BudManAppDataContext_Base, p3m.DataContext_Bi
                 dc_LOADED_WORKBOOKS collection.
                 success = False, result is a string describing the error.
         """
-        return self.DC.dc_WORKBOOK_load(wb_index)
+        return self.DC.dc_WORKBOOK_load(wb_index, select)
 
-    def dc_WORKBOOK_save(self, wb: Workbook) -> BUDMAN_RESULT_TYPE:
+    def dc_WORKBOOK_save(self, wb: EXCEL_TXNS_WORKBOOK_TYPE) -> BUDMAN_RESULT_TYPE:
         """DC_Binding: Save bdm_wb WORKBOOK_CONTENT_TYPE to storage.
             Abstract: Save bdm_wb WORKBOOK_CONTENT_TYPE to storage.
         """
         return self.DC.dc_WORKBOOK_save(wb)
 
-    def dc_WORKBOOK_close(self, wb: Workbook) -> BUDMAN_RESULT_TYPE:
+    def dc_WORKBOOK_close(self, wb: EXCEL_TXNS_WORKBOOK_TYPE) -> BUDMAN_RESULT_TYPE:
         """DC_Binding: Close bdm_wb WORKBOOK_CONTENT_TYPE."""
         return self.DC.dc_WORKBOOK_close(wb)
     #endregion WORKBOOK_CONTENT_TYPE storage-related methods
@@ -423,7 +422,7 @@ class BudManAppDataContext_Binding(BudManAppDataContext_Base, p3m.DataContext_Bi
         """DC_Binding: Remove the specified workbook by name."""
         return self.DC.dc_WORKBOOK_remove(wb_name)
 
-    def dc_WORKBOOK_add(self, wb_name: str, wb: Union[Workbook,Dict]) -> None:
+    def dc_WORKBOOK_add(self, wb_name: str, wb: Union[EXCEL_TXNS_WORKBOOK_TYPE,Dict]) -> None:
         """DC_Binding: Add a new workbook to the data context."""
         return self.DC.dc_WORKBOOK_add(wb_name, wb)
 
@@ -0,0 +1,336 @@
+# ---------------------------------------------------------------------------- +
+#region loaded_workbook_collection.py module
+""" loaded_workbook_collection.py implements LoadedWorkbookCollection.
+
+    The dc_LOADED_WORKBOOKS collection is a dict of wb_id: WORKBOOK_CONTENT.
+    LoadedWorkbookCollection keeps it within a memory budget, a maximum
+    count of loaded workbooks and a maximum estimated size in bytes. When a
+    put exceeds the budget, the least recently used content is evicted.
+
+    Content is only evicted if it can be reloaded, which requires a loader.
+    Dirty content, put but not saved to storage, is flushed first, or is
+    not evicted if there is no flush function or the flush fails. The owner
+    of evicted content, its BDMWorkbook, drops it with wb_content_evict(), so
+    the next read of owner.wb_content reloads it. An owner without 
+    wb_content_evict() has wb_content set to None and wb_loaded set to False.
+    Reading an evicted wb_id with [] or get() reloads the content with the
+    loader. Membership and len() count only content currently in memory.
+
+    Code changing loaded content marks it dirty with mark_dirty(), until it
+    is saved and put again.
+
+    Reads are counted as cache hits, content in memory, or misses, evicted
+    content reloaded or a wb_id not loaded, in hit_count and miss_count and
+    in the cp_metrics counters.
+"""
+#endregion loaded_workbook_collection.py module
+# ---------------------------------------------------------------------------- +
+#region Imports
+# python standard library modules and packages
+import logging, sys, threading
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+# third-party modules and packages
+import p3_utils as p3u
+from p3_mvvm import cp_metrics
+# local modules and packages
+from budman_namespace.design_language_namespace import (
+    BDM_METRIC_WB_CACHE_HITS, BDM_METRIC_WB_CACHE_MISSES)
+#endregion Imports
+# ---------------------------------------------------------------------------- +
+#region Globals and Constants
+logger = logging.getLogger(__name__)
+_MISSING = object()
+LOADED_WORKBOOKS_MAX_COUNT = 16
+LOADED_WORKBOOKS_MAX_BYTES = 256 * 1024 * 1024
+# Estimated memory per openpyxl cell, with its value and style references.
+LOADED_WORKBOOK_CELL_BYTES = 200
+#endregion Globals and Constants
+# ---------------------------------------------------------------------------- +
+#region wb_content_size() function
+def wb_content_size(wb_content: Any) -> int:
+    """Return the estimated memory size in bytes of wb_content."""
+    if wb_content is None:
+        return 0
+    worksheets = getattr(wb_content, "worksheets", None)
+    if worksheets is not None:
+        # An openpyxl Workbook, estimated by cell count.
+        cells = sum(ws.max_row * ws.max_column for ws in worksheets)
+        return cells * LOADED_WORKBOOK_CELL_BYTES
+    size = 0
+    stack = [wb_content]
+    while stack:
+        obj = stack.pop()
+        size += sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple)):
+            stack.extend(obj)
+    return size
+#endregion wb_content_size() function
+# ---------------------------------------------------------------------------- +
+@dataclass(slots=True)
+class LoadedWorkbookEntry:
+    """Residency information for one wb_id in a LoadedWorkbookCollection."""
+    owner: Any = None
+    size: int = 0
+    dirty: bool = False
+# ---------------------------------------------------------------------------- +
+class LoadedWorkbookCollection(dict):
+    """A LOADED_WORKBOOK_COLLECTION with an LRU memory budget.
+
+    The dict order is the LRU order, least recently used first. Use put()
+    to record the owner of content and whether it is dirty, [] assignment
+    puts clean content with no owner.
+    """
+    def __init__(self, *args, max_count: int = LOADED_WORKBOOKS_MAX_COUNT,
+                 max_bytes: int = LOADED_WORKBOOKS_MAX_BYTES, **kwargs) -> None:
+        """Create the collection, a max_count or max_bytes of 0 is unlimited."""
+        super().__init__()
+        self._lock: threading.RLock = threading.RLock()
+        self._entries: Dict[str, LoadedWorkbookEntry] = {}
+        # wb_id: owner of evicted content, to reload on access.
+        self._evicted: Dict[str, Any] = {}
+        self._bytes: int = 0
+        self.max_count: int = max_count
+        self.max_bytes: int = max_bytes
+        self.loader: Optional[Callable[[str, Any], Any]] = None
+        self.flush: Optional[Callable[[str, Any, Any], None]] = None
+        self.on_evict: Optional[Callable[[str, Any, Any], None]] = None
+        self.size_of: Callable[[Any], int] = wb_content_size
+        self.eviction_count: int = 0
+        self.reload_count: int = 0
+        self.hit_count: int = 0
+        self.miss_count: int = 0
+        for wb_id, wb_content in dict(*args, **kwargs).items():
+            self.put(wb_id, wb_content)
+
+    def configure(self, max_count: Optional[int] = None,
+                  max_bytes: Optional[int] = None,
+                  loader: Optional[Callable[[str, Any], Any]] = None,
+                  flush: Optional[Callable[[str, Any, Any], None]] = None,
+                  on_evict: Optional[Callable[[str, Any, Any], None]] = None) -> None:
+        """Set the budget and the functions used to evict and reload content.
+
+        Args:
+            max_count (int): Maximum count of loaded workbooks, 0 unlimited.
+            max_bytes (int): Maximum estimated bytes loaded, 0 unlimited.
+            loader (Callable): loader(wb_id, owner) returns reloaded content.
+            flush (Callable): flush(wb_id, wb_content, owner) saves dirty
+                content to storage, raising an exception on failure.
+            on_evict (Callable): on_evict(wb_id, wb_content, owner) is called
+                after content is evicted, instead of the default owner update.
+        """
+        with self._lock:
+            if max_count is not None:
+                self.max_count = max_count
+            if max_bytes is not None:
+                self.max_bytes = max_bytes
+            self.loader = loader or self.loader
+            self.flush = flush or self.flush
+            self.on_evict = on_evict or self.on_evict
+            self._enforce_budget()
+
+    # ------------------------------------------------------------------------ +
+    #region    Residency methods
+    def put(self, wb_id: str, wb_content: Any, owner: Any = None,
+            dirty: bool = False) -> None:
+        """Put wb_content for wb_id as most recently used, then evict LRU
+        content beyond the budget."""
+        with self._lock:
+            self._discard(wb_id)
+            size = self.size_of(wb_content)
+            dict.__setitem__(self, wb_id, wb_content)
+            self._entries[wb_id] = LoadedWorkbookEntry(owner, size, dirty)
+            self._bytes += size
+            self._enforce_budget(keep=wb_id)
+
+    def mark_dirty(self, wb_id: str, dirty: bool = True) -> None:
+        """Mark the content of wb_id as changed, and not saved, or clean."""
+        with self._lock:
+            if wb_id in self._entries:
+                self._entries[wb_id].dirty = dirty
+
+    def is_dirty(self, wb_id: str) -> bool:
+        """True if the content of wb_id is marked dirty."""
+        entry = self._entries.get(wb_id)
+        return entry is not None and entry.dirty
+
+    def is_evicted(self, wb_id: str) -> bool:
+        """True if the content of wb_id was evicted, to reload on access."""
+        return wb_id in self._evicted
+
+    def residency(self) -> Dict[str, int]:
+        """Return the current residency counts and budget."""
+        with self._lock:
+            return {
+                "loaded": sum(1 for v in dict.values(self) if v is not None),
+                "bytes": self._bytes,
+                "dirty": sum(1 for e in self._entries.values() if e.dirty),
+                "evicted": len(self._evicted),
+                "max_count": self.max_count,
+                "max_bytes": self.max_bytes,
+                "evictions": self.eviction_count,
+                "reloads": self.reload_count,
+                "hits": self.hit_count,
+                "misses": self.miss_count,
+            }
+
+    def residency_str(self) -> str:
+        """Return the residency as a display string."""
+        r = self.residency()
+        max_count = f"{r['max_count']}" if r['max_count'] else "-"
+        max_bytes = f"{r['max_bytes']:,}" if r['max_bytes'] else "-"
+        return (f"loaded: {r['loaded']}/{max_count}  "
+                f"bytes: {r['bytes']:,}/{max_bytes}  "
+                f"dirty: {r['dirty']}  evicted: {r['evicted']}  "
+                f"evictions: {r['evictions']}  reloads: {r['reloads']}  "
+                f"hits: {r['hits']}  misses: {r['misses']}")
+
+    def _discard(self, wb_id: str) -> None:
+        """Forget wb_id residency, the dict entry is handled by the caller."""
+        entry = self._entries.pop(wb_id, None)
+        if entry is not None:
+            self._bytes -= entry.size
+        self._evicted.pop(wb_id, None)
+        if dict.__contains__(self, wb_id):
+            # Remove, so the put moves wb_id to the MRU end.
+            dict.__delitem__(self, wb_id)
+
+    def _over_budget(self, count: int) -> bool:
+        return ((self.max_count > 0 and count > self.max_count) or
+                (self.max_bytes > 0 and self._bytes > self.max_bytes))
+
+    def _enforce_budget(self, keep: Optional[str] = None) -> None:
+        """Evict LRU content, except keep, until within the budget."""
+        if self.loader is None:
+            return  # Evicted content could not be reloaded.
+        count = sum(1 for v in dict.values(self) if v is not None)
+        if not self._over_budget(count):
+            return
+        for wb_id in list(dict.keys(self)):
+            if not self._over_budget(count):
+                break
+            wb_content = dict.__getitem__(self, wb_id)
+            if wb_id == keep or wb_content is None:
+                continue
+            if self._evict(wb_id, wb_content):
+                count -= 1
+        if self._over_budget(count):
+            logger.warning(f"Loaded workbooks over budget, "
+                           f"{self.residency_str()}")
+
+    def _evict(self, wb_id: str, wb_content: Any) -> bool:
+        """Evict wb_id, flushing dirty content first. False if not evicted."""
+        entry = self._entries[wb_id]
+        if entry.dirty:
+            if self.flush is None:
+                return False
+            try:
+                self.flush(wb_id, wb_content, entry.owner)
+            except Exception as e:
+                logger.warning(f"Not evicting WB_ID('{wb_id}'), flush failed: "
+                               f"{p3u.exc_err_msg(e)}")
+                return False
+        self._discard(wb_id)
+        self._evicted[wb_id] = entry.owner
+        self.eviction_count += 1
+        if self.on_evict is not None:
+            self.on_evict(wb_id, wb_content, entry.owner)
+        elif getattr(entry.owner, "wb_content", None) is wb_content:
+            evict = getattr(entry.owner, "wb_content_evict", None)
+            if evict is not None:
+                evict(lambda owner: self.get(wb_id))
+            else:
+                entry.owner.wb_content = None
+                entry.owner.wb_loaded = False
+        logger.debug(f"Evicted WB_ID('{wb_id}'), {entry.size:,} bytes.")
+        return True
+
+    def _count_read(self, hit: bool) -> None:
+        """Count a read as a cache hit or miss."""
+        if hit:
+            self.hit_count += 1
+            cp_metrics.counter(BDM_METRIC_WB_CACHE_HITS).inc()
+        else:
+            self.miss_count += 1
+            cp_metrics.counter(BDM_METRIC_WB_CACHE_MISSES).inc()
+
+    def _reload(self, wb_id: str) -> Any:
+        """Reload evicted content for wb_id with the loader."""
+        with self._lock:
+            owner = self._evicted[wb_id]
+            wb_content = self.loader(wb_id, owner)
+            self.reload_count += 1
+            logger.debug(f"Reloaded evicted WB_ID('{wb_id}').")
+            self.put(wb_id, wb_content, owner)
+            return wb_content
+    #endregion Residency methods
+    # ------------------------------------------------------------------------ +
+    #region    dict methods
+    def __getitem__(self, wb_id: str) -> Any:
+        with self._lock:
+            if wb_id in self._evicted:
+                self._count_read(hit=False)
+                return self._reload(wb_id)
+            if not dict.__contains__(self, wb_id):
+                self._count_read(hit=False)
+                raise KeyError(wb_id)
+            self._count_read(hit=True)
+            wb_content = dict.__getitem__(self, wb_id)
+            # Move to the MRU end.
+            dict.__delitem__(self, wb_id)
+            dict.__setitem__(self, wb_id, wb_content)
+            return wb_content
+
+    def get(self, wb_id: str, default: Any = None) -> Any:
+        if wb_id in self or wb_id in self._evicted:
+            return self[wb_id]
+        self._count_read(hit=False)
+        return default
+
+    def __setitem__(self, wb_id: str, wb_content: Any) -> None:
+        self.put(wb_id, wb_content)
+
+    def __delitem__(self, wb_id: str) -> None:
+        with self._lock:
+            if not dict.__contains__(self, wb_id) and wb_id not in self._evicted:
+                raise KeyError(wb_id)
+            self._discard(wb_id)
+
+    def pop(self, wb_id: str, default: Any = _MISSING) -> Any:
+        with self._lock:
+            if dict.__contains__(self, wb_id):
+                wb_content = dict.__getitem__(self, wb_id)
+                self._discard(wb_id)
+                return wb_content
+            self._evicted.pop(wb_id, None)
+            if default is _MISSING:
+                raise KeyError(wb_id)
+            return default
+
+    def popitem(self) -> tuple:
+        with self._lock:
+            wb_id, wb_content = dict.popitem(self)
+            dict.__setitem__(self, wb_id, wb_content)
+            self._discard(wb_id)
+            return wb_id, wb_content
+
+    def clear(self) -> None:
+        with self._lock:
+            dict.clear(self)
+            self._entries.clear()
+            self._evicted.clear()
+            self._bytes = 0
+
+    def update(self, *args, **kwargs) -> None:
+        for wb_id, wb_content in dict(*args, **kwargs).items():
+            self.put(wb_id, wb_content)
+
+    def setdefault(self, wb_id: str, default: Any = None) -> Any:
+        if wb_id not in self and wb_id not in self._evicted:
+            self.put(wb_id, default)
+        return self[wb_id]
+    #endregion dict methods
+    # ------------------------------------------------------------------------ +
@@ -22,7 +22,7 @@ from budman_namespace import (FILE_TREE_NODE_TYPE_KEY, FILE_TREE_NODE_WF_KEY,
                                 P2, P4, P6)
 from budman_data_context import BudManAppDataContext_Binding
 import budman_command_services as cp
-from budget_domain_model import BDMWorkbookTreeNode
+from budget_domain_model import BDMWorkbookTreeNode, WBT_CHANGE_REMOVE, WBT_CHANGE_MOVE, WBT_CHANGE_ADD, WBT_CHANGE_UPDATE
 from budget_storage_model import BSMFile
 from .budman_gui_style_registry import StyleRegistry
 from .budman_gui_command_processor import BudManGUICommandProcessor
@@ -77,6 +77,7 @@ class BudManGUIFrame(ttk.Frame,
         self._budman_gui_cp_binding:BudManGUICommandProcessor = None
         self._file_tree: Optional[Tree] = None
         self._workbook_tree: Optional[Tree] = None
+        self._workbook_tree_version: int = -1  # workbook_tree version shown
         self._filepath_value = tk.StringVar(self,value="default")  # file path for the budget manager data file
         self._dc_FI_KEY = tk.StringVar(self,value="")  # DataContext FI_KEY
         self._dc_workflow = tk.StringVar(self,value="")  # DataContext workflow
@@ -315,7 +316,7 @@ class BudManGUIFrame(ttk.Frame,
             if self.dc_binding:
                 # Use the the data context
                 self.workbook_tree = self.dc_WORKBOOK_TREE
-                self.refresh_workbook_treeview()
+                self.update_workbook_treeview()
             return self
         except Exception as e:
             logger.exception(p3u.exc_err_msg(e))
@@ -921,12 +922,100 @@ class BudManGUIFrame(ttk.Frame,
             add_workbook_tree_nodes(self.workbook_tree, 
                            root_wbt_node_id, 
                            root_workbook_treeview_id)
+            self._workbook_tree_version = getattr(self.workbook_tree, "version", -1)
+            if hasattr(self.workbook_tree, "compact_changes"):
+                # The view shows the current version, drop the change log.
+                self.workbook_tree.compact_changes()
             logger.debug("BudManGUIFrame: File treeview refreshed.")
         except Exception as e:
             m: str = p3u.exc_err_msg(e)
             logger.exception(m)
             raise
 
+    def update_workbook_treeview(self) -> None:
+        """Apply the workbook_tree changes since the workbook_treeview was
+        last refreshed, or refresh it if the changes are not available."""
+        try:
+            if self.workbook_tree is None:
+                logger.debug("BudManGUIFrame: No workbook_tree to update.")
+                return
+            changes = None
+            if (self._workbook_tree_version >= 0 and 
+                hasattr(self.workbook_tree, "changes_since")):
+                changes = self.workbook_tree.changes_since(self._workbook_tree_version)
+            if changes is None:
+                self.refresh_workbook_treeview()
+                return
+            tv: ttk.Treeview = self.workbook_treeview
+            touched_parents: Dict[str, None] = {}
+            # A removal shifts the wb_index of all the workbooks after it in
+            # the FI, across all its WF_FOLDER nodes, renumber the whole FI.
+            touched_fis: Dict[str, None] = {}
+            for op, node_id in changes:
+                wbt_node: BDMWorkbookTreeNode = self.workbook_tree.get_node(node_id)
+                if op == WBT_CHANGE_REMOVE or wbt_node is None:
+                    if tv.exists(node_id):
+                        fi_item_id = self.workbook_treeview_fi_item(node_id)
+                        if fi_item_id != node_id:
+                            touched_fis[fi_item_id] = None
+                        tv.delete(node_id)
+                    continue
+                parent_id = self.workbook_tree.parent(node_id).identifier
+                if not tv.exists(parent_id):
+                    continue  # Added with its parent.
+                if op == WBT_CHANGE_UPDATE:
+                    if tv.exists(node_id):
+                        tv.item(node_id, text=wbt_node.tag)
+                    continue
+                if op == WBT_CHANGE_MOVE and tv.exists(node_id):
+                    touched_parents[tv.parent(node_id)] = None
+                    tv.move(node_id, parent_id, tk.END)
+                elif op == WBT_CHANGE_ADD and not tv.exists(node_id):
+                    tv.insert(parent_id, tk.END, iid=node_id, text=wbt_node.tag,
+                              tags=(BMG_WBTVOBJECT,),
+                              values=(wbt_node.node_type, " - "))
+                touched_parents[parent_id] = None
+            for fi_item_id in touched_fis:
+                if tv.exists(fi_item_id):
+                    touched_parents.update(dict.fromkeys(
+                        self.workbook_treeview_items(fi_item_id)))
+            # wb_index values shift as workbooks are added and removed.
+            for parent_id in touched_parents:
+                if not tv.exists(parent_id):
+                    continue
+                for item_id in tv.get_children(parent_id):
+                    wbt_node = self.workbook_tree.get_node(item_id)
+                    if wbt_node is None:
+                        continue
+                    wb_index:str = f"{wbt_node.wb_index:02}" if wbt_node.wb_index > -1 else " - "
+                    tv.item(item_id, values=(wbt_node.node_type, wb_index))
+            self._workbook_tree_version = self.workbook_tree.version
+            # The changes are applied, drop them from the change log.
+            self.workbook_tree.compact_changes()
+            logger.debug(f"BudManGUIFrame: Applied {len(changes)} workbook "
+                         f"tree change(s) to the workbook_treeview.")
+        except Exception as e:
+            m: str = p3u.exc_err_msg(e)
+            logger.exception(m)
+            raise
+
+    def workbook_treeview_fi_item(self, item_id: str) -> str:
+        """Return the FI item of item_id in the workbook_treeview, the top
+        item below the root item, item_id itself if it is one."""
+        tv: ttk.Treeview = self.workbook_treeview
+        parent_id = tv.parent(item_id)
+        while parent_id and tv.parent(parent_id):
+            item_id, parent_id = parent_id, tv.parent(parent_id)
+        return item_id
+
+    def workbook_treeview_items(self, item_id: str) -> List[str]:
+        """Return item_id and all the items below it in the workbook_treeview."""
+        tv: ttk.Treeview = self.workbook_treeview
+        items: List[str] = [item_id]
+        for child_id in tv.get_children(item_id):
+            items += self.workbook_treeview_items(child_id)
+        return items
+
     def refresh_file_treeview(self) -> None:
         """Refresh the file_treeview widget from the file_tree property."""
         try:
@@ -170,22 +170,27 @@ class BudManGUIMsg(metaclass=BDMSingletonMeta):
     #--------------------------------------------------------------------------+
     #region    BudManGuiMsg class methods
     def msg_handler(self) -> None:
-        """Dispatch messages from the message queue to the message widget."""
+        """Dispatch messages from the message queue to the message widget,
+        all messages queued since the last poll as one batch."""
         if self.root is None:
             logger.warning("Root window is not set. Cannot handle messages.")
             return
+        batch: List[Dict[str, Any]] = []
         try:
             while True:
                 msg_item = self._budman_msg_queue.get_nowait()
                 if msg_item is None:
                     break  # Exit signal, requires explicit .put(None) to stop
-                self.update_msg_widget(msg_item["msg"], 
-                                       msg_item["tag"],
-                                       msg_item["prefix"] if "prefix" in msg_item else True)
+                if isinstance(msg_item, list):
+                    batch.extend(msg_item)
+                else:
+                    batch.append(msg_item)
         except queue.Empty:
             pass  # No message, continue waiting
+        if batch:
+            self.update_msg_widget_batch(batch)
         # poll for msgs every 100 ms
-        self.root.after(100, self.msg_handler)
+        self._after_id = self.root.after(100, self.msg_handler)
     
     def msg_handler_cancel(self):
         """Cancel the message handler."""
@@ -200,30 +205,53 @@ class BudManGUIMsg(metaclass=BDMSingletonMeta):
             msg_item = {"msg": msg, "tag": tag, "prefix": prefix}
             self._budman_msg_queue.put(msg_item)
 
+    def output_batch(self, batch: List[p3m.CPUserOutputMessage], 
+                     prefix: bool = True) -> None:
+        """Output a batch of CP user messages to the message queue, as one
+        queue item."""
+        msg_items: List[Dict[str, Any]] = [
+            {"msg": m.message + "\n", "tag": m.tag.upper(), "prefix": prefix}
+            for m in batch
+            if isinstance(m.message, str) and len(m.message) > 0]
+        if msg_items:
+            self._budman_msg_queue.put(msg_items)
+
     def update_msg_widget(self, msg : str, tag: str = BMG_INFO, prefix: bool = True) -> None:
         """Append a message to the message widget."""
+        self.update_msg_widget_batch([{"msg": msg, "tag": tag, "prefix": prefix}])
+
+    def update_msg_widget_batch(self, batch: List[Dict[str, Any]]) -> None:
+        """Append a batch of message queue items to the message widget."""
         if (self._msg_widget and 
             isinstance(self._msg_widget, scrolledtext.ScrolledText)):
-            prefixed = self.prefix_msg_with_tag(msg, tag, prefix)
-            self.process_msg_output(prefixed, tag)
+            prefixed: str = ""
+            for msg_item in batch:
+                m = self.prefix_msg_with_tag(msg_item["msg"], msg_item["tag"],
+                                             msg_item.get("prefix", True))
+                # Each message starts on a new line.
+                prefixed += m if m.endswith("\n") else m + "\n"
+            self.process_msg_output(prefixed, batch[-1]["tag"])
         else:
             logger.warning("Message widget is not set. Cannot append message.")
 
     def process_msg_output(self, msg: str, tag: str) -> None:
-        """Process a message string for GUI output."""  
+        """Process a message string for GUI output, with one insert of all
+        the tagged text tokens and one scroll."""  
         msg_tokens: List[Dict[str, Any]] = self.reformat_console_markup(msg)
         if len(msg_tokens) == 0:
             return
-        for t in msg_tokens:
-            lastline: int = int(self._msg_widget.index(tk.END).split(".")[0])
-            # Process each token as needed for GUI output
-            ln : int = lastline + int(t["line_no"] ) - 1
-            i_start = f"{ln}.{t['offset']}"
-            i_end = f"{ln}.{t['offset'] + len(t['text'])}"
-            # indx: str = f"{ln}.end"
-            self._msg_widget.insert(i_start, t["text"],(t["tag"],))
-            # self._msg_widget.tag_add(t["tag"], i_start, i_end)
-            self._msg_widget.see(tk.END)  # Scroll to the end
+        # Text.insert(index, chars, tags, chars, tags, ...) 
+        insert_args: List[Any] = []
+        for i, t in enumerate(msg_tokens):
+            text: str = t["text"]
+            # The tokens end only the last line, end each line of the msg.
+            line_end = (i + 1 == len(msg_tokens) or
+                        msg_tokens[i + 1]["line_no"] != t["line_no"])
+            if line_end and not text.endswith("\n"):
+                text += "\n"
+            insert_args.extend((text, (t["tag"],)))
+        self._msg_widget.insert(tk.END, *insert_args)
+        self._msg_widget.see(tk.END)  # Scroll to the end
         return
 
     def reformat_console_markup(self, msg_in: str) -> List[Dict[str, Any]]:
@@ -274,6 +302,7 @@ class BudManGUIMsg(metaclass=BDMSingletonMeta):
                     }
                     msg_no_markup += new["text"]
                     found_tokens.append(new)
+                    line = ""  # All wrapped, not again below.
                     break
                 # Found a token
                 # If any text preceeds it, wrap in normal token
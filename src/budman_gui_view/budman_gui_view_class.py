@@ -46,6 +46,15 @@ def gui_view_cp_user_output(m: p3m.CPUserOutputMessage) -> None:
     except Exception as e:
         logger.error(p3u.exc_err_msg(e))        
 
+@p3m.cp_user_message_batch_callback
+def gui_view_cp_user_output_batch(batch: List[p3m.CPUserOutputMessage]) -> None:
+    """Output a batch of user messages from the Command Processor to the 
+    GUI View."""
+    try:
+        budman_msg.output_batch(batch)
+    except Exception as e:
+        logger.error(p3u.exc_err_msg(e))        
+
 @p3m.cp_cmd_result_message_callback
 def gui_cmd_result_output(cmd_result: p3m.CMD_RESULT_TYPE) -> None:
     """Output command results to the GUI View."""
@@ -107,8 +116,10 @@ class BudManGUIView(BudManAppDataContext_Binding,
                                     budman_gui_cp=self.budman_gui_command_processor,
                                     data_context=data_context)
         
-        # CP Message Service Bindings, leveraged for BudManGUIMsg user output
-        p3m.cp_msg_svc.subscribe_user_message(gui_view_cp_user_output)
+        # CP Message Service Bindings, leveraged for BudManGUIMsg user output.
+        # User messages are coalesced in batches, one widget update each.
+        p3m.cp_msg_svc.subscribe_user_message_batch(gui_view_cp_user_output_batch)
+        p3m.cp_msg_svc.batch_start()
         p3m.cp_msg_svc.subscribe_cmd_result_message(gui_cmd_result_output)
         p3m.cp_msg_svc.user_info_message(f"Initializing BudMan GUI View")
         p3m.cp_msg_svc.user_debug_message(f"BudManGUIView created")
@@ -217,6 +228,7 @@ class BudManGUIView(BudManAppDataContext_Binding,
     def run(self) -> p3m.CMD_RESULT_TYPE:
         """Run the BudManView application loop"""
         self.root.mainloop()
+        p3m.cp_msg_svc.batch_stop()
         cmd_result: p3m.CMD_RESULT_TYPE = p3m.cp_CMD_RESULT_create(
             status=True,
             type=p3m.CV_CMD_STRING_OUTPUT,
@@ -10,15 +10,29 @@ __license__ = "MIT"
 
 # Data Context abstract interface
 from .bdm_singleton_meta import BDMSingletonMeta
-from .bdm_workbook_class import BDMWorkbook
+from .bdm_lazy_import import (BDMLazyModule, bdm_lazy_import, bdm_module_loaded,
+                              BDM_STARTUP_IMPORT_BUDGET_SECONDS,
+                              BDM_LAZY_IMPORT_MODULES)
+from .bdm_workbook_class import (BDMWorkbook, bdm_workbook_change_mark,
+                                 bdm_workbook_last_change,
+                                 bdm_workbook_type_detect)
 from .design_language_namespace import *
 
 
 __all__ = [
     # Metaclass for Singleton Pattern
     "BDMSingletonMeta",
+    # Lazy imports of heavy modules
+    "BDMLazyModule",
+    "bdm_lazy_import",
+    "bdm_module_loaded",
+    "BDM_STARTUP_IMPORT_BUDGET_SECONDS",
+    "BDM_LAZY_IMPORT_MODULES",
     # BDM Workbook Class
     "BDMWorkbook",
+    "bdm_workbook_change_mark",
+    "bdm_workbook_last_change",
+    "bdm_workbook_type_detect",
     # Budget Domain Model Constants
     "BDM",
     # Type Alias Constants
@@ -64,6 +78,16 @@ __all__ = [
     "FILE_TREE_NODE_TYPE_KEY",
     "FILE_TREE_NODE_WF_KEY",
     "FILE_TREE_NODE_WF_PURPOSE",
+    # BudMan metric names
+    "BDM_METRIC_WB_LOAD_SECONDS",
+    "BDM_METRIC_WB_LOAD_ROWS",
+    "BDM_METRIC_WB_SAVE_SECONDS",
+    "BDM_METRIC_WB_SAVE_ROWS",
+    "BDM_METRIC_WB_CACHE_HITS",
+    "BDM_METRIC_WB_CACHE_MISSES",
+    "BDM_METRIC_TXN_CATEGORIZED",
+    "BDM_METRIC_TXN_OTHER",
+    "BDM_METRIC_CATEGORIZE_SECONDS",
     # Common dictionary attribute key name constants
     "BDM_WORKBOOK",
     "FI_OBJECT",
@@ -110,6 +134,11 @@ __all__ = [
     "BDMO_LOG_LEVEL",
     "BDMO_LOG_FILE",
     "BDMO_JSON_LOG_FILE",
+    "BDMO_LAZY_REHYDRATE",
+    "BDMO_JOURNAL",
+    "BDMO_LOADED_WORKBOOKS_MAX_COUNT",
+    "BDMO_LOADED_WORKBOOKS_MAX_BYTES",
+    "BDMO_CONCURRENT_INITIALIZE",
     "BDMO_EXPECTED_KEYS",
     # FI_OBJECT financial institution pseudo-Object (Dictionary key names)
     "FI_KEY",
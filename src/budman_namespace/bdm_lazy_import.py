@@ -0,0 +1,89 @@
+# ---------------------------------------------------------------------------- +
+#region bdm_lazy_import.py module
+""" bdm_lazy_import.py defers the import of heavy modules to first use.
+
+    BudMan starts for runs which never open an Excel workbook or the GUI,
+    such as headless scripts. Modules like openpyxl and tkinter are only
+    imported on the storage, workflow and GUI code paths which use them:
+
+        openpyxl = bdm_lazy_import("openpyxl")
+        ...
+        wb = openpyxl.load_workbook(path)  # openpyxl is imported here.
+
+    A BDMLazyModule imports its module on the first attribute access and
+    delegates to it after that, it is not placed in sys.modules, so a plain
+    'import openpyxl' elsewhere is unaffected. Annotations must not touch a
+    lazy module at def time, use the lazy 'type' aliases from the
+    design_language_namespace, e.g. EXCEL_TXNS_WORKBOOK_TYPE, instead.
+
+    BDM_STARTUP_IMPORT_BUDGET_SECONDS is the import-time budget for the
+    startup imports, BDM_LAZY_IMPORT_MODULES are the modules startup must
+    not import. Both are checked by
+    tests/test_budman_domain_model/test_bdm_lazy_import.py.
+"""
+#endregion bdm_lazy_import.py module
+# ---------------------------------------------------------------------------- +
+#region Imports
+# python standard library modules and packages
+import importlib, logging, sys, time
+from types import ModuleType
+from typing import Tuple
+# third-party modules and packages
+# local modules and packages
+#endregion Imports
+# ---------------------------------------------------------------------------- +
+#region Globals and Constants
+logger = logging.getLogger(__name__)
+# Cumulative seconds allowed for the startup imports, python -X importtime,
+# about twice the 0.36s measured.
+BDM_STARTUP_IMPORT_BUDGET_SECONDS: float = 0.75
+# Heavy modules imported lazily, never by the startup imports.
+BDM_LAZY_IMPORT_MODULES: Tuple[str, ...] = ("openpyxl", "tkinter")
+#endregion Globals and Constants
+# ---------------------------------------------------------------------------- +
+#region    BDMLazyModule class
+class BDMLazyModule(ModuleType):
+    """A placeholder for a module, imported on the first attribute access."""
+    def __init__(self, name: str) -> None:
+        super().__init__(name)
+        self.__dict__["_bdm_module"] = None
+
+    def __getattr__(self, attr: str):
+        # Only called for attributes not found on the placeholder itself.
+        module = self.__dict__["_bdm_module"]
+        if module is None:
+            st = time.perf_counter()
+            module = importlib.import_module(self.__name__)
+            self.__dict__["_bdm_module"] = module
+            logger.debug(f"Lazy import '{self.__name__}': "
+                         f"{time.perf_counter() - st:.4f} seconds.")
+        return getattr(module, attr)
+
+    def __repr__(self) -> str:
+        state = "imported" if self.__dict__["_bdm_module"] else "lazy"
+        return f"<BDMLazyModule '{self.__name__}' ({state})>"
+#endregion BDMLazyModule class
+# ---------------------------------------------------------------------------- +
+#region    bdm_lazy_import() and bdm_module_loaded() functions
+def bdm_lazy_import(name: str) -> ModuleType:
+    """Return the module name, imported on first use.
+
+    Args:
+        name (str): The absolute module name, e.g. 'openpyxl'.
+
+    Returns:
+        ModuleType: The module if already imported, else a BDMLazyModule.
+    """
+    module = sys.modules.get(name)
+    return module if module is not None else BDMLazyModule(name)
+
+def bdm_module_loaded(module: ModuleType | str) -> bool:
+    """Return True if the module, or module name, has been imported.
+
+    Use it to skip isinstance() checks against a lazy module which would
+    import it, no object can be an instance of a class not yet imported.
+    """
+    name = module if isinstance(module, str) else module.__name__
+    return name in sys.modules
+#endregion bdm_lazy_import() and bdm_module_loaded() functions
+# ---------------------------------------------------------------------------- +
@@ -5,21 +5,22 @@
 # ---------------------------------------------------------------------------- +
 #region Imports
 # python standard library modules and packages
-from dataclasses import dataclass, asdict, field
-import logging
+from dataclasses import dataclass, fields, field
+import itertools, logging, sys, time
 from urllib.parse import urlparse, unquote
 from pathlib import Path
-from typing import Any, Optional, Union, List, Dict
+from typing import Any, Callable, Optional, Union, List, Dict
 # third-party modules and packages
 import p3_utils as p3u, pyjson5, p3logging as p3l
-from openpyxl import Workbook, load_workbook
 # local modules and packages
+from budman_namespace.bdm_lazy_import import bdm_lazy_import, bdm_module_loaded
 import budman_namespace.design_language_namespace as bdm
 from budman_namespace.design_language_namespace import (P1, P2, P3, P4, P5, P6, P7, P8, P9, P10)
 #endregion Imports
 # ---------------------------------------------------------------------------- +
 #region Globals and Constants
 logger = logging.getLogger(__name__)
+openpyxl = bdm_lazy_import("openpyxl")
 ID_SEPARATOR = "|"
 BDMWORKBOOK_SCHEMA_VERSION = "1.3.0"
 # Schema History:
@@ -28,17 +29,66 @@ BDMWORKBOOK_SCHEMA_VERSION = "1.3.0"
 #  1.2.0 - 07/26/2025 - added wb_last_error attribute.
 #  1.3.0 - 08/04/2025 - Added wf_folder_url attribute, added wb_schema_version 
 #                       and tracking schema changes.
+
+# Change stamps of BDMWorkbook persisted attributes. Starting from the time
+# keeps them above the stamps of workbooks pickled by an earlier process.
+_wb_change_stamps = itertools.count(time.time_ns())
+_wb_last_change_stamp: int = 0
+
+def bdm_workbook_change_mark() -> int:
+    """Return a new change stamp, BDMWorkbooks changed after this call have
+    a greater wb_change_stamp."""
+    return next(_wb_change_stamps)
+
+def bdm_workbook_last_change() -> int:
+    """Return the stamp of the last BDMWorkbook change, 0 if none. Greater
+    than a mark from bdm_workbook_change_mark() if any changed since."""
+    return _wb_last_change_stamp
+
+def bdm_workbook_type_detect(wb_path: Optional[Path]) -> str:
+    """Return the wb_type named in the wb_path filename, or WB_TYPE_UNKNOWN."""
+    if wb_path is None:
+        return bdm.WB_TYPE_UNKNOWN
+    stem = wb_path.stem.lower()
+    return next((tn for tn in bdm.VALID_WB_TYPE_VALUES if tn in stem),
+                bdm.WB_TYPE_UNKNOWN)
+
+def _intern(value: Any) -> Any:
+    """Intern str values repeated across many BDMWorkbooks."""
+    return sys.intern(value) if type(value) is str else value
 # ---------------------------------------------------------------------------- +
 #endregion Globals and Constants
 # ---------------------------------------------------------------------------- +
-@dataclass(init=True, kw_only=True)
-class BDMWorkbook:
+class BDMWorkbookCache:
+    """Slots for values BDMWorkbook derives from its attributes.
+
+    Each cached value is stored with the attribute values it was derived
+    from, and is recomputed when they are no longer the same objects. These
+    slots are not dataclass fields, so they are never serialized.
+    """
+    __slots__ = ("_wb_id", "_wb_id_src", "_abs_path", "_abs_path_src",
+                 "_wb_content_loader", "_wb_change_stamp")
+# ---------------------------------------------------------------------------- +
+@dataclass(init=True, kw_only=True, slots=True)
+class BDMWorkbook(BDMWorkbookCache):
     #region    doc string
     """ BDMWorkbook is basic wrapper around file-based data objects. It 
     holds the metadata attributes for a particular workbook. BDMWorkbook objects
     are serialized for storage. A url is used to identify the workbook, and
     the workbook is loaded from the storage system when needed.
 
+    BDMWorkbook uses __slots__, so only the dataclass attributes can be set.
+    String attributes repeated across workbooks, such as fi_key, wf_key,
+    wf_purpose, wf_folder and wb_type, are interned. The wb_id property and
+    abs_path() are cached.
+
+    Content evicted from the DC loaded workbooks, wb_content_evict(), is 
+    reloaded on the next read of wb_content, so wb_loaded stays True.
+
+    Setting a persisted attribute records a change stamp, wb_change_stamp,
+    so the BDM journal saves only the workbooks changed since the last
+    save, see bdm_workbook_change_mark().
+
     Attributes:
         wb_id (str): Unique identifier for the workbook. It is the wf_folder 
         value appended with wb_name with '|' as a separator. 
@@ -57,7 +107,8 @@ class BDMWorkbook:
     wf_folder_url: str = None
     wf_folder: str = None
     wb_loaded : bool = False
-    wb_content: bdm.WORKBOOK_CONTENT_TYPE = None  # added 07/06/2025
+    # Not compared, reading evicted content reloads it.
+    wb_content: bdm.WORKBOOK_CONTENT_TYPE = field(default=None, compare=False)  # added 07/06/2025
     wb_last_error: Optional[str] = None  # added 07/26/2025
     wb_schema_version: str = BDMWORKBOOK_SCHEMA_VERSION # added 08/04/2025
     #endregion dataclass object attributes
@@ -67,12 +118,30 @@ class BDMWorkbook:
         """BDMWorkbook.__post_init__() method."""
         try:
             self.wb_url = self.wb_url.lower() if self.wb_url else None
-            self.wf_folder = self.wf_folder.lower() if self.wf_folder else None
+            self.wf_folder = _intern(self.wf_folder.lower() if self.wf_folder else None)
+            self.wb_filetype = _intern(self.wb_filetype)
+            self.wb_type = _intern(self.wb_type)
+            self.fi_key = _intern(self.fi_key)
+            self.wf_key = _intern(self.wf_key)
+            self.wf_purpose = _intern(self.wf_purpose)
+            self.wf_folder_url = _intern(self.wf_folder_url)
+            self.wb_schema_version = _intern(self.wb_schema_version)
+            self._wb_id_src = self._abs_path_src = None
+            self._wb_content_loader = None
         except Exception as e:
             logger.error(f"BDMWorkbook __post_init__ error: {p3u.exc_err_msg(e)}")
             raise
     #endregion __post_init__() method
     # ------------------------------------------------------------------------ +
+    #region __setattr__() method
+    def __setattr__(self, name: str, value: Any) -> None:
+        global _wb_last_change_stamp
+        object.__setattr__(self, name, value)
+        if name in BDMWORKBOOK_CHANGE_STAMPED:
+            _wb_last_change_stamp = next(_wb_change_stamps)
+            object.__setattr__(self, "_wb_change_stamp", _wb_last_change_stamp)
+    #endregion __setattr__() method
+    # ------------------------------------------------------------------------ +
     #region __getitem__() and __setitem__() methods
     def __getitem__(self, key: str):
         # Try to get a property or attribute by name
@@ -107,10 +176,10 @@ class BDMWorkbook:
     def to_dict(self) -> dict[str, Any]:
         """Convert the BDMWorkbook instance to a dictionary.
         Always excludes the wb_content attribute to avoid serialization issues."""
-        tmp_obj: Any = self.wb_content
-        self.wb_content = None
-        ret_dict = asdict(self)
-        self.wb_content = tmp_obj
+        # Attribute values are immutable, no need for the deep copy of asdict().
+        # Not reading wb_content, which would reload evicted content.
+        ret_dict = {f.name: (getattr(self, f.name) if f.name != "wb_content"
+                             else None) for f in fields(self)}
         return ret_dict
     #endregion internal methods: to_dict(self)
     # ------------------------------------------------------------------------ +
@@ -118,7 +187,12 @@ class BDMWorkbook:
     @property
     def wb_id(self) -> str:
         """ combine wf_folder ID_SEPARATOR wb_name. """
-        return f"{self.wf_folder.lower()}{ID_SEPARATOR}{self.wb_name.lower()}"
+        src = self._wb_id_src
+        if (src is None or src[0] is not self.wf_folder or 
+            src[1] is not self.wb_name):
+            self._wb_id = f"{self.wf_folder.lower()}{ID_SEPARATOR}{self.wb_name.lower()}"
+            self._wb_id_src = (self.wf_folder, self.wb_name)
+        return self._wb_id
     @wb_id.setter
     def wb_id(self, value: str) -> None:
         """ set the wb_name. """
@@ -132,6 +206,14 @@ class BDMWorkbook:
     def name(self, value: str) -> None:
         """ set the wb_name. """
         self.wb_name = value
+    @property
+    def wb_change_stamp(self) -> int:
+        """ The stamp of the last persisted attribute change, 0 if none. """
+        return getattr(self, "_wb_change_stamp", 0)
+    @property
+    def wb_content_evicted(self) -> bool:
+        """ True if wb_content was evicted, to reload on the next read. """
+        return getattr(self, "_wb_content_loader", None) is not None
     #endregion BDMWorkbook properties
     # ------------------------------------------------------------------------ +
 
@@ -228,9 +310,12 @@ class BDMWorkbook:
             check = self.check_wb_url()
             if not check:
                 wb_status = f"not found at URL:'{self.wb_url}'"
+            elif self.wb_content_evicted:
+                wb_status = "evicted"
             elif self.wb_loaded and self.wb_content is not None:
                 d = p3u.dscr(self.wb_content)
-                if isinstance(self.wb_content, Workbook):
+                if (bdm_module_loaded(openpyxl) and
+                        isinstance(self.wb_content, openpyxl.Workbook)):
                     wb_status = f"{self.wb_content!r}"
                 elif isinstance(self.wb_content, dict):
                     wb_status = f"{d}[{len(self.wb_content)} items]"
@@ -255,14 +340,17 @@ class BDMWorkbook:
     # ------------------------------------------------------------------------ +
     #region abs_path()
     def abs_path(self) -> Optional[Path]:
-        """ Return abs_path of wb_url. """
+        """ Return abs_path of wb_url, cached until wb_url changes. """
         try:
             if not self.wb_url:
                 return None
+            if self._abs_path_src is self.wb_url:
+                return self._abs_path
             parsed_url = urlparse(self.wb_url)
             if parsed_url.scheme != "file":
                 raise ValueError(f"URL scheme is not 'file': {parsed_url.scheme}")
             file_path = Path.from_uri(self.wb_url)
+            self._abs_path, self._abs_path_src = file_path, self.wb_url
             return file_path
         except Exception as e:
             logger.error(f"Error checking URL '{self.wb_url}': {p3u.exc_err_msg(e)}")
@@ -289,15 +377,55 @@ class BDMWorkbook:
             logger.error(f"BDMWorkbook: {self.wb_id} has no abs_path.")
             self.wb_type = bdm.WB_TYPE_UNKNOWN
             return self.wb_type
-        fn = abs_path.stem
-        for tn in bdm.VALID_WB_TYPE_VALUES:
-            if tn in fn.lower():
-                self.wb_type = tn
-                return self.wb_type
-        self.wb_type = bdm.WB_TYPE_UNKNOWN
+        self.wb_type = bdm_workbook_type_detect(abs_path)
+        if self.wb_type != bdm.WB_TYPE_UNKNOWN:
+            return self.wb_type
         logger.warning(f"BDMWorkbook: {self.wb_id} has unknown wb_type")
         return self.wb_type
     #endregion determine_wb_type
     # ------------------------------------------------------------------------ +
+    #region wb_change_clear()
+    def wb_change_clear(self) -> None:
+        """ Clear wb_change_stamp, e.g. for a workbook just rehydrated. """
+        object.__setattr__(self, "_wb_change_stamp", 0)
+    #endregion wb_change_clear()
+    # ------------------------------------------------------------------------ +
+    #region wb_content_evict()
+    def wb_content_evict(self, loader: Callable[["BDMWorkbook"], Any]) -> None:
+        """ Drop wb_content from memory, loader(self) reloads it on the next
+        read of wb_content. """
+        self.wb_content = None
+        self._wb_content_loader = loader
+    #endregion wb_content_evict()
+    # ------------------------------------------------------------------------ +
     #endregion BDMWorkbook instance methods
     # ------------------------------------------------------------------------ +
+# ---------------------------------------------------------------------------- +
+# Persisted attributes, setting them records a wb_change_stamp. The wb_loaded
+# and wb_content attributes are never persisted.
+BDMWORKBOOK_CHANGE_STAMPED = frozenset(
+    f.name for f in fields(BDMWorkbook)) - {"wb_loaded", "wb_content"}
+# ---------------------------------------------------------------------------- +
+#region BDMWorkbook.wb_content property
+# The wb_content dataclass field is a slot, wrapped in a property to reload
+# evicted content on read. Setting wb_content cancels a pending reload.
+_wb_content_slot = BDMWorkbook.wb_content
+
+def _wb_content_get(self: BDMWorkbook) -> bdm.WORKBOOK_CONTENT_TYPE:
+    wb_content = _wb_content_slot.__get__(self, BDMWorkbook)
+    loader = getattr(self, "_wb_content_loader", None)
+    if wb_content is None and loader is not None:
+        self._wb_content_loader = None
+        wb_content = loader(self)
+        _wb_content_slot.__set__(self, wb_content)
+        self.wb_loaded = wb_content is not None
+    return wb_content
+
+def _wb_content_set(self: BDMWorkbook, value: bdm.WORKBOOK_CONTENT_TYPE) -> None:
+    _wb_content_slot.__set__(self, value)
+    self._wb_content_loader = None
+
+BDMWorkbook.wb_content = property(_wb_content_get, _wb_content_set,
+                                  doc="The workbook content, when loaded.")
+#endregion BDMWorkbook.wb_content property
+# ---------------------------------------------------------------------------- +
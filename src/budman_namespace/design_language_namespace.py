@@ -11,12 +11,11 @@ import re
 from typing import Dict, List, Tuple, Any, Type, TYPE_CHECKING, Union
 
 # third-party modules and packages
-import openpyxl
-from openpyxl import Workbook
-import openpyxl.worksheet.worksheet
-from openpyxl.worksheet.worksheet import Worksheet #as Worksheet
 # local modules and packages
+from .bdm_lazy_import import bdm_lazy_import
 
+# openpyxl is imported on first use, the EXCEL_ type aliases are lazy too.
+openpyxl = bdm_lazy_import("openpyxl")
 #endregion Imports
 # ---------------------------------------------------------------------------- +
 # Budget Domain Model Constants
@@ -132,6 +131,11 @@ BDMO_LOG_CONFIG = "log_config"
 BDMO_LOG_LEVEL = "log_level"
 BDMO_LOG_FILE = "log_file"
 BDMO_JSON_LOG_FILE = "json_log_file_name"
+BDMO_LAZY_REHYDRATE = "lazy_rehydrate"  # optional, bool, default False
+BDMO_JOURNAL = "journal"  # optional, bool, default False
+BDMO_LOADED_WORKBOOKS_MAX_COUNT = "loaded_workbooks_max_count"  # optional, int, 0 unlimited
+BDMO_LOADED_WORKBOOKS_MAX_BYTES = "loaded_workbooks_max_bytes"  # optional, int, 0 unlimited
+BDMO_CONCURRENT_INITIALIZE = "concurrent_initialize"  # optional, bool, default True
 BDMO_EXPECTED_KEYS = (BDMO_LOG_CONFIG, BDMO_LOG_LEVEL, BDMO_LOG_FILE,
                     BDMO_JSON_LOG_FILE)
 # ---------------------------------------------------------------------------- +
@@ -147,6 +151,17 @@ FILE_TREE_NODE_TYPE_KEY = "node_type"
 FILE_TREE_NODE_WF_KEY = WF_KEY
 FILE_TREE_NODE_WF_PURPOSE = WF_PURPOSE
 # ---------------------------------------------------------------------------- +
+# BudMan metric names, in the p3_telemetry cp_metrics registry
+BDM_METRIC_WB_LOAD_SECONDS = "bsm.wb_load.seconds"
+BDM_METRIC_WB_LOAD_ROWS = "bsm.wb_load.rows"
+BDM_METRIC_WB_SAVE_SECONDS = "bsm.wb_save.seconds"
+BDM_METRIC_WB_SAVE_ROWS = "bsm.wb_save.rows"
+BDM_METRIC_WB_CACHE_HITS = "dc.wb_cache.hits"
+BDM_METRIC_WB_CACHE_MISSES = "dc.wb_cache.misses"
+BDM_METRIC_TXN_CATEGORIZED = "wf.txn.categorized"
+BDM_METRIC_TXN_OTHER = "wf.txn.other"
+BDM_METRIC_CATEGORIZE_SECONDS = "wf.categorize.seconds"
+# ---------------------------------------------------------------------------- +
 # FI_OBJECT financial institution pseudo-Object (Dictionary key names)
 FI_KEY = FI_KEY # common
 FI_NAME = "fi_name"
@@ -39,6 +39,7 @@ __all__ = [
     "BUDMAN_DEFAULT_WORKBOOK_TYPE",
     "BUDMAN_CMD_HISTORY_FILENAME",
     "BUDMAN_CMD_STARTUP_SCRIPT",
+    "BUDMAN_WARM_START",
     "BUDMAN_VALID_WF_PURPOSE_KEY_VALUES",
     "BUDMAN_DEFAULT_WF_PURPOSE_KEY",
     "WORKFLOWS",
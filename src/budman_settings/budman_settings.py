@@ -5,8 +5,9 @@
 # ---------------------------------------------------------------------------- +
 #region Imports
 # python standard libraries packages and modules 
-import os, logging
+import os, logging, re
 from pathlib import Path
+from typing import List
 # third-party  packages and module libraries
 from dynaconf import Dynaconf
 from p3_utils import exc_err_msg, dscr
@@ -82,6 +83,21 @@ class BudManSettings(Dynaconf,metaclass=BDMSingletonMeta):
             raise
     #endregion BUDMAN_FOLDER_abs_path()
     # ------------------------------------------------------------------------ +
+    #region    SETTINGS_FILES_abs_paths()
+    def SETTINGS_FILES_abs_paths(self) -> List[Path]:
+        """Return the absolute paths of the settings files."""
+        try:
+            settings_files = self.get("SETTINGS_FILE_FOR_DYNACONF") or []
+            if isinstance(settings_files, str):
+                settings_files = re.split(r"[,;]", settings_files)
+            root_path = Path(self.get("ROOT_PATH_FOR_DYNACONF") or ".")
+            return [(root_path / f.strip()).expanduser().resolve()
+                    for f in settings_files if f.strip()]
+        except Exception as e:
+            logger.error(exc_err_msg(e))
+            raise
+    #endregion SETTINGS_FILES_abs_paths()
+    # ------------------------------------------------------------------------ +
     #region    FI_FOLDER_abs_path()
     def FI_FOLDER_abs_path(self, fi_key:str) -> Path:
         """Return the absolute path to the FI_FOLDER."""
@@ -32,6 +32,7 @@ BUDMAN_DEFAULT_WORKFLOW_PURPOSE = "budman.default_workflow_purpose"
 BUDMAN_DEFAULT_WORKBOOK_TYPE = "budman.default_workbook_type"
 BUDMAN_CMD_HISTORY_FILENAME = "budman.cmd_history_filename"
 BUDMAN_CMD_STARTUP_SCRIPT = "budman.cmd_startup_script"
+BUDMAN_WARM_START = "budman.warm_start"  # bool, default true
 # [workflows] Table
 WORKFLOWS = "workflows"
 BUDMAN_VALID_WF_KEY_VALUES = "workflows.valid_wf_key_values"  # List of valid workflow keys
@@ -246,7 +246,6 @@ import importlib
 
 # third-party modules and packages
 import p3_utils as p3u, p3logging as p3l, p3_mvvm as p3m
-from openpyxl import Workbook, load_workbook
 
 # local modules and packages
 # from budman_command_services.cp_utils import CMD_RESULT_OBJECT
@@ -254,13 +253,16 @@ import budman_command_services as cp
 import budman_settings as bdms
 from budman_namespace.design_language_namespace import *
 from budman_namespace.bdm_workbook_class import BDMWorkbook
+from budman_namespace.bdm_lazy_import import bdm_lazy_import
 from budget_domain_model import (BudgetDomainModel, BDMConfig)
+from budget_storage_model import BSMChangeEvent
 from budman_data_context.budman_app_data_context_binding_class import BudManAppDataContext_Binding
-from budman_gui_view import BudManGUIView
 #endregion Imports
 # ---------------------------------------------------------------------------- +
 #region Globals and Constants
 logger = logging.getLogger(__name__)
+# The GUI view, and tkinter, are imported on the first app gui cmd.
+budman_gui_view = bdm_lazy_import("budman_gui_view")
 #endregion Globals and Constants
 # ---------------------------------------------------------------------------- +
 class BudManViewModel(BudManAppDataContext_Binding, p3m.CommandProcessor, 
@@ -310,14 +312,20 @@ class BudManViewModel(BudManAppDataContext_Binding, p3m.CommandProcessor,
     #endregion __init__() constructor method
     # ------------------------------------------------------------------------ +
     #region    BudManViewModel Class initialize() method                       +
-    def initialize(self) -> "BudManViewModel":
-        """Initialize the command view_model."""
+    def initialize(self, model_state: Optional[Dict[str, Any]] = None) -> "BudManViewModel":
+        """Initialize the command view_model.
+
+        Args:
+            model_state (Dict): Optional, model state from a warm-start
+                snapshot, restored instead of initializing the model.
+        """
         try:
             st = p3u.start_timer()
             logger.info(f"BizEVENT: View Model setup for '{self.app_name}'")
             self.cp_initialize()
             self.cp_initialize_worker_thread()
-            self._budget_domain_model = self.initialize_model(self.bdms_url)
+            self._budget_domain_model = self.initialize_model(self.bdms_url,
+                                                              model_state)
             self._initialized = True
             logger.debug(f"Complete: {p3u.stop_timer(st)}")
             return self
@@ -327,13 +335,22 @@ class BudManViewModel(BudManAppDataContext_Binding, p3m.CommandProcessor,
     #endregion BudManViewModel Class initialize() method                       +
     # ------------------------------------------------------------------------ +
     #region    BudManViewModel Class initialize_model() method                 +
-    def initialize_model(self, bdms_url : str) -> BudgetDomainModel:
+    def initialize_model(self, bdms_url : str,
+                         model_state: Optional[Dict[str, Any]] = None) -> BudgetDomainModel:
         """Create a model using the bdms_url location for a valid BDM_STORE.
             The BDM_STORE object provides the model configuration and state.
+            If model_state from a warm-start snapshot is provided, the model
+            is restored from it instead.
         """
         try:
             st = p3u.start_timer()
             logger.debug(f"Start: ...")
+            if model_state is not None:
+                model : BudgetDomainModel = BudgetDomainModel(
+                    model_state[BDM_STORE_OBJECT]).bdm_WARM_START_restore(model_state)
+                self._BDM_STORE_loaded = True
+                logger.debug(f"Complete: warm start {p3u.stop_timer(st)}")
+                return model
             # if a bdms_url is provided, load the BDM_STORE file.
             if p3u.str_notempty(self.bdms_url):
                 # Load the BDM_STORE file from the URL, initializing 
@@ -375,6 +392,30 @@ class BudManViewModel(BudManAppDataContext_Binding, p3m.CommandProcessor,
             raise
     #endregion BudManViewModel Class save_model() method                       +
     # ------------------------------------------------------------------------ +
+    #region    BudManViewModel Class STORAGE_CHANGES methods                   +
+    def STORAGE_CHANGES_queue(self, events: List[BSMChangeEvent]) -> None:
+        """Queue storage changes found by the model's change monitor as an
+        async 'app storage_changes' cmd, so the writer lane applies them
+        holding the model lock. Called on the change monitor thread."""
+        try:
+            cmd = p3m.Command(
+                cp=self,
+                cmd_name=cp.CV_APP_CMD_NAME,
+                subcmd_name=cp.CV_STORAGE_CHANGES_SUBCMD_NAME,
+                cmd_exec_func=cp.BUDMAN_CMD_app_storage_changes)
+            cmd.cmd_parms[cp.CK_STORAGE_CHANGES] = list(events)
+            self.cp_execute_cmd_async(cmd, self.STORAGE_CHANGES_result)
+        except Exception as e:
+            logger.error(p3u.exc_err_msg(e))
+            raise
+
+    def STORAGE_CHANGES_result(self, cmd_result: p3m.CMD_RESULT_TYPE) -> None:
+        """Async result subscriber of the 'app storage_changes' cmd."""
+        if not cmd_result[p3m.CK_CMD_RESULT_STATUS]:
+            logger.error(f"Storage changes not applied: "
+                         f"{cmd_result[p3m.CK_CMD_RESULT_CONTENT]}")
+    #endregion BudManViewModel Class STORAGE_CHANGES methods                   +
+    # ------------------------------------------------------------------------ +
     #region    BudManViewModel Class Properties
     @property
     def app_name(self) -> str:
@@ -741,6 +782,18 @@ class BudManViewModel(BudManAppDataContext_Binding, p3m.CommandProcessor,
                     cp.CK_LEVEL
                 ]
                 )
+            # show METRICS
+            self.cp_commands[cp.CV_SHOW_METRICS_SUBCMD_KEY] = p3m.Command(
+                cp=self,
+                cmd_name=cp.CV_SHOW_CMD_NAME, 
+                subcmd_name=cp.CV_METRICS_SUBCMD_NAME,
+                cmd_exec_func=cp.BUDMAN_CMD_show_METRICS,
+                required_parms=[
+                    cp.CK_METRICS_PREFIX,
+                    cp.CK_METRICS_JSON,
+                    cp.CK_METRICS_RESET
+                ]
+                )
             #endregion Command object definitions
             p3m.cp_user_info_message(f"Command map initialized with {len(self.cp_commands)} commands.")
         except Exception as e:
@@ -765,6 +818,73 @@ class BudManViewModel(BudManAppDataContext_Binding, p3m.CommandProcessor,
 
     #endregion validate_command_for_exec() Command Processor method
     # ------------------------------------------------------------------------ +
+    #region    cp_async_cmd_priority() Command Processor method
+    def cp_async_cmd_priority(self, cmd: p3m.CMD_OBJECT_TYPE | p3m.Command) -> int:
+        """Override: Interactive list, show and val cmds run ahead of
+        workflow cmds, which are batch jobs over many workbooks."""
+        if self._cp_async_cmd_attr(cmd, p3m.CK_CMD_ASYNC_PRIORITY) is not None:
+            return super().cp_async_cmd_priority(cmd)
+        cmd_key = (cmd.get(p3m.CK_CMD_KEY) if isinstance(cmd, dict)
+                   else getattr(cmd, p3m.CK_CMD_KEY, None))
+        if cmd_key in (cp.CV_LIST_CMD_KEY, cp.CV_SHOW_CMD_KEY, cp.CV_VAL_CMD_KEY):
+            return p3m.CV_CMD_PRIORITY_INTERACTIVE
+        if cmd_key == cp.CV_WORKFLOW_CMD_KEY:
+            return p3m.CV_CMD_PRIORITY_BATCH
+        return super().cp_async_cmd_priority(cmd)
+    #endregion cp_async_cmd_priority() Command Processor method
+    # ------------------------------------------------------------------------ +
+    #region    cp_cmd_read_only() Command Processor method
+    def cp_cmd_read_only(self, cmd: p3m.CMD_OBJECT_TYPE | p3m.Command) -> bool:
+        """Override: The cmds named in CV_READ_ONLY_SUBCMD_KEYS change
+        neither the model nor the DC."""
+        _, _, subcmd_key = self._cp_cmd_names(cmd)
+        return subcmd_key in cp.CV_READ_ONLY_SUBCMD_KEYS
+    #endregion cp_cmd_read_only() Command Processor method
+    # ------------------------------------------------------------------------ +
+    #region    cp_cmd_shared_write() Command Processor method
+    def cp_cmd_shared_write(self, cmd: p3m.CMD_OBJECT_TYPE | p3m.Command) -> bool:
+        """Override: 'save wb', 'close wb' and a 'load wb' not selecting the
+        DC current workbook change only the content of their workbooks, in
+        the dc_LOADED_WORKBOOKS collection with its own lock."""
+        _, _, subcmd_key = self._cp_cmd_names(cmd)
+        if subcmd_key in (cp.CV_SAVE_WORKBOOKS_SUBCMD_KEY,
+                          cp.CV_CLOSE_WORKBOOKS_SUBCMD_KEY):
+            return True
+        if subcmd_key != cp.CV_LOAD_WORKBOOKS_SUBCMD_KEY:
+            return False
+        cmd_parms = cmd.cmd_parms if isinstance(cmd, p3m.Command) else cmd
+        return not cmd_parms.get(cp.CK_SELECT_WORKBOOK, True)
+    #endregion cp_cmd_shared_write() Command Processor method
+    # ------------------------------------------------------------------------ +
+    #region    cp_cmd_unlocked() Command Processor method
+    def cp_cmd_unlocked(self, cmd: p3m.CMD_OBJECT_TYPE | p3m.Command) -> bool:
+        """Override: The app gui cmd runs the GUI session, each cmd of the
+        GUI holds the model lock, the session does not."""
+        _, _, subcmd_key = self._cp_cmd_names(cmd)
+        return subcmd_key == cp.CV_GUI_SUBCMD_KEY
+    #endregion cp_cmd_unlocked() Command Processor method
+    # ------------------------------------------------------------------------ +
+    #region    cp_cmd_cacheable() Command Processor method
+    def cp_cmd_cacheable(self, cmd: p3m.CMD_OBJECT_TYPE | p3m.Command) -> bool:
+        """Override: The list and show cmds reading the model, named in
+        CV_CACHEABLE_SUBCMD_KEYS, are cacheable. The storage listings in
+        CV_STORAGE_LISTING_SUBCMD_KEYS are too, while the model's change
+        monitor bumps the storage version in cp_cache_version()."""
+        _, _, subcmd_key = self._cp_cmd_names(cmd)
+        if subcmd_key in cp.CV_STORAGE_LISTING_SUBCMD_KEYS:
+            return getattr(self._budget_domain_model, 
+                           "bdm_CHANGE_MONITOR_running", False)
+        return subcmd_key in cp.CV_CACHEABLE_SUBCMD_KEYS
+    #endregion cp_cmd_cacheable() Command Processor method
+    # ------------------------------------------------------------------------ +
+    #region    cp_cache_version() Command Processor method
+    def cp_cache_version(self) -> Tuple[int, int]:
+        """Override: Storage changes applied by the model's change monitor
+        also invalidate the cached cmd results."""
+        return (super().cp_cache_version(),
+                getattr(self._budget_domain_model, "bdm_storage_version", 0))
+    #endregion cp_cache_version() Command Processor method
+    # ------------------------------------------------------------------------ +
     #                                                                          +
     #endregion BudManViewModel p3mCommandProcessor super class Override methods          +
     # ======================================================================== +
@@ -881,18 +1001,23 @@ class BudManViewModel(BudManAppDataContext_Binding, p3m.CommandProcessor,
             selected_bdm_wb_list : List[BDMWorkbook] = None
             selected_bdm_wb_list = self.process_selected_workbook_input(cmd)
             bdm_wb : Optional[BDMWorkbook] = None
+            # A script 'load wb' runs in parallel, and does not select the
+            # current workbook in the Data Context.
+            select: bool = self.cp_cmd_attr_get(cmd, cp.CK_SELECT_WORKBOOK, True)
             r = f"\nBudget Manager Workbooks({len(selected_bdm_wb_list)}):"
             for bdm_wb in selected_bdm_wb_list:
-                # Select the current workbook in the Data Context.
-                self.dc_WORKBOOK = bdm_wb
-                success, result = self.dc_WORKBOOK_load(bdm_wb) 
+                if select:
+                    # Select the current workbook in the Data Context.
+                    self.dc_WORKBOOK = bdm_wb
+                wb_index = self.dc_WORKBOOK_index(bdm_wb.wb_id)
+                success, result = self.dc_WORKBOOK_load(bdm_wb, select) 
                 if not success:
                     m = f"Error loading wb_id: '{bdm_wb.wb_id}': {result}"
                     logger.error(m)
-                    r += f"\n{P2}Error wb_index: {self.dc_WB_INDEX:>4} wb_id: '{bdm_wb.wb_id:<40}' Reason:{m}"
+                    r += f"\n{P2}Error wb_index: {wb_index:>4} wb_id: '{bdm_wb.wb_id:<40}' Reason:{m}"
                     continue
                 # Cmd output string
-                r_str = bdm_wb.wb_index_display_str(self.dc_WB_INDEX)
+                r_str = bdm_wb.wb_index_display_str(wb_index)
                 r += f"\n{P2}Loaded {r_str}"
                 continue
             logger.debug(f"Complete Command: 'Load' {p3u.stop_timer(st)}")   
@@ -1009,6 +1134,8 @@ class BudManViewModel(BudManAppDataContext_Binding, p3m.CommandProcessor,
             subcmd_name: CV_RELOAD_SUBCMD
             subcmd_key: 'app_cmd_log'
             subcmd_name: CV_LOG_SUBCMD
+            subcmd_key: 'app_cmd_trace'
+            subcmd_name: CV_TRACE_SUBCMD
 
         Returns:
             Tuple[success : bool, result : Any]: The outcome of the command 
@@ -1029,9 +1156,9 @@ class BudManViewModel(BudManAppDataContext_Binding, p3m.CommandProcessor,
             # another View)
             if cmd[cp.p3m.CK_SUBCMD_NAME] == cp.CV_GUI_SUBCMD_NAME:
                 # Create the gui_view and run it
-                gui_view: BudManGUIView = BudManGUIView(command_processor=self,
-                                                        data_context=self.DC,
-                                                        budman_settings=self.settings)
+                gui_view = budman_gui_view.BudManGUIView(command_processor=self,
+                                                         data_context=self.DC,
+                                                         budman_settings=self.settings)
                 gui_view.initialize()
                 cmd_result = gui_view.run()
                 del gui_view
@@ -24,10 +24,9 @@ from dataclasses import dataclass, field
 
 # third-party modules and packages
 import p3logging as p3l, p3_utils as p3u
-from openpyxl import Workbook, load_workbook
-from openpyxl.worksheet.worksheet import Worksheet
-from openpyxl.cell.cell import Cell
-from pyparsing import Optional
+from p3_telemetry import (cp_traced, cp_trace_current, cp_metrics, cp_timed,
+                          CP_TRACE_CAT_TASK, CK_TRACE_WB_ID, CK_TRACE_ROWS,
+                          CK_TRACE_RULE_COUNT)
 
 # local modules and packages
 import budman_command_services as cp
@@ -40,6 +39,7 @@ from .category_manager import (BDMTXNCategoryManager, TXNCategoryMap)
 # ---------------------------------------------------------------------------- +
 #region Globals and Constants
 logger = logging.getLogger(__name__)
+openpyxl = bdm_lazy_import("openpyxl")
 
 # Note: Python lists are 0-based. With openpyxl, data is often returned in a
 # list. In excel, worksheet columns are 1-based. So, we need to adjust the indices.
@@ -190,7 +190,7 @@ class TransactionData:
 #endregion TransactionData dataclass
 # ---------------------------------------------------------------------------- +
 #region excel_WORKSHEET_remove_extra_columns() function
-def excel_WORKSHEET_remove_extra_columns(ws: Worksheet, expected_columns: List[str]) -> bdm.BUDMAN_RESULT_TYPE:
+def excel_WORKSHEET_remove_extra_columns(ws: EXCEL_TXNS_WORKSHEET_TYPE, expected_columns: List[str]) -> bdm.BUDMAN_RESULT_TYPE:
     """Remove extra columns from a worksheet that are not in the expected columns list.
 
     Args:
@@ -217,7 +217,8 @@ def excel_WORKSHEET_remove_extra_columns(ws: Worksheet, expected_columns: List[s
 #endregion excel_WORKSHEET_remove_extra_columns() function
 # ---------------------------------------------------------------------------- +
 #region WORKFLOW_TASK_set_column_width() function
-def WORKFLOW_TASK_set_column_width(sheet: Worksheet, 
+@cp_traced(CP_TRACE_CAT_TASK)
+def WORKFLOW_TASK_set_column_width(sheet: EXCEL_TXNS_WORKSHEET_TYPE, 
                                    col_dimensions: Dict[str, int]) -> None:
     """Set the width of columns in the worksheet based on the provided dimensions.
     
@@ -255,8 +256,9 @@ def WORKFLOW_TASK_set_column_width(sheet: Worksheet,
 #endregion WORKFLOW_TASK_set_column_width() function
 # ---------------------------------------------------------------------------- +
 #region WORKFLOW_TASK_check_sheet_columns() function
+@cp_traced(CP_TRACE_CAT_TASK)
 def WORKFLOW_TASK_check_sheet_columns(
-        sheet: Worksheet, 
+        sheet: EXCEL_TXNS_WORKSHEET_TYPE, 
         add_columns: bool = True) -> bool:
     """Check that the sheet is ready to process transactions.
     
@@ -320,7 +322,7 @@ def WORKFLOW_TASK_check_sheet_columns(
 #endregion WORKFLOW_TASK_check_sheet_columns() function
 # ---------------------------------------------------------------------------- +
 #region check_sheet_schema() function
-def check_sheet_schema(wb: Workbook, 
+def check_sheet_schema(wb: EXCEL_TXNS_WORKBOOK_TYPE, 
                        correct: bool = False) -> bool:
     """Check that the Workbook active sheet is ready to process transactions.
     
@@ -337,7 +339,7 @@ def check_sheet_schema(wb: Workbook,
     """
     try:
         logger.info("Check worksheet for schema structure.")
-        p3u.is_not_obj_of_type("wb", wb, Workbook, raise_error=True)
+        p3u.is_not_obj_of_type("wb", wb, openpyxl.Workbook, raise_error=True)
         # Check the active worksheet.
         ws = wb.active  # Get the active worksheet.
         good_schema = True  # Assume the schema is good.
@@ -390,7 +392,7 @@ def check_sheet_schema(wb: Workbook,
 #endregion check_sheet_schema() function
 # ---------------------------------------------------------------------------- +
 #region WORKSHEET_data(ws:Worksheet) -> List[TransactionData]
-def WORKSHEET_data(ws:Worksheet, just_values:bool=False) -> list[TransactionData]:
+def WORKSHEET_data(ws:EXCEL_TXNS_WORKSHEET_TYPE, just_values:bool=False) -> list[TransactionData]:
     """Extract transaction data from a worksheet.
 
     Args:
@@ -400,7 +402,7 @@ def WORKSHEET_data(ws:Worksheet, just_values:bool=False) -> list[TransactionData
         list[TransactionData]: A list of TransactionData objects.
     """
     try:
-        if not isinstance(ws, Worksheet):
+        if not isinstance(ws, openpyxl.worksheet.worksheet.Worksheet):
             raise TypeError(f"Expected 'ws' arg to be a Worksheet, got {type(ws)}")
         transactions = []
         headers = [cell.value for cell in ws[1]]  # Get the header row values.
@@ -436,7 +438,7 @@ def WORKSHEET_row_data(row:tuple,hdr:list=BUDMAN_WB_SCHEMA) -> TransactionData:
             raise ValueError(f"Hdr is missing required columns: {missing_columns}")
         # First, determine if row contains Cells or value-only cell.value's and
         # extract the values accordingly.
-        if isinstance(row[0], Cell):
+        if isinstance(row[0], openpyxl.cell.cell.Cell):
             # This is a Tuple of Cell objects.
             row_values = [cell.value for cell in row]
         else:
@@ -559,12 +561,12 @@ def validate_budget_categories(bdm_wb:BDMWorkbook,
             logger.error(m)
             result += f"\n{pad}{m}"
             return False, result
-        if p3u.is_not_obj_of_type("wb", bdm_wb.wb_content, Workbook):
+        if p3u.is_not_obj_of_type("wb", bdm_wb.wb_content, openpyxl.Workbook):
             m = f"Error accessing wb_content for workbook: '{bdm_wb.wb_id}'."
             logger.error(m)
             result += f"\n{pad}{m}"
             return False, result
-        ws : Worksheet = bdm_wb.wb_content.active  # Get the active worksheet.
+        ws : EXCEL_TXNS_WORKSHEET_TYPE = bdm_wb.wb_content.active  # Get the active worksheet.
         if not WORKFLOW_TASK_check_sheet_columns(ws, add_columns=False):
             m = (f"Sheet '{ws.title}' cannot be mapped due to "
                     f"missing required columns.")
@@ -651,6 +653,7 @@ def validate_budget_categories(bdm_wb:BDMWorkbook,
 #endregion validate_budget_categories() function
 # ---------------------------------------------------------------------------- +
 #region WORKFLOW_TASK_invert_amount_column() function
+@cp_traced(CP_TRACE_CAT_TASK)
 def WORKFLOW_TASK_invert_amount_column(
         bdm_wb:BDMWorkbook,
         bdm_DC : BudManAppDataContext_Base) -> BUDMAN_RESULT_TYPE:
@@ -683,7 +686,7 @@ def WORKFLOW_TASK_invert_amount_column(
             success, result = bdm_DC.dc_WORKBOOK_content_get(bdm_wb)
             if not success:
                 return success, result
-        if p3u.is_not_obj_of_type("wb", bdm_wb.wb_content, Workbook):
+        if p3u.is_not_obj_of_type("wb", bdm_wb.wb_content, openpyxl.Workbook):
             m = f"Error accessing wb_content for workbook: '{bdm_wb.wb_id}'."
             logger.error(m)
             return False, m
@@ -714,8 +717,8 @@ def WORKFLOW_TASK_invert_amount_column(
             return False, m
         #
         # Access the named worksheet from the wb_content
-        ws : Worksheet = bdm_wb.wb_content[ws_name] 
-        if ws is None or not isinstance(ws, Worksheet):
+        ws : EXCEL_TXNS_WORKSHEET_TYPE = bdm_wb.wb_content[ws_name] 
+        if ws is None or not isinstance(ws, openpyxl.worksheet.worksheet.Worksheet):
             m = (f"Worksheet '{ws_name}' not found in workbook '{bdm_wb.wb_id}'.")
             logger.error(m)
             return False, m
@@ -754,9 +757,13 @@ def WORKFLOW_TASK_invert_amount_column(
             if amt_i != -1 and row[amt_i].value is not None:
                 row[amt_i].value = -row[amt_i].value
         time_taken = p3u.stop_timer(st)
+        cp_trace_current().set(**{CK_TRACE_WB_ID: bdm_wb.wb_id,
+                                  CK_TRACE_ROWS: ws.max_row - 1})
         m = (f"Task Complete: {time_taken} ")
         logger.info(m)
         del transactions 
+        # The content changed, it is saved before it can be evicted.
+        bdm_DC.dc_LOADED_WORKBOOKS.mark_dirty(bdm_wb.wb_id)
         return True, m
     except Exception as e:
         m = p3u.exc_err_msg(e)
@@ -765,6 +772,8 @@ def WORKFLOW_TASK_invert_amount_column(
 #endregion WORKFLOW_TASK_invert_amount_column() function
 # ---------------------------------------------------------------------------- +
 #region WORKFLOW_TASK_process_budget_category() function
+@cp_traced(CP_TRACE_CAT_TASK)
+@cp_timed(BDM_METRIC_CATEGORIZE_SECONDS)
 def WORKFLOW_TASK_process_budget_category(
         bdm_wb:BDMWorkbook,
         bdm_DC : BudManAppDataContext_Base,
@@ -806,7 +815,7 @@ def WORKFLOW_TASK_process_budget_category(
             m = f"Workbook '{bdm_wb.wb_id}' is not loaded, no action taken."
             logger.error(m)
             return False, m
-        if p3u.is_not_obj_of_type("wb", bdm_wb.wb_content, Workbook):
+        if p3u.is_not_obj_of_type("wb", bdm_wb.wb_content, openpyxl.Workbook):
             m = f"Error accessing wb_content for workbook: '{bdm_wb.wb_id}'."
             logger.error(m)
             return False, m
@@ -876,8 +885,8 @@ def WORKFLOW_TASK_process_budget_category(
             return False, m
         #
         # Access the named worksheet from the wb_content
-        ws : Worksheet = bdm_wb.wb_content[ws_name] 
-        if ws is None or not isinstance(ws, Worksheet):
+        ws : EXCEL_TXNS_WORKSHEET_TYPE = bdm_wb.wb_content[ws_name] 
+        if ws is None or not isinstance(ws, openpyxl.worksheet.worksheet.Worksheet):
             m = (f"Worksheet '{ws_name}' not found in workbook '{bdm_wb.wb_id}'.")
             logger.error(m)
             return False, m
@@ -905,8 +914,8 @@ def WORKFLOW_TASK_process_budget_category(
         hdr = [cell.value for cell in ws[1]] # Extract hdr col names. 
 
         # Open Other category workbook to save unmapped rows.
-        other_wb: Workbook = None
-        other_ws: Worksheet = None
+        other_wb: EXCEL_TXNS_WORKBOOK_TYPE = None
+        other_ws: EXCEL_TXNS_WORKSHEET_TYPE = None
         other_wb, other_ws = open_other_category_workbook(other_cat_path,
                                                           hdr, 
                                                           clear_content=clear_other)
@@ -933,6 +942,7 @@ def WORKFLOW_TASK_process_budget_category(
                      f"'{bud_cat}'({bud_cat_i})")
         num_rows = ws.max_row # or set a smaller limit
         other_count = 0
+        categorized_count = 0
         ch = fi_catmap.clear_category_histogram()  # Clear the category histogram.
         rules_count = fi_catmap.category_map_count()
 
@@ -960,6 +970,7 @@ def WORKFLOW_TASK_process_budget_category(
                 transaction, 
                 fi_catmap, 
                 log_all)
+            categorized_count += 1
 
             row[bud_cat_i].value = transaction.category # Capture bud_cat mapping 
             # Modify the actual row with additional values for BudMan.
@@ -986,11 +997,19 @@ def WORKFLOW_TASK_process_budget_category(
         elapsed : float = time.time() - st
         per_row = elapsed / (num_rows - 1) if num_rows > 1 else 0.0
         ch = fi_catmap.category_histogram 
+        cp_metrics.counter(BDM_METRIC_TXN_CATEGORIZED).inc(categorized_count)
+        cp_metrics.counter(BDM_METRIC_TXN_OTHER).inc(other_count)
+        cp_trace_current().set(other_count=other_count, **{
+            CK_TRACE_WB_ID: bdm_wb.wb_id,
+            CK_TRACE_ROWS: num_rows - 1,
+            CK_TRACE_RULE_COUNT: rules_count})
         m = (f"Task Complete: {time_taken} Mapped '{num_rows}' rows, to "
              f"'{len(ch)}' Categories, {per_row:6f} seconds per row, "
              f"'Other' category count: ({ch['Other']})({other_count})")
         logger.info(m)
         del transactions 
+        # The content changed, it is saved before it can be evicted.
+        bdm_DC.dc_LOADED_WORKBOOKS.mark_dirty(bdm_wb.wb_id)
         return True, m
     except Exception as e:
         m = p3u.exc_err_msg(e)
@@ -1093,7 +1112,7 @@ def WORKFLOW_TASK_categorize_transaction(
 #endregion WORKFLOW_TASK_categorize_transaction() function
 # ---------------------------------------------------------------------------- +
 #region open_other_category_workbook() function
-def open_other_category_workbook(other_wb_path: Path,hdr: List[str],clear_content:bool=True) -> Tuple[Workbook, Worksheet]:
+def open_other_category_workbook(other_wb_path: Path,hdr: List[str],clear_content:bool=True) -> Tuple[EXCEL_TXNS_WORKBOOK_TYPE, EXCEL_TXNS_WORKSHEET_TYPE]:
     """Open the 'Other' category workbook.
 
     Args:
@@ -1104,8 +1123,8 @@ def open_other_category_workbook(other_wb_path: Path,hdr: List[str],clear_conten
     """
     try:
         p3u.is_not_obj_of_type("other_wb_path", other_wb_path, Path,raise_error=True)
-        other_wb: Workbook = load_workbook(other_wb_path)
-        other_ws: Worksheet = other_wb.active
+        other_wb: EXCEL_TXNS_WORKBOOK_TYPE = openpyxl.load_workbook(other_wb_path)
+        other_ws: EXCEL_TXNS_WORKSHEET_TYPE = other_wb.active
         # Clear the other worksheet before processing.
         if clear_content:
             clear_worksheet(other_wb, BUDMAN_SHEET_NAME)
@@ -1118,7 +1137,7 @@ def open_other_category_workbook(other_wb_path: Path,hdr: List[str],clear_conten
         logger.error(p3u.exc_err_msg(e))
         raise
 
-def close_other_category_workbook(other_wb:Workbook) -> None:
+def close_other_category_workbook(other_wb:EXCEL_TXNS_WORKBOOK_TYPE) -> None:
     """Close the 'Other' category workbook.
 
     Args:
@@ -1128,7 +1147,7 @@ def close_other_category_workbook(other_wb:Workbook) -> None:
         None
     """
     try:
-        if p3u.is_not_obj_of_type("other_wb", other_wb, Workbook):
+        if p3u.is_not_obj_of_type("other_wb", other_wb, openpyxl.Workbook):
             raise TypeError(f"Expected 'other_wb' to be a Workbook, got {type(other_wb)}")
         other_wb_abs_path_str = "C:/Users/ppain/OneDrive/budget/boa/Other.excel_txns.xlsx"
         other_wb_path: Path = Path(other_wb_abs_path_str)
@@ -20,10 +20,7 @@ import importlib.util
 
 # third-party modules and packages
 import toml
-import p3logging as p3l, p3_utils as p3u
-from openpyxl import Workbook, load_workbook
-from openpyxl.worksheet.worksheet import Worksheet
-from openpyxl.cell.cell import Cell
+import p3logging as p3l, p3_utils as p3u, p3_telemetry as p3t
 from treelib import Tree
 
 # local modules and packages
@@ -32,7 +29,8 @@ import budman_namespace.design_language_namespace as bdm
 import budman_settings as bdms
 from budget_storage_model import (
     bsm_WORKBOOK_CONTENT_url_get,
-    bsm_WORKBOOK_CONTENT_url_put
+    bsm_WORKBOOK_CONTENT_url_put,
+    bsm_map_folders_concurrent
 )
 #endregion Imports
 # ---------------------------------------------------------------------------- +
@@ -274,6 +272,7 @@ class TXNCategoryMap:
     #region TXNCategoryMap methods
     # ------------------------------------------------------------------------ +
     #region    compile_category_map()
+    @p3t.cp_traced(p3t.CP_TRACE_CAT_TASK)
     def compile_category_map(self) :
         """Compile the regex patterns loaded from a CATEGORY_MAP_WORKBOOK.
 
@@ -286,6 +285,9 @@ class TXNCategoryMap:
             compiled_map = {re.compile(pattern, re.IGNORECASE): category 
                             for pattern, category in self.category_map.items()}
             self.compiled_category_map = compiled_map
+            p3t.cp_trace_current().set(
+                fi_key=self.fi_key,
+                **{p3t.CK_TRACE_RULE_COUNT: len(compiled_map)})
             return compiled_map
         except PatternError as e:
             m = f"Error compiling category map pattern: ({e.pattern})"
@@ -572,6 +574,33 @@ class TXNCategoryMap:
     # ------------------------------------------------------------------------ +
     #endregion CATEGORY_MAP_WORKBOOK methods
     # ------------------------------------------------------------------------ +
+    #region    WARM_START methods
+    # Attributes saved in a warm-start snapshot, the imported
+    # CATEGORY_MAP_WORKBOOK module itself is not.
+    WARM_START_ATTRIBUTES = (
+        "_txn_categories_workbook", "_category_collection", "_category_map",
+        "_compiled_category_map", "_check_register_map", 
+        "_category_map_fi_key", "_csv_file_has_header", 
+        "_csv_file_input_columns", "_csv_file_account_code",
+        "_csv_file_column_transformations")
+
+    def WARM_START_state(self) -> Dict[str, Any]:
+        """Return the loaded and compiled map state for a warm-start snapshot."""
+        return {name: getattr(self, name) for name in self.WARM_START_ATTRIBUTES}
+
+    @classmethod
+    def WARM_START_restore(cls, fi_key: str, settings: bdms.BudManSettings,
+                           state: Dict[str, Any]) -> "TXNCategoryMap":
+        """Return a TXNCategoryMap restored from WARM_START_state() content.
+
+        The category_map_module is None until CATEGORY_MAP_WORKBOOK_import().
+        """
+        tcm = cls(fi_key, settings)
+        for name in cls.WARM_START_ATTRIBUTES:
+            setattr(tcm, name, state[name])
+        return tcm
+    #endregion WARM_START methods
+    # ------------------------------------------------------------------------ +
 #endregion TXNCategoryMap class
 # ---------------------------------------------------------------------------- +
 
@@ -599,6 +628,8 @@ class BDMTXNCategoryManager(metaclass=BDMSingletonMeta):
         """App settings: bdms.BudManSettings object."""
         self._catalogs: Dict[str, TXNCategoryMap] = {} # bdm.DATA_OBJECT
         """Catalog: key: fi_key, value: TXNCategoryCatalogItem object."""
+        self._restored_fi_keys: set = set()
+        """FI keys with a catalog restored by a warm start, not loaded yet."""
     #endregion BDMTXNCategoryManager class __init__()
     # ------------------------------------------------------------------------ +
     #region class properties
@@ -716,6 +747,44 @@ class BDMTXNCategoryManager(metaclass=BDMSingletonMeta):
             TXNCategoryCatalogItem: The loaded transaction category catalog item
             or None if no settings for the fi_key are available.
         """
+        try:
+            txn_category_catalog = self.FI_TXN_CATEGORIES_WORKBOOK_read(fi_key)
+            if txn_category_catalog is not None:
+                # Add/replace catalog item
+                self.catalogs[fi_key] = txn_category_catalog
+            return txn_category_catalog
+        except Exception as e:
+            e.add_note(f"Error loading catalog fi_key: '{fi_key}'")
+            raise
+
+    def FI_TXN_CATEGORIES_WORKBOOK_load_all(self, fi_keys: List[str],
+                                            concurrent: bool = True) -> None:
+        """Load the Category Catalogs of fi_keys, see 
+        FI_TXN_CATEGORIES_WORKBOOK_load().
+
+        With concurrent, the workbooks of all FI's are read on a thread 
+        pool, then added to the catalogs in fi_keys order. As when loading 
+        one at a time, the first error is raised after the catalogs of the 
+        FI's before it are added.
+        """
+        if not concurrent:
+            for fi_key in fi_keys:
+                self.FI_TXN_CATEGORIES_WORKBOOK_load(fi_key)
+            return
+        results = bsm_map_folders_concurrent(
+            self.FI_TXN_CATEGORIES_WORKBOOK_read, fi_keys, 
+            return_exceptions=True)
+        for fi_key, result in zip(fi_keys, results):
+            if isinstance(result, Exception):
+                result.add_note(f"Error loading catalog fi_key: '{fi_key}'")
+                raise result
+            if result is not None:
+                self.catalogs[fi_key] = result
+
+    def FI_TXN_CATEGORIES_WORKBOOK_read(self, fi_key: str) -> TXNCategoryMap:
+        """Read the Category Catalog of an FI without adding it to the 
+        catalogs, see FI_TXN_CATEGORIES_WORKBOOK_load(). Only reads the 
+        manager state, so FI's can be read concurrently."""
         try:
             self.valid_state()  # Ensure the manager is in a valid state
             # Load the TXN_CATEGORIES_WORKBOOK file for an FI
@@ -749,14 +818,11 @@ class BDMTXNCategoryManager(metaclass=BDMSingletonMeta):
             txn_category_catalog = TXNCategoryMap(**tcc_params)
             # Load the CATEGORY_MAP_WORKBOOK from the URL.
             txn_category_catalog.CATEGORY_MAP_WORKBOOK_import()
-
-            # Add/replace catalog item
-            self.catalogs[fi_key] = txn_category_catalog
             count = txn_cat_wb_content.get(bdm.WB_CATEGORY_COUNT, 0)
             logger.debug(f"Loaded '{count}' categories for FI_KEY('{fi_key}').")
             return txn_category_catalog
         except Exception as e:
-            e.add_note(f"Error loading catalog fi_key: '{fi_key}'")
+            logger.error(p3u.exc_err_msg(e))
             raise
     #endregion FI_TXN_CATEGORIES_WORKBOOK_load()
     # ------------------------------------------------------------------------ +
@@ -984,6 +1050,50 @@ class BDMTXNCategoryManager(metaclass=BDMSingletonMeta):
             raise
     #endregion FI_CATEGORY_MAP_WORKBOOK_abs_path()
     # ------------------------------------------------------------------------ +
+    #region WARM_START methods
+    def WARM_START_state(self) -> Dict[str, Dict[str, Any]]:
+        """Return the state of the loaded catalogs for a warm-start snapshot."""
+        return {fi_key: tcm.WARM_START_state()
+                for fi_key, tcm in self.catalogs.items()}
+
+    def WARM_START_restore(self, state: Dict[str, Dict[str, Any]]) -> None:
+        """Restore the catalogs from WARM_START_state() content.
+
+        dc_initialize() loads the catalog of every FI, except an FI restored
+        here, see FI_CATALOG_restored_take().
+        """
+        try:
+            self.valid_state()
+            for fi_key, tcm_state in state.items():
+                self.catalogs[fi_key] = TXNCategoryMap.WARM_START_restore(
+                    fi_key, self.settings, tcm_state)
+            self._restored_fi_keys = set(state.keys())
+            logger.debug(f"Restored {len(state)} catalog(s) from warm start.")
+        except Exception as e:
+            logger.error(p3u.exc_err_msg(e))
+            raise
+
+    def WARM_START_sources(self) -> List[Path]:
+        """Return the source files of the loaded catalogs, for the manifest."""
+        try:
+            paths: List[Path] = []
+            for fi_key, tcm in self.catalogs.items():
+                paths.append(self.FI_TXN_CATEGORIES_WORKBOOK_abs_path(fi_key))
+                paths.append(tcm.CATEGORY_MAP_WORKBOOK_abs_path(fi_key))
+            return paths
+        except Exception as e:
+            logger.error(p3u.exc_err_msg(e))
+            raise
+
+    def FI_CATALOG_restored_take(self, fi_key: str) -> bool:
+        """True, once, if the catalog of fi_key was restored by a warm start
+        and does not need to be loaded."""
+        if fi_key in self._restored_fi_keys:
+            self._restored_fi_keys.discard(fi_key)
+            return True
+        return False
+    #endregion WARM_START methods
+    # ------------------------------------------------------------------------ +
     #region valid_state()
     def valid_state(self) -> None:
         """Raise an error if the BDMTXNCategoryManager is NOT in a valid state."""
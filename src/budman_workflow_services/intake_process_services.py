@@ -23,9 +23,6 @@ from dataclasses import dataclass
 
 # third-party modules and packages
 import p3logging as p3l, p3_utils as p3u, p3_mvvm as p3m
-from openpyxl import Workbook, load_workbook
-from openpyxl.worksheet.worksheet import Worksheet
-from openpyxl.cell.cell import Cell
 from treelib import Tree
 
 # local modules and packages
@@ -82,7 +82,57 @@ from .cp_message_service import (
     cp_user_debug_message,
     cp_user_verbose_message,
     cp_subscribe_cmd_result_message,
-    cp_publish_cmd_result
+    cp_publish_cmd_result,
+    cp_user_message_batch_callback,
+    cp_subscribe_user_message_batch
+)
+from .cp_message_batcher import (
+    CPMessageBatcher
+)
+from .async_command_processor import (
+    AsyncCommandProcessor
+)
+from .cp_script_runner import (
+    CPScriptRunner,
+    CPScriptStep,
+    cp_resource_match,
+    cp_resources_overlap
+)
+# Tracing and metrics are in p3_telemetry, re-exported here.
+from p3_telemetry import (
+    CPTracer,
+    CPTraceSpan,
+    CPNullSpan,
+    cp_tracer,
+    cp_trace_span,
+    cp_trace_current,
+    cp_traced
+)
+from .cp_profiler import (
+    CPProfiler,
+    CPProfileResult
+)
+from p3_telemetry import (
+    CPCounter,
+    CPGauge,
+    CPHistogram,
+    CPMetricsRegistry,
+    cp_metrics,
+    cp_metrics_json,
+    cp_timed
+)
+from .cp_result_cache import (
+    CPResultCache,
+    CPResultCacheEntry
+)
+from .cp_cancel_token import (
+    CPCancelToken,
+    CPCommandCancelled,
+    cp_cmd_cancel_token,
+    cp_cmd_cancel_check
+)
+from .cp_rw_lock import (
+    CPReadWriteLock
 )
 from .application_base_ABC import (
     Application_Base
@@ -101,6 +151,16 @@ from .mvvm_namespace import (
     CK_CMD_EXEC_FUNC,
     CK_CMD_ASYNC_ID,
     CK_CMD_ASYNC_RESULT_SUBSCRIBER,
+    CK_CMD_ASYNC_PRIORITY,
+    CK_CMD_CANCEL_TOKEN,
+    CK_CMD_LOCK_YIELD,
+    CV_CMD_PRIORITY_INTERACTIVE,
+    CV_CMD_PRIORITY_NORMAL,
+    CV_CMD_PRIORITY_BATCH,
+    CP_DEFAULT_WORKER_COUNT,
+    CP_SCRIPT_COMMENT_PREFIX,
+    CP_RESOURCE_ALL,
+    CP_RESOURCE_SEP,
     # Builtin CMD_OBJECT paramenter constants
     CK_PARSE_ONLY,
     CK_VALIDATE_ONLY,
@@ -111,6 +171,8 @@ from .mvvm_namespace import (
     CK_CMD_RESULT_CONTENT_TYPE,
     CK_CMD_RESULT_CONTENT,
     CK_CMD_OBJECT_VALUE,
+    CK_CMD_RESULT_QUEUE_WAIT,
+    CK_CMD_RESULT_EXEC_TIME,
     CV_CMD_STRING_OUTPUT,
     CV_CMD_ASYNC_ID,
     CV_CMD_ERROR_STRING_OUTPUT,
@@ -124,7 +186,44 @@ from .mvvm_namespace import (
     CP_DEBUG, 
     CP_VERBOSE,
     CP_CRITICAL,
-    CP_NONE
+    CP_NONE,
+    CP_USER_MSG_BATCH_TOPIC,
+    CP_MSG_BATCH_FLUSH_INTERVAL,
+    CP_MSG_BATCH_CAPACITY,
+    CV_MSG_POLICY_KEEP,
+    CV_MSG_POLICY_DROP,
+    CV_MSG_POLICY_SUMMARIZE,
+    CP_MSG_BATCH_DEFAULT_POLICIES,
+    # CPTracer Constants
+    CP_TRACE_CAT_COMMAND,
+    CP_TRACE_CAT_TASK,
+    CP_TRACE_CAT_STORAGE,
+    CP_TRACE_CAPACITY,
+    CK_TRACE_ERROR,
+    CK_TRACE_STATUS,
+    CK_TRACE_ROWS,
+    CK_TRACE_WB_ID,
+    CK_TRACE_RULE_COUNT,
+    # CPProfiler Constants
+    CP_PROFILE_TOP,
+    CV_PROFILE_SORT_CUMULATIVE,
+    CV_PROFILE_SORT_TOTTIME,
+    CV_PROFILE_SORT_NCALLS,
+    CV_PROFILE_SORT_KEYS,
+    # CPMetricsRegistry Constants
+    CP_METRICS_LATENCY_BUCKETS,
+    CP_METRICS_DUMP_INTERVAL,
+    CP_METRIC_CMD_COUNT,
+    CP_METRIC_CMD_FAILED,
+    CP_METRIC_CMD_SECONDS,
+    CP_METRIC_ASYNC_QUEUE_DEPTH,
+    CP_METRIC_ASYNC_QUEUE_WAIT,
+    CP_METRIC_MSG_QUEUE_DEPTH,
+    CP_METRIC_MSG_BATCH_DEPTH,
+    CP_METRIC_RESULT_CACHE_HITS,
+    CP_METRIC_RESULT_CACHE_MISSES,
+    # CPResultCache Constants
+    CP_RESULT_CACHE_CAPACITY
 )
 # target for 'from budman_app import *'
 __all__ = [
@@ -146,6 +245,11 @@ __all__ = [
     "CommandProcessor_Base",
     "CommandProcessor",
     "CMDValidationException",
+    "AsyncCommandProcessor",
+    "CPScriptRunner",
+    "CPScriptStep",
+    "cp_resource_match",
+    "cp_resources_overlap",
     "CMD_OBJECT_TYPE",
     "CMD_RESULT_TYPE",
     "CMD_ARGS_TYPE",
@@ -159,6 +263,16 @@ __all__ = [
     "CK_CMD_EXEC_FUNC",
     "CK_CMD_ASYNC_ID",
     "CK_CMD_ASYNC_RESULT_SUBSCRIBER",
+    "CK_CMD_ASYNC_PRIORITY",
+    "CK_CMD_CANCEL_TOKEN",
+    "CK_CMD_LOCK_YIELD",
+    "CV_CMD_PRIORITY_INTERACTIVE",
+    "CV_CMD_PRIORITY_NORMAL",
+    "CV_CMD_PRIORITY_BATCH",
+    "CP_DEFAULT_WORKER_COUNT",
+    "CP_SCRIPT_COMMENT_PREFIX",
+    "CP_RESOURCE_ALL",
+    "CP_RESOURCE_SEP",
     #     Builtin CMD_OBJECT paramenter constants
     "CK_PARSE_ONLY",
     "CK_VALIDATE_ONLY",
@@ -168,6 +282,8 @@ __all__ = [
     "CK_CMD_RESULT_STATUS",
     "CK_CMD_RESULT_CONTENT_TYPE",
     "CK_CMD_RESULT_CONTENT",
+    "CK_CMD_RESULT_QUEUE_WAIT",
+    "CK_CMD_RESULT_EXEC_TIME",
     "cp_CMD_OBJECT_create",
     "CV_CMD_STRING_OUTPUT",
     "CV_CMD_ASYNC_ID",
@@ -184,6 +300,13 @@ __all__ = [
     "cp_CMD_RESULT_ERROR_create",
     "cp_CMD_RESULT_EXCEPTION_create",
     "cp_CMD_RESULT_ERROR_unknown",
+    # Async command cancellation
+    "CPCancelToken",
+    "CPCommandCancelled",
+    "cp_cmd_cancel_token",
+    "cp_cmd_cancel_check",
+    # Model lock, read only cmds share it, other cmds hold it alone
+    "CPReadWriteLock",
     # CPMessageService Constants
     "CP_USER_MSG_TOPIC",
     "CP_CMD_RESULT_TOPIC",
@@ -194,7 +317,15 @@ __all__ = [
     "CP_DEBUG",
     "CP_VERBOSE",
     "CP_CRITICAL",
+    "CP_USER_MSG_BATCH_TOPIC",
+    "CP_MSG_BATCH_FLUSH_INTERVAL",
+    "CP_MSG_BATCH_CAPACITY",
+    "CV_MSG_POLICY_KEEP",
+    "CV_MSG_POLICY_DROP",
+    "CV_MSG_POLICY_SUMMARIZE",
+    "CP_MSG_BATCH_DEFAULT_POLICIES",
     "CPMessageService",
+    "CPMessageBatcher",
     "CPUserOutputMessage",
     "cp_user_message_callback",
     "cp_cmd_result_message_callback",
@@ -209,6 +340,56 @@ __all__ = [
     "cp_user_verbose_message",
     "cp_subscribe_cmd_result_message",
     "cp_publish_cmd_result",
+    "cp_user_message_batch_callback",
+    "cp_subscribe_user_message_batch",
+    # CPTracer
+    "CPTracer",
+    "CPTraceSpan",
+    "CPNullSpan",
+    "cp_tracer",
+    "cp_trace_span",
+    "cp_trace_current",
+    "cp_traced",
+    "CP_TRACE_CAT_COMMAND",
+    "CP_TRACE_CAT_TASK",
+    "CP_TRACE_CAT_STORAGE",
+    "CP_TRACE_CAPACITY",
+    "CK_TRACE_ERROR",
+    "CK_TRACE_STATUS",
+    "CK_TRACE_ROWS",
+    "CK_TRACE_WB_ID",
+    "CK_TRACE_RULE_COUNT",
+    # CPProfiler
+    "CPProfiler",
+    "CPProfileResult",
+    "CP_PROFILE_TOP",
+    "CV_PROFILE_SORT_CUMULATIVE",
+    "CV_PROFILE_SORT_TOTTIME",
+    "CV_PROFILE_SORT_NCALLS",
+    "CV_PROFILE_SORT_KEYS",
+    # CPMetricsRegistry
+    "CPCounter",
+    "CPGauge",
+    "CPHistogram",
+    "CPMetricsRegistry",
+    "cp_metrics",
+    "cp_metrics_json",
+    "cp_timed",
+    "CP_METRICS_LATENCY_BUCKETS",
+    "CP_METRICS_DUMP_INTERVAL",
+    "CP_METRIC_CMD_COUNT",
+    "CP_METRIC_CMD_FAILED",
+    "CP_METRIC_CMD_SECONDS",
+    "CP_METRIC_ASYNC_QUEUE_DEPTH",
+    "CP_METRIC_ASYNC_QUEUE_WAIT",
+    "CP_METRIC_MSG_QUEUE_DEPTH",
+    "CP_METRIC_MSG_BATCH_DEPTH",
+    "CP_METRIC_RESULT_CACHE_HITS",
+    "CP_METRIC_RESULT_CACHE_MISSES",
+    # CPResultCache
+    "CPResultCache",
+    "CPResultCacheEntry",
+    "CP_RESULT_CACHE_CAPACITY",
     # Application_Base
     "Application_Base"
 ]
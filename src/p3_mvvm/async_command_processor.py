@@ -0,0 +1,312 @@
+# ---------------------------------------------------------------------------- +
+#region async_command_processor.py module
+""" AsyncCommandProcessor class, a CommandProcessor on an asyncio event loop.
+
+    The CommandProcessor runs async commands on worker threads and leaves
+    their results in a queue.Queue, which the main thread has to poll with
+    cp_process_async_cmd_results(). The AsyncCommandProcessor runs them on
+    the event loop of the application instead:
+
+    - cp_execute_cmd_aio() returns an awaitable CMD_RESULT. A Command with a
+      coroutine cmd_exec_func is awaited on the loop, and awaits
+      cp_run_blocking() for its blocking stages, such as openpyxl load and
+      save or CSV I/O. Any other command is run by cp_execute_cmd() in the
+      executor, so it does not block the loop.
+    - cp_execute_cmd_async() queues a command, from any thread, on an
+      asyncio.PriorityQueue served by worker tasks. Results are passed
+      through an asyncio.Queue to a dispatcher task which calls, or awaits,
+      the subscriber as soon as each result is ready. There is no polling.
+    - Priorities, CPCancelTokens and the result latency attributes are the
+      same as for the CommandProcessor.
+    - Each cmd holds the cp_model_lock like in cp_execute_cmd(), to read for
+      a read only or shared write cmd, else to write. The lock belongs to a
+      thread, so a coroutine cmd has it held for it, from start to end, by a
+      thread of the lock executor. Its blocking stages, in other threads, 
+      must not execute cmds themselves.
+
+    Several commands, or the blocking stages of one command, overlap their
+    I/O, e.g. cp_map_blocking() loading several workbooks at once, or the
+    budget_storage_model bsm_BDMWorkbook_load_aio() and 
+    bsm_BDMWorkbook_save_aio() awaiting cp_run_blocking().
+
+    Usage:
+        cp = AsyncCommandProcessor(worker_count=4).cp_initialize()
+        await cp.cp_start()
+        cp.cp_execute_cmd_async(cmd, subscriber)
+        ...
+        await cp.cp_stop()
+"""
+#endregion async_command_processor.py module
+# ---------------------------------------------------------------------------- +
+#region Imports
+# python standard library modules and packages
+import logging, asyncio, contextlib, functools, inspect, threading, time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Any, AsyncIterator, Callable, Optional, Iterable, Tuple
+# third-party modules and packages
+import p3_utils as p3u
+from p3_telemetry import cp_metrics
+# local modules and packages
+from .mvvm_namespace import *
+from .cp_message_service import *
+from .command_class import Command
+from .command_processor import (CommandProcessor, cp_CMD_RESULT_EXCEPTION_create)
+#endregion Imports
+# ---------------------------------------------------------------------------- +
+#region Globals
+logger = logging.getLogger(__name__)
+#endregion Globals
+# ---------------------------------------------------------------------------- +
+#region    AsyncCommandProcessor class
+class AsyncCommandProcessor(CommandProcessor):
+    """CommandProcessor running async commands on an asyncio event loop."""
+    # ------------------------------------------------------------------------ +
+    #region    __init__() constructor method
+    def __init__(self, view: View_Base|None = None,
+                 worker_count: int = CP_DEFAULT_WORKER_COUNT) -> None:
+        super().__init__(view)
+        if worker_count < 1:
+            raise ValueError(f"worker_count must be >= 1: {worker_count}")
+        self._worker_count: int = worker_count
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock_executor: Optional[ThreadPoolExecutor] = None
+        self._aio_cmd_queue: Optional[asyncio.PriorityQueue] = None
+        self._aio_result_queue: Optional[asyncio.Queue] = None
+        self._aio_worker_tasks: List[asyncio.Task] = []
+        self._aio_dispatch_task: Optional[asyncio.Task] = None
+    #endregion __init__() constructor method
+    # ------------------------------------------------------------------------ +
+    #region    AsyncCommandProcessor Properties
+    @property
+    def cp_loop(self) -> Optional[asyncio.AbstractEventLoop]:
+        """Return the event loop of cp_start(), None if not started."""
+        return self._loop
+
+    @property
+    def cp_is_started(self) -> bool:
+        """Return True between cp_start() and cp_stop()."""
+        return self._loop is not None
+    #endregion AsyncCommandProcessor Properties
+    # ------------------------------------------------------------------------ +
+    #region    cp_start() and cp_stop() methods
+    async def cp_start(self) -> "AsyncCommandProcessor":
+        """Start the worker and dispatcher tasks on the running event loop."""
+        try:
+            if self._loop is not None:
+                return self
+            self._loop = asyncio.get_running_loop()
+            # worker_count bounds the concurrent cmds, the executor is sized
+            # for the blocking stages they overlap.
+            self._executor = ThreadPoolExecutor(
+                thread_name_prefix="AsyncCommandProcessor")
+            # Threads waiting for the cp_model_lock stay out of the executor,
+            # the blocking stages of the cmd holding it must not wait on them.
+            self._lock_executor = ThreadPoolExecutor(
+                max_workers=self._worker_count,
+                thread_name_prefix="AsyncCommandProcessorLock")
+            self._aio_cmd_queue = asyncio.PriorityQueue()
+            self._aio_result_queue = asyncio.Queue()
+            cp_metrics.gauge(CP_METRIC_ASYNC_QUEUE_DEPTH,
+                             func=self._aio_cmd_queue.qsize)
+            self._aio_worker_tasks = [
+                asyncio.create_task(self._cp_aio_worker(),
+                                    name=f"AsyncCommandProcessorWorker-{i}")
+                for i in range(self._worker_count)]
+            self._aio_dispatch_task = asyncio.create_task(
+                self._cp_aio_dispatch(), name="AsyncCommandProcessorDispatch")
+            cp_user_verbose_message(f"AsyncCommandProcessor started "
+                                    f"{self._worker_count} workers.")
+            return self
+        except Exception as e:
+            cp_user_error_message(p3u.exc_err_msg(e))
+            raise
+
+    async def cp_stop(self) -> None:
+        """Run the queued cmds, dispatch their results, then stop."""
+        try:
+            if self._loop is None:
+                return
+            for _ in self._aio_worker_tasks:
+                # sentinel to stop a worker, after all priorities and after
+                # the cmds put by other threads before.
+                self._cp_async_cmd_put(
+                    (float("inf"), next(self._async_cmd_seq), 0.0, None))
+            await asyncio.gather(*self._aio_worker_tasks)
+            await self._aio_result_queue.put(None)
+            await self._aio_dispatch_task
+            self._executor.shutdown(wait=True)
+            self._lock_executor.shutdown(wait=True)
+            self._loop = None
+            self._executor = None
+            self._lock_executor = None
+            self._aio_worker_tasks = []
+            self._aio_dispatch_task = None
+            cp_user_verbose_message("AsyncCommandProcessor stopped.")
+        except Exception as e:
+            cp_user_error_message(p3u.exc_err_msg(e))
+            raise
+    #endregion cp_start() and cp_stop() methods
+    # ------------------------------------------------------------------------ +
+    #region    cp_run_blocking() and cp_map_blocking() methods
+    async def cp_run_blocking(self, func: Callable, *args, **kwargs) -> Any:
+        """Await func(*args, **kwargs) run in the executor, for blocking I/O
+        such as openpyxl load and save or CSV reads and writes."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(func, *args, **kwargs))
+
+    async def cp_map_blocking(self, func: Callable, items: Iterable[Any]) -> List[Any]:
+        """Await func(item) for each item, run concurrently in the executor,
+        results in items order. The first exception is raised."""
+        return await asyncio.gather(*(self.cp_run_blocking(func, item)
+                                      for item in items))
+    #endregion cp_run_blocking() and cp_map_blocking() methods
+    # ------------------------------------------------------------------------ +
+    #region    cp_execute_cmd_aio() method
+    async def cp_execute_cmd_aio(self, cmd : CMD_OBJECT_TYPE | Command = None,
+                                 raise_error : bool = False) -> CMD_RESULT_TYPE:
+        """Await the execution of a command.
+
+        A Command with a coroutine cmd_exec_func is awaited on the event
+        loop, holding the cp_model_lock, and bumps the model version unless
+        read only. Any other command is executed by cp_execute_cmd() in the
+        lock executor.
+
+        Arguments:
+            cmd (Dict|Command): The command to execute along with any arguments.
+            raise_error (bool): If True, raise any errors encountered.
+
+        Returns:
+            CMD_RESULT_TYPE: The outcome of the command execution.
+        """
+        exec_func = cmd.cmd_exec_func if isinstance(cmd, Command) else None
+        if (not inspect.iscoroutinefunction(exec_func) or
+            cmd.cmd_parms.get(CK_PARSE_ONLY, False)):
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._lock_executor,
+                functools.partial(self.cp_execute_cmd, cmd, raise_error))
+        try:
+            st = p3u.start_timer()
+            async with self._cp_aio_cmd_lock(cmd):
+                try:
+                    cmd_result: CMD_RESULT_TYPE = await exec_func(cmd, self.DC, self)
+                finally:
+                    if not self.cp_cmd_read_only(cmd):
+                        self.cp_model_version_bump()
+            cp_publish_cmd_result(cmd_result)
+            cp_user_info_message(
+                f"Complete: [{p3u.stop_timer(st)}] "
+                f"status: {(cmd_result[CK_CMD_RESULT_STATUS])}")
+            return cmd_result
+        except Exception as e:
+            cmd_result = cp_CMD_RESULT_EXCEPTION_create(cmd, e)
+            if raise_error:
+                raise RuntimeError(cmd_result[CK_CMD_RESULT_CONTENT]) from e
+            return cmd_result
+
+    @contextlib.asynccontextmanager
+    async def _cp_aio_cmd_lock(self, cmd: Command) -> AsyncIterator[None]:
+        """Hold the cp_model_lock for a coroutine cmd, in a thread of the
+        lock executor, to read for a read only or shared write cmd, to write
+        for any other. The event loop is not blocked while waiting for it."""
+        if self.cp_cmd_unlocked(cmd):
+            yield
+            return
+        loop = asyncio.get_running_loop()
+        held: asyncio.Future = loop.create_future()
+        release = threading.Event()
+        lock = self.cp_model_lock
+        shared = self.cp_cmd_read_only(cmd) or self.cp_cmd_shared_write(cmd)
+        def _held() -> None:
+            if not held.done():
+                held.set_result(None)
+        def _hold() -> None:
+            with (lock.read() if shared else lock.write()):
+                loop.call_soon_threadsafe(_held)
+                release.wait()
+        holder = loop.run_in_executor(self._lock_executor, _hold)
+        try:
+            await held
+            yield
+        finally:
+            release.set()
+            await holder
+
+    async def cp_execute_cmds_aio(self, cmds: Iterable[CMD_OBJECT_TYPE | Command]
+                                  ) -> List[CMD_RESULT_TYPE]:
+        """Await the concurrent execution of cmds, results in cmds order."""
+        return await asyncio.gather(*(self.cp_execute_cmd_aio(cmd) for cmd in cmds))
+    #endregion cp_execute_cmd_aio() method
+    # ------------------------------------------------------------------------ +
+    #region    CommandProcessor async cmd overrides
+    def cp_initialize_worker_thread(self,
+                                    worker_count: int = CP_DEFAULT_WORKER_COUNT):
+        """Override: The worker tasks are started by cp_start()."""
+        cp_user_verbose_message("AsyncCommandProcessor uses cp_start(), "
+                                "not worker threads.")
+
+    def _cp_async_cmd_put(self, item: Tuple[float, int, float, Any],
+                          read_only: bool = False) -> None:
+        """Override: Queue an async cmd item for the worker tasks, from any
+        thread, without waiting. Read only or not, the cmds share the worker
+        tasks, the cp_model_lock orders them."""
+        if self._loop is None:
+            raise RuntimeError("AsyncCommandProcessor is not started, await cp_start().")
+        try:
+            on_loop = asyncio.get_running_loop() is self._loop
+        except RuntimeError:
+            on_loop = False
+        if on_loop:
+            self._aio_cmd_queue.put_nowait(item)
+        else:
+            self._loop.call_soon_threadsafe(self._aio_cmd_queue.put_nowait, item)
+    #endregion CommandProcessor async cmd overrides
+    # ------------------------------------------------------------------------ +
+    #region    _cp_aio_worker() and _cp_aio_dispatch() methods
+    async def _cp_aio_worker(self) -> None:
+        """Worker task executing queued async cmds."""
+        while True:
+            _, _, queued, cmd = await self._aio_cmd_queue.get()
+            try:
+                if cmd is None:  # sentinel to stop the worker
+                    break
+                st = time.perf_counter()
+                async_id, async_cmd_result = self._cp_async_cmd_start(cmd)
+                if async_id is None:
+                    continue
+                if async_cmd_result is None:
+                    logger.debug(f"Worker task executing async cmd '{async_id}'...")
+                    async_cmd_result = await self.cp_execute_cmd_aio(cmd)
+                self._cp_async_cmd_complete(async_id, async_cmd_result, queued, st)
+                await self._aio_result_queue.put(async_cmd_result)
+            except Exception as e:
+                cp_user_error_message(p3u.exc_err_msg(e))
+            finally:
+                self._aio_cmd_queue.task_done()
+
+    async def _cp_aio_dispatch(self) -> None:
+        """Dispatcher task passing async cmd results to their subscribers."""
+        while True:
+            cmd_result: CMD_RESULT_TYPE = await self._aio_result_queue.get()
+            try:
+                if cmd_result is None:  # sentinel to stop the dispatcher
+                    break
+                cmd = cmd_result.get(CK_CMD_OBJECT_VALUE, None)
+                async_subscriber: Callable = self._cp_async_cmd_attr(
+                    cmd, CK_CMD_ASYNC_RESULT_SUBSCRIBER)
+                if async_subscriber is None:
+                    logger.error(f"Invalid async cmd result: {str(cmd_result)}")
+                    continue
+                r = async_subscriber(cmd_result)
+                if inspect.isawaitable(r):
+                    await r
+            except Exception as e:
+                cp_user_error_message(p3u.exc_err_msg(e))
+            finally:
+                self._aio_result_queue.task_done()
+    #endregion _cp_aio_worker() and _cp_aio_dispatch() methods
+    # ------------------------------------------------------------------------ +
+#endregion AsyncCommandProcessor class
+# ---------------------------------------------------------------------------- +
@@ -79,7 +79,6 @@
 import logging, threading, queue, uuid, time
 from typing import List, Type, Union, Dict, Tuple, Any, Callable, Optional
 # third-party modules and packages
-from git import cmd
 import p3_utils as p3u 
 import p3logging as p3l
 # local modules and packages
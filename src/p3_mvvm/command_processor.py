@@ -82,8 +82,9 @@
 # ---------------------------------------------------------------------------- +
 #region Imports
 # python standard library modules and packages
-import logging, threading, queue, uuid, time
-from typing import List, Type, Union, Dict, Tuple, Any, Callable, Optional
+import logging, threading, queue, uuid, time, itertools, contextlib
+from typing import (List, Type, Union, Dict, Tuple, Any, Callable, Optional,
+                    ContextManager, Iterator)
 # third-party modules and packages
 from h11 import Data
 import cmd2, argparse
@@ -99,6 +100,11 @@ from .command_processor_Base_ABC import CommandProcessor_Base
 from .cp_message_service import *
 from .data_context_binding import DataContext_Binding
 from .command_class import Command
+from .cp_cancel_token import CPCancelToken
+from .cp_rw_lock import CPReadWriteLock
+from p3_telemetry import cp_tracer, cp_trace_span
+from p3_telemetry import cp_metrics
+from .cp_result_cache import CPResultCache, CPResultCacheEntry
 #endregion Imports
 # ---------------------------------------------------------------------------- +
 #region Globals
@@ -132,11 +138,25 @@ class CommandProcessor(CommandProcessor_Base, DataContext_Binding):
         # View may be provided at construction or later bound through the view property.
         self._view : View_Base|None = view
         self._cp_message_service: CPMessageService = CPMessageService(view=view)
-        # Cmd Asyn attributes
-        self._worker_thread : Optional[threading.Thread] = None
-        self._async_cmd_queue: queue.Queue | None = None
+        # Cmd Async attributes, queue items are 
+        # (priority, seq, queued perf_counter, cmd), cmd None to stop a worker.
+        # Read only cmds are run by the worker threads from the cmd queue,
+        # any other cmd by the one writer thread from the write queue.
+        self._worker_threads : List[threading.Thread] = []
+        self._writer_thread : threading.Thread | None = None
+        self._async_cmd_queue: queue.PriorityQueue | None = None
+        self._async_write_queue: queue.PriorityQueue | None = None
+        self._async_cmd_seq = itertools.count()
         self._async_cmd_result_queue: queue.Queue | None = None
         self._async_cmd_result_registry: Dict[str, CMD_RESULT_TYPE] = {}
+        self._async_cmd_cancel_tokens: Dict[str, CPCancelToken] = {}
+        # Held by each cmd, to read for a read only cmd, else to write.
+        self._cp_model_lock: CPReadWriteLock = CPReadWriteLock()
+        # Read cmd result cache, valid for one model version. Shared write
+        # cmds run in parallel, and bump the version under its own lock.
+        self._cp_model_version: int = 0
+        self._cp_model_version_lock: threading.Lock = threading.Lock()
+        self._cp_result_cache: CPResultCache = CPResultCache()
     #endregion __init__() constructor method
     # ------------------------------------------------------------------------ +
     #endregion CommandProcessor class instrisics - override for app-specific
@@ -212,18 +232,34 @@ class CommandProcessor(CommandProcessor_Base, DataContext_Binding):
 
     @property
     def cp_worker_thread(self) -> Optional[threading.Thread]:
-        """Return the command processor worker thread."""
-        return self._worker_thread
+        """Return the first command processor worker thread."""
+        return self._worker_threads[0] if self._worker_threads else None
+    
+    @property
+    def cp_worker_threads(self) -> List[threading.Thread]:
+        """Return the command processor worker threads, and writer thread."""
+        writer = [self._writer_thread] if self._writer_thread else []
+        return self._worker_threads + writer
     
     @property
     def cp_is_worker_thread_running(self) -> bool:
-        """Return True if the worker thread is running."""
-        return self._worker_thread.is_alive() if self._worker_thread else False
+        """Return True if any worker thread is running."""
+        return any(t.is_alive() for t in self.cp_worker_threads)
 
     @property
-    def cp_async_cmd_queue(self) -> Optional[queue.Queue]:
-        """Return the command processor async command queue."""
+    def cp_async_cmd_queue(self) -> Optional[queue.PriorityQueue]:
+        """Return the command processor async read only command queue."""
         return self._async_cmd_queue
+
+    @property
+    def cp_async_write_queue(self) -> Optional[queue.PriorityQueue]:
+        """Return the command processor async write command queue."""
+        return self._async_write_queue
+
+    @property
+    def cp_model_lock(self) -> CPReadWriteLock:
+        """Return the lock held by each cmd, to read or write the model."""
+        return self._cp_model_lock
     
     @property
     def cp_async_cmd_result_queue(self) -> Optional[queue.Queue]:
@@ -280,58 +316,99 @@ class CommandProcessor(CommandProcessor_Base, DataContext_Binding):
     #endregion cp_initialize_cmd_map() method
     # ------------------------------------------------------------------------ +
     #region    cp_initialize_worker_thread() method
-    def cp_initialize_worker_thread(self):
-        """Initialize the command processor worker thread."""
+    def cp_initialize_worker_thread(self, 
+                                    worker_count: int = CP_DEFAULT_WORKER_COUNT):
+        """Initialize the command processor worker threads.
+
+        Async cmds changing the model run one at a time, in queue order, in
+        the writer thread. Read only cmds, cp_cmd_read_only(), run in the
+        worker threads, in parallel with each other.
+        
+        Arguments:
+            worker_count (int): The number of worker threads running read
+                only async commands, so a long command does not block the
+                others.
+        """
         try:
+            if worker_count < 1:
+                raise ValueError(f"worker_count must be >= 1: {worker_count}")
             if self._async_cmd_queue is None:
-                self._async_cmd_queue = queue.Queue()
+                self._async_cmd_queue = queue.PriorityQueue()
+                self._async_write_queue = queue.PriorityQueue()
+                cp_metrics.gauge(CP_METRIC_ASYNC_QUEUE_DEPTH,
+                                 func=lambda: (self._async_cmd_queue.qsize() +
+                                               self._async_write_queue.qsize()))
             if self._async_cmd_result_queue is None:
                 self._async_cmd_result_queue = queue.Queue()
-            if self._worker_thread is None or not self._worker_thread.is_alive():
-                self._worker_thread = threading.Thread(
+            self._worker_threads = [t for t in self._worker_threads if t.is_alive()]
+            for i in range(len(self._worker_threads), worker_count):
+                worker_thread = threading.Thread(
                     target=self._worker_thread_func,
-                    name="CommandProcessorWorkerThread",
+                    args=(self._async_cmd_queue,),
+                    name=f"CommandProcessorWorkerThread-{i}",
                     daemon=True)
-                self._worker_thread.start()
-                cp_user_verbose_message("CommandProcessor worker thread started.")
+                self._worker_threads.append(worker_thread)
+                worker_thread.start()
+                cp_user_verbose_message(f"CommandProcessor worker thread "
+                                        f"'{worker_thread.name}' started.")
+            if self._writer_thread is None or not self._writer_thread.is_alive():
+                self._writer_thread = threading.Thread(
+                    target=self._worker_thread_func,
+                    args=(self._async_write_queue,),
+                    name="CommandProcessorWriterThread",
+                    daemon=True)
+                self._writer_thread.start()
+                cp_user_verbose_message(f"CommandProcessor writer thread "
+                                        f"'{self._writer_thread.name}' started.")
         except Exception as e:
             cp_user_error_message(p3u.exc_err_msg(e))
             raise
     #endregion cp_initialize_worker_thread() method
     # ------------------------------------------------------------------------ +
     #region    _worker_thread_func() method
-    def _worker_thread_func(self):
-        """Worker thread function for processing async commands."""
+    def _worker_thread_func(self, cmd_queue: queue.PriorityQueue):
+        """Worker thread function for processing the async commands of
+        cmd_queue."""
         try:
             logger.debug("Worker thread start.")
-            # Validate in the worker thread
-            caller_tid: int = threading.get_ident()
-            worker_tid: int = self.cp_worker_thread.ident
-            if caller_tid != worker_tid:
-                logger.error("_worker_thread() must be called from the worker thread.")
+            # Validate in a worker thread
+            if threading.current_thread() not in self.cp_worker_threads:
+                logger.error("_worker_thread() must be called from a worker thread.")
                 return
             while True:
                 # Blocks until a message is available
                 logger.debug("Worker thread waiting for async cmd...")
-                cmd = self._async_cmd_queue.get()
+                _, _, queued, cmd = cmd_queue.get()
                 if cmd is None:  # sentinel to stop the thread
                     logger.debug("Break worker thread event loop.")
+                    cmd_queue.task_done()
                     break
-                # Validate the async cmd object
-                if (cmd[CK_CMD_ASYNC_ID] is None or
-                    cmd[CK_CMD_ASYNC_ID] not in self.cp_async_cmd_result_registry):
-                    logger.error(f"Invalid async cmd object: {str(cmd)}")
-                    self._async_cmd_queue.task_done()
-                    return
-                # Execuite the cmd in the worker thread, collect the result.
-                logger.debug(f"Worker thread executing async cmd '{cmd[CK_CMD_ASYNC_ID]}'...")
-                async_cmd_result: CMD_RESULT_TYPE = self.cp_execute_cmd(cmd)
-                self.cp_async_cmd_result_registry[cmd[CK_CMD_ASYNC_ID]] = async_cmd_result
-                # Place the async_cmd_result in the async_cmd_result_queue for
-                # subsequent retrieval and invocation of the subscriber function.
-                self.cp_async_cmd_result_queue.put(async_cmd_result)
-                self._async_cmd_queue.task_done()
-                logger.debug(f"Worker thread queued async cmd result'{cmd[CK_CMD_ASYNC_ID]}'...")
+                async_id: str | None = None
+                try:
+                    st = time.perf_counter()
+                    try:
+                        async_id, async_cmd_result = self._cp_async_cmd_start(cmd)
+                        if async_id is None:
+                            continue
+                        if async_cmd_result is None:
+                            # Execute the cmd in the worker thread, collect the result.
+                            logger.debug(f"Worker thread executing async cmd '{async_id}'...")
+                            async_cmd_result = self.cp_execute_cmd(cmd)
+                    except Exception as e:
+                        # Record the error as the cmd result, the worker goes on.
+                        logger.error(f"Async cmd '{async_id}': {p3u.exc_err_msg(e)}")
+                        if async_id is None:
+                            continue
+                        async_cmd_result = cp_CMD_RESULT_EXCEPTION_create(cmd, e)
+                    self._cp_async_cmd_complete(async_id, async_cmd_result, queued, st)
+                    # Place the async_cmd_result in the async_cmd_result_queue for
+                    # subsequent retrieval and invocation of the subscriber function.
+                    self.cp_async_cmd_result_queue.put(async_cmd_result)
+                    logger.debug(f"Worker thread queued async cmd result '{async_id}'...")
+                except Exception as e:
+                    logger.error(f"Async cmd '{async_id}': {p3u.exc_err_msg(e)}")
+                finally:
+                    cmd_queue.task_done()
             cp_user_verbose_message("Worker thread stop.")
         except Exception as e:
             cp_user_error_message(p3u.exc_err_msg(e))
@@ -340,27 +417,121 @@ class CommandProcessor(CommandProcessor_Base, DataContext_Binding):
     # ------------------------------------------------------------------------ +
     #region    cp_cancel_worker_thread() method
     def cp_cancel_worker_thread(self):
-        """Worker thread function for processing commands."""
+        """Stop the worker threads after the async cmds queued before."""
         try:
-            cp_user_verbose_message("Cancel CommandProcessor Worker thread.")
-            self.cp_async_cmd_queue.put(None)  # sentinel to stop the thread
+            cp_user_verbose_message("Cancel CommandProcessor Worker threads.")
+            for _ in self._worker_threads:
+                # sentinel to stop a thread, after all priorities.
+                self.cp_async_cmd_queue.put(
+                    (float("inf"), next(self._async_cmd_seq), 0.0, None))
+            if self._writer_thread is not None:
+                self.cp_async_write_queue.put(
+                    (float("inf"), next(self._async_cmd_seq), 0.0, None))
             cp_user_verbose_message("Requested worker thread stop.")
         except Exception as e:
             cp_user_error_message(p3u.exc_err_msg(e))
             raise
     #endregion cp_cancel_worker_thread() method
     # ------------------------------------------------------------------------ +
+    #region    cp_async_cmd_join() method
+    def cp_async_cmd_join(self) -> None:
+        """Wait until the async cmds queued, read only and write, are done."""
+        for cmd_queue in (self._async_write_queue, self._async_cmd_queue):
+            if cmd_queue is not None:
+                cmd_queue.join()
+    #endregion cp_async_cmd_join() method
+    # ------------------------------------------------------------------------ +
+    #region    cp_cancel_async_cmd() method
+    def cp_cancel_async_cmd(self, async_id: str) -> bool:
+        """Request cancellation of the async cmd for async_id.
+
+        A queued cmd is not executed. A running cmd stops where it calls
+        cp_cmd_cancel_check(). Returns False if async_id is not pending.
+        """
+        token = self._async_cmd_cancel_tokens.get(async_id)
+        if token is None:
+            return False
+        token.cancel()
+        cp_user_info_message(f"Async CMD '{async_id}' cancel requested.")
+        return True
+    #endregion cp_cancel_async_cmd() method
+    # ------------------------------------------------------------------------ +
+    #region    cp_async_cmd_priority() method
+    def cp_async_cmd_priority(self, cmd: CMD_OBJECT_TYPE | Command) -> int:
+        """Return the queue priority of an async cmd, lower runs first.
+        
+        Uses the CK_CMD_ASYNC_PRIORITY attribute of cmd, if present, else
+        CV_CMD_PRIORITY_NORMAL. Override for app-specific priorities.
+        """
+        priority = self._cp_async_cmd_attr(cmd, CK_CMD_ASYNC_PRIORITY)
+        return CV_CMD_PRIORITY_NORMAL if priority is None else priority
+    #endregion cp_async_cmd_priority() method
+    # ------------------------------------------------------------------------ +
+    #region    Read cmd result cache methods
+    @property
+    def cp_model_version(self) -> int:
+        """Return the model version, bumped by each cmd not cacheable."""
+        return self._cp_model_version
+
+    @property
+    def cp_result_cache(self) -> CPResultCache:
+        """Return the cache of read cmd results."""
+        return self._cp_result_cache
+
+    def cp_model_version_bump(self) -> int:
+        """Bump the model version, discarding the cached cmd results. Call
+        this when the model changes other than by a cmd."""
+        with self._cp_model_version_lock:
+            self._cp_model_version += 1
+            self._cp_result_cache.clear()
+            return self._cp_model_version
+
+    def cp_cmd_read_only(self, cmd: CMD_OBJECT_TYPE | Command) -> bool:
+        """Return True if cmd does not change the model. A read only cmd
+        holds the cp_model_lock to read, runs in parallel with other read
+        only cmds and does not bump the model version. By default, only a
+        cacheable cmd, override to name other app-specific read only cmds."""
+        return self.cp_cmd_cacheable(cmd)
+
+    def cp_cmd_shared_write(self, cmd: CMD_OBJECT_TYPE | Command) -> bool:
+        """Return True if cmd changes only state guarded by its own locks,
+        e.g. the content of one workbook. A shared write cmd holds the
+        cp_model_lock to read, runs in parallel with read only and other
+        shared write cmds, and bumps the model version like any cmd not read
+        only. None by default."""
+        return False
+
+    def cp_cmd_unlocked(self, cmd: CMD_OBJECT_TYPE | Command) -> bool:
+        """Return True if cmd holds no cp_model_lock, e.g. a cmd running a
+        GUI session, whose cmds each hold the lock. None by default."""
+        return False
+
+    def cp_cmd_cacheable(self, cmd: CMD_OBJECT_TYPE | Command) -> bool:
+        """Return True if cmd is a pure read of the model, its result can be
+        cached until the model version changes. No cmd is cacheable by
+        default, override to name the app-specific read cmds."""
+        return False
+
+    def cp_cache_version(self) -> Any:
+        """Return the version the cached cmd results are valid for, by
+        default the cp_model_version. Override to include versions of
+        changes made outside of cmds."""
+        return self._cp_model_version
+    #endregion Read cmd result cache methods
+    # ------------------------------------------------------------------------ +
     #region    cp_execute_cmd_async() method
     def cp_execute_cmd_async(self, 
                              cmd : CMD_OBJECT_TYPE = None,
                              async_result_subscriber: Callable = None,
                              raise_error : bool = False) -> CMD_RESULT_TYPE:
-        """Client requests to execute a command within the command processor 
+        """Client requests to execute a command within a command processor 
         worker thread.
 
         Validate the async_subscriber callback, register the async cmd for
         processing upon completion, then submit the command request through to 
-        the command processor async queue for execution. 
+        the command processor async queue for execution, without waiting.
+        Queued cmds run in cp_async_cmd_priority() order. The cmd gets a 
+        CPCancelToken for cp_cancel_async_cmd().
 
         Arguments:
             cmd (Dict): The command to execute along with any arguments.
@@ -376,15 +547,22 @@ class CommandProcessor(CommandProcessor_Base, DataContext_Binding):
                 not callable(async_result_subscriber)):
                 raise ValueError("async_subscriber must be a valid callable object.")
             async_id: str = uuid.uuid4().hex[:8]
+            token = CPCancelToken()
             # Register new async cmd result expected
             self.cp_async_cmd_result_registry[async_id] = None
+            self._async_cmd_cancel_tokens[async_id] = token
             # Flag this cmd as async
-            cmd[CK_CMD_ASYNC_ID] = async_id
-            cmd[CK_CMD_ASYNC_RESULT_SUBSCRIBER] = async_result_subscriber
-            # Put the async cmd in the worker thread queue
-            self._async_cmd_queue.put(cmd)
-            cp_user_info_message(f"Async CMD '{async_id}' queued for subscriber: '{async_result_subscriber.__name__}'.")
-            time.sleep(0.2)  # Allow some time for the worker thread to pick up the cmd
+            self._cp_async_cmd_attr_set(cmd, CK_CMD_ASYNC_ID, async_id)
+            self._cp_async_cmd_attr_set(cmd, CK_CMD_ASYNC_RESULT_SUBSCRIBER,
+                                        async_result_subscriber)
+            self._cp_async_cmd_attr_set(cmd, CK_CMD_CANCEL_TOKEN, token)
+            # Put the async cmd in the worker thread queue, or writer queue.
+            priority: int = self.cp_async_cmd_priority(cmd)
+            self._cp_async_cmd_put(
+                (priority, next(self._async_cmd_seq), time.perf_counter(), cmd),
+                self.cp_cmd_read_only(cmd))
+            cp_user_info_message(f"Async CMD '{async_id}' queued, priority {priority}, "
+                                 f"for subscriber: '{async_result_subscriber.__name__}'.")
             return cp_CMD_RESULT_create(status=True,
                                             type=CV_CMD_ASYNC_ID,
                                             content=async_id,
@@ -396,6 +574,66 @@ class CommandProcessor(CommandProcessor_Base, DataContext_Binding):
             return cmd_result
     #endregion cp_execute_cmd() method
     # ------------------------------------------------------------------------ +
+    #region    _cp_async_cmd_put() method
+    def _cp_async_cmd_put(self, item: Tuple[float, int, float, Any],
+                          read_only: bool = False) -> None:
+        """Queue an async cmd item for the worker threads if read_only,
+        else for the writer thread."""
+        if self._async_cmd_queue is None:
+            raise RuntimeError("CommandProcessor worker threads are not initialized.")
+        if read_only:
+            self._async_cmd_queue.put(item)
+        else:
+            self._async_write_queue.put(item)
+    #endregion _cp_async_cmd_put() method
+    # ------------------------------------------------------------------------ +
+    #region    _cp_async_cmd_start() and _cp_async_cmd_complete() methods
+    def _cp_async_cmd_start(self, cmd: CMD_OBJECT_TYPE | Command
+                            ) -> Tuple[Optional[str], Optional[CMD_RESULT_TYPE]]:
+        """Return (async_id, None) for a dequeued cmd to execute. The result
+        is an error result for a cmd cancelled while queued, async_id is None
+        for an invalid cmd."""
+        async_id: str = self._cp_async_cmd_attr(cmd, CK_CMD_ASYNC_ID)
+        if (async_id is None or
+            async_id not in self.cp_async_cmd_result_registry):
+            logger.error(f"Invalid async cmd object: {str(cmd)}")
+            return None, None
+        token = self._async_cmd_cancel_tokens.get(async_id)
+        if token is not None and token.cancelled:
+            logger.debug(f"Skipped cancelled async cmd '{async_id}'.")
+            return async_id, cp_CMD_RESULT_ERROR_create(
+                cmd, f"Async CMD '{async_id}' cancelled before it started.")
+        return async_id, None
+
+    def _cp_async_cmd_complete(self, async_id: str, 
+                               async_cmd_result: CMD_RESULT_TYPE,
+                               queued: float, started: float) -> None:
+        """Record the result and latency of an async cmd."""
+        async_cmd_result[CK_CMD_RESULT_QUEUE_WAIT] = started - queued
+        cp_metrics.histogram(CP_METRIC_ASYNC_QUEUE_WAIT).observe(started - queued)
+        async_cmd_result[CK_CMD_RESULT_EXEC_TIME] = time.perf_counter() - started
+        self.cp_async_cmd_result_registry[async_id] = async_cmd_result
+        self._async_cmd_cancel_tokens.pop(async_id, None)
+    #endregion _cp_async_cmd_start() and _cp_async_cmd_complete() methods
+    # ------------------------------------------------------------------------ +
+    #region    _cp_async_cmd_attr() methods
+    @staticmethod
+    def _cp_async_cmd_attr(cmd: CMD_OBJECT_TYPE | Command, key: str) -> Any:
+        """Return the async attribute key of a CMD_OBJECT or Command."""
+        if isinstance(cmd, dict):
+            return cmd.get(key, None)
+        return getattr(cmd, key, None)
+
+    @staticmethod
+    def _cp_async_cmd_attr_set(cmd: CMD_OBJECT_TYPE | Command, 
+                               key: str, value: Any) -> None:
+        """Set the async attribute key of a CMD_OBJECT or Command."""
+        if isinstance(cmd, dict):
+            cmd[key] = value
+        else:
+            setattr(cmd, key, value)
+    #endregion _cp_async_cmd_attr() methods
+    # ------------------------------------------------------------------------ +
     #region    cp_process_async_cmd_results() method
     def cp_process_async_cmd_results(self) -> int:
         """Process results from the async_cmd_result_queue."""
@@ -403,10 +641,8 @@ class CommandProcessor(CommandProcessor_Base, DataContext_Binding):
             self.cp_async_cmd_result_queue.empty()):
             logger.warning("async_cmd_result_queue is empty.")
             return
-        # Validate not in the worker thread
-        caller_tid: int = threading.get_ident()
-        worker_tid: int = self.cp_worker_thread.ident
-        if caller_tid == worker_tid:
+        # Validate not in a worker thread
+        if threading.current_thread() in self.cp_worker_threads:
             logger.error("process_async_cmd_results() cannot be called "
                             "from the worker thread.")
             return
@@ -732,6 +968,122 @@ class CommandProcessor(CommandProcessor_Base, DataContext_Binding):
             CMD_RESULT_TYPE: The outcome of the command 
             execution.
         """
+        st = time.perf_counter()
+        cmd_result: CMD_RESULT_TYPE = None
+        try:
+            with self._cp_cmd_lock(cmd):
+                if not cp_tracer.enabled:
+                    cmd_result = self._cp_execute_cached(cmd, raise_error)
+                    return cmd_result
+                # Trace the command in a span, its tasks and storage calls nest in it.
+                cmd_name, cmd_key, subcmd_key = self._cp_cmd_names(cmd)
+                with cp_trace_span(cmd_name, CP_TRACE_CAT_COMMAND,
+                                   cmd_key=cmd_key, subcmd_key=subcmd_key) as span:
+                    cmd_result = self._cp_execute_cached(cmd, raise_error)
+                    if cp_is_CMD_RESULT(cmd_result):
+                        span.set(**{CK_TRACE_STATUS: cmd_result[CK_CMD_RESULT_STATUS]})
+                    return cmd_result
+        finally:
+            self._cp_cmd_metrics(cmd, cmd_result, time.perf_counter() - st)
+
+    def _cp_cmd_lock(self, cmd: CMD_OBJECT_TYPE | Command) -> ContextManager:
+        """Return the cp_model_lock context of cmd, to read for a read only
+        or shared write cmd, to write for any other, or none for an unlocked
+        cmd."""
+        if self.cp_cmd_unlocked(cmd):
+            return contextlib.nullcontext()
+        if self.cp_cmd_read_only(cmd) or self.cp_cmd_shared_write(cmd):
+            return self._cp_model_lock.read()
+        return self._cp_cmd_write_lock(cmd)
+
+    @contextlib.contextmanager
+    def _cp_cmd_write_lock(self, cmd: CMD_OBJECT_TYPE | Command) -> Iterator[None]:
+        """Hold the cp_model_lock to write for cmd, with cp_model_lock_yield()
+        in its CK_CMD_LOCK_YIELD attribute for cp_cmd_cancel_check()."""
+        with self._cp_model_lock.write():
+            outer = self._cp_async_cmd_attr(cmd, CK_CMD_LOCK_YIELD)
+            self._cp_async_cmd_attr_set(cmd, CK_CMD_LOCK_YIELD, self.cp_model_lock_yield)
+            try:
+                yield
+            finally:
+                self._cp_async_cmd_attr_set(cmd, CK_CMD_LOCK_YIELD, outer)
+
+    def cp_model_lock_yield(self) -> bool:
+        """Let the read only cmds waiting for the cp_model_lock run, while
+        the calling cmd holds it to write, between the steps of a long cmd.
+        The model version is bumped first, the cmd may have changed the
+        model already. Returns True if read only cmds ran."""
+        if self._cp_model_lock.readers_waiting == 0:
+            return False
+        self.cp_model_version_bump()
+        return self._cp_model_lock.yield_write()
+
+    @staticmethod
+    def _cp_cmd_names(cmd: CMD_OBJECT_TYPE | Command) -> Tuple[str, str, str]:
+        """Return the (cmd_name subcmd_name, cmd_key, subcmd_key) of a cmd."""
+        if isinstance(cmd, Command):
+            cmd_name = f"{cmd.cmd_name} {getattr(cmd, CK_SUBCMD_NAME, '')}"
+            return (cmd_name.strip(), cmd.cmd_key,
+                    getattr(cmd, CK_SUBCMD_KEY, None))
+        cmd_obj: Dict = cmd if isinstance(cmd, dict) else {}
+        cmd_name = f"{cmd_obj.get(CK_CMD_NAME)} {cmd_obj.get(CK_SUBCMD_NAME, '')}"
+        return (cmd_name.strip(), cmd_obj.get(CK_CMD_KEY),
+                cmd_obj.get(CK_SUBCMD_KEY))
+
+    def _cp_cmd_metrics(self, cmd: CMD_OBJECT_TYPE | Command,
+                        cmd_result: CMD_RESULT_TYPE, elapsed: float) -> None:
+        """Count a cmd and observe its latency, overall and by its key."""
+        _, cmd_key, subcmd_key = self._cp_cmd_names(cmd)
+        cp_metrics.counter(CP_METRIC_CMD_COUNT).inc()
+        if not (cp_is_CMD_RESULT(cmd_result) and cmd_result[CK_CMD_RESULT_STATUS]):
+            cp_metrics.counter(CP_METRIC_CMD_FAILED).inc()
+        cp_metrics.histogram(CP_METRIC_CMD_SECONDS).observe(elapsed)
+        cp_metrics.histogram(
+            f"{CP_METRIC_CMD_SECONDS}.{subcmd_key or cmd_key}").observe(elapsed)
+
+    def _cp_execute_cached(self, cmd: CMD_OBJECT_TYPE | Command,
+                           raise_error: bool = False) -> CMD_RESULT_TYPE:
+        """Execute a cmd, returning the cached result of a cacheable cmd
+        executed at the same cp_cache_version(). A cmd not read only may
+        change the model, and bumps the model version after it executes."""
+        if not self.cp_cmd_cacheable(cmd):
+            if self.cp_cmd_read_only(cmd):
+                return self._cp_execute_cmd(cmd, raise_error)
+            try:
+                return self._cp_execute_cmd(cmd, raise_error)
+            finally:
+                self.cp_model_version_bump()
+        key = CPResultCache.key(cmd, self.cp_cache_version())
+        if key is None:
+            return self._cp_execute_cmd(cmd, raise_error)
+        msg_svc: CPMessageService = self._cp_message_service
+        entry = self._cp_result_cache.get(key)
+        if entry is not None:
+            logger.debug(f"Result cache hit: {key[:2]}")
+            msg_svc.replay(entry.messages)
+            return entry.cmd_result
+        # Capture the messages of the cmd, to cache and replay with its result.
+        buffer = msg_svc.capture_buffer
+        if buffer is not None:
+            # Already capturing, e.g. a script step, the messages stay in
+            # the outer buffer.
+            start = len(buffer)
+            cmd_result = self._cp_execute_cmd(cmd, raise_error)
+            messages = buffer[start:]
+        else:
+            msg_svc.capture_start()
+            try:
+                cmd_result = self._cp_execute_cmd(cmd, raise_error)
+            finally:
+                messages = msg_svc.capture_stop()
+                msg_svc.replay(messages)
+        if cp_is_CMD_RESULT(cmd_result) and cmd_result[CK_CMD_RESULT_STATUS]:
+            self._cp_result_cache.put(key, CPResultCacheEntry(cmd_result, messages))
+        return cmd_result
+
+    def _cp_execute_cmd(self, cmd : CMD_OBJECT_TYPE | Command = None,
+                        raise_error : bool = False) -> CMD_RESULT_TYPE:
+        """Execute a command, the implementation of cp_execute_cmd()."""
         try:
             st = p3u.start_timer()
             if isinstance(cmd, Command):
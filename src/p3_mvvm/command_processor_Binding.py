@@ -12,7 +12,7 @@ implementation for a View class.
 import logging
 from typing import List, Type, Generator, Dict, Tuple, Any, Callable, Optional
 # third-party modules and packages
-import cmd2, argparse
+import argparse
 import p3_utils as p3u, pyjson5, p3logging as p3l
 # local modules and packages
 from .mvvm_namespace import *
@@ -246,6 +246,16 @@ class CommandProcessor_Binding(CommandProcessor_Base):
             return cmd_result
     #endregion execute_cmd() command method
     # ------------------------------------------------------------------------ +
+    #region cp_cancel_async_cmd() method
+    def cp_cancel_async_cmd(self, async_id: str) -> bool:
+        """Request cancellation of the async cmd for async_id."""
+        try:
+            return self.CP.cp_cancel_async_cmd(async_id)
+        except Exception as e:
+            logger.error(p3u.exc_err_msg(e))
+            raise
+    #endregion cp_cancel_async_cmd() method
+    # ------------------------------------------------------------------------ +
     #region execute_cmd() method
     def cp_execute_cmd(self, cmd : Dict = None,
                        raise_error : bool = False) -> CMD_RESULT_TYPE:
@@ -0,0 +1,76 @@
+# ---------------------------------------------------------------------------- +
+#region cp_cancel_token.py module
+""" cp_cancel_token.py implements cooperative cancellation of async commands.
+
+    The CommandProcessor gives each async command a CPCancelToken, in the
+    CK_CMD_CANCEL_TOKEN attribute of the command. cp_cancel_async_cmd() sets
+    the token. A command not yet started is skipped by the worker, a running
+    command stops only where it calls cp_cmd_cancel_check(), e.g. between
+    workbooks, which raises CPCommandCancelled.
+
+    A command holding the model lock to write, sync or async, also yields
+    it in cp_cmd_cancel_check() to the read only commands waiting for it.
+"""
+#endregion cp_cancel_token.py module
+#------------------------------------------------------------------------------+
+#region Imports
+# python standard library modules and packages
+import logging, threading
+from typing import Any, Optional
+# third-party modules and packages
+# local modules and packages
+from .mvvm_namespace import *
+#endregion Imports
+# ---------------------------------------------------------------------------- +
+#region Globals and Constants
+logger = logging.getLogger(__name__)  # create logger for the module
+#endregion Globals and Constants
+# ---------------------------------------------------------------------------- +
+#region    CPCommandCancelled class
+class CPCommandCancelled(Exception):
+    """Raised by cp_cmd_cancel_check() in a cancelled command."""
+#endregion CPCommandCancelled class
+# ---------------------------------------------------------------------------- +
+#region    CPCancelToken class
+class CPCancelToken:
+    """A thread-safe cancellation flag for one async command."""
+    def __init__(self) -> None:
+        self._event: threading.Event = threading.Event()
+
+    @property
+    def cancelled(self) -> bool:
+        """True if cancel() was called."""
+        return self._event.is_set()
+
+    def cancel(self) -> None:
+        """Request the command to stop."""
+        self._event.set()
+
+    def check(self) -> None:
+        """Raise CPCommandCancelled if cancel() was called."""
+        if self._event.is_set():
+            raise CPCommandCancelled("Command cancelled.")
+#endregion CPCancelToken class
+# ---------------------------------------------------------------------------- +
+#region    cp_cmd_cancel_token() function
+def cp_cmd_cancel_token(cmd: Any) -> Optional[CPCancelToken]:
+    """Return the CPCancelToken of a CMD_OBJECT or Command, None if it is
+    not an async command."""
+    if isinstance(cmd, dict):
+        return cmd.get(CK_CMD_CANCEL_TOKEN, None)
+    return getattr(cmd, CK_CMD_CANCEL_TOKEN, None)
+#endregion cp_cmd_cancel_token() function
+# ---------------------------------------------------------------------------- +
+#region    cp_cmd_cancel_check() function
+def cp_cmd_cancel_check(cmd: Any) -> None:
+    """Raise CPCommandCancelled if cmd is a cancelled async command. Else,
+    if cmd holds the model lock to write, let waiting readers run."""
+    token = cp_cmd_cancel_token(cmd)
+    if token is not None:
+        token.check()
+    lock_yield = (cmd.get(CK_CMD_LOCK_YIELD, None) if isinstance(cmd, dict)
+                  else getattr(cmd, CK_CMD_LOCK_YIELD, None))
+    if lock_yield is not None:
+        lock_yield()
+#endregion cp_cmd_cancel_check() function
+# ---------------------------------------------------------------------------- +
@@ -0,0 +1,79 @@
+# ---------------------------------------------------------------------------- +
+#region cp_message_batcher.py module
+""" cp_message_batcher.py implements the class CPMessageBatcher.
+
+    A CPMessageBatcher coalesces user messages into batches for the
+    CPMessageService, so a view does one update per batch rather than per
+    message. Messages are kept in a bounded ring buffer, when it is full the
+    oldest message is overwritten and counted. By the policy for its tag, a
+    message is kept, dropped, or only counted and summarized at the end of
+    the next batch, CP_MSG_BATCH_DEFAULT_POLICIES summarizes DEBUG and
+    VERBOSE messages.
+"""
+#endregion cp_message_batcher.py module
+#------------------------------------------------------------------------------+
+#region Imports
+# python standard library modules and packages
+import logging, threading
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+# third-party modules and packages
+# local modules and packages
+from .mvvm_namespace import *
+#endregion Imports
+# ---------------------------------------------------------------------------- +
+#region Globals and Constants
+logger = logging.getLogger(__name__)  # create logger for the module
+#endregion Globals and Constants
+# ---------------------------------------------------------------------------- +
+#region    CPMessageBatcher class
+class CPMessageBatcher:
+    """A thread-safe, bounded buffer of (message, tag) user messages."""
+    def __init__(self, capacity: int = CP_MSG_BATCH_CAPACITY,
+                 policies: Optional[Dict[str, str]] = None) -> None:
+        if capacity < 1:
+            raise ValueError(f"capacity must be >= 1: {capacity}")
+        self._lock: threading.Lock = threading.Lock()
+        self._buffer: Deque[Tuple[str, str]] = deque(maxlen=capacity)
+        self.policies: Dict[str, str] = dict(
+            CP_MSG_BATCH_DEFAULT_POLICIES if policies is None else policies)
+        self._overflow: int = 0
+        self._summarized: Dict[str, int] = {}
+        # Totals since construction, for monitoring.
+        self.added: int = 0
+        self.dropped: int = 0
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+    def add(self, message: str, tag: str = CP_INFO) -> None:
+        """Add a message to the next batch by the policy for its tag."""
+        policy = self.policies.get(tag, CV_MSG_POLICY_KEEP)
+        with self._lock:
+            self.added += 1
+            if policy == CV_MSG_POLICY_DROP:
+                self.dropped += 1
+            elif policy == CV_MSG_POLICY_SUMMARIZE:
+                self._summarized[tag] = self._summarized.get(tag, 0) + 1
+            else:
+                if len(self._buffer) == self._buffer.maxlen:
+                    self._overflow += 1
+                    self.dropped += 1
+                self._buffer.append((message, tag))
+
+    def flush(self) -> List[Tuple[str, str]]:
+        """Return and clear the batch of (message, tag), in the order added,
+        with the overflow and summary messages. Empty if nothing was added."""
+        with self._lock:
+            batch: List[Tuple[str, str]] = list(self._buffer)
+            self._buffer.clear()
+            overflow, self._overflow = self._overflow, 0
+            summarized, self._summarized = self._summarized, {}
+        if overflow:
+            batch.insert(0, (f"{overflow} messages dropped, message buffer "
+                             f"full.", CP_WARNING))
+        for tag, count in summarized.items():
+            batch.append((f"{count} {tag} messages not shown.", tag))
+        return batch
+#endregion CPMessageBatcher class
+# ---------------------------------------------------------------------------- +
@@ -7,7 +7,7 @@
 #region Imports
 # python standard library modules and packages
 import logging, threading
-from typing import Optional
+from typing import Optional, List, Tuple
 # third-party modules and packages
 import p3_utils as p3u, p3logging as p3l
 from splurge_pub_sub import PubSub, Message, Callback
@@ -15,6 +15,8 @@ from splurge_pub_sub import PubSub, Message, Callback
 from budman_namespace import BDMSingletonMeta
 from .mvvm_namespace import *
 from .view_base_ABC import View_Base
+from .cp_message_batcher import CPMessageBatcher
+from p3_telemetry import cp_metrics
 
 #endregion Imports
 # ---------------------------------------------------------------------------- +
@@ -58,6 +60,23 @@ def cp_cmd_result_message_callback(func: Callback) -> Callback:
     return wrapper
 #endregion cp_cmd_result_message_callback decorator
 # ---------------------------------------------------------------------------- +
+#region   cp_user_message_batch_callback decorator
+def cp_user_message_batch_callback(func: Callback) -> Callback:
+    """Decorator to mark a function as a PubSub callback for batches of user
+        messages, see CPMessageService.batch_start(). The decorator converts 
+        the splurge_pub_sub.Message to a list of CPUserOutputMessage before 
+        passing it to the decorated function.
+    """
+    def wrapper(*args, **kwargs) -> None:
+        # Expecting first argument to be a Message
+        message: Message = args[0]
+        batch: List[CPUserOutputMessage] = [
+            CPUserOutputMessage(message=m.get('message', ''), tag=m.get('tag', 'INFO'))
+            for m in message.data.get('messages', [])]
+        return func(batch)
+    return wrapper
+#endregion cp_user_message_batch_callback decorator
+# ---------------------------------------------------------------------------- +
 
 # ---------------------------------------------------------------------------- +
 #region   CPUserOutputMessage class
@@ -128,6 +147,16 @@ class CPMessageService(PubSub, metaclass=BDMSingletonMeta):
         self._view : View_Base|None = view
         self._in_main_thread: bool = threading.current_thread() == threading.main_thread()
         self.verbose_log: bool = False
+        # Per-thread message capture buffers, see capture_start().
+        self._capture_local: threading.local = threading.local()
+        # User message batching, see batch_start().
+        self._batcher: Optional[CPMessageBatcher] = None
+        self._batch_thread: Optional[threading.Thread] = None
+        self._batch_stop_event: threading.Event = threading.Event()
+        # Message queue depths, sampled when the metrics are read.
+        cp_metrics.gauge(CP_METRIC_MSG_QUEUE_DEPTH, func=self.queue_depth)
+        cp_metrics.gauge(CP_METRIC_MSG_BATCH_DEPTH,
+                         func=lambda: len(self._batcher) if self._batcher else 0)
     #endregion  __init__()
     # ------------------------------------------------------------------------ +
     #region    CPMessageService class Properties
@@ -144,6 +173,26 @@ class CPMessageService(PubSub, metaclass=BDMSingletonMeta):
     def in_main_thread(self) -> bool:
         """Return True if the current thread is the main thread."""
         return self._in_main_thread
+    @property
+    def batching(self) -> bool:
+        """Return True if user messages are published in batches."""
+        return self._batcher is not None
+    @property
+    def batcher(self) -> Optional[CPMessageBatcher]:
+        """Get the CPMessageBatcher, None if not batching."""
+        return self._batcher
+    @property
+    def capturing(self) -> bool:
+        """Return True if messages of the current thread are captured."""
+        return getattr(self._capture_local, "buffer", None) is not None
+    @property
+    def capture_buffer(self) -> Optional[List[Tuple[str, Dict[str, Any]]]]:
+        """Get the capture buffer of the current thread, None if not capturing."""
+        return getattr(self._capture_local, "buffer", None)
+    def queue_depth(self) -> int:
+        """Return the count of messages waiting in the PubSub queue."""
+        message_queue = getattr(self, "_message_queue", None)
+        return message_queue.qsize() if message_queue is not None else 0
     #endregion CPMessageService class Properties
     # ------------------------------------------------------------------------ +
     #endregion CPMessageService class Intrinsics
@@ -160,7 +209,8 @@ class CPMessageService(PubSub, metaclass=BDMSingletonMeta):
     def user_message(self, message: str, tag: str = CP_INFO) -> None:
         """If not in main thread Publish a user message. If in main thread
         and view object bound, invoke view method directly."""
-        if self.in_main_thread and self.view is not None:
+        if (self.in_main_thread and self.view is not None and 
+            not self.capturing and not self.batching):
             self.view.view_user_message(message, tag)
             return
         self.publish(topic=CP_USER_MSG_TOPIC, 
@@ -216,6 +266,89 @@ class CPMessageService(PubSub, metaclass=BDMSingletonMeta):
 
     #endregion CP_CMD_RESULT_TOPIC Methods
     # ------------------------------------------------------------------------ +
+    #region Message capture Methods
+    def publish(self, topic: str, data: Optional[Dict[str, Any]] = None,
+                metadata: Optional[Dict[str, Any]] = None, *,
+                correlation_id: Optional[str] = None) -> None:
+        """Override: Publish a message, or append it to the capture buffer
+        of the current thread."""
+        buffer = getattr(self._capture_local, "buffer", None)
+        if buffer is not None:
+            buffer.append((topic, data))
+            return
+        batcher = self._batcher
+        if batcher is not None and topic == CP_USER_MSG_TOPIC:
+            batcher.add(data.get('message', ''), data.get('tag', CP_INFO))
+            return
+        super().publish(topic, data, metadata, correlation_id=correlation_id)
+    def capture_start(self) -> None:
+        """Capture the messages of the current thread until capture_stop()."""
+        self._capture_local.buffer = []
+    def capture_stop(self) -> List[Tuple[str, Dict[str, Any]]]:
+        """Stop capturing, return the captured (topic, data) messages."""
+        buffer = getattr(self._capture_local, "buffer", None)
+        self._capture_local.buffer = None
+        return buffer or []
+    def replay(self, messages: List[Tuple[str, Dict[str, Any]]]) -> None:
+        """Publish captured messages, in order. They were logged when
+        captured."""
+        for topic, data in messages:
+            if topic == CP_USER_MSG_TOPIC:
+                self.user_message(data.get('message', ''), data.get('tag', CP_INFO))
+            else:
+                self.publish(topic, data)
+    #endregion Message capture Methods
+    # ------------------------------------------------------------------------ +
+    #region CP_USER_MSG_BATCH_TOPIC Methods
+    def subscribe_user_message_batch(self, callback: Callback) -> str:
+        """Subscribe to batches of user messages."""
+        return self.subscribe(CP_USER_MSG_BATCH_TOPIC, callback)
+    def batch_start(self, flush_interval: float = CP_MSG_BATCH_FLUSH_INTERVAL,
+                    capacity: int = CP_MSG_BATCH_CAPACITY,
+                    policies: Optional[Dict[str, str]] = None) -> None:
+        """Publish user messages in batches on CP_USER_MSG_BATCH_TOPIC, each
+        flush_interval seconds, instead of one by one on CP_USER_MSG_TOPIC.
+        
+        Arguments:
+            flush_interval (float): Seconds between batches.
+            capacity (int): Size of the ring buffer of messages.
+            policies (Dict): CV_MSG_POLICY_* by tag, default is
+                CP_MSG_BATCH_DEFAULT_POLICIES.
+        """
+        self.batch_stop()
+        self._batcher = CPMessageBatcher(capacity, policies)
+        self._batch_stop_event.clear()
+        self._batch_thread = threading.Thread(
+            target=self._batch_worker, args=(flush_interval,),
+            name="CPMessageBatcher", daemon=True)
+        self._batch_thread.start()
+    def batch_stop(self) -> None:
+        """Publish the last batch, then publish user messages one by one."""
+        if self._batch_thread is not None:
+            self._batch_stop_event.set()
+            self._batch_thread.join()
+            self._batch_thread = None
+        self.batch_flush()
+        self._batcher = None
+    def batch_flush(self) -> int:
+        """Publish the buffered user messages as one batch, return the
+        number of messages in the batch."""
+        if self._batcher is None:
+            return 0
+        batch = self._batcher.flush()
+        if batch:
+            super().publish(CP_USER_MSG_BATCH_TOPIC,
+                            {'messages': [{'message': m, 'tag': t} for m, t in batch]})
+        return len(batch)
+    def _batch_worker(self, flush_interval: float) -> None:
+        """Thread publishing a batch each flush_interval seconds."""
+        while not self._batch_stop_event.wait(flush_interval):
+            try:
+                self.batch_flush()
+            except Exception as e:
+                logger.error(p3u.exc_err_msg(e))
+    #endregion CP_USER_MSG_BATCH_TOPIC Methods
+    # ------------------------------------------------------------------------ +
     #endregion CPMessageService class Methods
     # ------------------------------------------------------------------------ +
 #endregion    CPMessageService class Methods
@@ -293,4 +426,10 @@ def cp_publish_cmd_result(cmd_result: CMD_RESULT_TYPE) -> None:
 
 #endregion cmd_result functions
 # ---------------------------------------------------------------------------- +
+#region user_message_batch functions
+def cp_subscribe_user_message_batch(callback: Callback) -> str:
+    """Subscribe to batches of user messages."""
+    return cp_msg_svc.subscribe_user_message_batch(callback)
+#endregion user_message_batch functions
+# ---------------------------------------------------------------------------- +
 
@@ -0,0 +1,153 @@
+# ---------------------------------------------------------------------------- +
+#region cp_profiler.py module
+""" cp_profiler.py implements the class CPProfiler.
+
+    A CPProfiler runs a function, such as the execution of a command line,
+    under cProfile and, optionally, tracemalloc. For each run it saves a
+    .pstats file and, with memory, a .alloc.txt file of the top allocation
+    sites in a profiles folder, and returns a CPProfileResult with a report
+    of the top hotspots by cumulative time.
+
+    cProfile profiles only the calling thread, the work of a command done in
+    worker threads is not in the hotspots, tracemalloc traces all threads.
+
+    Usage:
+        profiler = CPProfiler(profiles_folder, memory=True, top=20)
+        result = profiler.run(lambda: cp.cp_execute_cmd(cmd), "load")
+        print(result.report())
+        # python -m pstats <result.pstats_path>, or snakeviz, to explore.
+"""
+#endregion cp_profiler.py module
+#------------------------------------------------------------------------------+
+#region Imports
+# python standard library modules and packages
+import cProfile, logging, pstats, re, time, tracemalloc
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, List, Optional
+# third-party modules and packages
+import p3_utils as p3u
+# local modules and packages
+from .mvvm_namespace import *
+#endregion Imports
+# ---------------------------------------------------------------------------- +
+#region Globals and Constants
+logger = logging.getLogger(__name__)  # create logger for the module
+#endregion Globals and Constants
+# ---------------------------------------------------------------------------- +
+#region    CPProfileResult class
+@dataclass
+class CPProfileResult:
+    """The result of a CPProfiler run."""
+    name: str
+    elapsed: float = 0.0
+    value: Any = None
+    pstats_path: Optional[Path] = None
+    alloc_path: Optional[Path] = None
+    hotspots: List[str] = field(default_factory=list)
+    allocations: List[str] = field(default_factory=list)
+    peak_memory: int = 0
+
+    def report(self) -> str:
+        """Return the report of the hotspots and top allocation sites."""
+        lines = [f"Profile '{self.name}': {self.elapsed:.3f}s, "
+                 f"stats: '{self.pstats_path}'"]
+        lines.append(f"{'cumtime':>9} {'tottime':>9} {'ncalls':>9}  function")
+        lines.extend(self.hotspots)
+        if self.alloc_path:
+            lines.append(f"Peak traced memory: {self.peak_memory / 1024:,.1f} "
+                         f"KiB, allocations: '{self.alloc_path}'")
+            lines.extend(self.allocations)
+        return "\n".join(lines)
+#endregion CPProfileResult class
+# ---------------------------------------------------------------------------- +
+#region    CPProfiler class
+class CPProfiler:
+    """Run functions under cProfile and tracemalloc, saving the results."""
+    # Index of the sort key in a pstats (cc, nc, tt, ct, callers) tuple.
+    STATS_INDEX = {CV_PROFILE_SORT_NCALLS: 1, CV_PROFILE_SORT_TOTTIME: 2,
+                   CV_PROFILE_SORT_CUMULATIVE: 3}
+
+    def __init__(self, profiles_folder: str | Path,
+                 memory: bool = False,
+                 top: int = CP_PROFILE_TOP,
+                 sort: str = CV_PROFILE_SORT_CUMULATIVE) -> None:
+        if top < 1:
+            raise ValueError(f"top must be >= 1: {top}")
+        if sort not in self.STATS_INDEX:
+            raise ValueError(f"sort must be one of {CV_PROFILE_SORT_KEYS}: {sort}")
+        self.profiles_folder: Path = Path(profiles_folder)
+        self.memory: bool = memory
+        self.top: int = top
+        self.sort: str = sort
+
+    def run(self, func: Callable[[], Any], name: str) -> CPProfileResult:
+        """Run func under the profilers and save the results, named by name
+        and the start time. An exception of func is raised after the results
+        are saved."""
+        try:
+            result = CPProfileResult(name=name)
+            stem = (f"{datetime.now():%Y%m%d_%H%M%S}_"
+                    f"{re.sub(r'[^A-Za-z0-9]+', '_', name).strip('_') or 'cmd'}")
+            self.profiles_folder.mkdir(parents=True, exist_ok=True)
+            start_tracemalloc = self.memory and not tracemalloc.is_tracing()
+            if start_tracemalloc:
+                tracemalloc.start()
+            profiler = cProfile.Profile()
+            st = time.perf_counter()
+            try:
+                profiler.enable()
+                try:
+                    result.value = func()
+                finally:
+                    profiler.disable()
+                    result.elapsed = time.perf_counter() - st
+            finally:
+                snapshot = None
+                if self.memory:
+                    snapshot = tracemalloc.take_snapshot()
+                    result.peak_memory = tracemalloc.get_traced_memory()[1]
+                if start_tracemalloc:
+                    tracemalloc.stop()
+                result.pstats_path = self.profiles_folder / f"{stem}.pstats"
+                profiler.dump_stats(result.pstats_path)
+                result.hotspots = self.hotspots(pstats.Stats(profiler))
+                if snapshot is not None:
+                    result.alloc_path = self.profiles_folder / f"{stem}.alloc.txt"
+                    result.allocations = self.allocations(snapshot)
+                    result.alloc_path.write_text(
+                        "\n".join(result.allocations) + "\n", encoding="utf-8")
+                logger.info(f"Profile '{name}' saved: '{result.pstats_path}'")
+            return result
+        except Exception as e:
+            logger.error(p3u.exc_err_msg(e))
+            raise
+
+    def hotspots(self, stats: pstats.Stats) -> List[str]:
+        """Return the top functions by the sort key, formatted as lines."""
+        i = self.STATS_INDEX[self.sort]
+        rows = sorted(stats.stats.items(), key=lambda item: item[1][i],
+                      reverse=True)[:self.top]
+        lines: List[str] = []
+        for (filename, line_no, func_name), (cc, nc, tt, ct, _) in rows:
+            ncalls = f"{nc}" if nc == cc else f"{nc}/{cc}"
+            where = func_name if filename == "~" else (
+                f"{func_name} {Path(filename).name}:{line_no}")
+            lines.append(f"{ct:9.3f} {tt:9.3f} {ncalls:>9}  {where}")
+        return lines
+
+    def allocations(self, snapshot: tracemalloc.Snapshot) -> List[str]:
+        """Return the top allocation sites by size, formatted as lines."""
+        snapshot = snapshot.filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            tracemalloc.Filter(False, "<unknown>")))
+        lines: List[str] = []
+        for stat in snapshot.statistics("lineno")[:self.top]:
+            frame = stat.traceback[0]
+            lines.append(f"{stat.size / 1024:9,.1f} KiB {stat.count:>9} blocks  "
+                         f"{frame.filename}:{frame.lineno}")
+        return lines
+#endregion CPProfiler class
+# ---------------------------------------------------------------------------- +
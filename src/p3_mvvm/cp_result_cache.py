@@ -0,0 +1,102 @@
+# ---------------------------------------------------------------------------- +
+#region cp_result_cache.py module
+""" cp_result_cache.py implements the class CPResultCache.
+
+    A CPResultCache memoizes the results of pure read commands, such as list
+    and show commands, in the CommandProcessor. An entry is keyed by the
+    cmd_key, subcmd_key and arguments of a command plus a model version. The
+    CommandProcessor bumps its model version when any other command executes,
+    so an entry is only used while the model is unchanged. The user messages
+    of the command are cached with the result, to replay on a hit.
+
+    The cache holds the most recently used entries, up to its capacity.
+"""
+#endregion cp_result_cache.py module
+#------------------------------------------------------------------------------+
+#region Imports
+# python standard library modules and packages
+import logging, threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+# local modules and packages
+from .mvvm_namespace import *
+from .command_class import Command
+from p3_telemetry import cp_metrics
+#endregion Imports
+# ---------------------------------------------------------------------------- +
+#region Globals and Constants
+logger = logging.getLogger(__name__)  # create logger for the module
+#endregion Globals and Constants
+# ---------------------------------------------------------------------------- +
+#region    CPResultCacheEntry class
+@dataclass(slots=True)
+class CPResultCacheEntry:
+    """A cached cmd result and the messages published while executing."""
+    cmd_result: CMD_RESULT_TYPE
+    messages: List[Tuple[str, Dict[str, Any]]] = field(default_factory=list)
+#endregion CPResultCacheEntry class
+# ---------------------------------------------------------------------------- +
+#region    CPResultCache class
+class CPResultCache:
+    """An LRU cache of read cmd results, keyed by cmd and model version."""
+    def __init__(self, capacity: int = CP_RESULT_CACHE_CAPACITY) -> None:
+        if capacity < 0:
+            raise ValueError(f"capacity must be >= 0: {capacity}")
+        self.capacity: int = capacity
+        self._lock: threading.Lock = threading.Lock()
+        self._entries: OrderedDict[Hashable, CPResultCacheEntry] = OrderedDict()
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def key(cmd: CMD_OBJECT_TYPE | Command, version: Hashable) -> Optional[Hashable]:
+        """Return the cache key of cmd at version, None if cmd has no key."""
+        if isinstance(cmd, Command):
+            cmd_key = cmd.cmd_key
+            subcmd_key = getattr(cmd, CK_SUBCMD_KEY, None)
+            args: Dict[str, Any] = cmd.cmd_parms
+        elif isinstance(cmd, dict):
+            cmd_key = cmd.get(CK_CMD_KEY)
+            subcmd_key = cmd.get(CK_SUBCMD_KEY)
+            args = {k: v for k, v in cmd.items() if k != CK_CMD_EXEC_FUNC}
+        else:
+            return None
+        if cmd_key is None:
+            return None
+        # repr() makes list values hashable and tells 1 from '1'.
+        return (cmd_key, subcmd_key, version,
+                tuple(sorted((k, repr(v)) for k, v in args.items())))
+
+    def get(self, key: Hashable) -> Optional[CPResultCacheEntry]:
+        """Return the entry for key as most recently used, or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+            else:
+                self._entries.move_to_end(key)
+                self.hits += 1
+        cp_metrics.counter(CP_METRIC_RESULT_CACHE_MISSES if entry is None
+                           else CP_METRIC_RESULT_CACHE_HITS).inc()
+        return entry
+
+    def put(self, key: Hashable, entry: CPResultCacheEntry) -> None:
+        """Put the entry for key, evicting the least recently used."""
+        if self.capacity == 0:
+            return
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.capacity:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Discard all entries."""
+        with self._lock:
+            self._entries.clear()
+#endregion CPResultCache class
+# ---------------------------------------------------------------------------- +
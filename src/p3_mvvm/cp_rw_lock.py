@@ -0,0 +1,174 @@
+# ---------------------------------------------------------------------------- +
+#region cp_rw_lock.py module
+""" cp_rw_lock.py implements the class CPReadWriteLock.
+
+    The CommandProcessor holds a CPReadWriteLock over the model and its data
+    context (DC) while a command executes. Commands which only read the
+    model, cp_cmd_read_only(), or change only state with its own locks,
+    cp_cmd_shared_write(), hold it to read and run in parallel, any other
+    command holds it to write and runs alone. Async commands changing the
+    model are also queued to a single writer lane, so they run in order.
+
+    The lock is reentrant, a thread holding it to write may take it again to
+    read or write, e.g. a command run by a GUI started by a command. A
+    thread holding it only to read cannot take it to write, which would
+    deadlock with another reader doing the same, a RuntimeError is raised.
+    Waiting writers are preferred over new readers.
+
+    A long writer, e.g. a workflow command over many workbooks, calls
+    yield_write() between its steps, where the model is consistent. The
+    threads then waiting to read run first, e.g. an interactive 'list',
+    while other writers keep waiting, then the writer continues.
+"""
+#endregion cp_rw_lock.py module
+#------------------------------------------------------------------------------+
+#region Imports
+# python standard library modules and packages
+import logging, threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+# third-party modules and packages
+# local modules and packages
+#endregion Imports
+# ---------------------------------------------------------------------------- +
+#region Globals and Constants
+logger = logging.getLogger(__name__)  # create logger for the module
+#endregion Globals and Constants
+# ---------------------------------------------------------------------------- +
+#region    CPReadWriteLock class
+class CPReadWriteLock:
+    """A reentrant lock held by many readers or one writer."""
+    def __init__(self) -> None:
+        self._cond: threading.Condition = threading.Condition(threading.Lock())
+        self._readers: Dict[int, int] = {}  # thread ident: read depth
+        self._writer: Optional[int] = None
+        self._write_depth: int = 0
+        self._writers_waiting: int = 0
+        self._readers_waiting: int = 0
+        # The writer in yield_write(), readers may enter while _yield_open.
+        self._yielder: Optional[int] = None
+        self._yield_open: bool = False
+
+    @property
+    def write_locked(self) -> bool:
+        """True while a thread holds the lock to write."""
+        return self._writer is not None
+
+    @property
+    def reader_count(self) -> int:
+        """The count of threads holding the lock to read."""
+        return len(self._readers)
+
+    @property
+    def readers_waiting(self) -> int:
+        """The count of threads waiting to take the lock to read."""
+        return self._readers_waiting
+
+    def acquire_read(self) -> None:
+        """Take the lock to read, wait while another thread writes."""
+        me = threading.get_ident()
+        with self._cond:
+            if self._writer == me or me in self._readers:
+                self._readers[me] = self._readers.get(me, 0) + 1
+                return
+            self._readers_waiting += 1
+            try:
+                while (self._writer is not None or 
+                       ((self._writers_waiting or self._yielder is not None) and
+                        not self._yield_open)):
+                    self._cond.wait()
+            finally:
+                self._readers_waiting -= 1
+            self._readers[me] = 1
+            if self._yielder is not None:
+                self._cond.notify_all()
+
+    def release_read(self) -> None:
+        me = threading.get_ident()
+        with self._cond:
+            depth = self._readers.get(me, 0)
+            if depth == 0:
+                raise RuntimeError("release_read() of a lock not read locked.")
+            if depth > 1:
+                self._readers[me] = depth - 1
+                return
+            del self._readers[me]
+            self._cond.notify_all()
+
+    def acquire_write(self) -> None:
+        """Take the lock to write, wait while any other thread holds it."""
+        me = threading.get_ident()
+        with self._cond:
+            if self._writer == me:
+                self._write_depth += 1
+                return
+            if me in self._readers:
+                raise RuntimeError("A read lock cannot be upgraded to write.")
+            self._writers_waiting += 1
+            try:
+                while (self._writer is not None or self._readers or
+                       self._yielder is not None):
+                    self._cond.wait()
+            finally:
+                self._writers_waiting -= 1
+            self._writer = me
+            self._write_depth = 1
+
+    def release_write(self) -> None:
+        with self._cond:
+            if self._writer != threading.get_ident():
+                raise RuntimeError("release_write() by a thread not writing.")
+            self._write_depth -= 1
+            if self._write_depth == 0:
+                self._writer = None
+                self._cond.notify_all()
+
+    def yield_write(self) -> bool:
+        """Let the threads waiting to read run, then hold the lock to write
+        again. Other writers keep waiting. A nested writer does not yield,
+        the outer writer may be in the middle of a step.
+
+        Returns:
+            bool: True if readers ran, False to continue at once.
+        """
+        me = threading.get_ident()
+        with self._cond:
+            if self._writer != me:
+                raise RuntimeError("yield_write() by a thread not writing.")
+            if self._readers_waiting == 0 or self._write_depth > 1:
+                return False
+            depth = self._write_depth
+            self._writer, self._write_depth = None, 0
+            self._yielder, self._yield_open = me, True
+            self._cond.notify_all()
+            try:
+                # The waiting readers enter, then new readers wait again.
+                while self._readers_waiting:
+                    self._cond.wait()
+                self._yield_open = False
+                while any(t != me for t in self._readers):
+                    self._cond.wait()
+            finally:
+                self._yielder, self._yield_open = None, False
+                self._writer, self._write_depth = me, depth
+            return True
+
+    @contextmanager
+    def read(self) -> Iterator[None]:
+        """Hold the lock to read in a with block."""
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def write(self) -> Iterator[None]:
+        """Hold the lock to write in a with block."""
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
+#endregion CPReadWriteLock class
+# ---------------------------------------------------------------------------- +
@@ -0,0 +1,306 @@
+# ---------------------------------------------------------------------------- +
+#region cp_script_runner.py module
+""" CPScriptRunner class, runs a command script with independent commands in
+    parallel.
+
+    A command script, such as load_all.bdm, is a text file with one command
+    per line. Blank lines and lines starting with CP_SCRIPT_COMMENT_PREFIX
+    are skipped. The CPScriptRunner:
+
+    - parses every line into a Command with an application line_parser. No
+      command is executed if any line fails to parse.
+    - asks an application resource_func for the resources each Command reads
+      and writes, e.g. ({"DC"}, {"WB:3"}). A Command depends on each earlier
+      Command writing a resource it reads or writes, or reading a resource
+      it writes. The default resource_func writes CP_RESOURCE_ALL, so the
+      commands run one after another, as in the cmd2 run_script command.
+    - runs each Command with cp_execute_cmd() on a worker thread as soon as
+      the Commands it depends on are complete. A Command depending on a
+      failed Command is skipped.
+    - captures the user messages and results of each Command and outputs
+      them in script line order, followed by a single summary message.
+
+    Usage:
+        runner = CPScriptRunner(cp, line_parser, resource_func, max_workers=4)
+        cmd_result = runner.cp_script_run_file("load_all.bdm")
+"""
+#endregion cp_script_runner.py module
+# ---------------------------------------------------------------------------- +
+#region Imports
+# python standard library modules and packages
+import logging, time
+from concurrent.futures import ThreadPoolExecutor, Future, wait, FIRST_COMPLETED
+from pathlib import Path
+from typing import List, Dict, Any, Callable, Optional, Iterable, Tuple, Set
+# third-party modules and packages
+import p3_utils as p3u
+# local modules and packages
+from .mvvm_namespace import *
+from .cp_message_service import *
+from .command_class import Command
+from .command_processor import (cp_CMD_RESULT_create,
+                                cp_CMD_RESULT_EXCEPTION_create)
+#endregion Imports
+# ---------------------------------------------------------------------------- +
+#region Globals
+logger = logging.getLogger(__name__)
+CP_SCRIPT_LINE_PARSER_TYPE = Callable[[str], Command]
+CP_SCRIPT_RESOURCE_FUNC_TYPE = Callable[[Command], Tuple[Set[str], Set[str]]]
+#endregion Globals
+# ---------------------------------------------------------------------------- +
+#region    cp_resources_overlap() function
+def cp_resource_match(r1: str, r2: str) -> bool:
+    """Return True if resources r1 and r2 are, or cover, the same resource."""
+    if r1 == r2 or CP_RESOURCE_ALL in (r1, r2):
+        return True
+    kind1, _, name1 = r1.partition(CP_RESOURCE_SEP)
+    kind2, _, name2 = r2.partition(CP_RESOURCE_SEP)
+    return kind1 == kind2 and CP_RESOURCE_ALL in (name1, name2)
+
+def cp_resources_overlap(resources1: Iterable[str],
+                         resources2: Iterable[str]) -> bool:
+    """Return True if any resource in resources1 matches one in resources2."""
+    return any(cp_resource_match(r1, r2)
+               for r1 in resources1 for r2 in resources2)
+#endregion cp_resources_overlap() function
+# ---------------------------------------------------------------------------- +
+#region    CPScriptStep class
+class CPScriptStep:
+    """One command line of a script, with its dependencies and outcome."""
+    def __init__(self, line_no: int, line: str) -> None:
+        self.line_no: int = line_no
+        self.line: str = line
+        self.cmd: Optional[Command] = None
+        self.parse_error: Optional[str] = None
+        self.reads: Set[str] = set()
+        self.writes: Set[str] = set()
+        # Indexes of the earlier steps this step depends on.
+        self.deps: List[int] = []
+        # Longest chain of dependencies ending at this step, from 1.
+        self.level: int = 1
+        self.cmd_result: Optional[CMD_RESULT_TYPE] = None
+        self.skipped: bool = False
+        self.exec_time: float = 0.0
+        self.messages: List[Tuple[str, Dict[str, Any]]] = []
+
+    @property
+    def done(self) -> bool:
+        """True when the step has a cmd_result."""
+        return self.cmd_result is not None
+
+    @property
+    def ok(self) -> bool:
+        """True when the step ran with a successful cmd_result."""
+        return (self.cmd_result is not None and not self.skipped and
+                self.cmd_result.get(CK_CMD_RESULT_STATUS, False) is True)
+#endregion CPScriptStep class
+# ---------------------------------------------------------------------------- +
+#region    CPScriptRunner class
+class CPScriptRunner:
+    """Run the commands of a script, independent commands in parallel."""
+    # ------------------------------------------------------------------------ +
+    #region    __init__() constructor method
+    def __init__(self, cp: Any,
+                 line_parser: CP_SCRIPT_LINE_PARSER_TYPE,
+                 resource_func: Optional[CP_SCRIPT_RESOURCE_FUNC_TYPE] = None,
+                 max_workers: int = CP_DEFAULT_WORKER_COUNT) -> None:
+        """Construct a CPScriptRunner.
+
+        Arguments:
+            cp (CommandProcessor): Executes the commands with cp_execute_cmd().
+            line_parser (Callable): Returns the Command for a script line,
+                raises an exception for an invalid line.
+            resource_func (Callable): Returns the (reads, writes) resource
+                sets of a Command. Default: all commands write all resources.
+            max_workers (int): The maximum number of commands run at once.
+        """
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be >= 1: {max_workers}")
+        self.cp = cp
+        self.line_parser: CP_SCRIPT_LINE_PARSER_TYPE = line_parser
+        self.resource_func: CP_SCRIPT_RESOURCE_FUNC_TYPE = (
+            resource_func if resource_func else
+            lambda cmd: (set(), {CP_RESOURCE_ALL}))
+        self.max_workers: int = max_workers
+        self.steps: List[CPScriptStep] = []
+    #endregion __init__() constructor method
+    # ------------------------------------------------------------------------ +
+    #region    cp_script_run_file() and cp_script_run() methods
+    def cp_script_run_file(self, script_path: str | Path) -> CMD_RESULT_TYPE:
+        """Run the command script file at script_path."""
+        try:
+            script_path = Path(script_path).expanduser()
+            lines = script_path.read_text(encoding="utf-8").splitlines()
+            return self.cp_script_run(lines, script_path.name)
+        except Exception as e:
+            cp_user_error_message(p3u.exc_err_msg(e))
+            raise
+
+    def cp_script_run(self, lines: Iterable[str],
+                      script_name: str = "script") -> CMD_RESULT_TYPE:
+        """Parse, plan and run the command script lines.
+
+        Returns:
+            CMD_RESULT_TYPE: status is True if all commands succeeded, the
+            content is the summary message.
+        """
+        try:
+            st = time.perf_counter()
+            self.steps = self.cp_script_parse(lines)
+            parse_errors = [s for s in self.steps if s.parse_error]
+            if parse_errors:
+                for step in parse_errors:
+                    cp_user_error_message(f"{script_name} line {step.line_no}: "
+                                          f"'{step.line}': {step.parse_error}")
+                m = (f"Script '{script_name}': {len(parse_errors)} invalid "
+                     f"lines, no commands executed.")
+                cp_user_error_message(m)
+                return cp_CMD_RESULT_create(False, CV_CMD_ERROR_STRING_OUTPUT, m)
+            self.cp_script_plan(self.steps)
+            self.cp_script_execute(self.steps)
+            m = self.cp_script_summary(script_name, time.perf_counter() - st)
+            status = all(step.ok for step in self.steps)
+            if status:
+                cp_user_info_message(m)
+            else:
+                cp_user_error_message(m)
+            return cp_CMD_RESULT_create(status, CV_CMD_STRING_OUTPUT, m)
+        except Exception as e:
+            cp_user_error_message(p3u.exc_err_msg(e))
+            raise
+    #endregion cp_script_run_file() and cp_script_run() methods
+    # ------------------------------------------------------------------------ +
+    #region    cp_script_parse() and cp_script_plan() methods
+    def cp_script_parse(self, lines: Iterable[str]) -> List[CPScriptStep]:
+        """Return a CPScriptStep for each command line, with its Command or
+        parse_error."""
+        steps: List[CPScriptStep] = []
+        for line_no, line in enumerate(lines, start=1):
+            line = line.strip()
+            if not line or line.startswith(CP_SCRIPT_COMMENT_PREFIX):
+                continue
+            step = CPScriptStep(line_no, line)
+            try:
+                step.cmd = self.line_parser(line)
+                if step.cmd is None:
+                    raise ValueError("No command for line.")
+                reads, writes = self.resource_func(step.cmd)
+                step.reads, step.writes = set(reads), set(writes)
+            except BaseException as e:
+                # argparse raises SystemExit for an invalid line.
+                if not isinstance(e, (Exception, SystemExit)):
+                    raise
+                step.parse_error = str(e) or type(e).__name__
+            steps.append(step)
+        return steps
+
+    def cp_script_plan(self, steps: List[CPScriptStep]) -> int:
+        """Set the deps and level of each step, return the number of levels,
+        the longest chain of dependent commands."""
+        levels = 0
+        for j, step in enumerate(steps):
+            step.deps = [i for i in range(j) if
+                         cp_resources_overlap(steps[i].writes,
+                                              step.reads | step.writes) or
+                         cp_resources_overlap(steps[i].reads, step.writes)]
+            step.level = 1 + max((steps[i].level for i in step.deps), default=0)
+            levels = max(levels, step.level)
+        return levels
+    #endregion cp_script_parse() and cp_script_plan() methods
+    # ------------------------------------------------------------------------ +
+    #region    cp_script_execute() method
+    def cp_script_execute(self, steps: List[CPScriptStep]) -> None:
+        """Run the planned steps on worker threads, output each step in line
+        order when it and all steps before it are done."""
+        waiting: List[Set[int]] = [set(step.deps) for step in steps]
+        dependents: List[List[int]] = [[] for _ in steps]
+        for j, step in enumerate(steps):
+            for i in step.deps:
+                dependents[i].append(j)
+        next_output = 0
+        with ThreadPoolExecutor(max_workers=self.max_workers,
+                                thread_name_prefix="CPScriptRunner") as executor:
+            futures: Dict[Future, int] = {}
+            def release(i: int) -> None:
+                """Step i is done, start or skip the steps waiting for it."""
+                pending = [i]
+                while pending:
+                    k = pending.pop()
+                    for j in dependents[k]:
+                        waiting[j].discard(k)
+                        if waiting[j]:
+                            continue
+                        failed = [steps[d] for d in steps[j].deps if not steps[d].ok]
+                        if failed:
+                            self._cp_script_step_skip(steps[j], failed[0])
+                            pending.append(j)
+                        else:
+                            futures[executor.submit(
+                                self._cp_script_step_run, steps[j])] = j
+            for j, step in enumerate(steps):
+                if not step.deps:
+                    futures[executor.submit(self._cp_script_step_run, step)] = j
+            while futures:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    release(futures.pop(future))
+                while next_output < len(steps) and steps[next_output].done:
+                    self._cp_script_step_output(steps[next_output])
+                    next_output += 1
+        for step in steps[next_output:]:
+            self._cp_script_step_output(step)
+    #endregion cp_script_execute() method
+    # ------------------------------------------------------------------------ +
+    #region    cp_script_summary() method
+    def cp_script_summary(self, script_name: str, elapsed: float) -> str:
+        """Return the summary message of the last cp_script_run()."""
+        steps = self.steps
+        ok = sum(1 for s in steps if s.ok)
+        skipped = sum(1 for s in steps if s.skipped)
+        failed = len(steps) - ok - skipped
+        levels = max((s.level for s in steps), default=0)
+        cmd_time = sum(s.exec_time for s in steps)
+        return (f"Script '{script_name}': {len(steps)} commands, {ok} ok, "
+                f"{failed} failed, {skipped} skipped, {levels} levels, "
+                f"elapsed {elapsed:.3f}s, command time {cmd_time:.3f}s.")
+    #endregion cp_script_summary() method
+    # ------------------------------------------------------------------------ +
+    #region    _cp_script_step methods
+    def _cp_script_step_run(self, step: CPScriptStep) -> None:
+        """Worker thread: execute the step Command, capturing its messages."""
+        cp_msg_svc.capture_start()
+        st = time.perf_counter()
+        try:
+            step.cmd_result = self.cp.cp_execute_cmd(step.cmd)
+            if step.cmd_result is None:
+                step.cmd_result = cp_CMD_RESULT_create(
+                    False, CV_CMD_ERROR_STRING_OUTPUT, "No cmd_result.", step.cmd)
+        except Exception as e:
+            step.cmd_result = cp_CMD_RESULT_EXCEPTION_create(step.cmd, e)
+        finally:
+            step.exec_time = time.perf_counter() - st
+            step.messages = cp_msg_svc.capture_stop()
+
+    def _cp_script_step_skip(self, step: CPScriptStep,
+                             failed: CPScriptStep) -> None:
+        """Skip step, it depends on the failed step."""
+        step.skipped = True
+        step.cmd_result = cp_CMD_RESULT_create(
+            False, CV_CMD_ERROR_STRING_OUTPUT,
+            f"Skipped, depends on line {failed.line_no}: '{failed.line}'",
+            step.cmd)
+
+    def _cp_script_step_output(self, step: CPScriptStep) -> None:
+        """Output the line, captured messages and outcome of a done step."""
+        cp_user_none_message(f"[{step.line_no:>4}] {step.line}")
+        cp_msg_svc.replay(step.messages)
+        if step.skipped:
+            cp_user_warning_message(step.cmd_result[CK_CMD_RESULT_CONTENT])
+        elif not step.ok:
+            cp_user_error_message(
+                f"Line {step.line_no} failed: "
+                f"{step.cmd_result.get(CK_CMD_RESULT_CONTENT, '')}", log=False)
+    #endregion _cp_script_step methods
+    # ------------------------------------------------------------------------ +
+#endregion CPScriptRunner class
+# ---------------------------------------------------------------------------- +
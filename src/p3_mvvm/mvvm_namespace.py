@@ -76,10 +76,25 @@ subcmd_name."""
 # which is used to register a Callable subscriber function to handle the result.
 CK_CMD_ASYNC_ID = "cmd_async_id"
 CK_CMD_ASYNC_RESULT_SUBSCRIBER = "cmd_async_result_subscriber"
+# Async commands are run by a pool of worker threads in CK_CMD_ASYNC_PRIORITY
+# order, lower values first, then in submission order. Only read only commands
+# run in the pool, CP_DEFAULT_WORKER_COUNT at once, commands changing the model
+# run one at a time in a single writer thread. The CPCancelToken in 
+# CK_CMD_CANCEL_TOKEN is checked by commands to stop cooperatively. While a
+# command holds the model lock to write, CK_CMD_LOCK_YIELD is a callable
+# letting waiting read only commands run, called at the same check points.
+CK_CMD_ASYNC_PRIORITY = "cmd_async_priority"
+CK_CMD_CANCEL_TOKEN = "cmd_cancel_token"
+CK_CMD_LOCK_YIELD = "cmd_lock_yield"
+CV_CMD_PRIORITY_INTERACTIVE = 0
+CV_CMD_PRIORITY_NORMAL = 50
+CV_CMD_PRIORITY_BATCH = 100
+CP_DEFAULT_WORKER_COUNT = 2
 
 BASE_COMMAND_OBJECT_KEYS = [
     CK_CMD_NAME, CK_CMD_KEY, CK_SUBCMD_NAME, CK_SUBCMD_KEY, CK_CMD_EXEC_FUNC,
-    CK_CMD_ASYNC_ID, CK_CMD_ASYNC_RESULT_SUBSCRIBER
+    CK_CMD_ASYNC_ID, CK_CMD_ASYNC_RESULT_SUBSCRIBER, CK_CMD_ASYNC_PRIORITY,
+    CK_CMD_CANCEL_TOKEN, CK_CMD_LOCK_YIELD
 ]
 # ---------------------------------------------------------------------------- +
 # CMD_RESULT_OBJECT dictionary key constants
@@ -92,6 +107,9 @@ CK_REQUIRED_CMD_RESULT_KEYS = [
     CK_CMD_RESULT_STATUS, CK_CMD_RESULT_CONTENT_TYPE, CK_CMD_RESULT_CONTENT,
     CK_CMD_OBJECT_VALUE
 ]
+# Async CMD_RESULTs add the seconds queued and executing.
+CK_CMD_RESULT_QUEUE_WAIT = "cmd_result_queue_wait"
+CK_CMD_RESULT_EXEC_TIME = "cmd_result_exec_time"
 # CK_CMD_RESULT_CONTENT_TYPE values
 # CV_CMD_TREE_OBJECT is a treeblib.Tree object.
 CV_CMD_STRING_OUTPUT = "string_output"
@@ -112,6 +130,14 @@ CV_P3_SAMPLE_CMD_NAME = "sample"
 CV_P3_SAMPLE_CMD_KEY = CV_P3_SAMPLE_CMD_NAME + CK_CMD_KEY_SUFFIX
 CV_ATTRIBUTES_SUBCMD_NAME = "attributes"
 CV_ATTRIBUTES_SUBCMD_KEY = CV_P3_SAMPLE_CMD_KEY + "_" + CV_ATTRIBUTES_SUBCMD_NAME
+# ---------------------------------------------------------------------------- +
+# CPScriptRunner constants.
+# Script lines starting with CP_SCRIPT_COMMENT_PREFIX are comments. Commands
+# read and write named resources, e.g. "DC" or "WB:3". A resource "KIND:*"
+# covers every "KIND:..." resource and CP_RESOURCE_ALL covers all resources.
+CP_SCRIPT_COMMENT_PREFIX = "#"
+CP_RESOURCE_ALL = "*"
+CP_RESOURCE_SEP = ":"
 
 #endregion Global Constants for p3_mvvm Command Processor pattern.
 # ---------------------------------------------------------------------------- +
@@ -131,8 +157,70 @@ CP_DEBUG =   "DEBUG"
 CP_VERBOSE = "VERBOSE"
 CP_CRITICAL = "CRITICAL"
 CP_NONE = "NONE"
+# Batched user messages, see CPMessageService.batch_start(). A batch is
+# published each CP_MSG_BATCH_FLUSH_INTERVAL seconds from a ring buffer of 
+# CP_MSG_BATCH_CAPACITY messages. Per tag, messages are kept, dropped or
+# summarized by a count at the end of the batch.
+CP_USER_MSG_BATCH_TOPIC = "cp.user_message_batch"
+CP_MSG_BATCH_FLUSH_INTERVAL = 0.1
+CP_MSG_BATCH_CAPACITY = 1000
+CV_MSG_POLICY_KEEP = "keep"
+CV_MSG_POLICY_DROP = "drop"
+CV_MSG_POLICY_SUMMARIZE = "summarize"
+CP_MSG_BATCH_DEFAULT_POLICIES = {
+    CP_DEBUG: CV_MSG_POLICY_SUMMARIZE,
+    CP_VERBOSE: CV_MSG_POLICY_SUMMARIZE
+}
 #endregion Constants for CPMessageService class.
 # ---------------------------------------------------------------------------- +
 
+# ---------------------------------------------------------------------------- +
+#region    Constants for CPTracer class.
+# Defined in p3_telemetry, which the storage and domain layers import
+# without p3_mvvm.
+from p3_telemetry.telemetry_namespace import (
+    CP_TRACE_CAT_COMMAND, CP_TRACE_CAT_TASK, CP_TRACE_CAT_STORAGE,
+    CP_TRACE_CAPACITY, CK_TRACE_ERROR, CK_TRACE_STATUS, CK_TRACE_ROWS,
+    CK_TRACE_WB_ID, CK_TRACE_RULE_COUNT)
+#endregion Constants for CPTracer class.
+# ---------------------------------------------------------------------------- +
+
+# ---------------------------------------------------------------------------- +
+#region    Constants for CPProfiler class.
+# Count of hotspots and allocation sites reported.
+CP_PROFILE_TOP = 20
+# Hotspot sort keys, as pstats.
+CV_PROFILE_SORT_CUMULATIVE = "cumulative"
+CV_PROFILE_SORT_TOTTIME = "tottime"
+CV_PROFILE_SORT_NCALLS = "ncalls"
+CV_PROFILE_SORT_KEYS = (CV_PROFILE_SORT_CUMULATIVE, CV_PROFILE_SORT_TOTTIME,
+                        CV_PROFILE_SORT_NCALLS)
+#endregion Constants for CPProfiler class.
+# ---------------------------------------------------------------------------- +
+
+# ---------------------------------------------------------------------------- +
+#region    Constants for CPMetricsRegistry class.
+from p3_telemetry.telemetry_namespace import (
+    CP_METRICS_LATENCY_BUCKETS, CP_METRICS_DUMP_INTERVAL)
+# Command Processor metric names.
+CP_METRIC_CMD_COUNT = "cp.cmd.count"
+CP_METRIC_CMD_FAILED = "cp.cmd.failed"
+CP_METRIC_CMD_SECONDS = "cp.cmd.seconds"
+CP_METRIC_ASYNC_QUEUE_DEPTH = "cp.async.queue_depth"
+CP_METRIC_ASYNC_QUEUE_WAIT = "cp.async.queue_wait.seconds"
+CP_METRIC_MSG_QUEUE_DEPTH = "cp.msg.queue_depth"
+CP_METRIC_MSG_BATCH_DEPTH = "cp.msg.batch_depth"
+CP_METRIC_RESULT_CACHE_HITS = "cp.result_cache.hits"
+CP_METRIC_RESULT_CACHE_MISSES = "cp.result_cache.misses"
+#endregion Constants for CPMetricsRegistry class.
+# ---------------------------------------------------------------------------- +
+
+# ---------------------------------------------------------------------------- +
+#region    Constants for CPResultCache class.
+# Default count of read cmd results cached.
+CP_RESULT_CACHE_CAPACITY = 32
+#endregion Constants for CPResultCache class.
+# ---------------------------------------------------------------------------- +
+
 #endregion Globals and Constants
 # ---------------------------------------------------------------------------- +
\ No newline at end of file
@@ -0,0 +1,79 @@
+"""
+p3_telemetry - tracing spans and metrics for a Python application.
+
+Depends only on the python standard library and p3_utils, so any layer of an
+application can be traced and measured, from the storage model up to the
+p3_mvvm Command Processor, which re-exports these names.
+"""
+__version__ = "0.1.0"
+__author__ = "Paul Painter"
+__copyright__ = "2025 Paul Painter"
+__name__ = "p3_telemetry"
+__description__ = "p3_telemetry - tracing spans and metrics for Python."
+__license__ = "MIT"
+
+from .telemetry_namespace import (
+    CP_TRACE_CAT_COMMAND,
+    CP_TRACE_CAT_TASK,
+    CP_TRACE_CAT_STORAGE,
+    CP_TRACE_CAPACITY,
+    CK_TRACE_ERROR,
+    CK_TRACE_STATUS,
+    CK_TRACE_ROWS,
+    CK_TRACE_WB_ID,
+    CK_TRACE_RULE_COUNT,
+    CP_METRICS_LATENCY_BUCKETS,
+    CP_METRICS_DUMP_INTERVAL
+)
+from .cp_trace import (
+    CPTracer,
+    CPTraceSpan,
+    CPNullSpan,
+    CP_NULL_SPAN,
+    cp_tracer,
+    cp_trace_span,
+    cp_trace_current,
+    cp_traced
+)
+from .cp_metrics import (
+    CPCounter,
+    CPGauge,
+    CPHistogram,
+    CPMetricsRegistry,
+    cp_metrics,
+    cp_metrics_json,
+    cp_timed
+)
+
+__all__ = [
+    # CPTracer Constants
+    "CP_TRACE_CAT_COMMAND",
+    "CP_TRACE_CAT_TASK",
+    "CP_TRACE_CAT_STORAGE",
+    "CP_TRACE_CAPACITY",
+    "CK_TRACE_ERROR",
+    "CK_TRACE_STATUS",
+    "CK_TRACE_ROWS",
+    "CK_TRACE_WB_ID",
+    "CK_TRACE_RULE_COUNT",
+    # CPMetricsRegistry Constants
+    "CP_METRICS_LATENCY_BUCKETS",
+    "CP_METRICS_DUMP_INTERVAL",
+    # cp_trace module
+    "CPTracer",
+    "CPTraceSpan",
+    "CPNullSpan",
+    "CP_NULL_SPAN",
+    "cp_tracer",
+    "cp_trace_span",
+    "cp_trace_current",
+    "cp_traced",
+    # cp_metrics module
+    "CPCounter",
+    "CPGauge",
+    "CPHistogram",
+    "CPMetricsRegistry",
+    "cp_metrics",
+    "cp_metrics_json",
+    "cp_timed",
+]
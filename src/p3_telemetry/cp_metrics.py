@@ -0,0 +1,354 @@
+# ---------------------------------------------------------------------------- +
+#region cp_metrics.py module
+""" cp_metrics.py implements the class CPMetricsRegistry.
+
+    An in-process registry of named metrics, to compare operational numbers
+    across runs instead of reading them from log text:
+    - CPCounter, a count that only goes up, e.g. commands, rows categorized.
+    - CPGauge, a current value, set or sampled from a function when read,
+      e.g. a queue depth.
+    - CPHistogram, a count of observations in fixed buckets, with the count,
+      sum, min and max, e.g. command latency in seconds.
+
+    Metrics are created on first use by name, cp_metrics.counter(name).inc().
+    Names are dotted, '<layer>.<object>.<measure>', e.g. 'cp.cmd.seconds'.
+    cp_metrics.snapshot() returns all values as a JSON-ready dict, dump()
+    appends a snapshot to a JSON Lines file, dump_start() does so
+    periodically from a daemon thread.
+"""
+#endregion cp_metrics.py module
+#------------------------------------------------------------------------------+
+#region Imports
+# python standard library modules and packages
+import bisect, functools, json, logging, math, threading, time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+# third-party modules and packages
+import p3_utils as p3u
+# local modules and packages
+from .telemetry_namespace import *
+#endregion Imports
+# ---------------------------------------------------------------------------- +
+#region Globals and Constants
+logger = logging.getLogger(__name__)  # create logger for the module
+#endregion Globals and Constants
+# ---------------------------------------------------------------------------- +
+#region    CPCounter class
+class CPCounter:
+    """A count that only goes up."""
+    __slots__ = ("name", "help", "_value", "_lock")
+
+    def __init__(self, name: str, help: str = "") -> None:
+        self.name: str = name
+        self.help: str = help
+        self._value: int = 0
+        self._lock: threading.Lock = threading.Lock()
+
+    @property
+    def value(self) -> int:
+        return self._value
+
+    def inc(self, n: int = 1) -> None:
+        """Add n to the count, n must not be negative."""
+        if n < 0:
+            raise ValueError(f"Counter '{self.name}' inc must be >= 0: {n}")
+        with self._lock:
+            self._value += n
+
+    def reset(self) -> None:
+        with self._lock:
+            self._value = 0
+#endregion CPCounter class
+# ---------------------------------------------------------------------------- +
+#region    CPGauge class
+class CPGauge:
+    """A current value, set, or sampled from func when read."""
+    __slots__ = ("name", "help", "func", "_value", "_lock")
+
+    def __init__(self, name: str, help: str = "",
+                 func: Optional[Callable[[], float]] = None) -> None:
+        self.name: str = name
+        self.help: str = help
+        self.func: Optional[Callable[[], float]] = func
+        self._value: float = 0
+        self._lock: threading.Lock = threading.Lock()
+
+    @property
+    def value(self) -> float:
+        if self.func is None:
+            return self._value
+        try:
+            return self.func()
+        except Exception as e:
+            logger.debug(f"Gauge '{self.name}' func failed: {p3u.exc_err_msg(e)}")
+            return math.nan
+
+    def set(self, value: float) -> None:
+        with self._lock:
+            self._value = value
+
+    def inc(self, n: float = 1) -> None:
+        with self._lock:
+            self._value += n
+
+    def dec(self, n: float = 1) -> None:
+        with self._lock:
+            self._value -= n
+
+    def reset(self) -> None:
+        self.set(0)
+#endregion CPGauge class
+# ---------------------------------------------------------------------------- +
+#region    CPHistogram class
+class CPHistogram:
+    """Observations counted in fixed buckets, by the bucket upper bounds.
+
+    An observation is counted in the first bucket with an upper bound >= the
+    value, values above the last bound are counted in an overflow bucket.
+    """
+    __slots__ = ("name", "help", "buckets", "_counts", "_count", "_sum",
+                 "_min", "_max", "_lock")
+
+    def __init__(self, name: str, help: str = "",
+                 buckets: Sequence[float] = CP_METRICS_LATENCY_BUCKETS) -> None:
+        if len(buckets) == 0 or list(buckets) != sorted(set(buckets)):
+            raise ValueError(f"Histogram '{name}' buckets must be ascending "
+                             f"and unique: {buckets}")
+        self.name: str = name
+        self.help: str = help
+        self.buckets: List[float] = list(buckets)
+        self._lock: threading.Lock = threading.Lock()
+        self.reset()
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def sum(self) -> float:
+        return self._sum
+
+    def observe(self, value: float) -> None:
+        """Count value in its bucket."""
+        i = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[i] += 1
+            self._count += 1
+            self._sum += value
+            self._min = min(self._min, value)
+            self._max = max(self._max, value)
+
+    def quantile(self, q: float) -> float:
+        """Return an estimate of quantile q, the upper bound of the bucket of
+        the q-th observation, or the max for the overflow bucket."""
+        with self._lock:
+            if self._count == 0:
+                return math.nan
+            rank = q * self._count
+            total = 0
+            for i, count in enumerate(self._counts):
+                total += count
+                if total >= rank and count > 0:
+                    return (min(self.buckets[i], self._max)
+                            if i < len(self.buckets) else self._max)
+            return self._max
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return the histogram values as a dict."""
+        with self._lock:
+            count, total = self._count, self._sum
+            counts = list(self._counts)
+            h_min = self._min if count else 0.0
+            h_max = self._max if count else 0.0
+        return {"count": count, "sum": total,
+                "mean": total / count if count else 0.0,
+                "min": h_min, "max": h_max,
+                "p50": self.quantile(0.5) if count else 0.0,
+                "p95": self.quantile(0.95) if count else 0.0,
+                "buckets": {str(b): c for b, c in zip(self.buckets, counts)},
+                "overflow": counts[-1]}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counts: List[int] = [0] * (len(self.buckets) + 1)
+            self._count: int = 0
+            self._sum: float = 0.0
+            self._min: float = math.inf
+            self._max: float = -math.inf
+#endregion CPHistogram class
+# ---------------------------------------------------------------------------- +
+#region    CPMetricsRegistry class
+class CPMetricsRegistry:
+    """A registry of named CPCounter, CPGauge and CPHistogram metrics."""
+    def __init__(self) -> None:
+        self._lock: threading.Lock = threading.Lock()
+        self._metrics: Dict[str, CPCounter | CPGauge | CPHistogram] = {}
+        self._started: float = time.time()
+        self._dump_thread: Optional[threading.Thread] = None
+        self._dump_stop_event: threading.Event = threading.Event()
+        self.dump_path: Optional[Path] = None
+
+    def _get(self, name: str, cls: type, **kwargs) -> Any:
+        metric = self._metrics.get(name)
+        if metric is None:
+            with self._lock:
+                metric = self._metrics.get(name)
+                if metric is None:
+                    metric = self._metrics[name] = cls(name, **kwargs)
+        if not isinstance(metric, cls):
+            raise TypeError(f"Metric '{name}' is a {type(metric).__name__}, "
+                            f"not a {cls.__name__}.")
+        return metric
+
+    def counter(self, name: str, help: str = "") -> CPCounter:
+        """Return the counter name, created on first use."""
+        return self._get(name, CPCounter, help=help)
+
+    def gauge(self, name: str, help: str = "",
+              func: Optional[Callable[[], float]] = None) -> CPGauge:
+        """Return the gauge name, created on first use. A func replaces the
+        func of an existing gauge, the last registered is sampled."""
+        gauge = self._get(name, CPGauge, help=help, func=func)
+        if func is not None:
+            gauge.func = func
+        return gauge
+
+    def histogram(self, name: str, help: str = "",
+                  buckets: Sequence[float] = CP_METRICS_LATENCY_BUCKETS
+                  ) -> CPHistogram:
+        """Return the histogram name, created on first use with buckets."""
+        return self._get(name, CPHistogram, help=help, buckets=buckets)
+
+    def names(self) -> List[str]:
+        with self._lock:
+            return sorted(self._metrics)
+
+    def reset(self) -> None:
+        """Reset all metrics to zero, gauge funcs are kept."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+            self._started = time.time()
+        for metric in metrics:
+            metric.reset()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return the values of all metrics as a JSON-ready dict."""
+        with self._lock:
+            metrics = sorted(self._metrics.items())
+        snapshot: Dict[str, Any] = {
+            "time": datetime.now().isoformat(timespec="seconds"),
+            "uptime": round(time.time() - self._started, 3),
+            "counters": {}, "gauges": {}, "histograms": {}}
+        for name, metric in metrics:
+            if isinstance(metric, CPCounter):
+                snapshot["counters"][name] = metric.value
+            elif isinstance(metric, CPGauge):
+                snapshot["gauges"][name] = metric.value
+            else:
+                snapshot["histograms"][name] = metric.snapshot()
+        return snapshot
+
+    def report(self, prefix: str = "") -> str:
+        """Return the metrics, with names starting with prefix, as text."""
+        s = self.snapshot()
+        lines: List[str] = [f"Metrics at {s['time']}, uptime {s['uptime']:.1f}s"]
+        for kind in ("counters", "gauges"):
+            for name, value in s[kind].items():
+                if name.startswith(prefix):
+                    lines.append(f"  {name:<40} {value:>12,.6g}")
+        for name, h in s["histograms"].items():
+            if name.startswith(prefix):
+                lines.append(f"  {name:<40} {h['count']:>12,} "
+                             f"mean {h['mean']:.4f} p50 {h['p50']:.4f} "
+                             f"p95 {h['p95']:.4f} max {h['max']:.4f}")
+        return "\n".join(lines)
+
+    def dump(self, path: str | Path) -> Dict[str, Any]:
+        """Append a snapshot to path, a JSON Lines file, one line per dump,
+        and return the snapshot."""
+        try:
+            path = Path(path)
+            snapshot = self.snapshot()
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, "a", encoding="utf-8") as f:
+                f.write(cp_metrics_json(snapshot) + "\n")
+            return snapshot
+        except Exception as e:
+            logger.error(p3u.exc_err_msg(e))
+            raise
+
+    @property
+    def dumping(self) -> bool:
+        """True while a periodic dump is running."""
+        return self._dump_thread is not None
+
+    def dump_start(self, path: str | Path,
+                   interval: float = CP_METRICS_DUMP_INTERVAL) -> None:
+        """Dump a snapshot to path each interval seconds, and at dump_stop()."""
+        if interval <= 0:
+            raise ValueError(f"interval must be > 0: {interval}")
+        self.dump_stop()
+        self.dump_path = Path(path)
+        self._dump_stop_event.clear()
+        self._dump_thread = threading.Thread(
+            target=self._dump_worker, args=(interval,),
+            name="CPMetricsDump", daemon=True)
+        self._dump_thread.start()
+        logger.info(f"Metrics dump started: '{self.dump_path}' each {interval}s.")
+
+    def dump_stop(self) -> None:
+        """Stop the periodic dump, after a last dump."""
+        if self._dump_thread is None:
+            return
+        self._dump_stop_event.set()
+        self._dump_thread.join()
+        self._dump_thread = None
+        self.dump(self.dump_path)
+        logger.info(f"Metrics dump stopped: '{self.dump_path}'")
+
+    def _dump_worker(self, interval: float) -> None:
+        """Thread dumping a snapshot each interval seconds."""
+        while not self._dump_stop_event.wait(interval):
+            try:
+                self.dump(self.dump_path)
+            except Exception as e:
+                logger.error(p3u.exc_err_msg(e))
+#endregion CPMetricsRegistry class
+# ---------------------------------------------------------------------------- +
+#region    cp_metrics and module functions
+cp_metrics: CPMetricsRegistry = CPMetricsRegistry()
+
+def cp_timed(name: str, errors: Optional[str] = None) -> Callable:
+    """Decorator, observe the seconds of each call of a function in the
+    cp_metrics histogram name, and count the calls raising an exception in
+    the counter errors, if given."""
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            st = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            except Exception:
+                if errors:
+                    cp_metrics.counter(errors).inc()
+                raise
+            finally:
+                cp_metrics.histogram(name).observe(time.perf_counter() - st)
+        return wrapper
+    return decorator
+
+def cp_metrics_json(snapshot: Dict[str, Any]) -> str:
+    """Return a metrics snapshot as strict JSON. NaN and infinite values,
+    e.g. a gauge whose func failed, are null, JSON has no NaN."""
+    def finite(value: Any) -> Any:
+        if isinstance(value, float) and not math.isfinite(value):
+            return None
+        if isinstance(value, dict):
+            return {k: finite(v) for k, v in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [finite(v) for v in value]
+        return value
+    return json.dumps(finite(snapshot), default=str, allow_nan=False)
+#endregion cp_metrics and module functions
+# ---------------------------------------------------------------------------- +
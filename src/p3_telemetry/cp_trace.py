@@ -0,0 +1,246 @@
+# ---------------------------------------------------------------------------- +
+#region cp_trace.py module
+""" cp_trace.py implements the class CPTracer, structured tracing spans.
+
+    A span times a unit of work, a command, a workflow task, a storage call,
+    recording the wall time, the CPU time of its thread and attributes such
+    as rows, wb_id or rule count. Spans nest by time on a thread, a command
+    span contains the task spans, which contain the storage spans. The
+    recorded spans are dumped as Chrome trace-event JSON, to inspect in a
+    trace viewer such as chrome://tracing or https://ui.perfetto.dev.
+
+    Tracing is off by default, cp_tracer.start() to turn it on. When off,
+    cp_trace_span() returns a shared no-op span, the cost is one check.
+
+    Usage:
+        with cp_trace_span("compile_category_map", CP_TRACE_CAT_TASK) as span:
+            ...
+            span.set(rule_count=len(rules))
+
+        @cp_traced(CP_TRACE_CAT_STORAGE)
+        def bsm_file_load(path):
+            ...
+            cp_trace_current().set(rows=len(rows))
+"""
+#endregion cp_trace.py module
+#------------------------------------------------------------------------------+
+#region Imports
+# python standard library modules and packages
+import functools, json, logging, os, threading, time
+from collections import deque
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, List, Optional
+# third-party modules and packages
+import p3_utils as p3u
+# local modules and packages
+from .telemetry_namespace import *
+#endregion Imports
+# ---------------------------------------------------------------------------- +
+#region Globals and Constants
+logger = logging.getLogger(__name__)  # create logger for the module
+#endregion Globals and Constants
+# ---------------------------------------------------------------------------- +
+#region    CPTraceSpan class
+class CPTraceSpan:
+    """A timed span, a context manager recording a Chrome trace 'X' event."""
+    __slots__ = ("tracer", "name", "cat", "args", "_st_ns", "_st_cpu_ns")
+
+    def __init__(self, tracer: "CPTracer", name: str, cat: str,
+                 args: Dict[str, Any]) -> None:
+        self.tracer: CPTracer = tracer
+        self.name: str = name
+        self.cat: str = cat
+        self.args: Dict[str, Any] = args
+        self._st_ns: int = 0
+        self._st_cpu_ns: int = 0
+
+    def set(self, **args: Any) -> "CPTraceSpan":
+        """Set attributes of the span."""
+        self.args.update(args)
+        return self
+
+    def __enter__(self) -> "CPTraceSpan":
+        self.tracer._push(self)
+        self._st_cpu_ns = time.thread_time_ns()
+        self._st_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        end_ns = time.perf_counter_ns()
+        end_cpu_ns = time.thread_time_ns()
+        self.tracer._pop(self)
+        if exc_type is not None:
+            self.args[CK_TRACE_ERROR] = f"{exc_type.__name__}: {exc}"
+        self.tracer._record(self, self._st_ns, end_ns - self._st_ns,
+                            end_cpu_ns - self._st_cpu_ns)
+        return False
+#endregion CPTraceSpan class
+# ---------------------------------------------------------------------------- +
+#region    CPNullSpan class
+class CPNullSpan:
+    """The no-op span used when tracing is off."""
+    __slots__ = ()
+
+    def set(self, **args: Any) -> "CPNullSpan":
+        return self
+
+    def __enter__(self) -> "CPNullSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        return False
+
+CP_NULL_SPAN = CPNullSpan()
+#endregion CPNullSpan class
+# ---------------------------------------------------------------------------- +
+#region    CPTracer class
+class CPTracer:
+    """Record tracing spans in a bounded buffer and dump Chrome trace JSON.
+
+    Spans are recorded from any thread. When the buffer is full, the oldest
+    events are discarded and counted in dropped.
+    """
+    def __init__(self, capacity: int = CP_TRACE_CAPACITY) -> None:
+        if capacity < 1:
+            raise ValueError(f"capacity must be >= 1: {capacity}")
+        self._lock: threading.Lock = threading.Lock()
+        self._events: Deque[Dict[str, Any]] = deque(maxlen=capacity)
+        self._thread_names: Dict[int, str] = {}
+        self._local: threading.local = threading.local()
+        self._enabled: bool = False
+        self._origin_ns: int = time.perf_counter_ns()
+        self.dropped: int = 0
+
+    @property
+    def enabled(self) -> bool:
+        """True when spans are recorded."""
+        return self._enabled
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def start(self, clear: bool = True) -> None:
+        """Start recording spans, by default clearing the recorded spans."""
+        if clear:
+            self.clear()
+        self._enabled = True
+        logger.info("CPTracer started.")
+
+    def stop(self) -> None:
+        """Stop recording spans, the recorded spans are kept for dump()."""
+        self._enabled = False
+        logger.info(f"CPTracer stopped: {len(self._events)} events.")
+
+    def clear(self) -> None:
+        """Discard the recorded spans."""
+        with self._lock:
+            self._events.clear()
+            self._thread_names.clear()
+            self._origin_ns = time.perf_counter_ns()
+            self.dropped = 0
+
+    def span(self, name: str, cat: str = CP_TRACE_CAT_COMMAND,
+             **args: Any) -> CPTraceSpan | CPNullSpan:
+        """Return a span context manager, a no-op span when not enabled."""
+        if not self._enabled:
+            return CP_NULL_SPAN
+        return CPTraceSpan(self, name, cat, args)
+
+    def current(self) -> CPTraceSpan | CPNullSpan:
+        """Return the innermost open span of the calling thread."""
+        stack: List[CPTraceSpan] = getattr(self._local, "stack", None)
+        return stack[-1] if stack else CP_NULL_SPAN
+
+    def events(self) -> List[Dict[str, Any]]:
+        """Return a copy of the recorded span events."""
+        with self._lock:
+            return list(self._events)
+
+    def trace_events(self) -> Dict[str, Any]:
+        """Return the recorded spans as a Chrome trace-event JSON object."""
+        with self._lock:
+            events = list(self._events)
+            thread_names = dict(self._thread_names)
+        pid = os.getpid()
+        metadata = [{"name": "thread_name", "ph": "M", "pid": pid, "tid": tid,
+                     "args": {"name": name}}
+                    for tid, name in thread_names.items()]
+        return {"traceEvents": metadata + events,
+                "displayTimeUnit": "ms",
+                "otherData": {"dropped": self.dropped}}
+
+    def dump(self, path: str | Path) -> int:
+        """Write the recorded spans to path as Chrome trace-event JSON.
+
+        Returns:
+            int: The count of span events written.
+        """
+        try:
+            path = Path(path)
+            trace = self.trace_events()
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(trace, f, default=str)
+            count = sum(1 for e in trace["traceEvents"] if e["ph"] == "X")
+            logger.info(f"CPTracer dumped {count} events to: '{path}'")
+            return count
+        except Exception as e:
+            logger.error(p3u.exc_err_msg(e))
+            raise
+
+    def _push(self, span: CPTraceSpan) -> None:
+        stack: List[CPTraceSpan] = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        stack.append(span)
+
+    def _pop(self, span: CPTraceSpan) -> None:
+        stack: List[CPTraceSpan] = getattr(self._local, "stack", None)
+        if stack and stack[-1] is span:
+            stack.pop()
+
+    def _record(self, span: CPTraceSpan, st_ns: int, dur_ns: int,
+                cpu_ns: int) -> None:
+        thread = threading.current_thread()
+        tid = threading.get_native_id()
+        event = {"name": span.name, "cat": span.cat, "ph": "X",
+                 "ts": (st_ns - self._origin_ns) / 1000.0,
+                 "dur": dur_ns / 1000.0,
+                 "tdur": cpu_ns / 1000.0,
+                 "pid": os.getpid(), "tid": tid,
+                 "args": span.args}
+        with self._lock:
+            if len(self._events) == self._events.maxlen:
+                self.dropped += 1
+            self._events.append(event)
+            self._thread_names[tid] = thread.name
+#endregion CPTracer class
+# ---------------------------------------------------------------------------- +
+#region    cp_tracer and module functions
+cp_tracer: CPTracer = CPTracer()
+
+def cp_trace_span(name: str, cat: str = CP_TRACE_CAT_COMMAND,
+                  **args: Any) -> CPTraceSpan | CPNullSpan:
+    """Return a span of the cp_tracer, a no-op span when not enabled."""
+    return cp_tracer.span(name, cat, **args)
+
+def cp_trace_current() -> CPTraceSpan | CPNullSpan:
+    """Return the innermost open span of the calling thread."""
+    return cp_tracer.current()
+
+def cp_traced(cat: str = CP_TRACE_CAT_COMMAND,
+              name: Optional[str] = None) -> Callable:
+    """Decorator, trace each call of a function in a span of the cp_tracer,
+    named by the function name by default."""
+    def decorator(func: Callable) -> Callable:
+        span_name = name or func.__name__
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not cp_tracer.enabled:
+                return func(*args, **kwargs)
+            with cp_tracer.span(span_name, cat):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+#endregion cp_tracer and module functions
+# ---------------------------------------------------------------------------- +
@@ -0,0 +1,31 @@
+# ---------------------------------------------------------------------------- +
+#region telemetry_namespace.py module
+""" telemetry_namespace.py defines symbol constants for the p3_telemetry
+package."""
+#endregion telemetry_namespace.py module
+# ---------------------------------------------------------------------------- +
+#region    Constants for CPTracer class.
+# Span categories, the Chrome trace-event 'cat' of a span.
+CP_TRACE_CAT_COMMAND = "command"
+CP_TRACE_CAT_TASK = "task"
+CP_TRACE_CAT_STORAGE = "storage"
+# Max span events kept, the oldest are dropped.
+CP_TRACE_CAPACITY = 100000
+# Span attribute keys
+CK_TRACE_ERROR = "error"
+CK_TRACE_STATUS = "status"
+CK_TRACE_ROWS = "rows"
+CK_TRACE_WB_ID = "wb_id"
+CK_TRACE_RULE_COUNT = "rule_count"
+#endregion Constants for CPTracer class.
+# ---------------------------------------------------------------------------- +
+
+# ---------------------------------------------------------------------------- +
+#region    Constants for CPMetricsRegistry class.
+# Default CPHistogram bucket upper bounds, for latency in seconds.
+CP_METRICS_LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1,
+                              0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+# Default seconds between periodic dumps.
+CP_METRICS_DUMP_INTERVAL = 60.0
+#endregion Constants for CPMetricsRegistry class.
+# ---------------------------------------------------------------------------- +
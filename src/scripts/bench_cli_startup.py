@@ -0,0 +1,54 @@
+#------------------------------------------------------------------------------+
+# bench_cli_startup.py - CLI startup time, the BudManCLIParser construction
+# with lazy cmd parsers, against building all cmd parsers up front, and with
+# --app, the time for main.py to reach the first prompt and quit.
+#
+# usage: python src/scripts/bench_cli_startup.py [repeat] [--app]
+#------------------------------------------------------------------------------+
+import sys, subprocess, time
+from pathlib import Path
+from typing import Callable
+
+# local modules and packages
+from budman_settings import BudManSettings
+from budman_cli_view import BudManCLIParser
+
+#------------------------------------------------------------------------------+
+def best_of(repeat: int, func: Callable[[], None]) -> float:
+    """Return the best elapsed seconds of repeat calls of func."""
+    best = float("inf")
+    for _ in range(repeat):
+        st = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - st)
+    return best
+
+def bench_parsers(repeat: int) -> None:
+    """Time the parser construction, lazy, eager and per cmd."""
+    settings = BudManSettings()
+    lazy = best_of(repeat, lambda: BudManCLIParser(settings))
+    eager = best_of(repeat, lambda: BudManCLIParser(settings).cmd_parser_build_all())
+    print(f"BudManCLIParser, best of {repeat}:")
+    print(f"  lazy, at startup   : {lazy * 1000:>9.2f} ms")
+    print(f"  all cmd parsers    : {eager * 1000:>9.2f} ms")
+    for cmd_name in BudManCLIParser.CMD_NAMES:
+        first_use = best_of(repeat, lambda: BudManCLIParser(settings).cmd_parser(cmd_name))
+        print(f"    {cmd_name:<16} : {first_use * 1000:>9.2f} ms on first use")
+
+def bench_first_prompt(repeat: int) -> None:
+    """Time main.py from launch to the first prompt, answered with quit."""
+    main_py = Path(__file__).resolve().parents[2] / "main.py"
+    def run() -> None:
+        subprocess.run([sys.executable, str(main_py)], input="quit\n",
+                       text=True, capture_output=True, check=False,
+                       cwd=main_py.parent)
+    elapsed = best_of(repeat, run)
+    print(f"main.py to first prompt and quit, best of {repeat}: "
+          f"{elapsed:.3f} s")
+
+if __name__ == "__main__":
+    argv = [a for a in sys.argv[1:] if a != "--app"]
+    repeat = int(argv[0]) if argv else 5
+    bench_parsers(repeat)
+    if "--app" in sys.argv:
+        bench_first_prompt(max(1, repeat // 5))
@@ -0,0 +1,57 @@
+#------------------------------------------------------------------------------+
+# bench_cp_messages.py - throughput of the CPMessageService user messages,
+# one by one and batched, in messages per second.
+#
+# usage: python src/scripts/bench_cp_messages.py [message_count]
+#------------------------------------------------------------------------------+
+import sys, time
+from typing import List
+
+# third-party modules and packages
+import p3_mvvm as p3m
+
+#------------------------------------------------------------------------------+
+def bench_one_by_one(count: int) -> float:
+    """Publish count user messages, one PubSub message and callback each."""
+    received: List[int] = [0]
+    def subscriber(message) -> None:
+        received[0] += 1
+    sub_id = p3m.cp_msg_svc.subscribe_user_message(subscriber)
+    try:
+        st = time.perf_counter()
+        for i in range(count):
+            p3m.cp_msg_svc.user_message(f"Message {i}", p3m.CP_INFO)
+        p3m.cp_msg_svc.drain(timeout=60000)
+        elapsed = time.perf_counter() - st
+    finally:
+        p3m.cp_msg_svc.unsubscribe(p3m.CP_USER_MSG_TOPIC, sub_id)
+    assert received[0] == count, f"received {received[0]} of {count}"
+    return count / elapsed
+
+def bench_batched(count: int) -> float:
+    """Publish count user messages in batches, one callback per batch."""
+    received: List[int] = [0]
+    @p3m.cp_user_message_batch_callback
+    def subscriber(batch: List[p3m.CPUserOutputMessage]) -> None:
+        received[0] += len(batch)
+    sub_id = p3m.cp_msg_svc.subscribe_user_message_batch(subscriber)
+    p3m.cp_msg_svc.batch_start(capacity=count)
+    try:
+        st = time.perf_counter()
+        for i in range(count):
+            p3m.cp_msg_svc.user_message(f"Message {i}", p3m.CP_INFO)
+        p3m.cp_msg_svc.batch_stop()
+        p3m.cp_msg_svc.drain(timeout=60000)
+        elapsed = time.perf_counter() - st
+    finally:
+        p3m.cp_msg_svc.unsubscribe(p3m.CP_USER_MSG_BATCH_TOPIC, sub_id)
+    assert received[0] == count, f"received {received[0]} of {count}"
+    return count / elapsed
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    one = bench_one_by_one(count)
+    batched = bench_batched(count)
+    print(f"{count} user messages:")
+    print(f"  one by one: {one:>12,.0f} msgs/s")
+    print(f"  batched   : {batched:>12,.0f} msgs/s  ({batched / one:.1f}x)")
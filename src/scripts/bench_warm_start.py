@@ -0,0 +1,50 @@
+#------------------------------------------------------------------------------+
+# bench_warm_start.py - BudManApp setup time for the BDM_STORE, a cold start
+# with no warm-start snapshot, which also saves one, against a warm start
+# restoring it. Each setup runs in a fresh python, headless.
+#
+# usage: python src/scripts/bench_warm_start.py [repeat] [bdms_url]
+#------------------------------------------------------------------------------+
+import sys, subprocess, time
+from pathlib import Path
+from typing import Optional
+
+# local modules and packages
+from budman_settings import BudManSettings
+from budman_settings.budman_settings_constants import BDM_STORE_URL
+from budget_storage_model import bsm_warm_start_clear, bsm_warm_start_path
+
+#------------------------------------------------------------------------------+
+def setup_seconds(bdms_url: str) -> float:
+    """Run budman_app_setup() for bdms_url in a fresh python, return the
+    seconds it took."""
+    code = ("import sys, time\n"
+            "from budman_settings import BudManSettings\n"
+            "from budman_app.budman_app import BudManApp\n"
+            "st = time.perf_counter()\n"
+            "BudManApp(BudManSettings()).budman_app_setup(sys.argv[1], headless=True)\n"
+            "print(time.perf_counter() - st)\n")
+    result = subprocess.run([sys.executable, "-c", code, bdms_url],
+                            text=True, capture_output=True, check=True)
+    return float(result.stdout.strip().splitlines()[-1])
+
+def bench_warm_start(repeat: int, bdms_url: Optional[str] = None) -> None:
+    """Time the cold and warm setup, best of repeat runs each."""
+    bdms_url = bdms_url or BudManSettings()[BDM_STORE_URL]
+    bdms_path = Path.from_uri(bdms_url)
+    cold, warm = float("inf"), float("inf")
+    for _ in range(repeat):
+        bsm_warm_start_clear(bdms_path)
+        cold = min(cold, setup_seconds(bdms_url))
+        if not bsm_warm_start_path(bdms_path).exists():
+            print(f"No warm-start snapshot saved for '{bdms_url}'.")
+            return
+        warm = min(warm, setup_seconds(bdms_url))
+    print(f"BudManApp setup '{bdms_path.name}', best of {repeat}:")
+    print(f"  cold start, saving snapshot : {cold * 1000:>9.2f} ms")
+    print(f"  warm start from snapshot    : {warm * 1000:>9.2f} ms")
+    print(f"  snapshot '{bsm_warm_start_path(bdms_path)}'")
+
+if __name__ == "__main__":
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    bench_warm_start(repeat, sys.argv[2] if len(sys.argv) > 2 else None)
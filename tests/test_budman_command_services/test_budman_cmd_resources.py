@@ -0,0 +1,58 @@
+# ---------------------------------------------------------------------------- +
+#region tests/test_budman_command_services/test_budman_cmd_resources.py
+"""Tests for the budman_command_services.budman_cmd_resources module."""
+#endregion tests/test_budman_command_services/test_budman_cmd_resources.py
+# ---------------------------------------------------------------------------- +
+#region    Imports
+# python standard libraries
+import pytest, logging
+from typing import Any, List
+# third-party libraries
+
+# local libraries
+import p3_mvvm as p3m
+import budman_command_services as cp
+#endregion Imports
+# ---------------------------------------------------------------------------- +
+#region Globals
+logger = logging.getLogger(__name__)
+#endregion Globals
+# ---------------------------------------------------------------------------- +
+def load_wb_cmd(wb_index: int, **parms: Any) -> p3m.CMD_OBJECT_TYPE:
+    """Return a 'load wb <wb_index>' CMD_OBJECT, as the script line parser."""
+    return p3m.cp_CMD_OBJECT_create(
+        cmd_name=cp.CV_LOAD_CMD_NAME, cmd_key=cp.CV_LOAD_CMD_KEY,
+        subcmd_name=cp.CV_WORKBOOKS_SUBCMD_NAME,
+        subcmd_key=cp.CV_LOAD_WORKBOOKS_SUBCMD_KEY,
+        other_attrs={cp.CK_WB_LIST: [wb_index], cp.CK_ALL_WBS: False, **parms})
+
+def plan_levels(cmds: List[p3m.CMD_OBJECT_TYPE]) -> List[int]:
+    """Return the CPScriptRunner plan level of each cmd."""
+    runner = p3m.CPScriptRunner(None, lambda line: None, cp.BUDMAN_CMD_resources)
+    steps = []
+    for line_no, cmd in enumerate(cmds, start=1):
+        step = p3m.CPScriptStep(line_no, str(line_no))
+        step.cmd = cmd
+        step.reads, step.writes = cp.BUDMAN_CMD_resources(cmd)
+        steps.append(step)
+    runner.cp_script_plan(steps)
+    return [step.level for step in steps]
+
+class TestBudManCmdResources:
+    """Tests for BUDMAN_CMD_resources()."""
+    def test_script_loads_write_only_their_workbook(self) -> None:
+        """Test a script 'load wb', not selecting the DC current workbook,
+        writes only its workbook, so loads of other workbooks run at once."""
+        cmd = load_wb_cmd(3, **{cp.CK_SELECT_WORKBOOK: False})
+        reads, writes = cp.BUDMAN_CMD_resources(cmd)
+        assert writes == {f"{cp.CV_WB_RESOURCE}{p3m.CP_RESOURCE_SEP}3"}
+        assert cp.CV_DC_RESOURCE in reads
+        assert plan_levels([load_wb_cmd(i, **{cp.CK_SELECT_WORKBOOK: False})
+                            for i in range(5)]) == [1] * 5
+
+    def test_selecting_load_writes_the_dc(self) -> None:
+        """Test an interactive 'load wb' selecting the DC current workbook
+        writes the DC, so such loads run one after another."""
+        _, writes = cp.BUDMAN_CMD_resources(load_wb_cmd(3))
+        assert cp.CV_DC_RESOURCE in writes
+        assert plan_levels([load_wb_cmd(i) for i in range(3)]) == [1, 2, 3]
@@ -0,0 +1,78 @@
+# ---------------------------------------------------------------------------- +
+# test_loaded_workbook_collection.py
+# ---------------------------------------------------------------------------- +
+#region imports
+# python standard libraries
+import pytest
+from types import SimpleNamespace
+# third-party libraries
+import logging, p3_utils as p3u, p3logging as p3l
+# local libraries
+from budman_namespace.bdm_workbook_class import BDMWorkbook
+from budman_data_context.loaded_workbook_collection import LoadedWorkbookCollection
+#endregion imports
+# ---------------------------------------------------------------------------- +
+#region Globals
+logger = logging.getLogger(__name__)
+#endregion Globals
+# ---------------------------------------------------------------------------- +
+def make_owner(wb_id: str) -> SimpleNamespace:
+    """Return a BDMWorkbook stand-in owning some content."""
+    return SimpleNamespace(wb_id=wb_id, wb_content=[wb_id], wb_loaded=True)
+
+def make_loaded(max_count: int) -> tuple:
+    """Return a LoadedWorkbookCollection with a loader and flush recorder."""
+    flushed = []
+    loaded = LoadedWorkbookCollection(max_count=max_count, max_bytes=0)
+    loaded.configure(loader=lambda wb_id, owner: [wb_id],
+                     flush=lambda wb_id, content, owner: flushed.append(wb_id))
+    return loaded, flushed
+# ---------------------------------------------------------------------------- +
+class TestLoadedWorkbookCollection:
+    """LoadedWorkbookCollection LRU eviction and lazy reload."""
+    def test_lru_eviction_and_reload(self) -> None:
+        """Test the LRU workbook is evicted and reloaded on access."""
+        loaded, _ = make_loaded(2)
+        owners = {k: make_owner(k) for k in ("a", "b", "c")}
+        loaded.put("a", owners["a"].wb_content, owners["a"])
+        loaded.put("b", owners["b"].wb_content, owners["b"])
+        _ = loaded["a"]  # b is now least recently used
+        loaded.put("c", owners["c"].wb_content, owners["c"])
+        assert "b" not in loaded and loaded.is_evicted("b")
+        assert owners["b"].wb_content is None and not owners["b"].wb_loaded
+        assert loaded.get("b") == ["b"]
+        assert "a" not in loaded and len(loaded) == 2
+        assert loaded.residency()["reloads"] == 1
+        assert (loaded.hit_count, loaded.miss_count) == (1, 1)
+
+    def test_bdm_workbook_lazy_reload(self) -> None:
+        """Test an evicted BDMWorkbook owner reloads wb_content on read."""
+        loaded, _ = make_loaded(1)
+        wbs = [BDMWorkbook(wb_name=f"{k}.xlsx", wf_folder="data/new")
+               for k in ("a", "b")]
+        for wb in wbs:
+            wb.wb_content, wb.wb_loaded = [wb.wb_id], True
+            loaded.put(wb.wb_id, wb.wb_content, wb)
+        wb = wbs[0]
+        assert loaded.is_evicted(wb.wb_id) and wb.wb_content_evicted
+        assert wb.wb_loaded and wb.to_dict()["wb_content"] is None
+        assert wb.wb_content == [wb.wb_id] and not wb.wb_content_evicted
+        assert wb.wb_id in loaded and loaded.residency()["reloads"] == 1
+
+    def test_dirty_flushed_or_kept(self) -> None:
+        """Test dirty content is flushed before eviction, or kept."""
+        loaded, flushed = make_loaded(1)
+        loaded.put("a", ["a"], make_owner("a"), dirty=True)
+        loaded.put("b", ["b"], make_owner("b"))
+        assert flushed == ["a"] and "a" not in loaded
+        loaded.flush = None
+        loaded.put("c", ["c"], make_owner("c"), dirty=True)
+        loaded.put("d", ["d"], make_owner("d"))
+        assert "c" in loaded and "b" not in loaded and len(loaded) == 2
+
+    def test_no_loader_no_eviction(self) -> None:
+        """Test content is never evicted without a loader."""
+        loaded = LoadedWorkbookCollection(max_count=1)
+        loaded["a"] = ["a"]
+        loaded["b"] = ["b"]
+        assert len(loaded) == 2 and loaded.residency()["evictions"] == 0
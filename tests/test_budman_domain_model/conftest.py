@@ -0,0 +1,59 @@
+# ---------------------------------------------------------------------------- +
+#region tests/test_budman_domain_model/conftest.py
+"""Fixtures for the budget_domain_model workbook tests."""
+#endregion tests/test_budman_domain_model/conftest.py
+# ---------------------------------------------------------------------------- +
+#region    Imports
+# python standard libraries
+import pytest, logging, copy, json
+from pathlib import Path
+from typing import Callable
+# third-party libraries
+
+# local libraries
+from budman_namespace import *
+from budget_domain_model import BDMConfig
+#endregion Imports
+# ---------------------------------------------------------------------------- +
+#region Globals
+logger = logging.getLogger(__name__)
+#endregion Globals
+# ---------------------------------------------------------------------------- +
+@pytest.fixture
+def wb_data() -> Callable[..., dict]:
+    """Return a factory of BDM_STORE workbook dicts for a wb_name, in the
+    boa intake 'data/New' folder. The FI_KEY is built at run time, so it is
+    not a constant already interned by the compiler."""
+    def _wb_data(wb_name: str, wf_purpose: str = "wf_input") -> dict:
+        return {
+            WB_NAME: wb_name,
+            WB_URL: f"file:///Budget/BoA/Data/New/{wb_name}",
+            FI_KEY: "".join(["bo", "a"]),
+            WF_KEY: "intake",
+            WF_PURPOSE: wf_purpose,
+            WF_FOLDER: "data/New",
+        }
+    return _wb_data
+# ---------------------------------------------------------------------------- +
+@pytest.fixture
+def bdms_url(tmp_path: Path) -> str:
+    """Write a BDM_STORE with workbooks in each FI's intake folder, return
+    its url."""
+    bdm_store = copy.deepcopy(BDMConfig.bdm_store_config)
+    bdms_path = tmp_path / "bdm_store.jsonc"
+    bdm_store[BDM_FOLDER] = str(tmp_path)
+    bdm_store[BDM_URL] = bdms_path.as_uri()
+    for fi_key, fi_object in bdm_store[BDM_FI_COLLECTION].items():
+        wf_folder = tmp_path / fi_object[FI_FOLDER] / "new"
+        wf_folder.mkdir(parents=True)
+        wdc = {}
+        for i in range(3):
+            wb_name = f"{fi_key}_{i}.excel_txns.xlsx"
+            (wf_folder / wb_name).write_bytes(b"")
+            wdc[wb_name] = {WB_NAME: wb_name, WB_TYPE: WB_TYPE_EXCEL_TXNS,
+                            WB_URL: (wf_folder / wb_name).as_uri(),
+                            FI_KEY: fi_key, WF_KEY: "intake",
+                            WF_PURPOSE: WF_WORKING, WF_FOLDER: "new"}
+        fi_object[FI_WORKBOOK_DATA_COLLECTION] = wdc
+    bdms_path.write_text(json.dumps(bdm_store))
+    return bdms_path.as_uri()
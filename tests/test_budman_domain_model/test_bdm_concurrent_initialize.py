@@ -0,0 +1,45 @@
+# ---------------------------------------------------------------------------- +
+# test_bdm_concurrent_initialize.py
+# ---------------------------------------------------------------------------- +
+#region imports
+# python standard libraries
+import pytest
+from pathlib import Path
+# third-party libraries
+import logging, p3_utils as p3u, p3logging as p3l
+# local libraries
+from budman_namespace import *
+from budman_namespace.bdm_singleton_meta import BDMSingletonMeta
+from budget_domain_model import (BudgetDomainModel, BDMConfig)
+#endregion imports
+# ---------------------------------------------------------------------------- +
+#region Globals
+logger = logging.getLogger(__name__)
+#endregion Globals
+# ---------------------------------------------------------------------------- +
+class TestBDMConcurrentInitialize:
+    """Concurrent per-FI initialization of the BudgetDomainModel."""
+    @pytest.mark.parametrize("concurrent", [False, True])
+    def test_same_store_as_sequential(self, tmp_path, monkeypatch,
+                                      bdms_url, concurrent) -> None:
+        """Test both paths dehydrate to the same BDM_STORE, and each FI
+        has its own resolved WF_FOLDER_URLs."""
+        stores = []
+        for option in (False, concurrent):
+            # Clear the BDMSingleton cache, a new model for each run.
+            monkeypatch.setattr(BDMSingletonMeta, "_instances", {})
+            bdm_config = BDMConfig.BDM_STORE_url_get(bdms_url)
+            bdm_config[BDM_OPTIONS][BDMO_CONCURRENT_INITIALIZE] = option
+            bdm = BudgetDomainModel(bdm_config).bdm_initialize()
+            assert bdm.bdm_concurrent_initialize == option
+            # The config object and the option differ by design.
+            bdm_store = bdm.bdm_dehydrate()
+            del bdm_store[BDM_STORE_OBJECT], bdm_store[BDM_OPTIONS]
+            stores.append(bdm_store)
+        assert stores[0] == stores[1]
+        for fi_key, fi_object in stores[1][BDM_FI_COLLECTION].items():
+            assert len(fi_object[FI_WORKBOOK_DATA_COLLECTION]) == 3
+            fi_url = (tmp_path / fi_object[FI_FOLDER]).as_uri()
+            for wf_folder_config_list in fi_object[FI_WF_FOLDER_CONFIG_COLLECTION].values():
+                for wf_folder_config in wf_folder_config_list:
+                    assert wf_folder_config[WF_FOLDER_URL].startswith(fi_url + "/")
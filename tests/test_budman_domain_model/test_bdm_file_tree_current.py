@@ -0,0 +1,50 @@
+# ---------------------------------------------------------------------------- +
+# test_bdm_file_tree_current.py
+# ---------------------------------------------------------------------------- +
+#region imports
+# python standard libraries
+import pytest
+# third-party libraries
+import logging
+# local libraries
+from budman_namespace import *
+from budman_namespace.bdm_singleton_meta import BDMSingletonMeta
+from budget_domain_model import (BudgetDomainModel, BDMConfig)
+#endregion imports
+# ---------------------------------------------------------------------------- +
+#region Globals
+logger = logging.getLogger(__name__)
+#endregion Globals
+# ---------------------------------------------------------------------------- +
+class TestBDMFileTreeCurrent:
+    """bdm_FILE_TREE_current() for the list files and list folder cmds."""
+    @pytest.fixture
+    def bdm(self, monkeypatch, bdms_url) -> BudgetDomainModel:
+        monkeypatch.setattr(BDMSingletonMeta, "_instances", {})
+        bdm = BudgetDomainModel(BDMConfig.BDM_STORE_url_get(bdms_url))
+        yield bdm.bdm_initialize()
+        bdm.bdm_CHANGE_MONITOR_stop()
+
+    def test_rescans_without_monitor(self, bdm, monkeypatch) -> None:
+        """Test storage is rescanned on each call, nothing else keeps the
+        file tree current."""
+        refreshed = []
+        monkeypatch.setattr(bdm, "bdm_FILE_TREE_refresh", 
+                            lambda: refreshed.append(True))
+        assert not bdm.bdm_CHANGE_MONITOR_running
+        bdm.bdm_FILE_TREE_current()
+        bdm.bdm_FILE_TREE_current()
+        assert len(refreshed) == 2
+
+    def test_monitor_keeps_tree_current(self, bdm, monkeypatch) -> None:
+        """Test the file tree is returned as is while the change monitor
+        runs, its storage version keys the cached listings."""
+        bdm.bdm_CHANGE_MONITOR_start(poll_interval=60.0)
+        assert bdm.bdm_CHANGE_MONITOR_running
+        refreshed = []
+        monkeypatch.setattr(bdm, "bdm_FILE_TREE_refresh", 
+                            lambda: refreshed.append(True))
+        file_tree = bdm.bdm_FILE_TREE_current()
+        assert file_tree is bdm.bsm_file_tree
+        assert file_tree is not None
+        assert refreshed == []
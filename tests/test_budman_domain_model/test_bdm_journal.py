@@ -0,0 +1,69 @@
+# ---------------------------------------------------------------------------- +
+# test_bdm_journal.py
+# ---------------------------------------------------------------------------- +
+#region imports
+# python standard libraries
+import pytest
+from types import SimpleNamespace
+# third-party libraries
+import logging, p3_utils as p3u, p3logging as p3l
+# local libraries
+from budman_namespace import *
+from budman_namespace.bdm_workbook_class import BDMWorkbook
+from budget_domain_model import BudgetDomainModel, LazyWorkbookDataCollection
+from budget_storage_model import (BSM_JOURNAL_OP, BSM_JOURNAL_OP_WB_PUT,
+                                  BSM_JOURNAL_OP_WB_DEL)
+#endregion imports
+# ---------------------------------------------------------------------------- +
+#region Globals
+logger = logging.getLogger(__name__)
+#endregion Globals
+# ---------------------------------------------------------------------------- +
+def make_model(wdc: dict) -> SimpleNamespace:
+    """Return a stand-in with the model state the journal reads."""
+    model = SimpleNamespace(**{k: None for k in BSM_PERSISTED_PROPERTIES})
+    model.bdm_fi_collection = {"boa": {FI_KEY: "boa",
+                                       FI_WORKBOOK_DATA_COLLECTION: wdc}}
+    return model
+
+def wb_records(model: SimpleNamespace, base: dict) -> list:
+    """Return the (op, wb_id) workbook journal records since base."""
+    state = BudgetDomainModel._bdm_journal_state(model)
+    return [(r[BSM_JOURNAL_OP], r[WB_ID])
+            for r in BudgetDomainModel._bdm_journal_records(base, state)
+            if WB_ID in r]
+# ---------------------------------------------------------------------------- +
+class TestBDMJournal:
+    """Journal records for the workbooks changed since the last save."""
+    def test_changed_workbooks_only(self, wb_data) -> None:
+        """Test only changed, added and removed workbooks are journaled."""
+        a, b = BDMWorkbook(**wb_data("a.xlsx")), BDMWorkbook(**wb_data("b.xlsx"))
+        wdc = {a.wb_id: a, b.wb_id: b, "plain": wb_data("p.xlsx")}
+        model = make_model(wdc)
+        base = BudgetDomainModel._bdm_journal_state(model)
+        assert wb_records(model, base) == []
+        # Loading content is not a change, wb_loaded is never persisted.
+        a.wb_loaded = True
+        assert wb_records(model, base) == []
+        a.wb_type = WB_TYPE_EXCEL_TXNS
+        wdc["plain"][WB_TYPE] = WB_TYPE_EXCEL_TXNS
+        c = BDMWorkbook(**wb_data("c.xlsx"))
+        wdc[c.wb_id] = c
+        del wdc[b.wb_id]
+        assert wb_records(model, base) == [
+            (BSM_JOURNAL_OP_WB_PUT, a.wb_id), (BSM_JOURNAL_OP_WB_PUT, "plain"),
+            (BSM_JOURNAL_OP_WB_PUT, c.wb_id), (BSM_JOURNAL_OP_WB_DEL, b.wb_id)]
+        base = BudgetDomainModel._bdm_journal_state(model)
+        assert wb_records(model, base) == []
+
+    def test_materialized_workbook_is_not_changed(self, wb_data) -> None:
+        """Test materializing a pending workbook is not journaled."""
+        data = wb_data("a.xlsx")
+        wb_id = BDMWorkbook(**data).wb_id
+        wdc = LazyWorkbookDataCollection({wb_id: (data, "transactions", None)})
+        model = make_model(wdc)
+        base = BudgetDomainModel._bdm_journal_state(model)
+        wdc[wb_id]
+        assert wb_records(model, base) == []
+        wdc[wb_id].wf_key = "categorize"
+        assert wb_records(model, base) == [(BSM_JOURNAL_OP_WB_PUT, wb_id)]
@@ -0,0 +1,70 @@
+# ---------------------------------------------------------------------------- +
+# test_bdm_lazy_import.py
+# ---------------------------------------------------------------------------- +
+#region imports
+# python standard libraries
+import pytest, os, re, subprocess, sys
+from pathlib import Path
+# third-party libraries
+import logging
+# local libraries
+from budman_namespace import *
+#endregion imports
+# ---------------------------------------------------------------------------- +
+#region Globals
+logger = logging.getLogger(__name__)
+SRC_PATH = Path(__file__).resolve().parents[2] / "src"
+# The modules main.py imports at startup, before any command runs.
+STARTUP_IMPORTS = ("import budman_namespace, p3_mvvm, budman_settings, "
+                   "budman_app.budman_app")
+#endregion Globals
+# ---------------------------------------------------------------------------- +
+def run_python(*args: str) -> subprocess.CompletedProcess:
+    """Run a fresh python with src on the PYTHONPATH."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        p for p in (str(SRC_PATH), env.get("PYTHONPATH")) if p)
+    return subprocess.run([sys.executable, *args], env=env, text=True,
+                          capture_output=True, cwd=SRC_PATH.parent)
+
+def startup_import_times() -> tuple[float, set[str]]:
+    """Return the seconds and the names of the startup imports, from
+    python -X importtime, the top level cumulative times in microseconds."""
+    result = run_python("-X", "importtime", "-c", STARTUP_IMPORTS)
+    assert result.returncode == 0, result.stderr[-2000:]
+    seconds, modules = 0.0, set()
+    for m in re.finditer(r"^import time:\s+\d+ \|\s+(\d+) \|( *)(\S+)$",
+                         result.stderr, re.MULTILINE):
+        modules.add(m.group(3))
+        if m.group(2) == " ":
+            seconds += int(m.group(1)) / 1e6
+    return seconds, modules
+# ---------------------------------------------------------------------------- +
+class TestBDMLazyImport:
+    """bdm_lazy_import() and the startup import-time budget."""
+    def test_lazy_module(self) -> None:
+        """Test the module is imported on the first attribute access."""
+        code = ("import sys, budman_namespace as bdm\n"
+                "m = bdm.bdm_lazy_import('openpyxl')\n"
+                "assert 'openpyxl' not in sys.modules and not bdm.bdm_module_loaded(m)\n"
+                "assert m.Workbook is sys.modules['openpyxl'].Workbook\n"
+                "assert bdm.bdm_module_loaded(m) and 'imported' in repr(m)\n"
+                "assert bdm.bdm_lazy_import('openpyxl') is sys.modules['openpyxl']\n")
+        result = run_python("-c", code)
+        assert result.returncode == 0, result.stderr[-2000:]
+        lazy = BDMLazyModule("no_such_module_xyz")
+        with pytest.raises(ModuleNotFoundError):
+            lazy.anything
+
+    def test_startup_import_budget(self) -> None:
+        """Test the startup imports leave out the lazy modules and fit the
+        BDM_STARTUP_IMPORT_BUDGET_SECONDS, best of two runs after a warm up
+        run compiles the bytecode."""
+        startup_import_times()
+        runs = [startup_import_times() for _ in range(2)]
+        seconds = min(s for s, _ in runs)
+        imported = set(BDM_LAZY_IMPORT_MODULES) & runs[0][1]
+        assert not imported, f"Startup imported lazy modules: {imported}"
+        assert seconds <= BDM_STARTUP_IMPORT_BUDGET_SECONDS, (
+            f"Startup imports took {seconds:.3f}s, budget is "
+            f"{BDM_STARTUP_IMPORT_BUDGET_SECONDS}s")
@@ -0,0 +1,64 @@
+# ---------------------------------------------------------------------------- +
+# test_bdm_wf_folder_table.py
+# ---------------------------------------------------------------------------- +
+#region imports
+# python standard libraries
+import pytest, copy, json
+from pathlib import Path
+# third-party libraries
+import logging, p3_utils as p3u, p3logging as p3l
+# local libraries
+from budman_namespace import *
+from budman_namespace.bdm_singleton_meta import BDMSingletonMeta
+from budget_domain_model import (BudgetDomainModel, BDMConfig, WFFolderTable)
+#endregion imports
+# ---------------------------------------------------------------------------- +
+#region Globals
+logger = logging.getLogger(__name__)
+#endregion Globals
+# ---------------------------------------------------------------------------- +
+@pytest.fixture
+def bdm(tmp_path, monkeypatch) -> BudgetDomainModel:
+    """An initialized BudgetDomainModel with its BDM_FOLDER in tmp_path."""
+    monkeypatch.setattr(BDMSingletonMeta, "_instances", {})
+    bdm_config = copy.deepcopy(BDMConfig.bdm_store_config)
+    bdms_path = tmp_path / "bdm_store.jsonc"
+    bdm_config[BDM_FOLDER] = str(tmp_path)
+    bdm_config[BDM_URL] = bdms_path.as_uri()
+    bdms_path.write_text(json.dumps(bdm_config))
+    return BudgetDomainModel(BDMConfig.BDM_STORE_url_get(bdms_path.as_uri())).bdm_initialize()
+# ---------------------------------------------------------------------------- +
+class TestWFFolderTable:
+    """WF_FOLDER_CONFIG lookups through the WFFolderTable."""
+    def test_lookups_match_config(self, bdm, tmp_path) -> None:
+        """Test lookups return the FI's config values and build once."""
+        fi_key = next(iter(bdm.bdm_fi_collection))
+        table: WFFolderTable = bdm._bdm_wf_folder_table
+        wfcc = bdm.bdm_FI_WF_FOLDER_CONFIG_COLLECTION(fi_key)
+        for _ in range(2):
+            for wf_key, wfc_list in wfcc.items():
+                wfc = wfc_list[0]
+                wf_purpose = wfc[WF_PURPOSE]
+                assert bdm.bdm_WF_FOLDER_CONFIG(fi_key, wf_key, wf_purpose) is wfc
+                assert bdm.bdm_WF_FOLDER_CONFIG_ATTRIBUTE(
+                    fi_key, wf_key, wf_purpose, WF_FOLDER_URL) == wfc[WF_FOLDER_URL]
+                path = bdm.bsm_FI_WORKFLOW_DATA_FOLDER_abs_path(fi_key, wf_key, wf_purpose)
+                assert path.as_uri() == wfc[WF_FOLDER_URL]
+        build_count = table.build_count
+        assert bdm.bdm_WF_FOLDER_CONFIG(fi_key, wf_key, wf_purpose) is wfc
+        assert table.build_count == build_count
+
+    def test_config_changes_rebuild(self, bdm, tmp_path) -> None:
+        """Test a changed FI_FOLDER, collection or appended config is seen."""
+        fi_key = next(iter(bdm.bdm_fi_collection))
+        wf_key, wfc_list = next(iter(bdm.bdm_FI_WF_FOLDER_CONFIG_COLLECTION(fi_key).items()))
+        wf_purpose = wfc_list[0][WF_PURPOSE]
+        bdm.bdm_FI_OBJECT(fi_key)[FI_FOLDER] = "moved"
+        path = bdm.bsm_FI_WORKFLOW_DATA_FOLDER_path(fi_key, wf_key, wf_purpose)
+        assert path == tmp_path / "moved" / wfc_list[0][WF_FOLDER]
+        bdm.bsm_FI_merge(fi_key, {wf_key: []})
+        assert bdm.bdm_WF_FOLDER_CONFIG(fi_key, wf_key, wf_purpose) is None
+        wfc = {WF_FOLDER: "x", WF_PURPOSE: wf_purpose, WF_PREFIX: None,
+               WF_FOLDER_URL: None}
+        bdm.bdm_FI_WF_FOLDER_CONFIG_COLLECTION_append(fi_key, wf_key, wfc)
+        assert bdm.bdm_WF_FOLDER_CONFIG(fi_key, wf_key, wf_purpose) is wfc
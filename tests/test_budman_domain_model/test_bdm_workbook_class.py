@@ -0,0 +1,42 @@
+# ---------------------------------------------------------------------------- +
+# test_bdm_workbook_class.py
+# ---------------------------------------------------------------------------- +
+#region imports
+# python standard libraries
+import pytest, copy, pickle
+# third-party libraries
+import logging, p3_utils as p3u, p3logging as p3l
+# local libraries
+from budman_namespace import *
+from budman_namespace.bdm_workbook_class import BDMWorkbook
+#endregion imports
+# ---------------------------------------------------------------------------- +
+#region Globals
+logger = logging.getLogger(__name__)
+#endregion Globals
+# ---------------------------------------------------------------------------- +
+class TestBDMWorkbook:
+    """BDMWorkbook slots, interning, caching and serialization."""
+    def test_to_dict_round_trip(self, wb_data) -> None:
+        """Test to_dict() and check_schema() still reconstruct the workbook."""
+        wb = BDMWorkbook(**BDMWorkbook.check_schema(wb_data("A.xlsx")))
+        wb.wb_content = {"loaded": True}
+        wb_dict = wb.to_dict()
+        assert wb_dict[WB_CONTENT] is None and wb.wb_content is not None
+        assert "_wb_id" not in wb_dict
+        assert BDMWorkbook(**BDMWorkbook.check_schema(wb_dict)).wb_id == wb.wb_id
+        assert pickle.loads(pickle.dumps(wb)) == wb == copy.deepcopy(wb)
+        with pytest.raises(AttributeError):
+            wb.not_an_attribute = 1
+
+    def test_interned_and_cached(self, wb_data) -> None:
+        """Test repeated strings are shared and caches follow changes."""
+        wb1 = BDMWorkbook(**wb_data("A.xlsx"))
+        wb2 = BDMWorkbook(**wb_data("B.xlsx"))
+        assert wb1.fi_key is wb2.fi_key and wb1.wf_folder is wb2.wf_folder
+        assert wb1.wb_id == "data/new|a.xlsx" and wb1.wb_id is wb1.wb_id
+        wb1.wb_name = "C.xlsx"
+        assert wb1.wb_id == "data/new|c.xlsx"
+        assert wb1.abs_path() is wb1.abs_path()
+        wb1.wb_url = "file:///budget/boa/data/new/c.xlsx"
+        assert wb1.abs_path().name == "c.xlsx"
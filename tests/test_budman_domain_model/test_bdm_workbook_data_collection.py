@@ -0,0 +1,110 @@
+# ---------------------------------------------------------------------------- +
+# test_bdm_workbook_data_collection.py
+# ---------------------------------------------------------------------------- +
+#region imports
+# python standard libraries
+import pytest, copy, pickle, sys
+from pathlib import Path
+# third-party libraries
+import logging, p3_utils as p3u, p3logging as p3l
+# local libraries
+from budman_namespace import *
+from budman_namespace.bdm_workbook_class import BDMWorkbook
+from budget_domain_model import (BudgetDomainModel, LazyWorkbookDataCollection,
+                                 wdc_attribute, wdc_reconcile)
+#endregion imports
+# ---------------------------------------------------------------------------- +
+#region Globals
+logger = logging.getLogger(__name__)
+#endregion Globals
+# ---------------------------------------------------------------------------- +
+def make_wdc(wb_data, count: int) -> LazyWorkbookDataCollection:
+    """Return a LazyWorkbookDataCollection with count pending workbooks."""
+    pending = {}
+    for i in range(count):
+        data = wb_data(f"CC_{i:03}_transactions.xlsx")
+        pending[BDMWorkbook(**data).wb_id] = (data, "transactions", "file:///wf")
+    return LazyWorkbookDataCollection(pending)
+# ---------------------------------------------------------------------------- +
+class TestLazyWorkbookDataCollection:
+    """LazyWorkbookDataCollection materializes BDMWorkbooks on access."""
+    def test_keys_and_attributes_do_not_materialize(self, wb_data) -> None:
+        """Test keys, len and wdc_attribute leave workbooks pending."""
+        wdc = make_wdc(wb_data, 3)
+        wb_ids = list(wdc.keys())
+        assert len(wdc) == 3 and wdc.pending_count == 3
+        assert wdc_attribute(wdc, wb_ids[0], WB_TYPE) == "transactions"
+        assert wdc_attribute(wdc, wb_ids[0], WF_FOLDER) == "data/new"
+        assert wdc_attribute(wdc, wb_ids[0], WB_URL).islower()
+        assert wdc.pending_count == 3
+
+    def test_access_materializes_once(self, wb_data) -> None:
+        """Test [] and get() return the same BDMWorkbook object."""
+        wdc = make_wdc(wb_data, 3)
+        wb_id = next(iter(wdc))
+        wb = wdc[wb_id]
+        assert isinstance(wb, BDMWorkbook)
+        assert wb.wb_type == "transactions"
+        assert wb.wf_folder_url == "file:///wf"
+        assert wdc.get(wb_id) is wb
+        assert wdc.is_materialized(wb_id) and wdc.pending_count == 2
+        assert wdc_attribute(wdc, wb_id, WB_NAME) == wb.wb_name
+        assert all(isinstance(v, BDMWorkbook) for v in wdc.values())
+        assert wdc.pending_count == 0
+
+    @pytest.mark.parametrize("copier", [
+        copy.deepcopy, lambda wdc: pickle.loads(pickle.dumps(wdc))])
+    def test_deepcopy_stays_lazy(self, wb_data, copier) -> None:
+        """Test deepcopy and pickle keep pending workbooks pending."""
+        wdc = make_wdc(wb_data, 2)
+        wdc_copy = copier(wdc)
+        assert isinstance(wdc_copy, LazyWorkbookDataCollection)
+        assert wdc_copy.pending_count == 2 and wdc.pending_count == 2
+        wb_id = next(iter(wdc_copy))
+        assert isinstance(wdc_copy[wb_id], BDMWorkbook)
+        assert wdc.pending_count == 2
+
+    def test_reconcile_changes(self, wb_data) -> None:
+        """Test wdc_reconcile() keyed changes, without materializing."""
+        wdc = make_wdc(wb_data, 4)
+        names = [f"CC_{i:03}_transactions.xlsx" for i in (0, 1, 2, 9)]
+        disc_wbs = [BDMWorkbook(**wb_data(name), wb_type="transactions")
+                    for name in names]
+        disc_wbs[1].wb_type = "budget"
+        disc_wbs[2].wf_folder = "data/Categorized"
+        disc_wdc = {wb.wb_id: wb for wb in disc_wbs}
+        summary = wdc_reconcile("boa", wdc, disc_wdc,
+                                {"data/new", "data/categorized"})
+        ids = [wb.wb_id for wb in disc_wbs]
+        old_id = list(wdc.keys())[2]
+        assert summary.added == [ids[3]]
+        assert summary.removed == [list(wdc.keys())[3]]
+        assert summary.moved == [(old_id, ids[2])]
+        assert summary.type_changed == [(ids[1], "transactions", "budget")]
+        assert summary.unchanged == 1 and summary.changed
+        assert wdc.pending_count == 4
+        # Workbooks in folders not scanned are left as they are.
+        summary = wdc_reconcile("boa", wdc, disc_wdc, set())
+        assert summary.removed == [] and summary.moved == []
+        assert summary.added == [ids[2], ids[3]]
+
+# ---------------------------------------------------------------------------- +
+class TestRehydrateChecks:
+    """The per workbook checks of a lazy rehydration."""
+    def test_workbook_type_detect(self, wb_data) -> None:
+        """Test the wb_type is the one BDMWorkbook.determine_wb_type() finds."""
+        wb = BDMWorkbook(**wb_data("CC_001.Excel_Txns.xlsx"))
+        assert bdm_workbook_type_detect(Path.from_uri(wb.wb_url)) == \
+            wb.determine_wb_type() == WB_TYPE_EXCEL_TXNS
+        assert bdm_workbook_type_detect(Path("notes.xlsx")) == WB_TYPE_UNKNOWN
+        assert bdm_workbook_type_detect(None) == WB_TYPE_UNKNOWN
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="case-insensitive")
+    def test_folder_listing_is_case_sensitive(self, tmp_path: Path) -> None:
+        """Test the folder listing matches names exactly, as posix does."""
+        (tmp_path / "a.xlsx").touch()
+        listings = {}
+        contains = BudgetDomainModel._bsm_folder_listing_contains
+        assert contains(listings, tmp_path / "a.xlsx")
+        assert not contains(listings, tmp_path / "A.xlsx")
+        assert list(listings) == [tmp_path]
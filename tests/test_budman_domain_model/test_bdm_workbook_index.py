@@ -0,0 +1,88 @@
+# ---------------------------------------------------------------------------- +
+# test_bdm_workbook_index.py
+# ---------------------------------------------------------------------------- +
+#region imports
+# python standard libraries
+import pytest
+# third-party libraries
+import logging, p3_utils as p3u, p3logging as p3l
+# local libraries
+from budman_namespace import *
+from budman_namespace.bdm_workbook_class import BDMWorkbook
+from budman_namespace.design_language_namespace import WB_INDEX
+from budget_domain_model import LazyWorkbookDataCollection, WorkbookIndex
+#endregion imports
+# ---------------------------------------------------------------------------- +
+#region Globals
+logger = logging.getLogger(__name__)
+#endregion Globals
+# ---------------------------------------------------------------------------- +
+def make_wdc(wb_data, names: list) -> dict:
+    """Return a plain wdc of BDMWorkbooks for names."""
+    wdc = {}
+    for wb_name in names:
+        wb = BDMWorkbook(**wb_data(wb_name))
+        wdc[wb.wb_id] = wb
+    return wdc
+# ---------------------------------------------------------------------------- +
+class TestWorkbookIndex:
+    """WorkbookIndex lookups and maintenance."""
+    def test_find_and_wb_index(self, wb_data) -> None:
+        """Test case-insensitive find and wb_index after a remove."""
+        wdc = make_wdc(wb_data, ["A.xlsx", "B.xlsx", "C.xlsx"])
+        index = WorkbookIndex()
+        index.rebuild({"boa": {FI_WORKBOOK_DATA_COLLECTION: wdc}},
+                      FI_WORKBOOK_DATA_COLLECTION)
+        wb_ids = list(wdc.keys())
+        assert index.find(WB_NAME, "b.XLSX") == [("boa", wb_ids[1])]
+        assert len(index.find(WF_KEY, "intake", "boa")) == 3
+        assert index.find(WB_INDEX, 2, "boa") == [("boa", wb_ids[2])]
+        del wdc[wb_ids[0]]
+        index.remove("boa", wb_ids[0])
+        assert index.wb_index("boa", wb_ids[2]) == 1
+        assert index.find(WB_NAME, "a.xlsx") == []
+        assert index.is_current("boa", wdc)
+        assert not index.is_current("boa", dict(wdc))
+
+    def test_find_purpose_order_and_reindex(self, wb_data) -> None:
+        """Test find_purpose returns wb_index order and follows changes."""
+        wdc = make_wdc(wb_data, ["Z.xlsx", "M.xlsx", "A.xlsx"])
+        index = WorkbookIndex()
+        index.index_fi("boa", wdc)
+        wb_ids = list(wdc.keys())
+        refs = index.find_purpose("intake", "wf_input")
+        assert [wb_id for _, wb_id in refs] == wb_ids
+        wdc[wb_ids[1]].wf_purpose = "wf_output"
+        index.add("boa", wb_ids[1])
+        assert index.find_purpose("intake", "wf_output") == [("boa", wb_ids[1])]
+        assert index.wb_index("boa", wb_ids[1]) == 1
+
+    def test_changed_in_place_reindexed(self, wb_data) -> None:
+        """Test a workbook renamed or replaced in place is re-indexed."""
+        wdc = make_wdc(wb_data, ["A.xlsx", "B.xlsx"])
+        index = WorkbookIndex()
+        index.index_fi("boa", wdc)
+        assert index.reindex_changed("boa") == 0
+        wb_ids = list(wdc.keys())
+        wdc[wb_ids[0]].wb_name = "A2.xlsx"
+        wdc[wb_ids[1]] = BDMWorkbook(**wb_data("B2.xlsx"))
+        assert index.is_current("boa", wdc)
+        assert index.reindex_changed("boa") == 2
+        assert index.find(WB_NAME, "a2.xlsx") == [("boa", wb_ids[0])]
+        assert index.find(WB_NAME, "b2.xlsx") == [("boa", wb_ids[1])]
+        assert index.find(WB_NAME, "a.xlsx") == []
+        assert index.reindex_changed("boa") == 0
+
+    def test_lazy_wdc_not_materialized(self, wb_data) -> None:
+        """Test indexing a LazyWorkbookDataCollection leaves it pending."""
+        pending = {}
+        for i in range(5):
+            data = wb_data(f"CC_{i:03}.xlsx")
+            pending[BDMWorkbook(**data).wb_id] = (data, "transactions", None)
+        wdc = LazyWorkbookDataCollection(pending)
+        index = WorkbookIndex()
+        index.index_fi("boa", wdc)
+        assert len(index.find(WB_TYPE, "transactions")) == 5
+        BDMWorkbook(**wb_data("other.xlsx"))
+        assert index.reindex_changed("boa") == 0
+        assert wdc.pending_count == 5
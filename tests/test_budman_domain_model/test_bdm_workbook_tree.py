@@ -0,0 +1,92 @@
+# ---------------------------------------------------------------------------- +
+# test_bdm_workbook_tree.py
+# ---------------------------------------------------------------------------- +
+#region imports
+# python standard libraries
+import pytest
+# third-party libraries
+import logging, p3_utils as p3u, p3logging as p3l
+# local libraries
+from budman_namespace import *
+from budget_domain_model import (BDMWorkbookTree, WBT_CHANGE_ADD,
+                                 WBT_CHANGE_REMOVE, WBT_CHANGE_MOVE,
+                                 WBT_CHANGE_UPDATE)
+#endregion imports
+# ---------------------------------------------------------------------------- +
+#region Globals
+logger = logging.getLogger(__name__)
+#endregion Globals
+# ---------------------------------------------------------------------------- +
+IN_GROUP = ("boa", "intake", "wf_input", "data/new")
+OUT_GROUP = ("boa", "intake", "wf_output", "data/categorized")
+
+def make_tree() -> BDMWorkbookTree:
+    """Return a tree with one FI, one workflow and two WF_FOLDER nodes."""
+    wb_tree = BDMWorkbookTree()
+    wb_tree.add_tree_node(node_type=BDM, tag="root", identifier="bdm")
+    wb_tree.add_tree_node(node_type=FI_OBJECT, tag="boa", identifier="boa",
+                          parent_id="bdm")
+    wb_tree.add_tree_node(node_type=WF_OBJECT, tag="intake",
+                          identifier="boa::intake", parent_id="boa")
+    for wb_group in (IN_GROUP, OUT_GROUP):
+        folder_id = "::".join(wb_group[1:])
+        wb_tree.add_tree_node(node_type=WF_FOLDER_CONFIG, tag=folder_id,
+                              identifier=folder_id, parent_id="boa::intake")
+        wb_tree.register_wf_folder_node(wb_group, folder_id)
+    return wb_tree
+# ---------------------------------------------------------------------------- +
+class TestBDMWorkbookTree:
+    """BDMWorkbookTree incremental workbook node maintenance."""
+    def test_put_move_remove(self) -> None:
+        """Test workbook nodes follow their group, and changes are logged."""
+        wb_tree = make_tree()
+        version = wb_tree.version
+        wb_tree.put_workbook_node("boa", "a", IN_GROUP, tag="a.xlsx",
+                                  wb_index_loader=lambda: 7)
+        wb_tree.put_workbook_node("boa", "b", IN_GROUP, tag="b.xlsx")
+        assert wb_tree.put_workbook_node(
+            "boa", "c", ("boa", "intake", "wf_none", "x"), tag="c") is None
+        assert wb_tree.parent("a").identifier == "intake::wf_input::data/new"
+        assert wb_tree.get_node("a").wb_index == 7
+        wb_tree.put_workbook_node("boa", "a", OUT_GROUP, tag="a.xlsx")
+        assert wb_tree.parent("a").identifier == "intake::wf_output::data/categorized"
+        wb_tree.remove_workbook_node("boa", "b")
+        assert not wb_tree.contains("b")
+        assert wb_tree.workbook_ids("boa") == ["a"]
+        assert wb_tree.changes_since(version) == [
+            (WBT_CHANGE_ADD, "a"), (WBT_CHANGE_ADD, "b"),
+            (WBT_CHANGE_MOVE, "a"), (WBT_CHANGE_REMOVE, "b")]
+        wb_tree.compact_changes()
+        assert wb_tree.changes_since(version) is None
+        assert wb_tree.changes_since(wb_tree.version) == []
+
+    def test_put_refreshes_existing_node(self) -> None:
+        """Test an existing node takes the new tag and loaders."""
+        wb_tree = make_tree()
+        old_wdc, new_wdc = {"a": "old"}, {"a": "new"}
+        wb_tree.put_workbook_node("boa", "a", IN_GROUP, tag="a.xlsx",
+                                  data_loader=lambda: old_wdc["a"],
+                                  wb_index_loader=lambda: 0)
+        assert wb_tree.get_node("a").data == "old"
+        version = wb_tree.version
+        wb_tree.put_workbook_node("boa", "a", IN_GROUP, tag="a2.xlsx",
+                                  data_loader=lambda: new_wdc["a"],
+                                  wb_index_loader=lambda: 3)
+        wb_node = wb_tree.get_node("a")
+        assert wb_node.tag == "a2.xlsx" and wb_node.data == "new"
+        assert wb_node.wb_index == 3
+        assert wb_tree.changes_since(version) == [(WBT_CHANGE_UPDATE, "a")]
+
+    def test_synced_and_remove_fi(self) -> None:
+        """Test is_synced() tracks the wdc object and remove_fi_node()."""
+        wb_tree = make_tree()
+        wdc = {"a": None}
+        wb_tree.put_workbook_node("boa", "a", IN_GROUP, tag="a.xlsx")
+        wb_tree.set_synced("boa", wdc)
+        assert wb_tree.is_synced("boa", wdc)
+        assert not wb_tree.is_synced("boa", dict(wdc))
+        wdc["b"] = None
+        assert not wb_tree.is_synced("boa", wdc)
+        wb_tree.remove_fi_node("boa")
+        assert not wb_tree.contains("a") and wb_tree.workbook_ids("boa") == []
+        assert wb_tree.wf_folder_node_id(IN_GROUP) is None
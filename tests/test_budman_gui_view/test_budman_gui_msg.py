@@ -0,0 +1,45 @@
+# ---------------------------------------------------------------------------- +
+# test_budman_gui_msg.py
+# ---------------------------------------------------------------------------- +
+#region imports
+# python standard libraries
+import pytest
+from tkinter import scrolledtext
+from typing import Any, List
+# third-party libraries
+import logging, p3_utils as p3u, p3logging as p3l
+# local libraries
+from budman_gui_view.budman_gui_msg import BudManGUIMsg
+from budman_gui_view.budman_gui_constants import BMG_INFO
+#endregion imports
+# ---------------------------------------------------------------------------- +
+#region Globals
+logger = logging.getLogger(__name__)
+#endregion Globals
+# ---------------------------------------------------------------------------- +
+class RecordedText(scrolledtext.ScrolledText):
+    """A ScrolledText recording the inserted text, without a Tk display."""
+    def __init__(self) -> None:
+        self.text: str = ""
+        self.see_count: int = 0
+
+    def insert(self, index: str, *args: Any) -> None:
+        self.text += "".join(args[0::2])
+
+    def see(self, index: str) -> None:
+        self.see_count += 1
+# ---------------------------------------------------------------------------- +
+class TestBudManGUIMsg:
+    """BudManGUIMsg rendering of message batches."""
+    def test_batch_keeps_lines(self) -> None:
+        """Test each message and each line of a message is its own line."""
+        gui_msg = BudManGUIMsg()
+        gui_msg._msg_widget = widget = RecordedText()
+        gui_msg.update_msg_widget_batch([
+            {"msg": "first\n", "tag": BMG_INFO, "prefix": False},
+            {"msg": "second\nthird\n\nfifth\n", "tag": BMG_INFO, "prefix": False},
+            {"msg": "last", "tag": BMG_INFO, "prefix": True}])
+        lines: List[str] = widget.text.split("\n")
+        assert lines[:5] == ["first", "second", "third", "", "fifth"]
+        assert BMG_INFO in lines[5] and "last" in lines[5]
+        assert lines[6:] == [""] and widget.see_count == 1
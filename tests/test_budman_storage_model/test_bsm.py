@@ -3,7 +3,7 @@
 # ---------------------------------------------------------------------------- +
 #region imports
 # python standard libraries
-import pytest, os
+import pytest, os, time, asyncio
 from pathlib import Path
 from typing import Type, Any
 # third-party libraries
@@ -11,6 +11,8 @@ import inspect
 import logging, p3_utils as p3u, p3logging as p3l
 # local libraries
 from budget_storage_model import *
+from budman_namespace import *
+import p3_mvvm as p3m
 #endregion imports
 # ---------------------------------------------------------------------------- +
 #region Globals
@@ -44,3 +46,132 @@ class TestBSM:
             logger.error(m)
             pytest.fail(m)
 
+    def test_csv_DATA_LIST_file_validate_header(self, tmp_path: Path) -> None:
+        """Test adding a missing header row to a csv file in a single pass."""
+        try:
+            logger.info(self.test_csv_DATA_LIST_file_validate_header.__doc__)
+            fieldnames = ["Date", "Description", "Amount"]
+            csv_path = tmp_path / "txns.csv"
+            csv_path.write_text("01/02/2025,Coffee,-3.50\n01/03/2025,Pay,100.00\n")
+            csv_path.chmod(0o644)
+            # Not inplace, a new "_hdr" file is created.
+            output_path = csv_DATA_LIST_file_validate_header(csv_path, fieldnames)
+            assert output_path == tmp_path / "txns_hdr.csv"
+            data = csv_DATA_LIST_file_load(output_path)
+            assert len(data) == 2
+            assert data[0]["Description"] == "Coffee"
+            # Inplace, the original is replaced and no temp files remain.
+            output_path = csv_DATA_LIST_file_validate_header(csv_path, fieldnames,
+                                                             inplace=True)
+            assert output_path == csv_path
+            assert sorted(p.name for p in tmp_path.iterdir()) == ["txns.csv", "txns_hdr.csv"]
+            assert csv_path.stat().st_mode & 0o777 == 0o644
+            # Header is now present, so the file is left alone.
+            mtime = csv_path.stat().st_mtime_ns
+            assert csv_DATA_LIST_file_validate_header(csv_path, fieldnames) == csv_path
+            assert csv_path.stat().st_mtime_ns == mtime
+        except Exception as e:
+            m = f"{p3u.exc_err_msg(e)}"
+            logger.error(m)
+            pytest.fail(m)
+
+    def test_csv_DATA_LIST_file_load_virtual_header(self, tmp_path: Path) -> None:
+        """Test loading a csv file with a virtual header, file is untouched."""
+        try:
+            logger.info(self.test_csv_DATA_LIST_file_load_virtual_header.__doc__)
+            fieldnames = ["Date", "Description", "Amount"]
+            content = "01/02/2025,Coffee,-3.50\n01/03/2025,Pay,100.00\n"
+            csv_path = tmp_path / "txns.csv"
+            csv_path.write_text(content)
+            data = csv_DATA_LIST_file_load(csv_path, fieldnames=fieldnames)
+            assert len(data) == 2
+            assert data[1]["Amount"] == "100.00"
+            assert csv_path.read_text() == content
+            # A real header row matching the fieldnames is skipped.
+            csv_path.write_text("Date,Description,Amount\n" + content)
+            data = csv_DATA_LIST_file_load(csv_path, fieldnames=fieldnames)
+            assert len(data) == 2
+            assert data[0]["Date"] == "01/02/2025"
+        except Exception as e:
+            m = f"{p3u.exc_err_msg(e)}"
+            logger.error(m)
+            pytest.fail(m)
+
+    def test_bsm_map_folders_concurrent_benchmark(self, tmp_path: Path) -> None:
+        """Benchmark workbook discovery over many FI and WF folders."""
+        try:
+            logger.info(self.test_bsm_map_folders_concurrent_benchmark.__doc__)
+            folders = []
+            for fi in range(20):
+                for wf in ("data/new", "data/categorized", "data/finalized",
+                           "budget/new", "budget/working", "budget/final"):
+                    folder = tmp_path / f"fi{fi:02}" / wf
+                    folder.mkdir(parents=True)
+                    for n in range(40):
+                        (folder / f"wb_{n:03}.xlsx").write_text("x")
+                    (folder / "notes.md").write_text("x")
+                    (folder / "~$wb_000.xlsx").write_text("x")
+                    folders.append(folder)
+            st = time.perf_counter()
+            sequential = bsm_map_folders_concurrent(bsm_get_workbook_names, 
+                                                    folders, max_workers=1)
+            seq_time = time.perf_counter() - st
+            st = time.perf_counter()
+            concurrent = bsm_map_folders_concurrent(bsm_get_workbook_names, folders)
+            con_time = time.perf_counter() - st
+            logger.info(f"{len(folders)} folders: sequential {seq_time:.4f}s, "
+                        f"concurrent {con_time:.4f}s")
+            assert concurrent == sequential
+            assert all(len(wb_paths) == 40 for wb_paths in concurrent)
+            assert concurrent[0][0] == folders[0] / "wb_000.xlsx"
+        except Exception as e:
+            m = f"{p3u.exc_err_msg(e)}"
+            logger.error(m)
+            pytest.fail(m)
+
+    def test_bsm_BDMWorkbook_load_save_aio(self, 
+                                           tmp_path_factory: pytest.TempPathFactory) -> None:
+        """Test a coroutine cmd loads and saves workbook content with the
+        file I/O in the AsyncCommandProcessor executor."""
+        try:
+            logger.info(self.test_bsm_BDMWorkbook_load_save_aio.__doc__)
+            # BDMWorkbook lowercases its wb_url, so the folder is lowercase.
+            tmp_path = tmp_path_factory.mktemp("wbs")
+            wbs = []
+            for name in ("a", "b"):
+                csv_path = tmp_path / f"{name}.csv"
+                csv_path.write_text(f"Date,Amount\n01/02/2025,{name}\n")
+                wbs.append(BDMWorkbook(wb_name=csv_path.name,
+                                       wb_url=csv_path.as_uri(),
+                                       wb_type=WB_TYPE_CSV_TXNS,
+                                       wf_folder="new"))
+            io_funcs = set()
+            async def run_blocking(cp, func, *args, **kwargs):
+                io_funcs.add(func.__name__)
+                return await cp.cp_run_blocking(func, *args, **kwargs)
+            async def load_save_cmd(cmd, dc, cp) -> p3m.CMD_RESULT_TYPE:
+                run = lambda f, *a, **kw: run_blocking(cp, f, *a, **kw)
+                await asyncio.gather(*(bsm_BDMWorkbook_load_aio(wb, run) for wb in wbs))
+                for wb in wbs:
+                    wb.wb_content[0]["Amount"] += "!"
+                await asyncio.gather(*(bsm_BDMWorkbook_save_aio(wb, run) for wb in wbs))
+                return p3m.cp_CMD_RESULT_create(True, p3m.CV_CMD_STRING_OUTPUT,
+                                                "", cmd)
+            async def run() -> None:
+                cp = p3m.AsyncCommandProcessor(worker_count=2).cp_initialize()
+                cp._data_context = None
+                await cp.cp_start()
+                await cp.cp_execute_cmd_aio(
+                    p3m.Command(cp, "wb", load_save_cmd, subcmd_name="test"),
+                    raise_error=True)
+                await cp.cp_stop()
+            asyncio.run(run())
+            assert io_funcs == {"bsm_WORKBOOK_CONTENT_file_load",
+                                  "bsm_WORKBOOK_CONTENT_file_save"}
+            assert all(wb.wb_loaded for wb in wbs)
+            data = csv_DATA_LIST_file_load(tmp_path / "b.csv")
+            assert data[0]["Amount"] == "b!"
+        except Exception as e:
+            m = f"{p3u.exc_err_msg(e)}"
+            logger.error(m)
+            pytest.fail(m)
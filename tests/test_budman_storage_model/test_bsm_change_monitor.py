@@ -0,0 +1,62 @@
+# ---------------------------------------------------------------------------- +
+# test_bsm_change_monitor.py
+# ---------------------------------------------------------------------------- +
+#region imports
+# python standard libraries
+import pytest, os, threading
+from pathlib import Path
+# third-party libraries
+import logging, p3_utils as p3u, p3logging as p3l
+# local libraries
+from budget_storage_model import (BSMChangeMonitor, BSMChangeEvent,
+                                  BSM_CHANGE_ADDED, BSM_CHANGE_REMOVED)
+#endregion imports
+# ---------------------------------------------------------------------------- +
+#region Globals
+logger = logging.getLogger(__name__)
+#endregion Globals
+# ---------------------------------------------------------------------------- +
+def bump_mtime(folder: Path) -> None:
+    """Force a new folder mtime, filesystem mtime resolution can be coarse."""
+    st = os.stat(folder)
+    os.utime(folder, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+# ---------------------------------------------------------------------------- +
+class TestBSMChangeMonitor:
+    """BSMChangeMonitor polling of watched folders."""
+    def test_poll_reports_added_and_removed(self, tmp_path) -> None:
+        """Test poll() reports only the files added or removed."""
+        (tmp_path / "keep.xlsx").write_text("x")
+        (tmp_path / "gone.xlsx").write_text("x")
+        monitor = BSMChangeMonitor()
+        monitor.watch(tmp_path.as_uri())
+        assert monitor.poll() == []
+        (tmp_path / "gone.xlsx").unlink()
+        (tmp_path / "new.xlsx").write_text("x")
+        bump_mtime(tmp_path)
+        events = monitor.poll()
+        assert events == [
+            BSMChangeEvent(BSM_CHANGE_ADDED, tmp_path.as_uri(),
+                           (tmp_path / "new.xlsx").as_uri()),
+            BSMChangeEvent(BSM_CHANGE_REMOVED, tmp_path.as_uri(),
+                           (tmp_path / "gone.xlsx").as_uri()),
+        ]
+        assert monitor.poll() == []
+
+    def test_monitor_thread_calls_on_changes(self, tmp_path) -> None:
+        """Test the monitor thread hands events to on_changes."""
+        received = []
+        done = threading.Event()
+        def on_changes(events):
+            received.extend(events)
+            done.set()
+        monitor = BSMChangeMonitor(on_changes=on_changes, poll_interval=0.05)
+        monitor.watch(tmp_path.as_uri())
+        monitor.start()
+        try:
+            (tmp_path / "new.xlsx").write_text("x")
+            bump_mtime(tmp_path)
+            assert done.wait(5.0)
+        finally:
+            monitor.stop()
+        assert not monitor.is_running
+        assert [e.file_path.name for e in received] == ["new.xlsx"]
@@ -0,0 +1,115 @@
+# ---------------------------------------------------------------------------- +
+# test_bsm_file_tree.py
+# ---------------------------------------------------------------------------- +
+#region imports
+# python standard libraries
+import pytest, os, time
+from pathlib import Path
+# third-party libraries
+import logging, p3_utils as p3u, p3logging as p3l
+# local libraries
+from budget_storage_model import (BSMFileTree, bsm_json_file_load,
+                                  bsm_journal_append)
+from budget_storage_model.bsm_file_tree import BSM_FILE_TREE_SNAPSHOT_FILENAME
+#endregion imports
+# ---------------------------------------------------------------------------- +
+#region Globals
+logger = logging.getLogger(__name__)
+#endregion Globals
+# ---------------------------------------------------------------------------- +
+def make_folder(root: Path, folders: int, files: int) -> None:
+    """Create folders, each with some files, under root."""
+    for d in range(folders):
+        folder = root / f"fi{d:03}" / "data" / "new"
+        folder.mkdir(parents=True)
+        for f in range(files):
+            (folder / f"wb_{f:04}.xlsx").write_text("x")
+
+def file_indexes(ft: BSMFileTree) -> dict:
+    """Map relative path to file_index for all files in the file_tree."""
+    return {bf.abs_path.relative_to(ft.folder_path).as_posix(): bf.file_index 
+            for bf in ft.all_files()}
+# ---------------------------------------------------------------------------- +
+class TestBSMFileTree:
+    """BSMFileTree incremental scanning and snapshot reuse."""
+    def test_incremental_scan_keeps_indexes(self, tmp_path) -> None:
+        """Test added and removed files leave existing file_index values alone."""
+        make_folder(tmp_path, 2, 3)
+        (tmp_path / "backup").mkdir()
+        (tmp_path / "backup" / "old.xlsx").write_text("x")
+        ft = BSMFileTree(tmp_path.as_uri())
+        before = file_indexes(ft)
+        assert len(before) == 6
+        assert "backup/old.xlsx" not in before
+        assert (tmp_path / BSM_FILE_TREE_SNAPSHOT_FILENAME).exists()
+        # Saving the snapshot touched the root folder, only it is listed.
+        ft.update_file_tree()
+        assert ft.scan_stats["listed"] == 1
+        assert not ft.scan_stats["dirty"]
+        # Nothing changed, no folder is listed again.
+        ft.update_file_tree()
+        assert ft.scan_stats["listed"] == 0
+        # Remove one file, add another.
+        new_folder = tmp_path / "fi001" / "data" / "new"
+        (new_folder / "wb_0000.xlsx").unlink()
+        (new_folder / "wb_9999.xlsx").write_text("x")
+        ft.update_file_tree()
+        assert ft.scan_stats["added"] == 1 and ft.scan_stats["removed"] == 1
+        after = file_indexes(ft)
+        assert "fi001/data/new/wb_0000.xlsx" not in after
+        assert after["fi001/data/new/wb_9999.xlsx"] == max(before.values()) + 1
+        for name, fi in after.items():
+            if name in before:
+                assert before[name] == fi
+        # A new BSMFileTree starts from the snapshot, same tree.
+        ft2 = BSMFileTree(tmp_path.as_uri())
+        assert ft2.scan_stats["listed"] <= 1
+        assert not ft2.scan_stats["dirty"]
+        assert file_indexes(ft2) == after
+        assert ft2.file_tree.size() == ft.file_tree.size()
+
+    def test_bsm_files_are_excluded(self, tmp_path) -> None:
+        """Test json snapshots and the BDM_STORE journal are not listed."""
+        make_folder(tmp_path, 1, 1)
+        (tmp_path / "bdm_store.jsonc").write_text("{}")
+        bsm_json_file_load(tmp_path / "bdm_store.jsonc")
+        bsm_journal_append(tmp_path / "bdm_store.jsonc", [{"op": "set"}])
+        ft = BSMFileTree(tmp_path.as_uri())
+        assert sorted(file_indexes(ft)) == ["bdm_store.jsonc",
+                                            "fi000/data/new/wb_0000.xlsx"]
+
+    def test_warm_scan_lists_few_folders(self, tmp_path) -> None:
+        """Test a warm scan from the snapshot lists only changed folders."""
+        make_folder(tmp_path, 50, 100)
+        st = time.perf_counter()
+        ft = BSMFileTree(tmp_path.as_uri())
+        cold = time.perf_counter() - st
+        st = time.perf_counter()
+        ft.update_file_tree()
+        warm = time.perf_counter() - st
+        logger.info(f"cold scan: {cold:.4f}s, warm scan: {warm:.4f}s")
+        assert ft.max_file_index == 50 * 100 - 1
+        assert ft.scan_stats["listed"] <= 1
+        assert not ft.scan_stats["dirty"]
+
+    def test_reset_metadata(self, tmp_path) -> None:
+        """Test reset_metadata() clears the marks set on a reused file_tree."""
+        make_folder(tmp_path, 1, 2)
+        ft = BSMFileTree(tmp_path.as_uri())
+        suffix = " (marked)"
+        for bsm_file in ft.all_files():
+            node = ft.file_tree.get_node(bsm_file.file_url)
+            node.tag += suffix
+            bsm_file.in_bdm = True
+            bsm_file.type = "marked"
+            bsm_file.wb_type = "marked"
+            bsm_file.wf_key = "marked"
+        for bsm_folder in ft.all_folders():
+            bsm_folder.type = "marked"
+        ft.reset_metadata(suffix)
+        assert not any(n.tag.endswith(suffix) 
+                       for n in ft.file_tree.all_nodes_itr())
+        for bsm_file in ft.all_files():
+            assert not bsm_file.in_bdm and bsm_file.type == "file"
+            assert bsm_file.wb_type != "marked" and bsm_file.wf_key == "n/a"
+        assert all(f.type == "folder" for f in ft.all_folders())
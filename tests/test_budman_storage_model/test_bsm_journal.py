@@ -0,0 +1,62 @@
+# ---------------------------------------------------------------------------- +
+# test_bsm_journal.py
+# ---------------------------------------------------------------------------- +
+#region imports
+# python standard libraries
+import pytest, json
+from pathlib import Path
+# third-party libraries
+import logging, p3_utils as p3u, p3logging as p3l
+# local libraries
+from budman_namespace import *
+from budget_storage_model import (bsm_journal_path, bsm_journal_append,
+                                  bsm_journal_read, bsm_journal_clear,
+                                  bsm_journal_replay, bsm_BDM_STORE_file_load,
+                                  BSM_JOURNAL_OP, BSM_JOURNAL_OP_WB_PUT,
+                                  BSM_JOURNAL_OP_WB_DEL, BSM_JOURNAL_OP_SET)
+#endregion imports
+# ---------------------------------------------------------------------------- +
+#region Globals
+logger = logging.getLogger(__name__)
+#endregion Globals
+# ---------------------------------------------------------------------------- +
+def bdm_store() -> dict:
+    """Return a small BDM_STORE dict with one FI and two workbooks."""
+    wdc = {"a": {WB_NAME: "a"}, "b": {WB_NAME: "b"}}
+    return {BDM_ID: "test", BDM_OPTIONS: {},
+            BDM_FI_COLLECTION: {"boa": {FI_KEY: "boa",
+                                        FI_WORKBOOK_DATA_COLLECTION: wdc}}}
+
+def wb_put(wb_id: str) -> dict:
+    return {BSM_JOURNAL_OP: BSM_JOURNAL_OP_WB_PUT, FI_KEY: "boa",
+            WB_ID: wb_id, "wb": {WB_NAME: wb_id}}
+# ---------------------------------------------------------------------------- +
+class TestBSMJournal:
+    """BDM_STORE journal append, read and replay."""
+    def test_replay_committed_records_only(self, tmp_path) -> None:
+        """Test a torn, uncommitted tail is not replayed."""
+        bdms_path = tmp_path / "bdm_store.jsonc"
+        bsm_journal_append(bdms_path, [wb_put("c")])
+        bsm_journal_append(bdms_path, [
+            {BSM_JOURNAL_OP: BSM_JOURNAL_OP_WB_DEL, FI_KEY: "boa", WB_ID: "a"},
+            {BSM_JOURNAL_OP: BSM_JOURNAL_OP_SET, "key": BDM_OPTIONS,
+             "value": {"x": 1}}])
+        with open(bsm_journal_path(bdms_path), "a") as f:
+            f.write(json.dumps(wb_put("d")) + "\n" + '{"op": "wb_')
+        records = bsm_journal_read(bdms_path)
+        assert len(records) == 3
+        store = bsm_journal_replay(bdm_store(), records)
+        wdc = store[BDM_FI_COLLECTION]["boa"][FI_WORKBOOK_DATA_COLLECTION]
+        assert list(wdc.keys()) == ["b", "c"]
+        assert store[BDM_OPTIONS] == {"x": 1}
+        bsm_journal_clear(bdms_path)
+        assert bsm_journal_read(bdms_path) == []
+
+    def test_store_load_replays_journal(self, tmp_path) -> None:
+        """Test bsm_BDM_STORE_file_load() applies the journal."""
+        bdms_path = tmp_path / "bdm_store.jsonc"
+        bdms_path.write_text(json.dumps(bdm_store()))
+        bsm_journal_append(bdms_path, [wb_put("c")])
+        store = bsm_BDM_STORE_file_load(bdms_path)
+        wdc = store[BDM_FI_COLLECTION]["boa"][FI_WORKBOOK_DATA_COLLECTION]
+        assert list(wdc.keys()) == ["a", "b", "c"]
@@ -0,0 +1,71 @@
+# ---------------------------------------------------------------------------- +
+# test_bsm_json_codec.py
+# ---------------------------------------------------------------------------- +
+#region imports
+# python standard libraries
+import pytest, os, time, json
+from pathlib import Path
+# third-party libraries
+import logging, p3_utils as p3u, p3logging as p3l, pyjson5 as json5
+# local libraries
+from budget_storage_model import (bsm_json_decode, bsm_json_file_load,
+                                  bsm_json_snapshot_path)
+#endregion imports
+# ---------------------------------------------------------------------------- +
+#region Globals
+logger = logging.getLogger(__name__)
+#endregion Globals
+# ---------------------------------------------------------------------------- +
+def large_bdm_store(fi_count: int, wb_count: int) -> dict:
+    """Return a BDM_STORE like dict with fi_count * wb_count workbooks."""
+    fi_collection = {}
+    for fi in range(fi_count):
+        wdc = {}
+        for wb in range(wb_count):
+            wb_name = f"CC_{wb:05}_transactions.xlsx"
+            wdc[f"data/new|{wb_name}"] = {
+                "wb_name": wb_name, "wb_type": "transactions",
+                "wb_url": f"file:///budget/fi{fi}/data/new/{wb_name}",
+                "fi_key": f"fi{fi}", "wf_key": "intake",
+                "wf_purpose": "wf_input", "wf_folder": "data/new",
+                "wb_loaded": False, "wb_content": None}
+        fi_collection[f"fi{fi}"] = {"fi_key": f"fi{fi}",
+                                    "fi_workbook_data_collection": wdc}
+    return {"bdm_id": "test", "bdm_fi_collection": fi_collection}
+# ---------------------------------------------------------------------------- +
+class TestBSMJsonCodec:
+    """bsm_json_codec decoding and snapshot reuse."""
+    def test_decode_json5_fallback(self) -> None:
+        """Test JSON5 syntax falls back to the json5 decoder."""
+        assert bsm_json_decode('{"a": [1, 2]}') == {"a": [1, 2]}
+        assert bsm_json_decode('{a: [1, 2,], // comment\n}') == {"a": [1, 2]}
+
+    def test_snapshot_reused_until_source_changes(self, tmp_path) -> None:
+        """Test a snapshot is written, used, and ignored once stale."""
+        json_path = tmp_path / "store.jsonc"
+        json_path.write_text('{"a": 1, /* json5 */ }')
+        assert bsm_json_file_load(json_path) == {"a": 1}
+        assert bsm_json_snapshot_path(json_path).exists()
+        assert bsm_json_file_load(json_path) == {"a": 1}
+        json_path.write_text('{"a": 22}')
+        assert bsm_json_file_load(json_path) == {"a": 22}
+        assert bsm_json_file_load(json_path, snapshot=False) == {"a": 22}
+
+    def test_large_store_load_timing(self, tmp_path) -> None:
+        """Measure json5, stdlib json and snapshot loads of a large store."""
+        json_path = tmp_path / "bdm_store.jsonc"
+        json_path.write_text(json5.encode(large_bdm_store(10, 2000)))
+        st = time.perf_counter()
+        with open(json_path, "r") as f:
+            expected = json5.decode(f.read(), 10)
+        json5_time = time.perf_counter() - st
+        st = time.perf_counter()
+        assert bsm_json_file_load(json_path, snapshot=False) == expected
+        json_time = time.perf_counter() - st
+        bsm_json_file_load(json_path)
+        st = time.perf_counter()
+        assert bsm_json_file_load(json_path) == expected
+        snapshot_time = time.perf_counter() - st
+        logger.info(f"{json_path.stat().st_size} bytes: json5 {json5_time:.4f}s, "
+                    f"json {json_time:.4f}s, snapshot {snapshot_time:.4f}s")
+        assert snapshot_time < json5_time
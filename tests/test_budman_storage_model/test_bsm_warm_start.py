@@ -0,0 +1,84 @@
+# ---------------------------------------------------------------------------- +
+# test_bsm_warm_start.py
+# ---------------------------------------------------------------------------- +
+#region imports
+# python standard libraries
+import pytest, os
+from pathlib import Path
+# third-party libraries
+import logging, p3_utils as p3u, p3logging as p3l
+# local libraries
+from budget_storage_model import (bsm_warm_start_path, bsm_warm_start_save,
+                                  bsm_warm_start_load, bsm_warm_start_clear)
+from budget_storage_model.bsm_warm_start import (
+    BSM_WARM_START_CACHE_DIR_ENV_VAR, BSM_WARM_START_KEY_FILENAME)
+#endregion imports
+# ---------------------------------------------------------------------------- +
+#region Globals
+logger = logging.getLogger(__name__)
+#endregion Globals
+# ---------------------------------------------------------------------------- +
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch) -> Path:
+    """Keep the warm-start snapshots in a cache folder under tmp_path."""
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv(BSM_WARM_START_CACHE_DIR_ENV_VAR, str(cache_dir))
+    return cache_dir
+
+def save_snapshot(tmp_path: Path) -> Path:
+    """Save a snapshot with one source file and one folder, return the
+    BDM_STORE path."""
+    bdms_path = tmp_path / "bdm_store.jsonc"
+    bdms_path.write_text('{"a": 1}')
+    folder = tmp_path / "boa"
+    folder.mkdir()
+    bsm_warm_start_save(bdms_path, {"model": [1, 2]}, [bdms_path],
+                        [tmp_path, folder])
+    return bdms_path
+# ---------------------------------------------------------------------------- +
+class TestBSMWarmStart:
+    """Warm-start snapshot save, load and manifest checks."""
+    def test_load_current_snapshot(self, tmp_path) -> None:
+        """Test the content loads while its sources are unchanged, or only
+        touched. The snapshot is kept in the cache folder."""
+        bdms_path = save_snapshot(tmp_path)
+        assert bsm_warm_start_path(bdms_path).parent == tmp_path / "cache"
+        assert bsm_warm_start_load(bdms_path) == {"model": [1, 2]}
+        st = os.stat(bdms_path)
+        os.utime(bdms_path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+        assert bsm_warm_start_load(bdms_path) == {"model": [1, 2]}
+        bsm_warm_start_clear(bdms_path)
+        assert not bsm_warm_start_path(bdms_path).exists()
+        assert bsm_warm_start_load(bdms_path) is None
+
+    def test_changed_sources_are_stale(self, tmp_path) -> None:
+        """Test a changed source file or folder rejects the snapshot."""
+        bdms_path = save_snapshot(tmp_path)
+        bdms_path.write_text('{"a": 2}')
+        assert bsm_warm_start_load(bdms_path) is None
+        (tmp_path / "x").mkdir()
+        bdms_path = save_snapshot(tmp_path / "x")
+        assert bsm_warm_start_load(bdms_path) is not None
+        (bdms_path.parent / "boa" / "new.xlsx").write_bytes(b"")
+        assert bsm_warm_start_load(bdms_path) is None
+
+    def test_tampered_snapshot_is_not_loaded(self, tmp_path, cache_dir) -> None:
+        """Test content not signed with the user's key is not unpickled."""
+        bdms_path = save_snapshot(tmp_path)
+        snapshot_path = bsm_warm_start_path(bdms_path)
+        data = snapshot_path.read_bytes()
+        snapshot_path.write_bytes(data[:-1] + bytes([data[-1] ^ 1]))
+        assert bsm_warm_start_load(bdms_path) is None
+        snapshot_path.write_bytes(data)
+        assert bsm_warm_start_load(bdms_path) == {"model": [1, 2]}
+        (cache_dir / BSM_WARM_START_KEY_FILENAME).unlink()
+        assert bsm_warm_start_load(bdms_path) is None
+
+    @pytest.mark.skipif(os.name != "posix", reason="POSIX file modes")
+    def test_cache_dir_is_private(self, tmp_path, cache_dir) -> None:
+        """Test the cache folder is private, and a shared one is refused."""
+        bdms_path = save_snapshot(tmp_path)
+        assert cache_dir.stat().st_mode & 0o777 == 0o700
+        assert bsm_warm_start_path(bdms_path).stat().st_mode & 0o777 == 0o600
+        cache_dir.chmod(0o777)
+        assert bsm_warm_start_load(bdms_path) is None
@@ -0,0 +1,54 @@
+# ---------------------------------------------------------------------------- +
+#region tests/test_p3_mvvm/conftest.py
+"""Fixtures for the p3_mvvm CommandProcessor tests."""
+#endregion tests/test_p3_mvvm/conftest.py
+# ---------------------------------------------------------------------------- +
+#region    Imports
+# python standard libraries
+import pytest, logging
+from typing import Any, Callable, Iterator, List, Optional, Type
+# third-party libraries
+
+# local libraries
+import p3_mvvm as p3m
+from p3_mvvm.command_processor import CommandProcessor
+from p3_mvvm.command_class import Command
+from p3_mvvm.mvvm_namespace import *
+#endregion Imports
+# ---------------------------------------------------------------------------- +
+#region Globals
+logger = logging.getLogger(__name__)
+#endregion Globals
+# ---------------------------------------------------------------------------- +
+@pytest.fixture
+def make_cp() -> Iterator[Callable[..., CommandProcessor]]:
+    """Return a factory of initialized CommandProcessors without a DC. With
+    a worker_count, the worker threads are started, and cancelled at
+    teardown."""
+    cps: List[CommandProcessor] = []
+    def _make_cp(cp_class: Type[CommandProcessor] = CommandProcessor,
+                 worker_count: Optional[int] = None) -> CommandProcessor:
+        cp = cp_class().cp_initialize()
+        cp._data_context = None
+        if worker_count:
+            cp.cp_initialize_worker_thread(worker_count=worker_count)
+            cps.append(cp)
+        return cp
+    yield _make_cp
+    for cp in cps:
+        cp.cp_cancel_worker_thread()
+
+@pytest.fixture
+def make_cmd() -> Callable[..., Command]:
+    """Return a factory of test Commands. The exec_func returns a CMD_RESULT
+    from p3m.cp_CMD_RESULT_create(), with the content returned by body(cmd),
+    "" without a body."""
+    def _make_cmd(cp: CommandProcessor, cmd_name: str,
+                  body: Optional[Callable[[Command], Any]] = None,
+                  subcmd_name: str = "test", status: bool = True) -> Command:
+        def exec_func(cmd, dc, cp) -> CMD_RESULT_TYPE:
+            content = body(cmd) if body is not None else ""
+            return p3m.cp_CMD_RESULT_create(status, CV_CMD_STRING_OUTPUT,
+                                            content, cmd)
+        return Command(cp, cmd_name, exec_func, subcmd_name=subcmd_name)
+    return _make_cmd
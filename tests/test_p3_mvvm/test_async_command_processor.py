@@ -0,0 +1,87 @@
+# ---------------------------------------------------------------------------- +
+#region tests/test_p3_mvvm/test_async_command_processor.py
+"""Tests for the p3_mvvm.async_command_processor module."""
+#endregion tests/test_p3_mvvm/test_async_command_processor.py
+# ---------------------------------------------------------------------------- +
+#region    Imports
+# python standard libraries
+import pytest, logging, asyncio, threading, time
+# third-party libraries
+
+# local libraries
+from p3_mvvm.async_command_processor import AsyncCommandProcessor
+from p3_mvvm.command_class import Command
+from p3_mvvm.mvvm_namespace import *
+#endregion Imports
+# ---------------------------------------------------------------------------- +
+#region Globals
+logger = logging.getLogger(__name__)
+#endregion Globals
+# ---------------------------------------------------------------------------- +
+class ReadOnlyAsyncCommandProcessor(AsyncCommandProcessor):
+    """All cmds are read only, they hold the cp_model_lock to read."""
+    def cp_cmd_read_only(self, cmd) -> bool:
+        return True
+
+def cmd_result(cmd: Command) -> CMD_RESULT_TYPE:
+    return {CK_CMD_RESULT_STATUS: True, CK_CMD_RESULT_CONTENT: cmd.cmd_name,
+            CK_CMD_OBJECT_VALUE: cmd}
+# ---------------------------------------------------------------------------- +
+class TestAsyncCommandProcessor:
+    """Tests for the AsyncCommandProcessor class."""
+    def test_overlapped_cmds(self) -> None:
+        """Test read only cmds overlap their blocking I/O and results reach
+        the subscriber without polling."""
+        # Each blocking stage waits for the other two, they all run at once.
+        barrier = threading.Barrier(3, timeout=5)
+        def blocking_cmd(cmd, dc, cp) -> CMD_RESULT_TYPE:
+            barrier.wait()
+            return cmd_result(cmd)
+        async def coroutine_cmd(cmd, dc, cp) -> CMD_RESULT_TYPE:
+            await cp.cp_map_blocking(lambda _: barrier.wait(), [0])
+            return cmd_result(cmd)
+        async def run() -> None:
+            cp = ReadOnlyAsyncCommandProcessor(worker_count=3).cp_initialize()
+            cp._data_context = None
+            await cp.cp_start()
+            results = []
+            async def subscriber(cmd_result: CMD_RESULT_TYPE) -> None:
+                results.append(cmd_result[CK_CMD_RESULT_CONTENT])
+            for name, exec_func in [("a", blocking_cmd), ("b", coroutine_cmd),
+                                    ("c", blocking_cmd)]:
+                cmd_result = cp.cp_execute_cmd_async(
+                    Command(cp, name, exec_func, subcmd_name="test"), subscriber)
+                assert cmd_result[CK_CMD_RESULT_STATUS] is True
+            await cp.cp_stop()
+            assert sorted(results) == ["a", "b", "c"]
+            assert cp.cp_is_started is False
+        asyncio.run(run())
+
+    def test_coroutine_cmds_hold_model_lock(self) -> None:
+        """Test coroutine cmds changing the model hold the cp_model_lock to
+        write, one at a time, and bump the model version."""
+        running, overlaps, write_locked = [0], [], []
+        def stage() -> None:
+            running[0] += 1
+            overlaps.append(running[0])
+            time.sleep(0.05)
+            running[0] -= 1
+        async def coroutine_cmd(cmd, dc, cp) -> CMD_RESULT_TYPE:
+            write_locked.append(cp.cp_model_lock.write_locked)
+            await cp.cp_run_blocking(stage)
+            return cmd_result(cmd)
+        async def run() -> None:
+            cp = AsyncCommandProcessor(worker_count=3).cp_initialize()
+            cp._data_context = None
+            await cp.cp_start()
+            version = cp.cp_model_version
+            results = await cp.cp_execute_cmds_aio(
+                [Command(cp, name, coroutine_cmd, subcmd_name="test")
+                 for name in ("a", "b", "c")])
+            await cp.cp_stop()
+            assert [r[CK_CMD_RESULT_CONTENT] for r in results] == ["a", "b", "c"]
+            assert write_locked == [True, True, True]
+            assert overlaps == [1, 1, 1]
+            assert cp.cp_model_version == version + 3
+            assert cp.cp_model_lock.write_locked is False
+        asyncio.run(run())
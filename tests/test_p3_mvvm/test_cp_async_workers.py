@@ -0,0 +1,132 @@
+# ---------------------------------------------------------------------------- +
+#region tests/test_p3_mvvm/test_cp_async_workers.py
+"""Tests for the CommandProcessor async worker threads."""
+#endregion tests/test_p3_mvvm/test_cp_async_workers.py
+# ---------------------------------------------------------------------------- +
+#region    Imports
+# python standard libraries
+import pytest, logging, threading
+from typing import Iterator
+# third-party libraries
+
+# local libraries
+from p3_mvvm.command_processor import CommandProcessor
+from p3_mvvm.command_class import Command
+from p3_mvvm.cp_cancel_token import cp_cmd_cancel_check
+from p3_mvvm.mvvm_namespace import *
+#endregion Imports
+# ---------------------------------------------------------------------------- +
+#region Globals
+logger = logging.getLogger(__name__)
+#endregion Globals
+# ---------------------------------------------------------------------------- +
+class ReadCommandProcessor(CommandProcessor):
+    """A CommandProcessor with the 'read' subcmds read only."""
+    def cp_cmd_read_only(self, cmd) -> bool:
+        return getattr(cmd, CK_SUBCMD_NAME, None) == "read"
+
+class TestCPAsyncWorkers:
+    """Tests for priorities, cancellation and latency of async commands."""
+    @pytest.fixture(autouse=True)
+    def setup(self, make_cp, make_cmd) -> Iterator[None]:
+        """Setup for each test method, release any blocked cmd at teardown."""
+        self.cp = make_cp(worker_count=1)
+        self.make_cmd = make_cmd
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.ran = []
+        yield
+        self.release.set()
+
+    def submit(self, name: str, priority: int) -> str:
+        """Submit an async cmd which records name when run, return its
+        async_id."""
+        def body(cmd: Command) -> str:
+            self.started.set()
+            self.release.wait(5)
+            cp_cmd_cancel_check(cmd)
+            self.ran.append(name)
+            return name
+        cmd = self.make_cmd(self.cp, name, body)
+        setattr(cmd, CK_CMD_ASYNC_PRIORITY, priority)
+        cmd_result = self.cp.cp_execute_cmd_async(cmd, lambda r: None)
+        assert cmd_result[CK_CMD_RESULT_STATUS] is True
+        return cmd_result[CK_CMD_RESULT_CONTENT]
+
+    def test_priority_and_cancel(self) -> None:
+        """Test queued cmds run by priority, a cancelled cmd is not run and
+        results have the queue wait and execution times."""
+        running = self.submit("running", CV_CMD_PRIORITY_BATCH)
+        assert self.started.wait(5)
+        batch = self.submit("batch", CV_CMD_PRIORITY_BATCH)
+        cancelled = self.submit("cancelled", CV_CMD_PRIORITY_INTERACTIVE)
+        self.submit("interactive", CV_CMD_PRIORITY_INTERACTIVE)
+        assert self.cp.cp_cancel_async_cmd(cancelled) is True
+        self.release.set()
+        self.cp.cp_async_cmd_join()
+        assert self.ran == ["running", "interactive", "batch"]
+        registry = self.cp.cp_async_cmd_result_registry
+        assert registry[cancelled][CK_CMD_RESULT_STATUS] is False
+        assert registry[batch][CK_CMD_RESULT_QUEUE_WAIT] >= 0.0
+        assert registry[running][CK_CMD_RESULT_EXEC_TIME] >= 0.0
+        assert self.cp.cp_cancel_async_cmd(batch) is False
+
+    def test_writer_lane_and_errors(self, make_cp) -> None:
+        """Test read only cmds run in parallel, a write cmd runs alone, and
+        a cmd raising an exception gets an error result, the writer goes on."""
+        cp = make_cp(ReadCommandProcessor, worker_count=2)
+        lock = threading.Lock()
+        active, overlaps = [0], []
+        both_reading = threading.Barrier(2, timeout=5)
+        def body(cmd: Command) -> str:
+            if cmd.cmd_name == "raise":
+                raise ValueError("bad cmd")
+            with lock:
+                active[0] += 1
+                overlaps.append((cmd.cmd_name, active[0]))
+            if cmd.subcmd_name == "read":
+                both_reading.wait()
+            with lock:
+                active[0] -= 1
+            return ""
+        ids = [cp.cp_execute_cmd_async(
+                   self.make_cmd(cp, name, body, subcmd_name=subcmd_name),
+                   lambda r: None)[CK_CMD_RESULT_CONTENT]
+               for name, subcmd_name in (("r1", "read"), ("r2", "read"),
+                                         ("raise", "write"), ("w", "write"))]
+        cp.cp_async_cmd_join()
+        registry = cp.cp_async_cmd_result_registry
+        assert registry[ids[2]][CK_CMD_RESULT_STATUS] is False
+        assert all(registry[i][CK_CMD_RESULT_STATUS] for i in ids[:2] + ids[3:])
+        assert ("w", 1) in overlaps and max(n for _, n in overlaps) == 2
+        assert cp.cp_model_lock.reader_count == 0
+        assert not cp.cp_model_lock.write_locked
+
+    def test_read_runs_between_writer_steps(self, make_cp) -> None:
+        """Test a read only cmd, e.g. 'list', completes while a long write
+        cmd runs, at the writer's next cp_cmd_cancel_check()."""
+        cp = make_cp(ReadCommandProcessor, worker_count=1)
+        list_done = threading.Event()
+        def write_body(cmd: Command) -> int:
+            self.started.set()
+            steps = 0
+            while not list_done.wait(0.01) and steps < 500:
+                cp_cmd_cancel_check(cmd) # The next workbook step.
+                steps += 1
+            return steps
+        writer_id = cp.cp_execute_cmd_async(
+            self.make_cmd(cp, "workflow", write_body, subcmd_name="write"),
+            lambda r: None)[CK_CMD_RESULT_CONTENT]
+        assert self.started.wait(5)
+        version = cp.cp_model_version
+        cmd_result = cp.cp_execute_cmd(
+            self.make_cmd(cp, "list", lambda cmd: "listed", subcmd_name="read"))
+        writer_result = cp.cp_async_cmd_result_registry[writer_id]
+        list_done.set()
+        assert cmd_result[CK_CMD_RESULT_CONTENT] == "listed"
+        assert writer_result is None
+        # Bumped before the read, the writer may have changed the model.
+        assert cp.cp_model_version > version
+        cp.cp_async_cmd_join()
+        assert cp.cp_async_cmd_result_registry[writer_id][CK_CMD_RESULT_STATUS]
+        assert not cp.cp_model_lock.write_locked
@@ -0,0 +1,59 @@
+# ---------------------------------------------------------------------------- +
+#region tests/test_p3_mvvm/test_cp_message_batcher.py
+"""Tests for the p3_mvvm.cp_message_batcher module and batched user messages."""
+#endregion tests/test_p3_mvvm/test_cp_message_batcher.py
+# ---------------------------------------------------------------------------- +
+#region    Imports
+# python standard libraries
+import pytest, logging
+# third-party libraries
+
+# local libraries
+from p3_mvvm.cp_message_batcher import CPMessageBatcher
+from p3_mvvm.cp_message_service import (cp_msg_svc, cp_user_info_message,
+                                        cp_user_message_batch_callback)
+from p3_mvvm.mvvm_namespace import *
+#endregion Imports
+# ---------------------------------------------------------------------------- +
+#region Globals
+logger = logging.getLogger(__name__)
+#endregion Globals
+# ---------------------------------------------------------------------------- +
+class TestCPMessageBatcher:
+    """Tests for the CPMessageBatcher class."""
+    def test_policies_and_overflow(self) -> None:
+        """Test the ring buffer keeps the newest messages and DEBUG/VERBOSE
+        messages are summarized or dropped."""
+        batcher = CPMessageBatcher(capacity=3, policies={
+            CP_DEBUG: CV_MSG_POLICY_SUMMARIZE, CP_VERBOSE: CV_MSG_POLICY_DROP})
+        for i in range(5):
+            batcher.add(f"info {i}", CP_INFO)
+            batcher.add(f"debug {i}", CP_DEBUG)
+            batcher.add(f"verbose {i}", CP_VERBOSE)
+        batch = batcher.flush()
+        assert batch == [("2 messages dropped, message buffer full.", CP_WARNING),
+                         ("info 2", CP_INFO), ("info 3", CP_INFO),
+                         ("info 4", CP_INFO),
+                         ("5 DEBUG messages not shown.", CP_DEBUG)]
+        assert (batcher.added, batcher.dropped) == (15, 7)
+        assert batcher.flush() == []
+
+    def test_service_batches(self) -> None:
+        """Test CPMessageService publishes the user messages in batches."""
+        batches = []
+        @cp_user_message_batch_callback
+        def subscriber(batch) -> None:
+            batches.append([m.message for m in batch])
+        sub_id = cp_msg_svc.subscribe_user_message_batch(subscriber)
+        cp_msg_svc.batch_start(flush_interval=60.0)
+        try:
+            for i in range(3):
+                cp_user_info_message(f"info {i}", log=False)
+            assert cp_msg_svc.batch_flush() == 3
+            cp_user_info_message("info 3", log=False)
+        finally:
+            cp_msg_svc.batch_stop()
+            cp_msg_svc.drain()
+            cp_msg_svc.unsubscribe(CP_USER_MSG_BATCH_TOPIC, sub_id)
+        assert batches == [["info 0", "info 1", "info 2"], ["info 3"]]
+        assert cp_msg_svc.batching is False
@@ -0,0 +1,87 @@
+# ---------------------------------------------------------------------------- +
+#region tests/test_p3_mvvm/test_cp_metrics.py
+"""Tests for the p3_telemetry.cp_metrics module."""
+#endregion tests/test_p3_mvvm/test_cp_metrics.py
+# ---------------------------------------------------------------------------- +
+#region    Imports
+# python standard libraries
+import pytest, logging, json, math
+# third-party libraries
+
+# local libraries
+from p3_telemetry.cp_metrics import (CPMetricsRegistry, CPHistogram, cp_metrics,
+                                     cp_metrics_json, cp_timed)
+from p3_mvvm.mvvm_namespace import *
+#endregion Imports
+# ---------------------------------------------------------------------------- +
+#region Globals
+logger = logging.getLogger(__name__)
+#endregion Globals
+# ---------------------------------------------------------------------------- +
+class TestCPMetricsRegistry:
+    """Tests for the CPMetricsRegistry class."""
+    def test_metrics(self, tmp_path) -> None:
+        """Test counters, gauges and histograms, snapshot and dump."""
+        metrics = CPMetricsRegistry()
+        metrics.counter("rows").inc(3)
+        metrics.counter("rows").inc()
+        with pytest.raises(ValueError):
+            metrics.counter("rows").inc(-1)
+        with pytest.raises(TypeError):
+            metrics.gauge("rows")
+        depth = [5]
+        metrics.gauge("depth", func=lambda: depth[0])
+        depth[0] = 7
+        h = metrics.histogram("seconds", buckets=(0.1, 1.0))
+        for value in (0.05, 0.5, 0.5, 2.0):
+            h.observe(value)
+        s = metrics.snapshot()
+        assert s["counters"] == {"rows": 4}
+        assert s["gauges"] == {"depth": 7}
+        hs = s["histograms"]["seconds"]
+        assert hs["buckets"] == {"0.1": 1, "1.0": 2} and hs["overflow"] == 1
+        assert (hs["count"], hs["min"], hs["max"]) == (4, 0.05, 2.0)
+        assert (h.quantile(0.5), h.quantile(0.95)) == (1.0, 2.0)
+        assert "rows" in metrics.report("ro") and "depth" not in metrics.report("ro")
+        path = tmp_path / "metrics.jsonl"
+        metrics.dump(path)
+        metrics.reset()
+        metrics.dump(path)
+        lines = [json.loads(line) for line in path.read_text().splitlines()]
+        assert [line["counters"]["rows"] for line in lines] == [4, 0]
+        assert lines[1]["gauges"]["depth"] == 7
+        assert math.isnan(CPHistogram("empty").quantile(0.5))
+        with pytest.raises(ValueError):
+            CPHistogram("bad", buckets=(1.0, 0.1))
+
+    def test_nan_is_null_json(self, tmp_path) -> None:
+        """Test a NaN gauge dumps as null, in strict JSON."""
+        metrics = CPMetricsRegistry()
+        metrics.gauge("broken", func=lambda: 1 / 0)
+        metrics.gauge("big").set(math.inf)
+        assert math.isnan(metrics.snapshot()["gauges"]["broken"])
+        text = cp_metrics_json(metrics.snapshot())
+        parse_constant = lambda c: pytest.fail(f"Not strict JSON: {c}")
+        assert json.loads(text, parse_constant=parse_constant)["gauges"] == {
+            "big": None, "broken": None}
+        path = tmp_path / "metrics.jsonl"
+        metrics.dump(path)
+        line = json.loads(path.read_text(), parse_constant=parse_constant)
+        assert line["gauges"]["broken"] is None
+
+    def test_timed_and_command(self, make_cp, make_cmd) -> None:
+        """Test cp_timed() and cp_execute_cmd() observe latency and count."""
+        @cp_timed("test.fail.seconds", errors="test.fail.errors")
+        def fail() -> None:
+            raise ValueError("bad")
+        with pytest.raises(ValueError):
+            fail()
+        assert cp_metrics.histogram("test.fail.seconds").count == 1
+        assert cp_metrics.counter("test.fail.errors").value == 1
+        cp = make_cp()
+        cmd = make_cmd(cp, "run", subcmd_name="metrics")
+        count = cp_metrics.counter(CP_METRIC_CMD_COUNT).value
+        cp.cp_execute_cmd(cmd)
+        assert cp_metrics.counter(CP_METRIC_CMD_COUNT).value == count + 1
+        assert cp_metrics.histogram(
+            f"{CP_METRIC_CMD_SECONDS}.run_cmd_metrics").count == 1
@@ -0,0 +1,51 @@
+# ---------------------------------------------------------------------------- +
+#region tests/test_p3_mvvm/test_cp_profiler.py
+"""Tests for the p3_mvvm.cp_profiler module."""
+#endregion tests/test_p3_mvvm/test_cp_profiler.py
+# ---------------------------------------------------------------------------- +
+#region    Imports
+# python standard libraries
+import pytest, logging, pstats
+# third-party libraries
+
+# local libraries
+from p3_mvvm.cp_profiler import CPProfiler
+from p3_mvvm.mvvm_namespace import *
+#endregion Imports
+# ---------------------------------------------------------------------------- +
+#region Globals
+logger = logging.getLogger(__name__)
+#endregion Globals
+# ---------------------------------------------------------------------------- +
+def hot_function(n: int) -> list:
+    """Allocate a list of n strings."""
+    return [str(i) * 10 for i in range(n)]
+
+class TestCPProfiler:
+    """Tests for the CPProfiler class."""
+    def test_run(self, tmp_path) -> None:
+        """Test a run saves the pstats and allocations and reports the
+        hotspots."""
+        profiler = CPProfiler(tmp_path / "profiles", memory=True, top=2)
+        result = profiler.run(lambda: hot_function(20000), "wf categorize 2")
+        assert len(result.value) == 20000
+        assert result.pstats_path.name.endswith("_wf_categorize_2.pstats")
+        assert "hot_function" in str(pstats.Stats(str(result.pstats_path)).stats)
+        assert len(result.hotspots) == 2
+        assert any("hot_function" in line for line in result.hotspots)
+        assert result.alloc_path.exists()
+        assert "test_cp_profiler.py" in result.alloc_path.read_text()
+        assert result.peak_memory > 0
+        assert "Peak traced memory" in result.report()
+
+    def test_run_error(self, tmp_path) -> None:
+        """Test the results are saved when the function raises."""
+        profiler = CPProfiler(tmp_path, sort=CV_PROFILE_SORT_TOTTIME)
+        def fail() -> None:
+            raise ValueError("bad")
+        with pytest.raises(ValueError):
+            profiler.run(fail, "fail")
+        assert len(list(tmp_path.glob("*_fail.pstats"))) == 1
+        assert len(list(tmp_path.glob("*.alloc.txt"))) == 0
+        with pytest.raises(ValueError):
+            CPProfiler(tmp_path, sort="bad")
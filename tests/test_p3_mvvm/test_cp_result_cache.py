@@ -0,0 +1,77 @@
+# ---------------------------------------------------------------------------- +
+#region tests/test_p3_mvvm/test_cp_result_cache.py
+"""Tests for the p3_mvvm.cp_result_cache module."""
+#endregion tests/test_p3_mvvm/test_cp_result_cache.py
+# ---------------------------------------------------------------------------- +
+#region    Imports
+# python standard libraries
+import pytest, logging
+# third-party libraries
+
+# local libraries
+from p3_mvvm.command_processor import CommandProcessor
+from p3_mvvm.command_class import Command
+from p3_mvvm.cp_message_service import cp_msg_svc, cp_user_info_message
+from p3_mvvm.cp_result_cache import CPResultCache, CPResultCacheEntry
+from p3_mvvm.mvvm_namespace import *
+#endregion Imports
+# ---------------------------------------------------------------------------- +
+#region Globals
+logger = logging.getLogger(__name__)
+#endregion Globals
+# ---------------------------------------------------------------------------- +
+class ReadCacheCommandProcessor(CommandProcessor):
+    """A CommandProcessor caching the 'read' subcmds, 'peek' is read only."""
+    def cp_cmd_cacheable(self, cmd) -> bool:
+        return getattr(cmd, CK_SUBCMD_NAME, None) == "read"
+
+    def cp_cmd_read_only(self, cmd) -> bool:
+        return getattr(cmd, CK_SUBCMD_NAME, None) in ("read", "peek")
+
+class TestCPResultCache:
+    """Tests for the CPResultCache class."""
+    def test_lru(self) -> None:
+        """Test the cache keys by cmd arguments and evicts the LRU entry."""
+        cache = CPResultCache(capacity=2)
+        keys = [("c", None, 0, (("n", repr(i)),)) for i in range(3)]
+        for key in keys:
+            cache.put(key, CPResultCacheEntry({}))
+        assert len(cache) == 2 and cache.get(keys[0]) is None
+        assert cache.get(keys[2]) is not None
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert CPResultCache.key(None, 0) is None
+        with pytest.raises(ValueError):
+            CPResultCache(capacity=-1)
+
+    def test_cached_command(self, make_cp, make_cmd) -> None:
+        """Test a read cmd result and messages are cached until another cmd
+        bumps the model version, a read only cmd does not."""
+        cp = make_cp(ReadCacheCommandProcessor)
+        calls = []
+        def body(cmd: Command) -> int:
+            calls.append(cmd.subcmd_name)
+            cp_user_info_message(f"{cmd.subcmd_name} {len(calls)}", log=False)
+            return len(calls)
+        read, write, peek = (make_cmd(cp, "run", body, subcmd_name=name)
+                             for name in ("read", "write", "peek"))
+        cp_msg_svc.capture_start()
+        try:
+            first = cp.cp_execute_cmd(read)
+            second = cp.cp_execute_cmd(read)
+            messages = cp_msg_svc.capture_buffer
+            assert second is first and calls == ["read"]
+            user_messages = [d["message"] for t, d in messages
+                             if t == CP_USER_MSG_TOPIC]
+            assert user_messages.count("read 1") == 2
+            read.cmd_parms["n"] = 1
+            cp.cp_execute_cmd(read)
+            assert calls == ["read", "read"]
+            version = cp.cp_model_version
+            cp.cp_execute_cmd(peek)
+            assert cp.cp_model_version == version and len(cp.cp_result_cache) == 2
+            cp.cp_execute_cmd(write)
+            assert cp.cp_model_version == version + 1 and len(cp.cp_result_cache) == 0
+            cp.cp_execute_cmd(read)
+            assert calls == ["read", "read", "peek", "write", "read"]
+        finally:
+            cp_msg_svc.capture_stop()
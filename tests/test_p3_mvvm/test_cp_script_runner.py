@@ -0,0 +1,117 @@
+# ---------------------------------------------------------------------------- +
+#region tests/test_p3_mvvm/test_cp_script_runner.py
+"""Tests for the p3_mvvm.cp_script_runner module."""
+#endregion tests/test_p3_mvvm/test_cp_script_runner.py
+# ---------------------------------------------------------------------------- +
+#region    Imports
+# python standard libraries
+import pytest, logging, threading
+# third-party libraries
+
+# local libraries
+from p3_mvvm.command_processor import CommandProcessor
+from p3_mvvm.command_class import Command
+from p3_mvvm.cp_message_service import cp_msg_svc, cp_user_info_message
+from p3_mvvm.cp_script_runner import CPScriptRunner, cp_resources_overlap
+from p3_mvvm.mvvm_namespace import *
+#endregion Imports
+# ---------------------------------------------------------------------------- +
+#region Globals
+logger = logging.getLogger(__name__)
+SCRIPT = """# test script
+show WB:0
+show WB:1
+show WB:2
+change DC
+fail WB:0
+show WB:0
+"""
+#endregion Globals
+# ---------------------------------------------------------------------------- +
+class ShowCommandProcessor(CommandProcessor):
+    """A CommandProcessor with the 'show' cmds read only, and the 'load' cmds
+    shared write."""
+    def cp_cmd_read_only(self, cmd) -> bool:
+        return cmd.cmd_name == "show"
+
+    def cp_cmd_shared_write(self, cmd) -> bool:
+        return cmd.cmd_name == "load"
+
+class TestCPScriptRunner:
+    """Tests for the CPScriptRunner class."""
+    @pytest.fixture(autouse=True)
+    def setup(self, make_cp, make_cmd) -> None:
+        """Setup for each test method."""
+        self.cp = make_cp(ShowCommandProcessor)
+        self.make_cmd = make_cmd
+        self.runner = CPScriptRunner(self.cp, self.line_parser,
+                                     self.resources, max_workers=3)
+        # The 'show' and 'load' cmds wait here, until 3 of them run at once.
+        self.barrier = threading.Barrier(3, timeout=5.0)
+
+    def line_parser(self, line: str) -> Command:
+        """Parse '<name> <resource>', a cmd writing resource, or reading it
+        for 'show'."""
+        name, resource = line.split()
+        def body(cmd: Command) -> str:
+            if name in ("show", "load"):
+                # Raises BrokenBarrierError unless run in parallel.
+                self.barrier.wait()
+            cp_user_info_message(f"{name} {resource}")
+            return resource
+        cmd = self.make_cmd(self.cp, name, body, status=name != "fail")
+        cmd.cmd_parms["resource"] = resource
+        return cmd
+
+    def resources(self, cmd: Command):
+        """Return the (reads, writes) of a test cmd, all cmds read 'DC'."""
+        resource = cmd.cmd_parms["resource"]
+        if cmd.cmd_name == "show":
+            return {"DC", resource}, set()
+        return {"DC"}, {resource}
+
+    def test_resources_overlap(self) -> None:
+        """Test resource wildcards."""
+        assert cp_resources_overlap({"WB:1"}, {"WB:*"})
+        assert cp_resources_overlap({"DC"}, {CP_RESOURCE_ALL})
+        assert not cp_resources_overlap({"WB:1"}, {"WB:2", "DC"})
+
+    def test_script_run(self) -> None:
+        """Test independent read only cmds run in parallel, a cmd after a
+        failed cmd is skipped and the output is in line order."""
+        output = []
+        sub_id = cp_msg_svc.subscribe_user_message(
+            lambda m: output.append(m.data["message"]))
+        try:
+            cmd_result = self.runner.cp_script_run(SCRIPT.splitlines(), "test")
+            cp_msg_svc.drain()
+        finally:
+            cp_msg_svc.unsubscribe(CP_USER_MSG_TOPIC, sub_id)
+        steps = self.runner.steps
+        assert cmd_result[CK_CMD_RESULT_STATUS] is False
+        assert [s.level for s in steps] == [1, 1, 1, 2, 3, 4]
+        assert [s.ok for s in steps] == [True] * 4 + [False, False]
+        assert steps[5].skipped is True
+        lines = [m for m in output if m.startswith("[")]
+        assert lines == [f"[{n:>4}] {s.line}" for n, s in
+                         zip(range(2, 8), steps)]
+        assert output.index("show WB:2") < output.index("[   5] change DC")
+        assert "1 failed, 1 skipped, 4 levels" in cmd_result[CK_CMD_RESULT_CONTENT]
+
+    def test_shared_write_cmds_overlap(self) -> None:
+        """Test cmds writing different resources, holding the model lock for
+        a shared write, run at once, and each bumps the model version."""
+        version = self.cp.cp_model_version
+        lines = ["load WB:0", "load WB:1", "load WB:2"]
+        cmd_result = self.runner.cp_script_run(lines, "test")
+        assert cmd_result[CK_CMD_RESULT_STATUS] is True
+        assert [s.level for s in self.runner.steps] == [1, 1, 1]
+        assert self.barrier.broken is False
+        assert self.cp.cp_model_version == version + 3
+
+    def test_script_parse_error(self) -> None:
+        """Test no cmd runs when a line does not parse."""
+        cmd_result = self.runner.cp_script_run(["load WB:0", "bad"], "test")
+        assert cmd_result[CK_CMD_RESULT_STATUS] is False
+        assert self.runner.steps[0].done is False
+        assert self.runner.steps[1].parse_error is not None
@@ -0,0 +1,77 @@
+# ---------------------------------------------------------------------------- +
+#region tests/test_p3_mvvm/test_cp_trace.py
+"""Tests for the p3_telemetry.cp_trace module."""
+#endregion tests/test_p3_mvvm/test_cp_trace.py
+# ---------------------------------------------------------------------------- +
+#region    Imports
+# python standard libraries
+import pytest, logging, json
+# third-party libraries
+
+# local libraries
+from p3_telemetry.cp_trace import (CPTracer, CP_NULL_SPAN, cp_tracer, cp_traced,
+                                   cp_trace_current)
+from p3_mvvm.mvvm_namespace import *
+#endregion Imports
+# ---------------------------------------------------------------------------- +
+#region Globals
+logger = logging.getLogger(__name__)
+#endregion Globals
+# ---------------------------------------------------------------------------- +
+@cp_traced(CP_TRACE_CAT_TASK)
+def traced_task(rows: int) -> int:
+    """A traced task, counts to rows."""
+    total = sum(range(rows * 1000))
+    cp_trace_current().set(**{CK_TRACE_ROWS: rows})
+    return total
+
+class TestCPTracer:
+    """Tests for the CPTracer class."""
+    def test_spans(self, tmp_path) -> None:
+        """Test nested spans record wall and CPU time, attributes and errors,
+        and dump as Chrome trace JSON."""
+        tracer = CPTracer(capacity=2)
+        assert tracer.span("off") is CP_NULL_SPAN
+        tracer.start()
+        with pytest.raises(ValueError):
+            with tracer.span("outer", CP_TRACE_CAT_COMMAND, cmd_key="x") as outer:
+                assert tracer.current() is outer
+                with tracer.span("inner", CP_TRACE_CAT_STORAGE) as inner:
+                    inner.set(rows=3)
+                raise ValueError("bad")
+        assert tracer.current() is CP_NULL_SPAN
+        inner_e, outer_e = tracer.events()
+        assert (inner_e["name"], inner_e["args"]) == ("inner", {"rows": 3})
+        assert outer_e["args"] == {"cmd_key": "x", CK_TRACE_ERROR: "ValueError: bad"}
+        assert outer_e["ts"] <= inner_e["ts"]
+        assert outer_e["ts"] + outer_e["dur"] >= inner_e["ts"] + inner_e["dur"]
+        assert outer_e["tdur"] >= 0
+        with tracer.span("third"):
+            pass
+        assert (len(tracer), tracer.dropped) == (2, 1)
+        tracer.stop()
+        assert tracer.span("off") is CP_NULL_SPAN
+        path = tmp_path / "trace.json"
+        assert tracer.dump(path) == 2
+        trace = json.loads(path.read_text())
+        assert [e["ph"] for e in trace["traceEvents"]] == ["M", "X", "X"]
+
+    def test_traced_command(self, make_cp, make_cmd) -> None:
+        """Test cp_execute_cmd() and a cp_traced function nest in spans."""
+        cp = make_cp()
+        cmd = make_cmd(cp, "run", lambda cmd: traced_task(2))
+        cp_tracer.start()
+        try:
+            cp.cp_execute_cmd(cmd)
+        finally:
+            cp_tracer.stop()
+        task_e, cmd_e = cp_tracer.events()
+        assert (task_e["name"], task_e["cat"]) == ("traced_task", CP_TRACE_CAT_TASK)
+        assert task_e["args"] == {CK_TRACE_ROWS: 2}
+        assert cmd_e["name"] == "run test"
+        assert cmd_e["args"] == {"cmd_key": "run_cmd",
+                                 "subcmd_key": "run_cmd_test",
+                                 CK_TRACE_STATUS: True}
+        cp_tracer.clear()
+        assert traced_task(1) == sum(range(1000))
+        assert len(cp_tracer) == 0